@@ -0,0 +1,200 @@
+"""
+Test de charge : des milliers de parties PvP simultanées, chacune traitée par son
+ActeurPartie sur le groupe de threads partagé du GestionnairePartie.
+
+Les sessions sont des SessionClient en mémoire (sans socket) : les messages émis par
+le serveur sont enregistrés, et chaque VOTRE_TOUR place la session dans une file de
+travail. Des threads « pilotes » jouent les tirs, à la manière des threads de session
+du serveur. Pour vérifier la sérialisation par partie :
+
+    * avant certains tirs, l'adversaire tire aussi (hors de son tour) : ce tir est
+      déposé avant celui du joueur dont c'est le tour et doit être refusé,
+    * une partie sur --abandon abandonne en cours de route.
+
+À la fin, on vérifie que chaque partie s'est terminée exactement une fois (VICTOIRE
+et DEFAITE, ou VICTOIRE par abandon), que chaque tir valide a reçu une réponse et
+un seul, et qu'il ne reste aucune partie active.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_acteurs_parties [--parties 2000] [--pilotes 16] [--travailleurs 8]
+"""
+import argparse
+import contextlib
+import os
+import queue
+import random
+import tempfile
+import threading
+import time
+
+from commun import constantes as const
+from commun.coeur_jeu.joueur import Joueur
+from commun.reseau.message import Message
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from serveur.logique_jeu.gestionnaire_partie import GestionnairePartie
+from serveur.reseau.session_client import SessionClient
+
+
+class SessionMemoire(SessionClient):
+    """ Session sans transport : les messages émis sont enregistrés. """
+
+    def __init__(self, nom: str, gestionnaire_utilisateurs, gestionnaire_partie, banc: 'Banc') -> None:
+        super().__init__(("memoire", 0), gestionnaire_utilisateurs, gestionnaire_partie)
+        self.nom_joueur = nom
+        self.banc = banc
+        self.recus: dict[str, int] = {}
+        self.fins: list[str] = []
+        self.cases: list[tuple[int, int]] = [(x, y) for y in range(const.TAILLE_GRILLE)
+                                              for x in range(const.TAILLE_GRILLE)]
+        random.Random(nom).shuffle(self.cases)
+        self.tirs_valides = 0
+        self.tirs_hors_tour = 0
+        self.abandonne = False
+
+    def _emettre(self, messages: list[Message]) -> bool:
+        for message in messages:
+            self.recus[message.type] = self.recus.get(message.type, 0) + 1
+            if message.type == const.MSG_VOTRE_TOUR:
+                self.banc.a_jouer.put(self)
+            elif message.type == const.MSG_FIN_PARTIE:
+                self.fins.append(message.donnees["status"])
+                self.banc.session_terminee()
+        return True
+
+    def _deconnecter_pair_lent(self) -> None:
+        pass
+
+    def stop(self):
+        self.actif = False
+
+
+class Banc:
+    """ Sessions, file de travail des pilotes et suivi de la fin des parties. """
+
+    def __init__(self, nb_parties: int, taux_abandon: int, taux_hors_tour: float) -> None:
+        self.a_jouer: queue.Queue[SessionMemoire | None] = queue.Queue()
+        self.taux_abandon = taux_abandon
+        self.taux_hors_tour = taux_hors_tour
+        self.clients: dict[str, SessionMemoire] = {}
+        self.adversaires: dict[str, SessionMemoire] = {}
+        self._verrou = threading.Lock()
+        self._restantes = 2 * nb_parties
+        self.fin = threading.Event()
+
+    def session_terminee(self, n: int = 1) -> None:
+        with self._verrou:
+            self._restantes -= n
+            if self._restantes <= 0:
+                self.fin.set()
+
+    def piloter(self, graine: int) -> None:
+        """ Thread pilote : joue le prochain tir de chaque session dont c'est le tour. """
+        hasard = random.Random(graine)
+        while (session := self.a_jouer.get()) is not None:
+            adversaire = self.adversaires[session.nom_joueur]
+            numero_partie = int(session.nom_joueur[1:])
+
+            if numero_partie % self.taux_abandon == 0 and session.tirs_valides == 10 and not adversaire.abandonne:
+                session.abandonne = True
+                self.session_terminee()  # Le joueur qui abandonne ne reçoit pas de FIN_PARTIE
+                session._traiter_message(Message.creer_abandon())
+                continue
+
+            if hasard.random() < self.taux_hors_tour and adversaire.cases:
+                # Tir de l'adversaire déposé avant celui du joueur : hors de son tour
+                adversaire.tirs_hors_tour += 1
+                x, y = adversaire.cases[-1]
+                adversaire._traiter_message(Message.creer_tir(x, y))
+
+            x, y = session.cases.pop()
+            session.tirs_valides += 1
+            session._traiter_message(Message.creer_tir(x, y))
+
+
+def positions_aleatoires(nom: str) -> list[dict]:
+    joueur = Joueur(nom)
+    joueur.placer_navires_aleatoire()
+    return joueur.obtenir_positions_navires()
+
+
+def verifier(banc: Banc, gestionnaire: GestionnairePartie) -> list[str]:
+    """ Retourne la liste des invariants violés. """
+    erreurs = []
+    for nom, session in banc.clients.items():
+        if session.recus.get(const.MSG_ERREUR):
+            erreurs.append(f"{nom}: {session.recus[const.MSG_ERREUR]} message(s) d'erreur")
+        if session.recus.get(const.MSG_REPONSE_TIR, 0) != session.tirs_valides:
+            erreurs.append(f"{nom}: {session.tirs_valides} tirs valides, "
+                           f"{session.recus.get(const.MSG_REPONSE_TIR, 0)} réponses")
+
+        adversaire = banc.adversaires[nom]
+        attendu = [] if session.abandonne else ["VICTOIRE"] if adversaire.abandonne else None
+        if attendu is not None and session.fins != attendu:
+            erreurs.append(f"{nom}: fins {session.fins}, attendu {attendu}")
+        elif attendu is None and sorted(session.fins + adversaire.fins) != ["DEFAITE", "VICTOIRE"]:
+            erreurs.append(f"{nom}: fins {session.fins} / adversaire {adversaire.fins}")
+
+    if gestionnaire.parties_actives or gestionnaire.acteurs or gestionnaire.client_partie_map:
+        erreurs.append(f"{len(gestionnaire.parties_actives)} partie(s) encore active(s)")
+    return erreurs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parties", type=int, default=2000)
+    parser.add_argument("--pilotes", type=int, default=16, help="threads qui jouent les tirs")
+    parser.add_argument("--travailleurs", type=int, default=const.NB_TRAVAILLEURS_PARTIES,
+                        help="threads partagés par les acteurs")
+    parser.add_argument("--abandon", type=int, default=10, help="une partie sur N abandonne")
+    parser.add_argument("--hors-tour", type=float, default=0.05, help="probabilité d'un tir hors tour")
+    parser.add_argument("--delai", type=float, default=300.0)
+    args = parser.parse_args()
+
+    const.NB_TRAVAILLEURS_PARTIES = args.travailleurs
+    gestionnaire_partie = GestionnairePartie()
+    gestionnaire_utilisateurs = GestionnaireUtilisateur(
+        os.path.join(tempfile.mkdtemp(), const.FICHIER_SAUVEGARDE_UTILISATEURS))
+    banc = Banc(args.parties, args.abandon, args.hors_tour)
+
+    with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+        # Matchmaking : les joueuses aN et bN s'affrontent
+        for i in range(args.parties):
+            a, b = (SessionMemoire(f"{c}{i}", gestionnaire_utilisateurs, gestionnaire_partie, banc) for c in "ab")
+            for session in (a, b):
+                session.callback_get_map = lambda: banc.clients
+                banc.clients[session.nom_joueur] = session
+            banc.adversaires[a.nom_joueur], banc.adversaires[b.nom_joueur] = b, a
+            a._traiter_message(Message.creer_choix_mode(const.MODE_VS_JOUEUR))
+            b._traiter_message(Message.creer_choix_mode(const.MODE_VS_JOUEUR))
+
+        pilotes = [threading.Thread(target=banc.piloter, args=(i,), daemon=True) for i in range(args.pilotes)]
+        for pilote in pilotes:
+            pilote.start()
+
+        debut = time.perf_counter()
+        for session in banc.clients.values():
+            session._traiter_message(Message.creer_placement_navires(positions_aleatoires(session.nom_joueur)))
+
+        termine = banc.fin.wait(args.delai)
+        duree = time.perf_counter() - debut
+
+        for _ in pilotes:
+            banc.a_jouer.put(None)
+        gestionnaire_partie.executeur.shutdown(wait=True)
+
+    tirs = sum(s.tirs_valides for s in banc.clients.values())
+    hors_tour = sum(s.tirs_hors_tour for s in banc.clients.values())
+    print(f"parties: {args.parties}  pilotes: {args.pilotes}  travailleurs: {args.travailleurs}")
+    print(f"tirs valides: {tirs}  tirs hors tour (refusés): {hors_tour}  "
+          f"abandons: {sum(s.abandonne for s in banc.clients.values())}")
+    print(f"durée: {duree:.2f} s  débit: {tirs / duree:,.0f} tirs/s")
+
+    erreurs = [] if termine else ["délai dépassé avant la fin de toutes les parties"]
+    erreurs += verifier(banc, gestionnaire_partie)
+    for erreur in erreurs[:20]:
+        print(f"  ECHEC {erreur}")
+    print("invariants: OK" if not erreurs else f"invariants: {len(erreurs)} échec(s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Benchmark : rafale de datagrammes de login sur AuthentificationUDP.
+
+    * historique : un thread créé par datagramme reçu,
+    * groupe     : NB_TRAVAILLEURS_AUTH travailleurs et file bornée (TAILLE_FILE_AUTH),
+                   refus explicite (MSG_AUTH_OCCUPE) quand la file est pleine.
+
+Les datagrammes sont envoyés par plusieurs émetteurs, au débit --debit ; on
+compte les réponses par statut (les datagrammes sans réponse ont été perdus par le
+noyau, tampon de réception du serveur plein), le nombre maximal de threads du
+processus, et les statistiques du serveur (groupe uniquement).
+--cout-ms simule une base d'utilisateurs plus lente (disque, réseau) : au-delà de
+la capacité des travailleurs, la file se remplit et le serveur refuse le surplus.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_auth_udp [--datagrammes 50000] [--emetteurs 4] [--debit 20000] [--cout-ms 1]
+"""
+import argparse
+import contextlib
+import os
+import socket
+import tempfile
+import threading
+import time
+
+from commun import constantes as const
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from serveur.reseau.authentification_udp import AuthentificationUDP
+
+NOM, MDP = "joueur", "motdepasse"
+DELAI_SILENCE = 2.0  # s sans réponse : la rafale est terminée
+
+
+class UtilisateursLents(GestionnaireUtilisateur):
+    """ Base d'utilisateurs dont chaque vérification coûte `cout` secondes. """
+
+    def __init__(self, chemin_fichier: str, cout: float):
+        super().__init__(chemin_fichier)
+        self.cout = cout
+
+    def verifier_authentification(self, nom: str, mdp: str) -> bool:
+        if self.cout:
+            time.sleep(self.cout)
+        return super().verifier_authentification(nom, mdp)
+
+
+class AuthentificationUDPHistorique(AuthentificationUDP):
+    """ Ancien comportement : un thread par datagramme. """
+
+    def _soumettre(self, data: bytes, adresse_client: tuple[str, int]) -> None:
+        t = threading.Thread(target=self._traiter_requete, args=(data, adresse_client))
+        t.daemon = True
+        t.start()
+
+
+def emetteur(port: int, nb: int, debit: float, reponses: dict[str, int], verrou: threading.Lock) -> None:
+    """ Envoie nb requêtes de login (debit par seconde, 0 = sans limite) et compte les réponses par statut. """
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+    s.connect(("127.0.0.1", port))
+    requete = const.SEPARATEUR.join([const.MSG_AUTH_LOGIN, NOM, MDP]).encode(const.ENCODAGE)
+    recus: dict[str, int] = {}
+
+    def recevoir():
+        s.settimeout(DELAI_SILENCE)
+        try:
+            while True:
+                status = s.recv(1024).split(const.SEPARATEUR.encode(), 1)[0].decode()
+                recus[status] = recus.get(status, 0) + 1
+        except (socket.timeout, OSError):
+            pass
+
+    recepteur = threading.Thread(target=recevoir)
+    recepteur.start()
+    debut = time.perf_counter()
+    for i in range(nb):
+        if debit and i % 50 == 0:
+            avance = debut + i / debit - time.perf_counter()
+            if avance > 0:
+                time.sleep(avance)
+        try:
+            s.send(requete)
+        except OSError:  # ENOBUFS / ECONNREFUSED : datagramme perdu
+            pass
+    recepteur.join()
+    s.close()
+    with verrou:
+        for status, n in recus.items():
+            reponses[status] = reponses.get(status, 0) + n
+
+
+def scenario(classe, port: int, nb_datagrammes: int, nb_emetteurs: int,
+             debit: float, cout: float) -> tuple[float, dict, int, dict | None]:
+    fichier = os.path.join(tempfile.mkdtemp(), const.FICHIER_SAUVEGARDE_UTILISATEURS)
+    utilisateurs = UtilisateursLents(fichier, cout)
+    utilisateurs.enregistrer_utilisateur(NOM, MDP)
+
+    serveur = classe(utilisateurs, host="127.0.0.1", port=port)
+    serveur.daemon = True
+    serveur.start()
+    time.sleep(0.3)
+
+    threads_max = threading.active_count()
+    fini = threading.Event()
+
+    def echantillonner():
+        nonlocal threads_max
+        while not fini.wait(0.005):
+            threads_max = max(threads_max, threading.active_count())
+
+    echantillonneur = threading.Thread(target=echantillonner, daemon=True)
+    echantillonneur.start()
+
+    reponses: dict[str, int] = {}
+    verrou = threading.Lock()
+    debut = time.perf_counter()
+    par_emetteur = nb_datagrammes // nb_emetteurs
+    emetteurs = [threading.Thread(target=emetteur, args=(port, par_emetteur, debit / nb_emetteurs, reponses, verrou))
+                 for _ in range(nb_emetteurs)]
+    for t in emetteurs:
+        t.start()
+    for t in emetteurs:
+        t.join()
+    duree = time.perf_counter() - debut - DELAI_SILENCE
+    fini.set()
+
+    stats = serveur.statistiques() if classe is AuthentificationUDP else None
+    serveur.stop()
+    return duree, reponses, threads_max, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--datagrammes", type=int, default=50000)
+    parser.add_argument("--emetteurs", type=int, default=4)
+    parser.add_argument("--debit", type=float, default=20000, help="datagrammes/s au total (0 = sans limite)")
+    parser.add_argument("--cout-ms", type=float, default=1.0, help="coût simulé d'une vérification (ms)")
+    parser.add_argument("--port", type=int, default=16855)
+    args = parser.parse_args()
+
+    print(f"{'mode':<11} {'durée(s)':>9} {'succès':>8} {'occupé':>8} {'perdus':>8} {'threads max':>12}")
+    resultats = []
+    for i, (nom, classe) in enumerate((("historique", AuthentificationUDPHistorique),
+                                       ("groupe", AuthentificationUDP))):
+        with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+            duree, reponses, threads_max, stats = scenario(classe, args.port + i, args.datagrammes, args.emetteurs,
+                                                            args.debit, args.cout_ms / 1000)
+        succes = reponses.get(const.MSG_AUTH_SUCCESS, 0)
+        occupe = reponses.get(const.MSG_AUTH_OCCUPE, 0)
+        perdus = args.datagrammes - sum(reponses.values())
+        print(f"{nom:<11} {duree:>9.2f} {succes:>8} {occupe:>8} {perdus:>8} {threads_max:>12}")
+        if stats:
+            resultats.append(stats)
+
+    for stats in resultats:
+        print(f"\nserveur (groupe) : profondeur max {stats['profondeur_max']}/{const.TAILLE_FILE_AUTH}, "
+              f"traitées {stats['requetes_traitees']}, rejets {stats['rejets']}")
+        print(f"latence : moyenne {stats['latence_moyenne'] * 1e3:.2f} ms, p50 {stats['latence_p50'] * 1e3:.2f} ms, "
+              f"p99 {stats['latence_p99'] * 1e3:.2f} ms, max {stats['latence_max'] * 1e3:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
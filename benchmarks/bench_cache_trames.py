@@ -0,0 +1,82 @@
+"""
+Benchmark : encadrement des messages serveur avec et sans CacheTrames.
+
+    * coût de Protocole.tampons_trame() par type de message fréquent,
+    * sur des parties simulées : part des trames serveur servies par le cache
+      et temps total d'encadrement.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_cache_trames [--iterations 200000] [--parties 200]
+"""
+import argparse
+import time
+import timeit
+
+from benchmarks.bench_codec import messages_partie
+from commun import constantes as const
+from commun.reseau.cache_trames import CacheTrames
+from commun.reseau.message import Message
+from commun.reseau.protocole import Protocole
+
+
+MESSAGES = {
+    "VOTRE_TOUR": Message.creer_votre_tour(),
+    "TOUR_ADVERSAIRE": Message.creer_tour_adversaire(),
+    "PLACEMENT_OK": Message.creer_placement_ok(),
+    "REPONSE_TIR": Message.creer_reponse_tir(const.TIR_TOUCHE, 4, 7),
+    "REPONSE_TIR (coulé)": Message.creer_reponse_tir(const.TIR_COULE, 4, 7, "Torpilleur"),
+}
+
+
+def tampons_sans_cache(message: Message, codec: str) -> list[bytes]:
+    """ Chemin d'encadrement sans cache (sérialisation + entête à chaque appel). """
+    data = message.serialiser(codec)
+    return [len(data).to_bytes(const.TAILLE_ENTETE, byteorder='big'), data]
+
+
+def micro_benchmark(iterations: int) -> None:
+    print(f"{'message':<20} {'codec':<8} {'sans cache(ns)':>15} {'avec cache(ns)':>15}")
+    for nom, message in MESSAGES.items():
+        for codec in const.CODECS_SUPPORTES:
+            t_sans = timeit.timeit(lambda: tampons_sans_cache(message, codec), number=iterations)
+            t_avec = timeit.timeit(lambda: Protocole.tampons_trame(message, codec), number=iterations)
+            print(f"{nom:<20} {codec:<8} {t_sans / iterations * 1e9:>15.0f} {t_avec / iterations * 1e9:>15.0f}")
+
+
+def parties(nb_parties: int) -> None:
+    print(f"\n{'partie':<6} {'codec':<8} {'trames':>7} {'cache':>6} {'sans cache(ms)':>15} {'avec cache(ms)':>15}")
+    for pvp in (False, True):
+        # Trames émises par le serveur (le TIR vient du client)
+        flux = [m for graine in range(nb_parties) for m in messages_partie(pvp, graine)
+                if m.type != const.MSG_TIR]
+        for codec in const.CODECS_SUPPORTES:
+            CacheTrames.vider()
+            succes_avant = CacheTrames.nb_succes
+
+            debut = time.perf_counter()
+            for message in flux:
+                tampons_sans_cache(message, codec)
+            t_sans = time.perf_counter() - debut
+
+            debut = time.perf_counter()
+            for message in flux:
+                Protocole.tampons_trame(message, codec)
+            t_avec = time.perf_counter() - debut
+
+            taux = (CacheTrames.nb_succes - succes_avant) / len(flux)
+            print(f"{'PvP' if pvp else 'Solo':<6} {codec:<8} {len(flux) // nb_parties:>7} {taux:>6.0%} "
+                  f"{t_sans * 1e3:>15.1f} {t_avec * 1e3:>15.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--parties", type=int, default=200)
+    args = parser.parse_args()
+
+    micro_benchmark(args.iterations)
+    parties(args.parties)
+
+
+if __name__ == '__main__':
+    main()
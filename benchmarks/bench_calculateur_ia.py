@@ -0,0 +1,98 @@
+"""
+Benchmark : tirs de l'IA Solo calculés dans le thread de la session, ou par le groupe de
+processus partagé (CalculateurIa), selon le nombre de sessions qui jouent en même temps.
+
+    * thread    : NB_PROCESSUS_IA = 0, la carte de densité est calculée par la session,
+    * processus : --processus processus, chaque tir attendu au plus --delai secondes
+                  (au-delà, tir rapide de repli).
+
+Chaque session (un thread) joue des parties Solo où seule l'IA tire, jusqu'à --tirs
+tirs. Pour chaque mode et chaque nombre de sessions : tirs par seconde (toutes sessions),
+latence d'un tir vue par la session (50e, 95e, 99e centile, pire), tirs joués en repli,
+tirs plafonnés sous charge (tir rapide sans calcul), et saturation du groupe (part des
+calculs soumis alors que tous les processus étaient occupés, maximum de calculs en cours).
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_calculateur_ia [--sessions 1 4 16] [--tirs 300] [--taille 10]
+        [--processus 2] [--delai 0.02] [--python]
+"""
+import argparse
+import contextlib
+import os
+import random
+import threading
+import time
+
+from commun import constantes as const
+from commun.coeur_jeu.configuration_partie import ConfigurationPartie
+from commun.coeur_jeu.ia_densite import IaDensite
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from serveur.logique_jeu.calculateur_ia import CalculateurIa
+
+FLOTTE_COMPLETE = (("Porte-avions", 5), ("Croiseur", 4), ("Contre-torpilleur", 3),
+                   ("Sous-marin", 3), ("Torpilleur", 2))
+
+
+def jouer_session(calculateur: CalculateurIa, configuration: ConfigurationPartie, nb_tirs: int,
+                  vectorise: bool, graine: int) -> None:
+    """ Une session : parties Solo jouées par l'IA seule jusqu'à nb_tirs tirs. """
+    rng = random.Random(graine)
+    tirs = 0
+    while tirs < nb_tirs:
+        partie = Partie(Joueur("Arnauld", configuration=configuration), strategie_ia=const.IA_DENSITE)
+        partie.joueur1.placer_navires_aleatoire(rng)
+        partie.demarrer()
+        partie._ia = IaDensite(partie.joueur1.configuration(), partie.joueur2.grille_suivi, vectorise=vectorise)
+        while not partie.est_terminee() and tirs < nb_tirs:
+            partie.est_tour_joueur1 = False
+            partie.traiter_tir(*calculateur.choisir_tir(partie))
+            tirs += 1
+
+
+def mesurer(calculateur: CalculateurIa, configuration: ConfigurationPartie, nb_sessions: int,
+            nb_tirs: int, vectorise: bool) -> tuple[float, dict]:
+    """ (tirs par seconde, statistiques du calculateur). """
+    sessions = [threading.Thread(target=jouer_session, args=(calculateur, configuration, nb_tirs, vectorise, i))
+                for i in range(nb_sessions)]
+    debut = time.perf_counter()
+    for session in sessions:
+        session.start()
+    for session in sessions:
+        session.join()
+    duree = time.perf_counter() - debut
+    return nb_sessions * nb_tirs / duree, calculateur.statistiques()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--tirs", type=int, default=300)
+    parser.add_argument("--taille", type=int, default=const.TAILLE_GRILLE)
+    parser.add_argument("--processus", type=int, default=const.NB_PROCESSUS_IA)
+    parser.add_argument("--delai", type=float, default=const.DELAI_TIR_IA)
+    parser.add_argument("--python", action="store_true", help="carte de densité sans NumPy")
+    args = parser.parse_args()
+    configuration = ConfigurationPartie(args.taille, FLOTTE_COMPLETE).valider()
+
+    print(f"grille {args.taille}x{args.taille}, {'sans' if args.python else 'avec'} NumPy, "
+          f"{args.processus} processus, délai {args.delai * 1e3:.0f} ms")
+    print(f"{'mode':<10} {'sessions':>8} {'tirs/s':>8} {'ms p50':>7} {'ms p95':>7} {'ms p99':>7} {'ms max':>7} "
+          f"{'replis':>7} {'plafond':>7} {'saturé':>7} {'en cours':>8}")
+    for mode, nb_processus in (("thread", 0), ("processus", args.processus)):
+        for nb_sessions in args.sessions:
+            calculateur = CalculateurIa(nb_processus, args.delai)
+            calculateur.demarrer()
+            try:
+                with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+                    debit, stats = mesurer(calculateur, configuration, nb_sessions, args.tirs, not args.python)
+            finally:
+                calculateur.fermer()
+            print(f"{mode:<10} {nb_sessions:>8} {debit:>8.0f} {stats['latence_p50'] * 1e3:>7.2f} "
+                  f"{stats['latence_p95'] * 1e3:>7.2f} {stats['latence_p99'] * 1e3:>7.2f} "
+                  f"{stats['latence_max'] * 1e3:>7.2f} {stats['taux_repli']:>7.1%} {stats['taux_plafonne']:>7.1%} "
+                  f"{stats['taux_saturation']:>7.1%} {stats['en_cours_max']:>8}")
+
+
+if __name__ == '__main__':
+    main()
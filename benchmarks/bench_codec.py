@@ -0,0 +1,100 @@
+"""
+Benchmark : codec JSON contre codec binaire (CodecBinaire) pour les messages fréquents.
+
+    * micro-benchmark encodage / décodage par type de message,
+    * octets échangés (entêtes compris) sur une partie Solo et une partie PvP
+      simulées jusqu'à la victoire.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_codec [--iterations 100000]
+"""
+import argparse
+import contextlib
+import io
+import random
+import timeit
+
+from commun import constantes as const
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from commun.reseau.message import Message
+
+
+MESSAGES = {
+    "TIR": Message.creer_tir(4, 7),
+    "REPONSE_TIR": Message.creer_reponse_tir(const.TIR_TOUCHE, 4, 7),
+    "REPONSE_TIR (coulé)": Message.creer_reponse_tir(const.TIR_COULE, 4, 7, "Torpilleur"),
+    "REPONSE_TIR_RECU": Message.creer_reponse_tir_recu(const.TIR_RATE, 4, 7, "Arnauld"),
+    "VOTRE_TOUR": Message.creer_votre_tour(),
+    "TOUR_ADVERSAIRE": Message.creer_tour_adversaire(),
+}
+
+
+def micro_benchmark(iterations: int) -> None:
+    print(f"{'message':<20} {'codec':<8} {'octets':>6} {'encodage(ns)':>13} {'décodage(ns)':>13}")
+    for nom, message in MESSAGES.items():
+        for codec in (const.CODEC_JSON, const.CODEC_BINAIRE):
+            data = message.serialiser(codec)
+            t_enc = timeit.timeit(lambda: message.serialiser(codec), number=iterations) / iterations * 1e9
+            t_dec = timeit.timeit(lambda: Message.deserialiser(data), number=iterations) / iterations * 1e9
+            print(f"{nom:<20} {codec:<8} {len(data):>6} {t_enc:>13.0f} {t_dec:>13.0f}")
+
+
+def messages_partie(pvp: bool, graine: int) -> list[Message]:
+    """ Messages TCP d'une partie jouée au hasard jusqu'à la victoire (hors connexion/placement). """
+    random.seed(graine)
+    with contextlib.redirect_stdout(io.StringIO()):
+        partie = Partie(Joueur("Arnauld"), Joueur("Wilfride") if pvp else None)
+        partie.demarrer()
+
+    cases = {1: [(x, y) for x in range(const.TAILLE_GRILLE) for y in range(const.TAILLE_GRILLE)],
+             2: [(x, y) for x in range(const.TAILLE_GRILLE) for y in range(const.TAILLE_GRILLE)]}
+    for liste in cases.values():
+        random.shuffle(liste)
+
+    messages = []
+    termine = False
+    while not termine:
+        joueur = 1 if partie.est_tour_joueur1 else 2
+        tireur = partie.joueur1 if joueur == 1 else partie.joueur2
+        x, y = cases[joueur].pop()
+        resultat, coule, termine = partie.traiter_tir(x, y)
+
+        if pvp or joueur == 1:
+            messages.append(Message.creer_tir(x, y))  # client -> serveur
+        messages.append(Message.creer_reponse_tir(resultat, x, y, coule))
+        messages.append(Message.creer_reponse_tir_recu(resultat, x, y, tireur.nom, coule))
+        if not termine:
+            messages.append(Message.creer_tour_adversaire())
+            messages.append(Message.creer_votre_tour())
+    return messages
+
+
+def octets_par_partie(parties: int) -> None:
+    print(f"\n{'partie':<6} {'messages':>9} {'JSON (o)':>10} {'binaire (o)':>12} {'gain':>6}")
+    for pvp in (False, True):
+        total = {const.CODEC_JSON: 0, const.CODEC_BINAIRE: 0}
+        nb = 0
+        for graine in range(parties):
+            messages = messages_partie(pvp, graine)
+            nb += len(messages)
+            for codec in total:
+                total[codec] += sum(const.TAILLE_ENTETE + len(m.serialiser(codec)) for m in messages)
+        json_moy = total[const.CODEC_JSON] / parties
+        bin_moy = total[const.CODEC_BINAIRE] / parties
+        print(f"{'PvP' if pvp else 'Solo':<6} {nb / parties:>9.0f} {json_moy:>10.0f} {bin_moy:>12.0f} "
+              f"{1 - bin_moy / json_moy:>6.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--parties", type=int, default=200)
+    args = parser.parse_args()
+
+    micro_benchmark(args.iterations)
+    octets_par_partie(args.parties)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark : latence de sauvegarde_partie / supprimer_partie_sauvegardee vue par les
+sessions, selon la stratégie d'écriture, pour les deux stockages (JSON + journal, SQLite).
+
+    * synchrone : chaque modification est écrite et synchronisée seule (lots d'une
+                  modification), l'appelant attend le disque — ancien comportement,
+    * groupée   : l'appelant attend le disque (durable=True), mais les modifications
+                  simultanées partagent un même fsync / une même transaction,
+    * différée  : l'appelant n'attend pas (défaut) ; le thread de persistance écrit
+                  un lot toutes les DELAI_ECRITURE_DIFFEREE s ou TAILLE_LOT_ECRITURE_DIFFEREE
+                  modifications.
+
+--threads sessions sauvegardent puis suppriment une partie en boucle. On mesure la
+latence côté appelant, et côté écrivain la taille des lots et la latence de vidage
+(soumission -> durabilité).
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_ecriture_differee [--threads 16] [--operations 4000]
+"""
+import argparse
+import contextlib
+import os
+import tempfile
+import threading
+import time
+
+from commun import constantes as const
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from serveur.donnees.ecrivain_differe import EcrivainDiffere
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from serveur.donnees.gestionnaire_utilisateur_sqlite import GestionnaireUtilisateurSQLite
+
+MDP = "motdepasse"
+
+
+def creer(classe, taille_lot: int) -> GestionnaireUtilisateur:
+    """ Gestionnaire neuf, dont l'écrivain forme des lots d'au plus taille_lot modifications. """
+    dossier = tempfile.mkdtemp()
+    fichier = const.FICHIER_BASE_UTILISATEURS if classe is GestionnaireUtilisateurSQLite \
+        else const.FICHIER_SAUVEGARDE_UTILISATEURS
+    gestionnaire = classe(os.path.join(dossier, fichier))
+    gestionnaire.ecrivain.stop()
+    gestionnaire.ecrivain = EcrivainDiffere(gestionnaire._ecrire_lot, gestionnaire.ecrivain.name, taille_lot=taille_lot)
+    gestionnaire.ecrivain.start()
+    return gestionnaire
+
+
+def scenario(classe, taille_lot: int, durable: bool, nb_threads: int, nb_operations: int) -> tuple[float, list, dict]:
+    gestionnaire = creer(classe, taille_lot)
+    for t in range(nb_threads):
+        gestionnaire.enregistrer_utilisateur(f"joueur{t}", MDP)
+    gestionnaire.ecrivain.vider()
+
+    latences: list[float] = []
+    verrou = threading.Lock()
+
+    def session(t: int):
+        nom = f"joueur{t}"
+        partie = Partie(Joueur(nom), Joueur(const.NOM_SERVEUR))
+        locales = []
+        for i in range(nb_operations // nb_threads):
+            debut = time.perf_counter()
+            if i % 2 == 0:
+                gestionnaire.sauvegarder_partie(nom, partie, durable=durable)
+            else:
+                gestionnaire.supprimer_partie_sauvegardee(nom, durable=durable)
+            locales.append(time.perf_counter() - debut)
+        with verrou:
+            latences.extend(locales)
+
+    threads = [threading.Thread(target=session, args=(t,)) for t in range(nb_threads)]
+    debut = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    duree = time.perf_counter() - debut
+
+    gestionnaire.ecrivain.vider()
+    stats = gestionnaire.statistiques()
+    gestionnaire.fermer()
+    return len(latences) / duree, sorted(latences), stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--operations", type=int, default=4000)
+    args = parser.parse_args()
+
+    def centile(valeurs: list[float], p: float) -> float:
+        return valeurs[min(len(valeurs) - 1, int(p * len(valeurs)))] * 1e3
+
+    print(f"{'stockage':<8} {'stratégie':<10} {'modif/s':>9} {'appel p50(ms)':>14} {'appel p99(ms)':>14} "
+          f"{'lot moyen':>10} {'vidage p99(ms)':>15}")
+    for nom_stockage, classe in (("json", GestionnaireUtilisateur), ("sqlite", GestionnaireUtilisateurSQLite)):
+        for strategie, taille_lot, durable in (("synchrone", 1, True),
+                                               ("groupée", const.TAILLE_LOT_ECRITURE_DIFFEREE, True),
+                                               ("différée", const.TAILLE_LOT_ECRITURE_DIFFEREE, False)):
+            with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+                debit, latences, stats = scenario(classe, taille_lot, durable, args.threads, args.operations)
+            print(f"{nom_stockage:<8} {strategie:<10} {debit:>9,.0f} {centile(latences, 0.5):>14.3f} "
+                  f"{centile(latences, 0.99):>14.3f} {stats['taille_lot_moyenne']:>10.1f} "
+                  f"{stats['latence_p99'] * 1e3:>15.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""
+Benchmark : latence d'un tour PvP et nombre de segments TCP émis par tour, avec
+l'ancien chemin d'envoi (deux sendall par message, un envoi par message, Nagle actif)
+et le nouveau (un sendmsg par message, envois regroupés par événement, TCP_NODELAY).
+
+Un tour = le tireur envoie TIR, puis reçoit REPONSE_TIR + TOUR_ADVERSAIRE pendant
+que son adversaire reçoit REPONSE_TIR_RECU + VOTRE_TOUR. Les segments sont comptés
+avec le compteur système OutSegs de /proc/net/snmp (boucle locale, Linux).
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_envoi_regroupe [--tours 150]
+"""
+import argparse
+import contextlib
+import io
+import socket
+import statistics
+import tempfile
+import os
+import time
+
+from commun import constantes as const
+from commun.reseau.message import Message
+from commun.reseau.protocole import Protocole, LecteurTrames
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from serveur.logique_jeu.gestionnaire_partie import GestionnairePartie
+from serveur.reseau.ecouteur_serveur import EcouteurServeur
+from serveur.reseau.gestionnaire_client import GestionnaireClient
+from serveur.reseau.session_client import SessionClient
+
+
+def _segments_tcp_emis() -> int:
+    with open("/proc/net/snmp") as f:
+        lignes = [l.split() for l in f if l.startswith("Tcp:")]
+    return int(lignes[1][lignes[0].index("OutSegs")])
+
+
+def _envoyer_message_historique(socket_actif: socket.socket, message: Message) -> None:
+    """ Ancien envoi : entête puis contenu, deux appels système. """
+    data = message.serialiser()
+    socket_actif.sendall(len(data).to_bytes(const.TAILLE_ENTETE, byteorder='big'))
+    socket_actif.sendall(data)
+
+
+def activer_envoi_historique() -> None:
+    """ Rétablit le comportement d'envoi d'origine côté serveur. """
+    def emettre(self, messages):
+        self.socket_client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 0)
+        for message in messages:
+            _envoyer_message_historique(self.socket_client, message)
+        return True
+
+    GestionnaireClient._emettre = emettre
+    SessionClient.regrouper_envois = lambda self: contextlib.nullcontext()
+
+
+class ClientBench:
+    def __init__(self, port: int, nom: str, historique: bool):
+        self.s = socket.create_connection(("127.0.0.1", port))
+        if not historique:
+            self.s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.historique = historique
+        self.lecteur = LecteurTrames(self.s, const.CLIENT)
+        self.nom = nom
+        self.envoyer(Message.creer_connexion(nom))
+        self.attendre(const.MSG_CONNEXION_OK)
+
+    def envoyer(self, message: Message) -> None:
+        if self.historique:
+            _envoyer_message_historique(self.s, message)
+        else:
+            Protocole.envoyer_message(self.s, message, const.CLIENT)
+
+    def attendre(self, type_message: str) -> Message:
+        return self.attendre_parmi(type_message)
+
+    def attendre_parmi(self, *types_message: str) -> Message:
+        while True:
+            message = Message.deserialiser(self.lecteur.lire_trame())
+            if message.type in types_message:
+                return message
+
+
+def jouer(port: int, tours: int, historique: bool) -> tuple[list[float], float]:
+    """ Joue `tours` tours PvP et retourne (latences en ms, segments TCP par tour). """
+    latences = []
+    segments = 0
+    fait = 0
+    partie = 0
+
+    while fait < tours:
+        a = ClientBench(port, f"a{partie}", historique)
+        b = ClientBench(port, f"b{partie}", historique)
+        a.envoyer(Message.creer_choix_mode(const.MODE_VS_JOUEUR))
+        a.attendre(const.MSG_ATTENTE_ADVERSAIRE)
+        b.envoyer(Message.creer_choix_mode(const.MODE_VS_JOUEUR))
+
+        # Un seul navire par joueur, en haut à gauche : les tirs visent le reste de la grille
+        positions = [{"nom": nom, "taille": taille, "x": 0, "y": i, "orientation": const.HORIZONTAL}
+                     for i, (nom, taille) in enumerate(const.NAVIRES)]
+        for c in (a, b):
+            c.attendre(const.MSG_ADVERSAIRE_TROUVE)
+            c.envoyer(Message.creer_placement_navires(positions))
+        for c in (a, b):
+            c.attendre(const.MSG_DEBUT_PARTIE)
+        a_commence = a.attendre_parmi(const.MSG_VOTRE_TOUR, const.MSG_TOUR_ADVERSAIRE).type == const.MSG_VOTRE_TOUR
+        b.attendre_parmi(const.MSG_VOTRE_TOUR, const.MSG_TOUR_ADVERSAIRE)
+        tireur, cible = (a, b) if a_commence else (b, a)
+
+        cases = [(x, y) for y in range(len(const.NAVIRES), const.TAILLE_GRILLE) for x in range(const.TAILLE_GRILLE)]
+        restantes = {a: list(cases), b: list(cases)}
+        while fait < tours and restantes[tireur]:
+            x, y = restantes[tireur].pop()
+            segments_avant = _segments_tcp_emis()
+            debut = time.perf_counter()
+            tireur.envoyer(Message.creer_tir(x, y))
+            tireur.attendre(const.MSG_TOUR_ADVERSAIRE)
+            cible.attendre(const.MSG_VOTRE_TOUR)
+            latences.append((time.perf_counter() - debut) * 1000)
+            segments += _segments_tcp_emis() - segments_avant
+            fait += 1
+            tireur, cible = cible, tireur
+
+        a.s.close()
+        b.s.close()
+        partie += 1
+
+    return latences, segments / max(fait, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tours", type=int, default=150)
+    parser.add_argument("--port", type=int, default=16655)
+    args = parser.parse_args()
+
+    resultats = []
+    for i, historique in enumerate((False, True)):
+        if historique:
+            activer_envoi_historique()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fichier = os.path.join(tempfile.mkdtemp(), const.FICHIER_SAUVEGARDE_UTILISATEURS)
+            ecouteur = EcouteurServeur(GestionnaireUtilisateur(fichier), GestionnairePartie(),
+                                       host="127.0.0.1", port=args.port + i)
+            ecouteur.daemon = True
+            ecouteur.start()
+            time.sleep(0.3)
+            latences, segments = jouer(args.port + i, args.tours, historique)
+        resultats.append(("historique" if historique else "regroupé", latences, segments))
+
+    print(f"{'envoi':<11} {'tours':>6} {'p50(ms)':>8} {'p99(ms)':>8} {'moy(ms)':>8} {'segments/tour':>14}")
+    for nom, latences, segments in resultats:
+        p99 = statistics.quantiles(latences, n=100)[98]
+        print(f"{nom:<11} {len(latences):>6} {statistics.median(latences):>8.2f} {p99:>8.2f} "
+              f"{statistics.fmean(latences):>8.2f} {segments:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark : opérations de Joueur selon le moteur de grille (MOTEUR_GRILLE).
+
+    * LISTE    : GrilleListe, listes de listes (représentation historique),
+    * OCTETS   : GrilleOctets, un bytearray (un octet par case),
+    * BITBOARD : GrilleBitboard, un entier par état de case.
+
+Opérations mesurées (flotte complète, grille TAILLE_GRILLE x TAILLE_GRILLE) :
+    * placement_valide         : test d'un emplacement tiré au hasard sur une flotte placée,
+    * placer_navires_aleatoire : placement de toute la flotte sur une grille vide,
+    * recevoir_tir             : une grille entière de tirs, en µs par tir,
+    * tous_navires_coules      : sur une flotte placée, à moitié touchée.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_grilles [--iterations 2000]
+"""
+import argparse
+import contextlib
+import copy
+import os
+import random
+import timeit
+
+from commun import constantes as const
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.navire import Navire
+
+FLOTTE_COMPLETE = [("Porte-avions", 5), ("Croiseur", 4), ("Contre-torpilleur", 3),
+                   ("Sous-marin", 3), ("Torpilleur", 2)]
+
+
+def joueur_place(graine: int) -> Joueur:
+    random.seed(graine)
+    joueur = Joueur("Arnauld")
+    joueur.placer_navires_aleatoire()
+    return joueur
+
+
+def mesurer(moteur: str, iterations: int) -> dict[str, float]:
+    """ µs par opération, pour chaque opération. """
+    const.MOTEUR_GRILLE = moteur
+    cases = [(x, y) for x in range(const.TAILLE_GRILLE) for y in range(const.TAILLE_GRILLE)]
+    random.seed(1)
+    random.shuffle(cases)
+    resultats = {}
+
+    place = joueur_place(graine=1)
+    essais = [(Navire("Croiseur", 4), random.randrange(const.TAILLE_GRILLE), random.randrange(const.TAILLE_GRILLE),
+               random.choice((const.HORIZONTAL, const.VERTICAL))) for _ in range(100)]
+    resultats["placement_valide"] = timeit.timeit(
+        lambda: [place.placement_valide(*essai) for essai in essais], number=iterations) / (iterations * len(essais))
+
+    resultats["placer_navires_aleatoire"] = timeit.timeit(
+        lambda: Joueur("Arnauld").placer_navires_aleatoire(), number=iterations) / iterations
+
+    # Copie du modèle à chaque fois : GrilleListe reprend les listes reçues sans les copier
+    def tirer_partout():
+        joueur = Joueur.from_dict(copy.deepcopy(modele))
+        for x, y in cases:
+            joueur.recevoir_tir(x, y)
+    modele = place.to_dict()
+    construction = timeit.timeit(lambda: Joueur.from_dict(copy.deepcopy(modele)), number=iterations) / iterations
+    resultats["recevoir_tir"] = (timeit.timeit(tirer_partout, number=iterations) / iterations
+                                 - construction) / len(cases)
+
+    moitie = joueur_place(graine=1)
+    for x, y in cases[:len(cases) // 2]:
+        moitie.recevoir_tir(x, y)
+    resultats["tous_navires_coules"] = timeit.timeit(moitie.tous_navires_coules, number=iterations * 10) / (iterations * 10)
+    return {operation: duree * 1e6 for operation, duree in resultats.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    const.NAVIRES = FLOTTE_COMPLETE
+
+    moteurs = (const.GRILLE_LISTE, const.GRILLE_OCTETS, const.GRILLE_BITBOARD)
+    with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+        mesures = {moteur: mesurer(moteur, args.iterations) for moteur in moteurs}
+
+    print(f"{'opération (µs)':<26}" + "".join(f" {moteur:>10}" for moteur in moteurs))
+    for operation in mesures[moteurs[0]]:
+        print(f"{operation:<26}" + "".join(f" {mesures[moteur][operation]:>10.2f}" for moteur in moteurs))
+
+
+if __name__ == '__main__':
+    main()
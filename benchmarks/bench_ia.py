@@ -0,0 +1,88 @@
+"""
+Benchmark : stratégies de tir de l'IA Solo (registre StrategieIa.classes()).
+
+    * ALEATOIRE    : une case pas encore visée au hasard (difficulté FACILE),
+    * CHASSE_CIBLE : au hasard, puis les voisines des touches (MOYENNE),
+    * PARITE       : chasse-cible, la chasse sur un damier (DIFFICILE),
+    * DENSITE      : carte de densité, avec NumPy si NumPy est installé (EXPERTE),
+    * python       : DENSITE sans NumPy (différences cumulées).
+
+--parties parties sont jouées par l'IA seule contre une flotte complète placée au
+hasard : tirs pour couler toute la flotte (moyenne, pire), et temps de chaque choix de
+tir (moyenne, 99e centile, pire) comparé au budget BUDGET_TIR_IA, avec la classe de
+coût déclarée par la stratégie.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_ia [--parties 200] [--taille 10]
+"""
+import argparse
+import contextlib
+import os
+import random
+import statistics
+import time
+
+from commun import constantes as const
+from commun.coeur_jeu import ia_densite
+from commun.coeur_jeu.configuration_partie import ConfigurationPartie
+from commun.coeur_jeu.ia_densite import IaDensite
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from commun.coeur_jeu.strategie_ia import StrategieIa
+
+FLOTTE_COMPLETE = (("Porte-avions", 5), ("Croiseur", 4), ("Contre-torpilleur", 3),
+                   ("Sous-marin", 3), ("Torpilleur", 2))
+
+
+def jouer(strategie: str, configuration: ConfigurationPartie, nb_parties: int) -> tuple[list[int], list[float]]:
+    """ (tirs par partie, secondes par choix de tir). """
+    random.seed(1)
+    nb_tirs = []
+    durees = []
+    for _ in range(nb_parties):
+        partie = Partie(Joueur("Arnauld", configuration=configuration),
+                        strategie_ia=const.IA_DENSITE if strategie == "python" else strategie)
+        partie.demarrer()
+        if strategie == "python":
+            partie._ia = IaDensite(partie.joueur1.configuration(), partie.joueur2.grille_suivi, vectorise=False)
+        tirs = 0
+        while not partie.est_terminee():
+            partie.est_tour_joueur1 = False
+            debut = time.perf_counter()
+            x, y = partie.choisir_tir_ia()
+            durees.append(time.perf_counter() - debut)
+            partie.traiter_tir(x, y)
+            tirs += 1
+        nb_tirs.append(tirs)
+    return nb_tirs, durees
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parties", type=int, default=200)
+    parser.add_argument("--taille", type=int, default=const.TAILLE_GRILLE)
+    args = parser.parse_args()
+    configuration = ConfigurationPartie(args.taille, FLOTTE_COMPLETE).valider()
+
+    classes = StrategieIa.classes()
+    strategies = list(classes) + ["python"]
+    if ia_densite.np is None:
+        strategies.remove("python")
+        print("NumPy n'est pas installé : DENSITE est mesurée sans NumPy.")
+
+    budget = const.BUDGET_TIR_IA * 1e3
+    print(f"grille {args.taille}x{args.taille}, budget : {budget:.1f} ms par tir")
+    print(f"{'stratégie':<13} {'coût':<9} {'tirs moy.':>9} {'tirs max':>9} {'ms moy.':>8} {'ms p99':>8} "
+          f"{'ms max':>8} {'budget':>7}")
+    for strategie in strategies:
+        with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+            nb_tirs, durees = jouer(strategie, configuration, args.parties)
+        durees_ms = sorted(duree * 1e3 for duree in durees)
+        p99 = durees_ms[int(len(durees_ms) * 0.99)]
+        respecte = "oui" if p99 <= budget else "non"
+        cout = classes.get(strategie, classes[const.IA_DENSITE]).COUT
+        print(f"{strategie:<13} {cout:<9} {statistics.mean(nb_tirs):>9.1f} {max(nb_tirs):>9} "
+              f"{statistics.mean(durees_ms):>8.3f} {p99:>8.3f} {durees_ms[-1]:>8.3f} {respecte:>7}")
+
+if __name__ == '__main__':
+    main()
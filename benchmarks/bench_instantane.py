@@ -0,0 +1,116 @@
+"""
+Benchmark : taille et temps d'encodage / décodage des parties et joueurs, JSON contre
+instantané binaire (Instantane).
+
+    * partie  : Partie.to_dict + json.dumps / json.loads + Partie.from_dict (JSON),
+                Partie.to_dict + encoder_partie / decoder_partie + Partie.from_dict
+                (instantané) — sauvegardes (DepotParties, blobs SQLite),
+    * reprise : message PARTIE_REPRISE sérialisé, données du joueur en dictionnaire
+                (joueur_etat) ou en instantané base64 (joueur_instantane).
+
+Les parties sont mesurées à trois moments : juste placée, après la moitié des tirs,
+terminée. La flotte est la flotte complète (--flotte complete, 5 navires) ou celle
+de constantes.NAVIRES (--flotte constantes).
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_instantane [--iterations 20000] [--flotte complete]
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import timeit
+
+from commun import constantes as const
+from commun.coeur_jeu.instantane import Instantane
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from commun.reseau.message import Message
+
+FLOTTE_COMPLETE = [("Porte-avions", 5), ("Croiseur", 4), ("Contre-torpilleur", 3),
+                   ("Sous-marin", 3), ("Torpilleur", 2)]
+
+
+def parties(graine: int) -> dict[str, Partie]:
+    """ Une même partie (joueur contre IA) à trois moments. """
+    random.seed(graine)
+    instantanes = {}
+    partie = Partie(Joueur("Arnauld"), Joueur(const.NOM_SERVEUR))
+    partie.demarrer()
+    instantanes["placée"] = Partie.from_dict(partie.to_dict())
+
+    cases = {nom: [(x, y) for x in range(const.TAILLE_GRILLE) for y in range(const.TAILLE_GRILLE)]
+             for nom in (partie.joueur1.nom, partie.joueur2.nom)}
+    for liste in cases.values():
+        random.shuffle(liste)
+    nb_tirs = 0
+    while not partie.est_terminee():
+        tireur = partie.joueur1 if partie.est_tour_joueur1 else partie.joueur2
+        partie.traiter_tir(*cases[tireur.nom].pop())
+        nb_tirs += 1
+        if nb_tirs == const.TAILLE_GRILLE ** 2 // 2:
+            instantanes["mi-partie"] = Partie.from_dict(partie.to_dict())
+    instantanes.setdefault("mi-partie", Partie.from_dict(partie.to_dict()))
+    instantanes["terminée"] = partie
+    return instantanes
+
+
+def mesurer(encoder, decoder, iterations: int) -> tuple[int, float, float]:
+    """ (octets, encodage en µs, décodage en µs). """
+    data = encoder()
+    t_enc = timeit.timeit(encoder, number=iterations) / iterations * 1e6
+    t_dec = timeit.timeit(lambda: decoder(data), number=iterations) / iterations * 1e6
+    return len(data), t_enc, t_dec
+
+
+def message_reprise(joueur: Joueur, instantane: bool) -> Message:
+    donnees = {"est_mon_tour": True, "nom_adversaire": const.NOM_SERVEUR}
+    if instantane:
+        donnees["joueur_instantane"] = Instantane.en_texte(Instantane.encoder_joueur(joueur.to_dict()))
+    else:
+        donnees["joueur_etat"] = joueur.to_dict()
+    return Message.creer_message_reprise(donnees)
+
+
+def joueur_reprise(data: bytes) -> Joueur:
+    message = Message.deserialiser(data)
+    instantane = message.obtenir_donnee("joueur_instantane")
+    if instantane:
+        return Joueur.from_dict(Instantane.decoder_joueur(Instantane.depuis_texte(instantane)))
+    return Joueur.from_dict(message.obtenir_donnee("joueur_etat"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--flotte", choices=("complete", "constantes"), default="complete")
+    args = parser.parse_args()
+    if args.flotte == "complete":
+        const.NAVIRES = FLOTTE_COMPLETE
+
+    with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+        moments = parties(graine=1)
+
+    formats = {
+        "JSON": (lambda p: json.dumps(p.to_dict(), separators=(',', ':')).encode(const.ENCODAGE),
+                 lambda data: Partie.from_dict(json.loads(data))),
+        "instantané": (lambda p: Instantane.encoder_partie(p.to_dict()),
+                       lambda data: Partie.from_dict(Instantane.decoder_partie(data))),
+    }
+    print(f"{'partie':<10} {'format':<11} {'octets':>7} {'encodage(µs)':>13} {'décodage(µs)':>13}")
+    for moment, partie in moments.items():
+        for nom_format, (encoder, decoder) in formats.items():
+            taille, t_enc, t_dec = mesurer(lambda: encoder(partie), decoder, args.iterations)
+            print(f"{moment:<10} {nom_format:<11} {taille:>7} {t_enc:>13.1f} {t_dec:>13.1f}")
+
+    print(f"\n{'reprise':<10} {'format':<11} {'octets':>7} {'encodage(µs)':>13} {'décodage(µs)':>13}")
+    for moment, partie in moments.items():
+        for nom_format, instantane in (("JSON", False), ("instantané", True)):
+            taille, t_enc, t_dec = mesurer(lambda: message_reprise(partie.joueur1, instantane).serialiser(),
+                                           joueur_reprise, args.iterations)
+            print(f"{moment:<10} {nom_format:<11} {taille:>7} {t_enc:>13.1f} {t_dec:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
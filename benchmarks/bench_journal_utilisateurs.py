@@ -0,0 +1,108 @@
+"""
+Benchmark : débit d'inscription de GestionnaireUtilisateur selon le nombre d'utilisateurs.
+
+    * historique : réécriture complète du fichier JSON (indent=4) à chaque modification,
+    * journal    : un enregistrement d'une ligne ajouté au journal, compaction en arrière-plan.
+
+Pour chaque taille de base (--tailles), la base est pré-remplie puis on mesure le débit
+d'inscriptions supplémentaires. Pour le journal, on mesure aussi le démarrage
+(instantané + rejeu d'un journal de SEUIL_COMPACTION_JOURNAL enregistrements) et la
+durée d'une compaction complète.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_journal_utilisateurs [--tailles 10000 100000 1000000]
+"""
+import argparse
+import contextlib
+import json
+import os
+import tempfile
+import time
+from typing import Any
+
+from commun import constantes as const
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+
+BUDGET_HISTORIQUE = 5.0  # s maximum de mesure par taille pour l'historique
+
+
+class GestionnaireUtilisateurHistorique(GestionnaireUtilisateur):
+    """ Ancienne persistance : tout le fichier est réécrit à chaque modification. """
+
+    def _charger_donnees(self) -> dict[str, Any]:
+        with open(self.chemin_fichier, 'r', encoding=const.ENCODAGE) as f:
+            return json.load(f)
+
+    def _utilisateur_enregistre(self, nom: str, mdp_hash: str) -> None:
+        self.data["utilisateurs"][nom] = {"mdp_hash": mdp_hash}
+        with open(self.chemin_fichier, 'w', encoding=const.ENCODAGE) as f:
+            json.dump(self.data, f, indent=4)
+
+    def _ecrire_modifications(self, lot: list[tuple[str, str, Any]], blobs: list[bytes | None]) -> list[int]:
+        return [1] * len(lot)  # Déjà écrites par _utilisateur_enregistre
+
+
+def preparer_base(taille: int, indent: int | None) -> str:
+    """ Écrit une base de `taille` utilisateurs et retourne le chemin du fichier. """
+    mdp_hash = GestionnaireUtilisateur._crypter_mdp("motdepasse")
+    donnees = {"utilisateurs": {f"u{i}": {"mdp_hash": mdp_hash}
+                                for i in range(taille)}}
+    chemin = os.path.join(tempfile.mkdtemp(), const.FICHIER_SAUVEGARDE_UTILISATEURS)
+    with open(chemin, 'w', encoding=const.ENCODAGE) as f:
+        json.dump(donnees, f, indent=indent)
+    return chemin
+
+
+def debit_inscriptions(gestionnaire: GestionnaireUtilisateur, nb_max: int, budget: float) -> float:
+    """ Inscriptions par seconde (au plus nb_max inscriptions, ou jusqu'à épuisement du budget). """
+    debut = time.perf_counter()
+    nb = 0
+    while nb < nb_max:
+        gestionnaire.enregistrer_utilisateur(f"nouveau{nb}", "motdepasse")
+        nb += 1
+        if time.perf_counter() - debut > budget:
+            break
+    return nb / (time.perf_counter() - debut)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tailles", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--inscriptions", type=int, default=20000, help="inscriptions mesurées (journal)")
+    args = parser.parse_args()
+
+    print(f"{'utilisateurs':>12} {'historique(insc/s)':>19} {'journal(insc/s)':>16} "
+          f"{'démarrage(s)':>13} {'compaction(s)':>14}")
+    for taille in args.tailles:
+        with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+            chemin = preparer_base(taille, indent=4)
+            historique = GestionnaireUtilisateurHistorique(chemin)
+            debit_historique = debit_inscriptions(historique, args.inscriptions, BUDGET_HISTORIQUE)
+            historique.ecrivain.stop()
+            del historique
+
+            chemin = preparer_base(taille, indent=None)
+            journal = GestionnaireUtilisateur(chemin)
+            debit_journal = debit_inscriptions(journal, args.inscriptions, float("inf"))
+            journal.ecrivain.vider()
+            journal.journal.attendre_compaction()
+
+            # Démarrage avec un journal plein à rejouer
+            for i in range(const.SEUIL_COMPACTION_JOURNAL - journal.journal.nb_enregistrements - 1):
+                journal.enregistrer_utilisateur(f"rejeu{i}", "motdepasse")
+            journal.ecrivain.stop()
+            journal.journal.fermer()
+            debut = time.perf_counter()
+            journal = GestionnaireUtilisateur(chemin)
+            demarrage = time.perf_counter() - debut
+
+            debut = time.perf_counter()
+            journal.fermer()
+            compaction = time.perf_counter() - debut
+            del journal
+
+        print(f"{taille:>12} {debit_historique:>19,.1f} {debit_journal:>16,.0f} {demarrage:>13.2f} {compaction:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark : réception des trames avec l'ancien Protocole.recevoir_message
+(`data += paquet`, un recv par entête) contre LecteurTrames (tampon réutilisé,
+recv_into, découpage des trames reçues ensemble).
+
+Le message mesuré est un PARTIE_REPRISE construit à partir d'une vraie Partie.
+On compte les appels système de lecture et les octets recopiés en espace
+utilisateur (hors copie noyau -> utilisateur, identique dans les deux cas).
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_lecteur_trames [--messages 2000]
+"""
+import argparse
+import contextlib
+import io
+import socket
+import threading
+import time
+
+from commun import constantes as const
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from commun.reseau.message import Message
+from commun.reseau.protocole import Protocole, LecteurTrames
+
+
+class SocketCompteur:
+    """ Enveloppe un socket et compte les appels de lecture. """
+
+    def __init__(self, s: socket.socket):
+        self.s = s
+        self.nb_appels_recv = 0
+
+    def recv(self, n: int) -> bytes:
+        self.nb_appels_recv += 1
+        return self.s.recv(n)
+
+    def recv_into(self, tampon, n: int = 0) -> int:
+        self.nb_appels_recv += 1
+        return self.s.recv_into(tampon, n)
+
+
+def recevoir_message_historique(socket_actif, compteur: list[int]) -> bytes | None:
+    """ Copie de l'ancienne implémentation, instrumentée (compteur[0] = octets copiés). """
+    taille_data = socket_actif.recv(const.TAILLE_ENTETE)
+    if not taille_data:
+        return None
+    taille = int.from_bytes(taille_data, byteorder='big')
+    data = b''
+    bytes_recus = 0
+    while bytes_recus < taille:
+        paquet = socket_actif.recv(taille - bytes_recus)
+        if not paquet:
+            return None
+        data += paquet
+        compteur[0] += len(data)
+        bytes_recus += len(paquet)
+    return data
+
+
+def message_reprise() -> Message:
+    with contextlib.redirect_stdout(io.StringIO()):
+        partie = Partie(Joueur("Arnauld"))
+        partie.demarrer()
+    for x in range(const.TAILLE_GRILLE):
+        partie.traiter_tir(x, x)
+    return Message.creer_message_reprise({
+        "joueur_etat": partie.joueur1.to_dict(),
+        "est_mon_tour": True,
+        "nom_adversaire": const.NOM_SERVEUR
+    })
+
+
+def _emettre(s: socket.socket, trame: bytes, nombre: int, par_envoi: int) -> None:
+    lot = trame * par_envoi
+    for _ in range(nombre // par_envoi):
+        s.sendall(lot)
+    s.shutdown(socket.SHUT_WR)
+
+
+def mesurer(lecteur_neuf: bool, trame: bytes, nombre: int, par_envoi: int) -> dict:
+    emetteur, recepteur = socket.socketpair()
+    thread = threading.Thread(target=_emettre, args=(emetteur, trame, nombre, par_envoi))
+    compteur_socket = SocketCompteur(recepteur)
+    copies = [0]
+    recus = 0
+
+    debut = time.perf_counter()
+    thread.start()
+    if lecteur_neuf:
+        lecteur = LecteurTrames(compteur_socket, const.CLIENT)
+        while (vue := lecteur.lire_trame()) is not None:
+            Message.deserialiser(vue)
+            recus += 1
+        copies[0] = lecteur.octets_copies
+    else:
+        while (data := recevoir_message_historique(compteur_socket, copies)) is not None:
+            Message.deserialiser(data)
+            recus += 1
+    duree = time.perf_counter() - debut
+    thread.join()
+    emetteur.close()
+    recepteur.close()
+
+    return {
+        "recus": recus,
+        "recv_par_msg": compteur_socket.nb_appels_recv / max(recus, 1),
+        "copies_par_msg": copies[0] / max(recus, 1),
+        "us_par_msg": duree / max(recus, 1) * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=2000)
+    args = parser.parse_args()
+
+    trame = Protocole.encadrer(message_reprise())
+    print(f"Trame PARTIE_REPRISE : {len(trame)} octets")
+    print(f"{'lecteur':<12} {'trames/envoi':>12} {'recv/msg':>9} {'octets copiés/msg':>18} {'µs/msg':>8}")
+    for par_envoi in (1, 8):
+        for nom, neuf in (("historique", False), ("LecteurTrames", True)):
+            r = mesurer(neuf, trame, args.messages, par_envoi)
+            print(f"{nom:<12} {par_envoi:>12} {r['recv_par_msg']:>9.2f} {r['copies_par_msg']:>18.0f} {r['us_par_msg']:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
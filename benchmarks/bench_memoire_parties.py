@@ -0,0 +1,101 @@
+"""
+Benchmark : mémoire occupée par les parties actives, en octets par partie.
+
+--parties parties PvP (flotte complète, placées, --tirs tirs joués) sont créées comme
+par GestionnairePartie.demarrer_partie_pvp et gardées dans parties_actives. tracemalloc
+mesure la mémoire allouée pour elles (identifiant, Partie, Joueur, grilles, navires et
+index), pour chaque moteur de grille (MOTEUR_GRILLE), et la compare au budget
+BUDGET_MEMOIRE_PARTIE.
+
+Les placements sont tirés d'un petit nombre de flottes placées à l'avance
+(placer_navires_depuis_positions), pour ne pas mesurer surtout le placement aléatoire.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_memoire_parties [--parties 1000 10000 100000] [--tirs 30]
+"""
+import argparse
+import contextlib
+import gc
+import os
+import random
+import time
+import tracemalloc
+import uuid
+
+from commun import constantes as const
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from serveur.logique_jeu.gestionnaire_partie import GestionnairePartie
+
+FLOTTE_COMPLETE = [("Porte-avions", 5), ("Croiseur", 4), ("Contre-torpilleur", 3),
+                   ("Sous-marin", 3), ("Torpilleur", 2)]
+NB_FLOTTES = 64
+
+
+def flottes(graine: int) -> list[list[dict]]:
+    random.seed(graine)
+    positions = []
+    for _ in range(NB_FLOTTES):
+        joueur = Joueur("modele")
+        joueur.placer_navires_aleatoire()
+        positions.append(joueur.obtenir_positions_navires())
+    return positions
+
+
+def remplir(gestionnaire: GestionnairePartie, nb_parties: int, nb_tirs: int, positions: list[list[dict]]) -> None:
+    cases = [(x, y) for x in range(const.TAILLE_GRILLE) for y in range(const.TAILLE_GRILLE)]
+    for i in range(nb_parties):
+        joueur1 = Joueur(f"joueur{2 * i}")
+        joueur2 = Joueur(f"joueur{2 * i + 1}")
+        joueur1.placer_navires_depuis_positions(random.choice(positions))
+        joueur2.placer_navires_depuis_positions(random.choice(positions))
+        partie = Partie(joueur1, joueur2)
+        partie.demarrer()
+        for x, y in random.sample(cases, nb_tirs):
+            if partie.traiter_tir(x, y)[2]:
+                break
+        gestionnaire.parties_actives[str(uuid.uuid4())] = partie
+
+
+def mesurer(moteur: str, nb_parties: int, nb_tirs: int, positions: list[list[dict]]) -> tuple[float, float]:
+    """ (octets par partie, secondes de création). """
+    const.MOTEUR_GRILLE = moteur
+    gestionnaire = GestionnairePartie()
+    gc.collect()
+    tracemalloc.start()
+    avant = tracemalloc.get_traced_memory()[0]
+    debut = time.perf_counter()
+    remplir(gestionnaire, nb_parties, nb_tirs, positions)
+    duree = time.perf_counter() - debut
+    gc.collect()
+    apres = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    gestionnaire.executeur.shutdown()
+    return (apres - avant) / nb_parties, duree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parties", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--tirs", type=int, default=30)
+    parser.add_argument("--moteurs", nargs="+", default=[const.GRILLE_LISTE, const.GRILLE_OCTETS, const.GRILLE_BITBOARD])
+    args = parser.parse_args()
+    const.NAVIRES = FLOTTE_COMPLETE
+
+    with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+        positions = flottes(graine=1)
+
+    print(f"budget : {const.BUDGET_MEMOIRE_PARTIE} octets par partie (moteur par défaut : {const.MOTEUR_GRILLE})")
+    print(f"{'parties':>8} {'moteur':<9} {'octets/partie':>14} {'total(Mo)':>10} {'création(s)':>12} {'budget':>7}")
+    for nb_parties in args.parties:
+        for moteur in args.moteurs:
+            random.seed(nb_parties)
+            with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+                par_partie, duree = mesurer(moteur, nb_parties, args.tirs, positions)
+            respecte = "oui" if par_partie <= const.BUDGET_MEMOIRE_PARTIE else "non"
+            print(f"{nb_parties:>8} {moteur:<9} {par_partie:>14.0f} {par_partie * nb_parties / 1e6:>10.1f} "
+                  f"{duree:>12.2f} {respecte:>7}")
+
+
+if __name__ == '__main__':
+    main()
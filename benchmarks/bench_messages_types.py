@@ -0,0 +1,119 @@
+"""
+Benchmark : messages typés (classes générées depuis schemas.SCHEMAS, avec __slots__)
+contre le modèle historique (Message générique + dictionnaire + chaîne if/elif).
+
+    * débit de réception : désérialisation puis aiguillage vers le traitement,
+    * mémoire : octets alloués (tracemalloc) par message décodé et conservé.
+
+Le chemin historique est reproduit ici (json.loads -> Message(type, dict) -> if/elif
+avec lectures dans le dictionnaire) pour servir de référence.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_messages_types [--messages 200000]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from commun import constantes as const
+from commun.reseau.message import Message
+
+
+def flux_partie(nb_messages: int) -> list[Message]:
+    """ Flux représentatif reçu par un client pendant une partie. """
+    cycle = [
+        Message.creer_reponse_tir(const.TIR_RATE, 3, 4),
+        Message.creer_reponse_tir_recu(const.TIR_TOUCHE, 5, 6, "Arnauld"),
+        Message.creer_votre_tour(),
+        Message.creer_reponse_tir(const.TIR_COULE, 7, 1, "Torpilleur"),
+        Message.creer_tour_adversaire(),
+        Message.creer_tir(2, 9),
+    ]
+    return [cycle[i % len(cycle)] for i in range(nb_messages)]
+
+
+# --- Chemin historique ---
+
+def deserialiser_historique(data: bytes) -> Message:
+    message_dict = json.loads(str(data, const.ENCODAGE))
+    return Message(message_dict["type"], message_dict.get("donnees", {}))
+
+
+def traiter_historique(message: Message, compteur: list[int]) -> None:
+    if message.type == const.MSG_TIR:
+        compteur[0] += message.donnees["x"] + message.donnees["y"]
+    elif message.type == const.MSG_CHAT:
+        compteur[0] += 1
+    elif message.type == const.MSG_VOTRE_TOUR:
+        compteur[0] += 1
+    elif message.type == const.MSG_TOUR_ADVERSAIRE:
+        compteur[0] += 1
+    elif message.type == const.MSG_REPONSE_TIR:
+        compteur[0] += message.obtenir_donnee("x") + message.obtenir_donnee("y")
+    elif message.type == const.MSG_REPONSE_TIR_RECU:
+        compteur[0] += message.obtenir_donnee("x") + message.obtenir_donnee("y")
+
+
+# --- Chemin typé ---
+
+def _sur_coordonnees(message: Message, compteur: list[int]) -> None:
+    compteur[0] += message.x + message.y
+
+
+def _sur_tour(message: Message, compteur: list[int]) -> None:
+    compteur[0] += 1
+
+
+AIGUILLAGE = {
+    const.MSG_TIR: _sur_coordonnees,
+    const.MSG_CHAT: _sur_tour,
+    const.MSG_VOTRE_TOUR: _sur_tour,
+    const.MSG_TOUR_ADVERSAIRE: _sur_tour,
+    const.MSG_REPONSE_TIR: _sur_coordonnees,
+    const.MSG_REPONSE_TIR_RECU: _sur_coordonnees,
+}
+
+
+def traiter_type(message: Message, compteur: list[int]) -> None:
+    traitement = AIGUILLAGE.get(message.type)
+    if traitement is not None:
+        traitement(message, compteur)
+
+
+def mesurer(nom: str, trames: list[bytes], deserialiser, traiter) -> None:
+    compteur = [0]
+    debut = time.perf_counter()
+    for data in trames:
+        traiter(deserialiser(data), compteur)
+    duree = time.perf_counter() - debut
+
+    # Mémoire conservée par message décodé (hors trames d'entrée)
+    echantillon = trames[:20_000]
+    tracemalloc.start()
+    avant, _ = tracemalloc.get_traced_memory()
+    conserves = [deserialiser(data) for data in echantillon]
+    apres, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    octets = (apres - avant) / len(conserves)
+
+    print(f"{nom:<22} {len(trames) / duree:>12,.0f} {duree / len(trames) * 1e9:>10.0f} {octets:>12.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200_000)
+    args = parser.parse_args()
+
+    flux = flux_partie(args.messages)
+    trames_json = [m.serialiser(const.CODEC_JSON) for m in flux]
+    trames_binaires = [m.serialiser(const.CODEC_BINAIRE) for m in flux]
+
+    print(f"{'chemin':<22} {'messages/s':>12} {'ns/msg':>10} {'octets/msg':>12}")
+    mesurer("historique (JSON)", trames_json, deserialiser_historique, traiter_historique)
+    mesurer("typé (JSON)", trames_json, Message.deserialiser, traiter_type)
+    mesurer("typé (binaire)", trames_binaires, Message.deserialiser, traiter_type)
+
+
+if __name__ == "__main__":
+    main()
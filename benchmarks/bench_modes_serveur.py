@@ -0,0 +1,194 @@
+"""
+Benchmark : serveur de jeu en mode "thread par client" contre le mode asyncio.
+
+Pour chaque mode et chaque palier (1k / 5k / 20k clients simulés), le serveur est
+lancé dans un processus séparé. Le client de bench ouvre toutes les connexions depuis
+un seul thread (selectors), envoie MSG_CONNEXION et attend CONNEXION_OK, puis laisse
+les connexions inactives et mesure :
+    * le temps pour que tous les clients soient acceptés,
+    * la mémoire résidente et le nombre de threads du serveur,
+    * la latence d'une nouvelle connexion pendant que les autres sont inactives.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_modes_serveur [--paliers 1000 5000 20000] [--delai-max 120]
+"""
+import argparse
+import os
+import resource
+import selectors
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from commun import constantes as const
+from commun.reseau.message import Message
+from commun.reseau.protocole import Protocole
+
+
+def _augmenter_limite_fichiers() -> None:
+    """ Relève la limite de descripteurs ouverts au maximum autorisé. """
+    _, maximum = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (maximum, maximum))
+
+
+def lancer_serveur(mode: str, port: int) -> None:
+    """ Point d'entrée du processus serveur (voir --serveur). """
+    from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+    from serveur.logique_jeu.gestionnaire_partie import GestionnairePartie
+    from serveur.reseau.ecouteur_serveur import EcouteurServeur
+    from serveur.reseau.ecouteur_serveur_asyncio import EcouteurServeurAsyncio
+
+    _augmenter_limite_fichiers()
+    fichier = os.path.join(tempfile.mkdtemp(), const.FICHIER_SAUVEGARDE_UTILISATEURS)
+    classe = EcouteurServeurAsyncio if mode == const.MODE_RESEAU_ASYNCIO else EcouteurServeur
+
+    ecouteur = classe(GestionnaireUtilisateur(fichier), GestionnairePartie(), host="127.0.0.1", port=port)
+    ecouteur.daemon = True
+    ecouteur.start()
+
+    # Le processus parent ferme stdin pour demander l'arrêt
+    sys.stdin.read()
+
+
+def _lire_proc_status(pid: int) -> tuple[int, int]:
+    """ Retourne (VmRSS en Ko, nombre de threads) d'un processus. """
+    rss, threads = 0, 0
+    with open(f"/proc/{pid}/status") as f:
+        for ligne in f:
+            if ligne.startswith("VmRSS:"):
+                rss = int(ligne.split()[1])
+            elif ligne.startswith("Threads:"):
+                threads = int(ligne.split()[1])
+    return rss, threads
+
+
+def _attendre_serveur(port: int, delai: float = 10.0) -> None:
+    fin = time.monotonic() + delai
+    while time.monotonic() < fin:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("Le serveur n'a pas démarré.")
+
+
+def ouvrir_clients(port: int, nombre: int, delai_max: float) -> tuple[list[socket.socket], int, float]:
+    """
+    Ouvre `nombre` connexions, envoie MSG_CONNEXION sur chacune et attend CONNEXION_OK.
+
+    Returns:
+        (sockets, nombre de clients acceptés, durée en secondes)
+    """
+    selecteur = selectors.DefaultSelector()
+    sockets = []
+    acceptes = 0
+    debut = time.perf_counter()
+
+    for i in range(nombre):
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setblocking(False)
+        s.connect_ex(("127.0.0.1", port))
+        selecteur.register(s, selectors.EVENT_WRITE, f"bench{i}")
+        sockets.append(s)
+
+    en_cours = nombre
+    fin = time.monotonic() + delai_max
+    while en_cours and time.monotonic() < fin:
+        for cle, evenement in selecteur.select(timeout=0.5):
+            s = cle.fileobj
+            if evenement & selectors.EVENT_WRITE:
+                if s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+                    selecteur.unregister(s)
+                    en_cours -= 1
+                    continue
+                s.send(Protocole.encadrer(Message.creer_connexion(cle.data)))
+                selecteur.modify(s, selectors.EVENT_READ, cle.data)
+            else:
+                try:
+                    recu = s.recv(4096)
+                except OSError:
+                    recu = b""
+                if recu:
+                    acceptes += 1
+                selecteur.unregister(s)
+                en_cours -= 1
+
+    selecteur.close()
+    return sockets, acceptes, time.perf_counter() - debut
+
+
+def mesurer_latence(port: int, echantillons: int = 50) -> list[float]:
+    """ Latence (ms) connexion -> CONNEXION_OK d'un nouveau client. """
+    latences = []
+    for i in range(echantillons):
+        debut = time.perf_counter()
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=5) as s:
+                Protocole.envoyer_message(s, Message.creer_connexion(f"sonde{i}"), const.CLIENT)
+                if Protocole.recevoir_message(s, const.CLIENT) is None:
+                    continue
+        except OSError:
+            continue
+        latences.append((time.perf_counter() - debut) * 1000)
+    return latences
+
+
+def executer_palier(mode: str, nombre: int, port: int, delai_max: float) -> dict:
+    processus = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.bench_modes_serveur", "--serveur", mode, str(port)],
+        stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        _attendre_serveur(port)
+        sockets, acceptes, duree = ouvrir_clients(port, nombre, delai_max)
+        time.sleep(1)
+        rss, threads = _lire_proc_status(processus.pid)
+        latences = mesurer_latence(port)
+        for s in sockets:
+            s.close()
+    finally:
+        processus.stdin.close()
+        processus.kill()
+        processus.wait()
+
+    return {
+        "mode": mode,
+        "clients": nombre,
+        "acceptes": acceptes,
+        "duree_s": duree,
+        "rss_mo": rss / 1024,
+        "threads": threads,
+        "latence_p50_ms": statistics.median(latences) if latences else float("nan"),
+        "latence_max_ms": max(latences) if latences else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--serveur", nargs=2, metavar=("MODE", "PORT"), help=argparse.SUPPRESS)
+    parser.add_argument("--paliers", nargs="+", type=int, default=[1000, 5000, 20000])
+    parser.add_argument("--modes", nargs="+", default=[const.MODE_RESEAU_THREADS, const.MODE_RESEAU_ASYNCIO])
+    parser.add_argument("--delai-max", type=float, default=120.0,
+                        help="Durée maximale (s) accordée à chaque palier pour accepter tous les clients")
+    parser.add_argument("--port", type=int, default=16555)
+    args = parser.parse_args()
+
+    if args.serveur:
+        lancer_serveur(args.serveur[0].upper(), int(args.serveur[1]))
+        return
+
+    _augmenter_limite_fichiers()
+    print(f"{'mode':<8} {'clients':>8} {'acceptés':>9} {'durée(s)':>9} {'RSS(Mo)':>8} {'threads':>8} {'p50(ms)':>8} {'max(ms)':>8}")
+    for nombre in args.paliers:
+        for i, mode in enumerate(args.modes):
+            r = executer_palier(mode.upper(), nombre, args.port + i, args.delai_max)
+            print(f"{r['mode']:<8} {r['clients']:>8} {r['acceptes']:>9} {r['duree_s']:>9.2f} {r['rss_mo']:>8.1f} "
+                  f"{r['threads']:>8} {r['latence_p50_ms']:>8.2f} {r['latence_max_ms']:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
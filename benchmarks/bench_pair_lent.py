@@ -0,0 +1,140 @@
+"""
+Benchmark : un pair PvP qui ne lit plus son socket bloque-t-il son adversaire ?
+
+Le joueur B arrête de lire dès le début de la partie. Le joueur A (qui a la main)
+lui envoie un flot de messages de chat, relayés par le serveur sur le socket de B,
+puis tire. On mesure la durée du flot côté A et la latence de son REPONSE_TIR :
+
+    * historique   : écriture directe sur le socket de B depuis le thread de A,
+    * IGNORER_CHAT : file d'envoi par connexion, le chat en trop est abandonné,
+    * DECONNECTER  : file d'envoi par connexion, B est déconnecté à la saturation,
+    * asyncio      : mode asyncio, tampon du transport borné.
+
+La profondeur maximale est en lots de messages (mode thread) ou en octets (asyncio).
+Le temps bloqué est celui des écritures sur les sockets des clients : dans le thread
+de A (historique), dans les threads écrivains (files d'envoi), ou le temps passé par
+le tampon du transport au-dessus de sa limite haute (asyncio).
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_pair_lent [--messages 20000] [--taille 2048]
+"""
+import argparse
+import contextlib
+import io
+import os
+import socket
+import tempfile
+import time
+
+from benchmarks.bench_envoi_regroupe import ClientBench
+from commun import constantes as const
+from commun.reseau.message import Message
+from commun.reseau.protocole import Protocole
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from serveur.logique_jeu.gestionnaire_partie import GestionnairePartie
+from serveur.reseau.ecouteur_serveur import EcouteurServeur
+from serveur.reseau.ecouteur_serveur_asyncio import EcouteurServeurAsyncio
+from serveur.reseau.gestionnaire_client import GestionnaireClient
+
+DELAI_ABANDON = 5.0  # s : au-delà, A est considéré comme bloqué
+
+
+def emettre_historique(self, messages):
+    """ Écriture directe, dans le thread appelant, sur le socket du destinataire. """
+    self._debut_envoi = time.perf_counter()
+    envoye = Protocole.envoyer_messages(self.socket_client, messages, const.SERVEUR, self.codec)
+    self.temps_bloque_envoi += time.perf_counter() - self._debut_envoi
+    self._debut_envoi = None
+    return envoye
+
+
+def preparer_partie(port: int) -> tuple[ClientBench, ClientBench]:
+    """ Lance une partie PvP et retourne (joueur qui a la main, adversaire). """
+    a = ClientBench(port, "a", False)
+    b = ClientBench(port, "b", False)
+    a.envoyer(Message.creer_choix_mode(const.MODE_VS_JOUEUR))
+    a.attendre(const.MSG_ATTENTE_ADVERSAIRE)
+    b.envoyer(Message.creer_choix_mode(const.MODE_VS_JOUEUR))
+
+    positions = [{"nom": nom, "taille": taille, "x": 0, "y": i, "orientation": const.HORIZONTAL}
+                 for i, (nom, taille) in enumerate(const.NAVIRES)]
+    for c in (a, b):
+        c.attendre(const.MSG_ADVERSAIRE_TROUVE)
+        c.envoyer(Message.creer_placement_navires(positions))
+    a_commence = a.attendre_parmi(const.MSG_VOTRE_TOUR, const.MSG_TOUR_ADVERSAIRE).type == const.MSG_VOTRE_TOUR
+    b.attendre_parmi(const.MSG_VOTRE_TOUR, const.MSG_TOUR_ADVERSAIRE)
+    return (a, b) if a_commence else (b, a)
+
+
+def scenario(ecouteur, port: int, nb_messages: int, taille: int) -> tuple[str, str, dict]:
+    """ Retourne (durée du flot, latence du tir, statistiques d'envoi du serveur). """
+    tireur, lent = preparer_partie(port)
+    tireur.s.settimeout(DELAI_ABANDON)
+    texte = "x" * taille
+
+    try:
+        debut = time.perf_counter()
+        for _ in range(nb_messages):
+            if not Protocole.envoyer_message(tireur.s, Message.creer_chat(texte), const.CLIENT):
+                raise socket.timeout()
+        duree_flot = f"{(time.perf_counter() - debut) * 1000:.0f} ms"
+
+        debut = time.perf_counter()
+        tireur.envoyer(Message.creer_tir(const.TAILLE_GRILLE - 1, const.TAILLE_GRILLE - 1))
+        while True:
+            data = tireur.lecteur.lire_trame()
+            if data is None:
+                raise socket.timeout()  # Délai dépassé ou connexion perdue
+            if Message.deserialiser(data).type == const.MSG_REPONSE_TIR:
+                break
+        latence = f"{(time.perf_counter() - debut) * 1000:.1f} ms"
+    except (socket.timeout, OSError):
+        duree_flot = locals().get("duree_flot", "bloqué")
+        latence = "bloqué"
+
+    stats = ecouteur.statistiques_envoi()
+    tireur.s.close()
+    lent.s.close()
+    return duree_flot, latence, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--taille", type=int, default=2048, help="octets par message de chat")
+    parser.add_argument("--port", type=int, default=16755)
+    args = parser.parse_args()
+
+    configurations = [
+        ("historique", EcouteurServeur, None),
+        (const.DEBORDEMENT_IGNORER_CHAT, EcouteurServeur, const.DEBORDEMENT_IGNORER_CHAT),
+        (const.DEBORDEMENT_DECONNECTER, EcouteurServeur, const.DEBORDEMENT_DECONNECTER),
+        ("asyncio", EcouteurServeurAsyncio, const.DEBORDEMENT_IGNORER_CHAT),
+    ]
+    emettre_file = GestionnaireClient._emettre
+
+    print(f"{'configuration':<14} {'flot de A':>10} {'tir de A':>10} {'prof. max':>10} "
+          f"{'bloqué(s)':>10} {'ignorés':>8} {'déconnexions':>13}")
+    for i, (nom, classe, politique) in enumerate(configurations):
+        GestionnaireClient._emettre = emettre_historique if politique is None else emettre_file
+        const.POLITIQUE_DEBORDEMENT_ENVOI = politique or const.DEBORDEMENT_IGNORER_CHAT
+        port = args.port + i
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            fichier = os.path.join(tempfile.mkdtemp(), const.FICHIER_SAUVEGARDE_UTILISATEURS)
+            ecouteur = classe(GestionnaireUtilisateur(fichier), GestionnairePartie(), host="127.0.0.1", port=port)
+            ecouteur.daemon = True
+            ecouteur.start()
+            time.sleep(0.3)
+            duree_flot, latence, stats = scenario(ecouteur, port, args.messages, args.taille)
+            time.sleep(0.2)  # Fin des sessions (messages du serveur)
+
+        print(f"{nom:<14} {duree_flot:>10} {latence:>10} {stats['profondeur_max']:>10} "
+              f"{stats['temps_bloque']:>10.2f} {stats['messages_ignores']:>8} "
+              f"{stats['deconnexions_pour_lenteur']:>13}")
+
+    GestionnaireClient._emettre = emettre_file
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark : démarrage et mémoire de GestionnaireUtilisateur selon le nombre de parties sauvegardées.
+
+    * historique : parties dans les enregistrements utilisateur, tout le fichier JSON
+                   chargé et gardé en mémoire,
+    * dépôt      : un fichier par partie (DepotParties), lu par charger_partie seulement,
+                   cache LRU borné (BUDGET_CACHE_PARTIES).
+
+Pour chaque nombre de parties (--parties), un fichier à l'ancien format est écrit puis
+chargé tel quel (historique), puis converti une fois (conversion) et rechargé (dépôt).
+On mesure le temps de démarrage et la mémoire allouée par le gestionnaire (tracemalloc),
+puis, pour le dépôt, --reprises charger_partie de joueurs tirés au hasard parmi un
+ensemble de --joueurs-actifs joueurs (succès du cache et latence).
+
+Les fichiers de parties ne sont pas synchronisés sur disque (SYNCHRONISER_JOURNAL
+désactivé) : seule la lecture est mesurée.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_parties_sauvegardees [--parties 1000 10000 30000]
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from commun import constantes as const
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+
+MDP = "motdepasse"
+
+
+class GestionnaireUtilisateurHistorique(GestionnaireUtilisateur):
+    """ Ancien format : les parties restent dans les enregistrements utilisateur, en mémoire. """
+
+    def _extraire_parties(self) -> None:
+        pass
+
+
+def ecrire_ancien_format(nb_parties: int) -> str:
+    """ Fichier JSON de nb_parties utilisateurs ayant chacun une partie sauvegardée en cours. """
+    partie = Partie(Joueur("modele"), Joueur(const.NOM_SERVEUR))
+    partie.demarrer()
+    partie.etat = const.ETAT_MIS_EN_PAUSE
+    mdp_hash = GestionnaireUtilisateur._crypter_mdp(MDP)
+    donnees = {"utilisateurs": {f"u{i}": {"mdp_hash": mdp_hash, "partie_sauvegardee": partie.to_dict()}
+                                for i in range(nb_parties)}}
+    chemin = os.path.join(tempfile.mkdtemp(), const.FICHIER_SAUVEGARDE_UTILISATEURS)
+    with open(chemin, 'w', encoding=const.ENCODAGE) as f:
+        json.dump(donnees, f, separators=(',', ':'))
+    return chemin
+
+
+def demarrer(classe, chemin: str) -> tuple[GestionnaireUtilisateur, float, int]:
+    """ Construit le gestionnaire ; retourne (gestionnaire, durée, octets alloués restant en mémoire). """
+    tracemalloc.start()
+    debut = time.perf_counter()
+    gestionnaire = classe(chemin)
+    duree = time.perf_counter() - debut
+    memoire = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return gestionnaire, duree, memoire
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parties", type=int, nargs="+", default=[1000, 10000, 30000])
+    parser.add_argument("--reprises", type=int, default=5000)
+    parser.add_argument("--joueurs-actifs", type=int, default=2000)
+    args = parser.parse_args()
+    const.SYNCHRONISER_JOURNAL = False
+
+    print(f"{'parties':>8} {'mode':<11} {'démarrage(s)':>13} {'mémoire(Mo)':>12} "
+          f"{'reprise(ms)':>12} {'succès cache':>13}")
+    for nb_parties in args.parties:
+        with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+            chemin = ecrire_ancien_format(nb_parties)
+            historique, duree_historique, memoire_historique = demarrer(GestionnaireUtilisateurHistorique, chemin)
+            historique.ecrivain.stop()
+            historique.journal.fermer()
+            del historique
+
+            debut = time.perf_counter()
+            GestionnaireUtilisateur(chemin).fermer()  # Conversion (une fois)
+            conversion = time.perf_counter() - debut
+
+            depot, duree_depot, memoire_depot = demarrer(GestionnaireUtilisateur, chemin)
+            actifs = [f"u{i}" for i in random.sample(range(nb_parties), min(args.joueurs_actifs, nb_parties))]
+            debut = time.perf_counter()
+            for _ in range(args.reprises):
+                depot.charger_partie(random.choice(actifs))
+            reprise = (time.perf_counter() - debut) / args.reprises
+            cache = depot.cache.statistiques()
+            depot.fermer()
+
+        succes = cache["succes"] / max(1, cache["succes"] + cache["echecs"])
+        print(f"{nb_parties:>8} {'historique':<11} {duree_historique:>13.3f} {memoire_historique / 2**20:>12.1f}")
+        print(f"{nb_parties:>8} {'conversion':<11} {conversion:>13.3f}")
+        print(f"{nb_parties:>8} {'dépôt':<11} {duree_depot:>13.3f} {memoire_depot / 2**20:>12.1f} "
+              f"{reprise * 1e3:>12.3f} {succes:>12.0%}  (cache {cache['taille'] / 2**20:.1f} Mo)")
+
+
+if __name__ == '__main__':
+    main()
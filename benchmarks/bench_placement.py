@@ -0,0 +1,99 @@
+"""
+Benchmark : placement aléatoire d'une flotte, tirage direct (PlaceurFlotte) contre
+l'ancien tirage par rejet.
+
+    * rejet  : jusqu'à 1000 positions et orientations tirées au hasard par navire, chacune
+               testée par placement_valide (l'ancien Joueur.placer_navires_aleatoire),
+    * direct : Joueur.placer_navires_aleatoire, chaque navire tiré parmi ses placements
+               libres, avec retour arrière.
+
+Pour chaque flotte : ms par flotte placée et proportion d'échecs (flotte non placée alors
+qu'une disposition existe). Les flottes de stress occupent TAUX_MAX_OCCUPATION_FLOTTE
+de la grille ; la flotte serrée (80 %, au-delà de ce que le serveur accepte) montre les
+échecs du tirage par rejet.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_placement [--placements 200]
+"""
+import argparse
+import contextlib
+import os
+import random
+import time
+
+from commun import constantes as const
+from commun.coeur_jeu.configuration_partie import ConfigurationPartie
+from commun.coeur_jeu.joueur import Joueur
+
+FLOTTE_COMPLETE = (("Porte-avions", 5), ("Croiseur", 4), ("Contre-torpilleur", 3),
+                   ("Sous-marin", 3), ("Torpilleur", 2))
+
+
+def flotte(taille_grille: int, tailles: list[int]) -> ConfigurationPartie:
+    """ Flotte de stress : les tailles données, répétées jusqu'au taux d'occupation maximal. """
+    navires = []
+    occupees = 0
+    while occupees + tailles[len(navires) % len(tailles)] <= taille_grille ** 2 * const.TAUX_MAX_OCCUPATION_FLOTTE:
+        taille = tailles[len(navires) % len(tailles)]
+        navires.append((f"Navire-{len(navires)}", taille))
+        occupees += taille
+    return ConfigurationPartie(taille_grille, tuple(navires)).valider()
+
+
+def placer_par_rejet(joueur: Joueur) -> None:
+    """ Ancien placement : tirage par rejet, 1000 essais par navire. """
+    for navire in joueur.navires:
+        for _ in range(1000):
+            x = random.randint(0, joueur.grille.largeur - 1)
+            y = random.randint(0, joueur.grille.hauteur - 1)
+            orientation = random.choice([const.HORIZONTAL, const.VERTICAL])
+            if joueur.placer_navire(navire, x, y, orientation):
+                break
+        else:
+            raise Exception(f"Impossible de placer le navire {navire.nom}")
+
+
+def mesurer(configuration: ConfigurationPartie, methode: str, nb_placements: int) -> tuple[float, float]:
+    """ (ms par flotte, proportion d'échecs). """
+    random.seed(1)
+    echecs = 0
+    duree = 0.0
+    for _ in range(nb_placements):
+        joueur = Joueur("Arnauld", configuration=configuration)
+        debut = time.perf_counter()
+        try:
+            if methode == "rejet":
+                placer_par_rejet(joueur)
+            else:
+                joueur.placer_navires_aleatoire()
+        except Exception:
+            echecs += 1
+        duree += time.perf_counter() - debut
+    return duree / nb_placements * 1e3, echecs / nb_placements
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--placements", type=int, default=200)
+    args = parser.parse_args()
+
+    scenarios = [
+        ("standard 10x10", ConfigurationPartie(const.TAILLE_GRILLE, FLOTTE_COMPLETE), args.placements),
+        ("stress 10x10", flotte(10, [5, 4, 3, 3, 2]), args.placements),
+        ("serrée 10x10", ConfigurationPartie(10, tuple((f"Navire-{i}", 4) for i in range(20))), args.placements),
+        ("stress 30x30", flotte(30, [5, 4, 3, 3, 2]), args.placements),
+        ("stress 100x100", flotte(100, [5, 4, 3, 3, 2]), max(1, args.placements // 20)),
+        ("1000 navires 1000x1000", ConfigurationPartie(1000, tuple((f"Navire-{i}", 2 + i % 4) for i in range(1000))),
+         max(1, args.placements // 100)),
+    ]
+    print(f"{'flotte':<24} {'navires':>7} {'rejet(ms)':>10} {'échecs':>7} {'direct(ms)':>11} {'échecs':>7}")
+    for nom, configuration, nb_placements in scenarios:
+        with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+            rejet, echecs_rejet = mesurer(configuration, "rejet", nb_placements)
+            direct, echecs_direct = mesurer(configuration, "direct", nb_placements)
+        print(f"{nom:<24} {len(configuration.navires):>7} {rejet:>10.3f} {echecs_rejet:>7.0%} "
+              f"{direct:>11.3f} {echecs_direct:>7.0%}")
+
+
+if __name__ == '__main__':
+    main()
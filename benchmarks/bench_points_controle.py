@@ -0,0 +1,112 @@
+"""
+Benchmark : coût d'écriture par tir du suivi des parties Solo en cours, et durée de
+leur reconstruction après un arrêt brutal.
+
+    * complet : un instantané complet de la partie réécrit à chaque tir (fichier
+                temporaire puis os.replace, comme une sauvegarde),
+    * delta   : PointsControle — instantané de base, puis 2 octets par tir ajoutés
+                en fin de fichier ; nouvel instantané tous les INTERVALLE_POINTS_CONTROLE tirs.
+
+--parties parties (flotte complète) sont jouées au hasard ; chacune est interrompue
+après un nombre de tirs tiré au hasard (les parties finies avant sont écartées).
+On mesure, autour des seules écritures, les octets écrits (wchar de /proc/self/io)
+et le temps par tir, sans puis avec fsync
+(SYNCHRONISER_POINTS_CONTROLE). Puis PointsControle.recuperer() reconstruit toutes
+les parties interrompues, vérifiées contre leur état au moment de l'interruption.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_points_controle [--parties 200]
+"""
+import argparse
+import contextlib
+import os
+import random
+import tempfile
+import time
+
+from commun import constantes as const
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from serveur.donnees.points_controle import PointsControle
+
+FLOTTE_COMPLETE = [("Porte-avions", 5), ("Croiseur", 4), ("Contre-torpilleur", 3),
+                   ("Sous-marin", 3), ("Torpilleur", 2)]
+
+
+def octets_ecrits() -> int:
+    """ Octets passés à write() par le processus depuis son démarrage (Linux). """
+    with open("/proc/self/io") as f:
+        for ligne in f:
+            if ligne.startswith("wchar:"):
+                return int(ligne.split()[1])
+    return 0
+
+
+def etat(partie: Partie) -> dict:
+    """ Partie.to_dict, cases touchées triées (ensembles : l'ordre n'est pas significatif). """
+    donnees = partie.to_dict()
+    for joueur in ("joueur1", "joueur2"):
+        for navire in donnees[joueur]["navires"]:
+            navire["cases_touchees"] = sorted(navire["cases_touchees"])
+    return donnees
+
+
+def scenario(strategie: str, nb_parties: int, graine: int) -> tuple[float, float, PointsControle, dict]:
+    """ Retourne (octets par tir, µs par tir, points de contrôle, états attendus par joueur). """
+    random.seed(graine)
+    points_controle = PointsControle(tempfile.mkdtemp())
+    octets = 0
+    duree = 0.0
+    nb_tirs = 0
+    attendus = {}
+    for i in range(nb_parties):
+        nom = f"joueur{i}"
+        partie = Partie(Joueur(nom), Joueur(const.NOM_SERVEUR))
+        partie.demarrer()
+        points_controle.ouvrir(nom, partie)
+        cases = {tireur: [(x, y) for x in range(const.TAILLE_GRILLE) for y in range(const.TAILLE_GRILLE)]
+                 for tireur in (True, False)}
+        for liste in cases.values():
+            random.shuffle(liste)
+
+        for _ in range(random.randint(1, 120)):
+            x, y = cases[partie.est_tour_joueur1].pop()
+            _, _, terminee = partie.traiter_tir(x, y)
+            if terminee:  # Partie finie : son point de contrôle est effacé, comme par la session
+                points_controle.fermer(nom)
+                break
+            avant, debut = octets_ecrits(), time.perf_counter()
+            if strategie == "complet":
+                points_controle._ecrire_base(nom, PointsControle._encoder_base(nom, partie))
+            else:
+                points_controle.ajouter_tir(nom, partie, x, y)
+            duree += time.perf_counter() - debut
+            octets += octets_ecrits() - avant
+            nb_tirs += 1
+        if not partie.est_terminee():
+            attendus[nom] = etat(partie)
+    return octets / nb_tirs, duree / nb_tirs * 1e6, points_controle, attendus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--parties", type=int, default=200)
+    args = parser.parse_args()
+    const.NAVIRES = FLOTTE_COMPLETE
+
+    print(f"{'stratégie':<9} {'fsync':<5} {'octets/tir':>11} {'µs/tir':>9} {'reconstruction(ms)':>19} {'exactes':>8}")
+    for synchroniser in (False, True):
+        const.SYNCHRONISER_POINTS_CONTROLE = synchroniser
+        for strategie in ("complet", "delta"):
+            with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+                octets, duree, points_controle, attendus = scenario(strategie, args.parties, graine=1)
+                debut = time.perf_counter()
+                recuperees = points_controle.recuperer()
+                reconstruction = time.perf_counter() - debut
+            exactes = sum(etat(partie) == attendus[nom] for nom, partie in recuperees)
+            print(f"{strategie:<9} {'oui' if synchroniser else 'non':<5} {octets:>11.1f} {duree:>9.1f} "
+                  f"{reconstruction * 1e3:>19.1f} {exactes:>4}/{len(attendus)}")
+
+
+if __name__ == '__main__':
+    main()
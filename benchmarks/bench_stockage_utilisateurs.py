@@ -0,0 +1,107 @@
+"""
+Benchmark : stockage des utilisateurs, fichier JSON + journal contre base SQLite (WAL).
+
+Pour chaque taille de base (--tailles) :
+    * démarrage   : construction du gestionnaire (JSON : chargement complet en mémoire,
+                    SQLite : ouverture de la base),
+    * lectures    : verifier_authentification + partie_existe par seconde, depuis
+                    --threads threads (travailleurs UDP, sessions),
+    * inscriptions: enregistrer_utilisateur par seconde depuis --threads threads
+                    (SQLite : les écritures simultanées sont validées par lots).
+
+La base SQLite est remplie par l'outil de migration à partir du même fichier JSON.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_stockage_utilisateurs [--tailles 10000 100000 1000000] [--threads 8]
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+
+from commun import constantes as const
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from serveur.donnees.gestionnaire_utilisateur_sqlite import GestionnaireUtilisateurSQLite
+from serveur.donnees.migration_json_sqlite import migrer
+
+MDP = "motdepasse"
+
+
+def preparer_bases(taille: int) -> tuple[str, str]:
+    """ Écrit une base JSON de `taille` utilisateurs, la migre en SQLite, et retourne les deux chemins. """
+    dossier = tempfile.mkdtemp()
+    chemin_json = os.path.join(dossier, const.FICHIER_SAUVEGARDE_UTILISATEURS)
+    mdp_hash = GestionnaireUtilisateur._crypter_mdp(MDP)
+    donnees = {"utilisateurs": {f"u{i}": {"mdp_hash": mdp_hash}
+                                for i in range(taille)}}
+    with open(chemin_json, 'w', encoding=const.ENCODAGE) as f:
+        json.dump(donnees, f, separators=(',', ':'))
+    chemin_base = os.path.join(dossier, const.FICHIER_BASE_UTILISATEURS)
+    migrer(chemin_json, chemin_base)
+    return chemin_json, chemin_base
+
+
+def en_parallele(nb_threads: int, nb_par_thread: int, operation) -> float:
+    """ Opérations par seconde, nb_threads threads appelant chacun operation(thread, i) nb_par_thread fois. """
+    def boucle(t: int):
+        for i in range(nb_par_thread):
+            operation(t, i)
+
+    threads = [threading.Thread(target=boucle, args=(t,)) for t in range(nb_threads)]
+    debut = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return nb_threads * nb_par_thread / (time.perf_counter() - debut)
+
+
+def mesurer(classe, chemin: str, taille: int, nb_threads: int, nb_operations: int) -> tuple[float, float, float]:
+    debut = time.perf_counter()
+    gestionnaire = classe(chemin)
+    demarrage = time.perf_counter() - debut
+
+    noms = [f"u{random.randrange(taille)}" for _ in range(1024)]
+
+    def lire(t: int, i: int):
+        nom = noms[(t * 7919 + i) % len(noms)]
+        gestionnaire.verifier_authentification(nom, MDP)
+        gestionnaire.partie_existe(nom)
+
+    def inscrire(t: int, i: int):
+        gestionnaire.enregistrer_utilisateur(f"nouveau{t}_{i}", MDP)
+
+    lectures = en_parallele(nb_threads, nb_operations // nb_threads, lire)
+    inscriptions = en_parallele(nb_threads, nb_operations // nb_threads, inscrire)
+    if classe is GestionnaireUtilisateur:
+        gestionnaire.ecrivain.stop()
+        gestionnaire.journal.fermer()  # Sans compaction finale : seule la base mesurée compte
+    else:
+        gestionnaire.fermer()
+    return demarrage, lectures, inscriptions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tailles", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--operations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'utilisateurs':>12} {'stockage':<8} {'démarrage(s)':>13} {'lectures/s':>11} {'inscriptions/s':>15}")
+    for taille in args.tailles:
+        with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+            chemin_json, chemin_base = preparer_bases(taille)
+            resultats = [("json", mesurer(GestionnaireUtilisateur, chemin_json, taille, args.threads, args.operations)),
+                         ("sqlite", mesurer(GestionnaireUtilisateurSQLite, chemin_base, taille, args.threads,
+                                            args.operations))]
+        for nom, (demarrage, lectures, inscriptions) in resultats:
+            print(f"{taille:>12} {nom:<8} {demarrage:>13.3f} {lectures:>11,.0f} {inscriptions:>15,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark : choix du tir de l'IA selon la part de la grille déjà visée.
+
+    * rejet   : l'ancien choix (cases tirées au hasard jusqu'à une case pas encore visée,
+                1000 essais au plus, puis (0, 0) même si cette case est déjà visée),
+    * cibles  : Partie.choisir_tir_ia, tirage dans les cases restantes (CiblesRestantes).
+
+Pour chaque taille de grille et chaque part visée : µs par tir choisi et proportion de
+tirs invalides (case déjà visée). --parties parties Solo complètes sont aussi jouées
+tir après tir par l'IA, pour le temps total de ses choix.
+
+Utilisation (depuis la racine du dépôt) :
+    python -m benchmarks.bench_tirs_ia [--tailles 10 100 1000] [--tirs 2000] [--parties 1000]
+"""
+import argparse
+import contextlib
+import os
+import random
+import time
+
+from commun import constantes as const
+from commun.coeur_jeu.configuration_partie import ConfigurationPartie
+from commun.coeur_jeu.grille import Grille
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+
+PARTS_VISEES = (0.0, 0.5, 0.9, 0.99, 0.999)
+
+
+def choisir_par_rejet(grille_suivi: Grille) -> tuple[int, int]:
+    """ Ancien choix du tir de l'IA. """
+    for _ in range(1000):
+        x = random.randint(0, grille_suivi.largeur - 1)
+        y = random.randint(0, grille_suivi.hauteur - 1)
+        case = grille_suivi.obtenir(x, y)
+        if case == const.CASE_EAU or case == const.CASE_NAVIRE:
+            return x, y
+    return 0, 0
+
+
+def partie_visee(taille: int, part: float) -> Partie:
+    """ Partie Solo dont l'IA a déjà visé `part` des cases de sa grille de suivi. """
+    partie = Partie(Joueur("Arnauld", configuration=ConfigurationPartie(taille, (("Torpilleur", 2),))))
+    suivi = partie.joueur2.grille_suivi
+    cases = [(x, y) for y in range(taille) for x in range(taille)]
+    for x, y in random.sample(cases, int(len(cases) * part)):
+        suivi.definir(x, y, const.CASE_RATE)
+    return partie
+
+
+def mesurer(taille: int, part: float, nb_tirs: int) -> dict[str, tuple[float, float]]:
+    """ Méthode -> (µs par tir, proportion de tirs invalides). """
+    random.seed(1)
+    partie = partie_visee(taille, part)
+    suivi = partie.joueur2.grille_suivi
+    resultats = {}
+    for methode, choisir in (("rejet", lambda: choisir_par_rejet(suivi)), ("cibles", partie.choisir_tir_ia)):
+        choisir()  # Les cibles restantes sont construites au premier tir
+        debut = time.perf_counter()
+        tirs = [choisir() for _ in range(nb_tirs)]
+        duree = time.perf_counter() - debut
+        invalides = sum(1 for x, y in tirs if suivi.obtenir(x, y) in (const.CASE_TOUCHE, const.CASE_RATE))
+        resultats[methode] = (duree / nb_tirs * 1e6, invalides / nb_tirs)
+    return resultats
+
+
+def jouer_parties(nb_parties: int) -> float:
+    """ Secondes passées dans choisir_tir_ia sur nb_parties parties où seule l'IA tire. """
+    random.seed(1)
+    duree = 0.0
+    for _ in range(nb_parties):
+        partie = Partie(Joueur("Arnauld"))
+        partie.demarrer()
+        partie.est_tour_joueur1 = False
+        while not partie.est_terminee():
+            debut = time.perf_counter()
+            x, y = partie.choisir_tir_ia()
+            duree += time.perf_counter() - debut
+            partie.traiter_tir(x, y)
+            partie.est_tour_joueur1 = False
+    return duree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tailles", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--tirs", type=int, default=2000)
+    parser.add_argument("--parties", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'grille':>9} {'visée':>7} {'rejet(µs)':>10} {'invalides':>10} {'cibles(µs)':>11} {'invalides':>10}")
+    for taille in args.tailles:
+        for part in PARTS_VISEES:
+            mesures = mesurer(taille, part, args.tirs)
+            (rejet, invalides_rejet), (cibles, invalides_cibles) = mesures["rejet"], mesures["cibles"]
+            print(f"{f'{taille}x{taille}':>9} {part:>7.1%} {rejet:>10.2f} {invalides_rejet:>10.1%} "
+                  f"{cibles:>11.2f} {invalides_cibles:>10.1%}")
+
+    with open(os.devnull, "w") as nul, contextlib.redirect_stdout(nul):
+        duree = jouer_parties(args.parties)
+    print(f"\n{args.parties} parties Solo jouées par l'IA : {duree:.3f} s de choix de tirs")
+
+
+if __name__ == '__main__':
+    main()
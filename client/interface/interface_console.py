@@ -5,6 +5,8 @@ import time
 from typing import Any
 from commun import constantes as const
 from commun.reseau.message import Message
+from commun.coeur_jeu.configuration_partie import ConfigurationPartie
+from commun.coeur_jeu.instantane import Instantane
 from commun.coeur_jeu.joueur import Joueur
 from client.reseau.connecteur_client import ConnecteurClient
 
@@ -35,6 +37,9 @@ class InterfaceConsole:
         self.etat_actuel: str = ETAT_LOCAL_DECONNECTE
         self.est_mon_tour: bool = False
         self.partie_sauvegardee_existe: bool = False
+        # Dernières cases visées, pour centrer l'affichage des grandes grilles
+        self.dernier_tir_recu: tuple[int, int] | None = None
+        self.dernier_tir_envoye: tuple[int, int] | None = None
 
     def lancer(self):
         """ Point d'entrée principal de l'application client. """
@@ -174,11 +179,11 @@ class InterfaceConsole:
             choix = input(f"Votre choix ({const.CHOIX_REPRENDRE_PARTIE}/{const.CHOIX_NOUVELLE_PARTIE}): ").strip()
 
             if choix == const.CHOIX_REPRENDRE_PARTIE:
-                self.connecteur.envoyer_commande(Message(const.MSG_REPRENDRE_PARTIE))
+                self.connecteur.envoyer_commande(Message.creer_reprendre_partie())
                 self.etat_actuel = ETAT_LOCAL_ATTENTE
                 break
             elif choix == const.CHOIX_NOUVELLE_PARTIE:
-                self.connecteur.envoyer_commande(Message(const.MSG_NOUVELLE_PARTIE))
+                self.connecteur.envoyer_commande(Message.creer_nouvelle_partie())
                 self.etat_actuel = ETAT_LOCAL_CHOIX_MODE
                 break
             else:
@@ -203,12 +208,12 @@ class InterfaceConsole:
             if choix == const.CHOIX_MODE_SOLO:  
                 self.mode_jeu = const.MODE_VS_SERVEUR
                 self.adversaire_nom = const.NOM_SERVEUR
-                self.connecteur.envoyer_commande(Message.creer_choix_mode(const.MODE_VS_SERVEUR))
+                self._envoyer_choix_mode(const.MODE_VS_SERVEUR)
                 self.etat_actuel = ETAT_LOCAL_PLACEMENT # En attente de réponse, les messages reçus sont ignorés
                 break
             elif choix == const.CHOIX_MODE_PVP:  
                 self.mode_jeu = const.MODE_VS_JOUEUR
-                self.connecteur.envoyer_commande(Message.creer_choix_mode(const.MODE_VS_JOUEUR))
+                self._envoyer_choix_mode(const.MODE_VS_JOUEUR)
                 self.etat_actuel = ETAT_LOCAL_ATTENTE
                 break
             else:
@@ -218,6 +223,66 @@ class InterfaceConsole:
         if self.mode_jeu == const.MODE_VS_SERVEUR:
             self.gerer_placement_navires()
 
+    def _envoyer_choix_mode(self, mode: str):
+        """ Envoie le mode choisi, avec la configuration de partie si elle n'est pas standard. """
+        configuration = InterfaceConsole._menu_configuration()
+        difficulte = InterfaceConsole._menu_difficulte() if mode == const.MODE_VS_SERVEUR else None
+        self.joueur_local = Joueur(self.connecteur.nom_joueur, configuration=configuration)
+        if configuration == ConfigurationPartie.standard():
+            self.connecteur.envoyer_commande(Message.creer_choix_mode(mode, difficulte=difficulte))
+        else:
+            self.connecteur.envoyer_commande(Message.creer_choix_mode(mode, configuration.to_dict(), difficulte))
+
+    @staticmethod
+    def _menu_difficulte() -> str:
+        """ Demande la difficulté de l'IA (mode Solo). """
+        difficultes = list(const.DIFFICULTES_IA)
+        while True:
+            print("=" * 40)
+            print("  DIFFICULTÉ DE L'IA")
+            print("=" * 40)
+            for numero, difficulte in enumerate(difficultes, start=1):
+                defaut = " (par défaut)" if difficulte == const.DIFFICULTE_IA else ""
+                print(f"{numero}. {difficulte.capitalize()} ({const.DIFFICULTES_IA[difficulte]}){defaut}")
+            print("-" * 40)
+
+            choix = input(f"Votre choix (1-{len(difficultes)}, Entrée : par défaut): ").strip()
+            if not choix:
+                return const.DIFFICULTE_IA
+            if choix.isdigit() and 1 <= int(choix) <= len(difficultes):
+                return difficultes[int(choix) - 1]
+            print("Choix invalide.")
+
+    @staticmethod
+    def _menu_configuration() -> ConfigurationPartie:
+        """ Demande la taille de la grille et la flotte (standard ou personnalisées). """
+        while True:
+            print("=" * 40)
+            print("  CONFIGURATION DE LA PARTIE")
+            print("=" * 40)
+            print(f"{const.CHOIX_CONFIG_STANDARD}. Standard ({const.TAILLE_GRILLE}x{const.TAILLE_GRILLE}, {len(const.NAVIRES)} navires)")
+            print(f"{const.CHOIX_CONFIG_PERSONNALISEE}. Personnalisée (taille de grille et flotte)")
+            print("-" * 40)
+
+            choix = input(f"Votre choix ({const.CHOIX_CONFIG_STANDARD}/{const.CHOIX_CONFIG_PERSONNALISEE}): ").strip()
+            if choix == const.CHOIX_CONFIG_STANDARD:
+                return ConfigurationPartie.standard()
+            if choix != const.CHOIX_CONFIG_PERSONNALISEE:
+                print("Choix invalide.")
+                continue
+
+            try:
+                taille_grille = int(input(f"Taille de la grille ({const.TAILLE_GRILLE_MIN}-{const.TAILLE_GRILLE_MAX}): ").strip())
+                # Flotte : "taille*nombre" séparés par des virgules, ex: 5*1, 4*2, 2*10
+                print("Flotte au format taille*nombre (ex: 5*1, 4*2, 2*10)")
+                navires = []
+                for element in input("Flotte: ").split(','):
+                    taille, nombre = (int(valeur) for valeur in element.split('*'))
+                    navires += [(f"Navire-{taille}-{i + 1}", taille) for i in range(nombre)]
+                return ConfigurationPartie(taille_grille, tuple(navires)).valider()
+            except ValueError as e:
+                print(f"Configuration invalide: {e}")
+
     # --- 3. Logique de Placement ---
 
     def gerer_placement_navires(self):
@@ -275,7 +340,8 @@ class InterfaceConsole:
 
                 try:
                     # 1. Position + Orientation
-                    print(f"Format: colonne (0-{const.TAILLE_GRILLE - 1}), ligne (0-{const.TAILLE_GRILLE - 1}), orientation ({const.HORIZONTAL}/{const.VERTICAL})")
+                    grille = self.joueur_local.grille
+                    print(f"Format: colonne (0-{grille.largeur - 1}), ligne (0-{grille.hauteur - 1}), orientation ({const.HORIZONTAL}/{const.VERTICAL})")
                     print("Exemple: 0, 2, V")
                     saisie = input(f"Entrez: ").strip()
 
@@ -292,8 +358,8 @@ class InterfaceConsole:
                     orientation = parties[2].upper()
 
                     # Validation des coordonnées
-                    if not (0 <= ligne < const.TAILLE_GRILLE and 0 <= colonne < const.TAILLE_GRILLE):
-                        print("Coordonnées hors limites (0-9).")
+                    if not self.joueur_local.grille.contient(colonne, ligne):
+                        print(f"Coordonnées hors limites (0-{grille.largeur - 1}, 0-{grille.hauteur - 1}).")
                         continue
 
                     # Validation de l'orientation
@@ -308,6 +374,7 @@ class InterfaceConsole:
                         # Mise à jour des objets Navire et Grille
                         navire.positionner(colonne, ligne, orientation)
                         self.joueur_local.placer_navire(navire, colonne, ligne, orientation)
+                        self.dernier_tir_recu = (colonne, ligne)  # Centre l'affichage sur le dernier navire placé
 
                         print(f"{navire.nom} placé. Prochain navire.")
                         place = True
@@ -358,12 +425,14 @@ class InterfaceConsole:
                     ligne = int(parties[1])
 
                     # 2. Validation des limites de la grille
-                    if 0 <= ligne < const.TAILLE_GRILLE and 0 <= colonne < const.TAILLE_GRILLE:
+                    grille = self.joueur_local.grille_suivi
+                    if grille.contient(colonne, ligne):
                         self.connecteur.envoyer_commande(Message.creer_tir(colonne, ligne))
                         self.est_mon_tour = False
+                        self.dernier_tir_envoye = (colonne, ligne)
                         print(f"Tir envoyé : ({colonne}, {ligne})")
                     else:
-                        print(f"Coordonnées hors limites (0 à {const.TAILLE_GRILLE - 1}).")
+                        print(f"Coordonnées hors limites (0 à {grille.largeur - 1}).")
 
                 else:
                     # Si la saisie n'est ni une commande, ni le nouveau format (x, y).
@@ -411,104 +480,132 @@ class InterfaceConsole:
                 self.gerer_placement_navires()
                 return
 
-        # Gestion des autres messages
-        if message.type == const.MSG_CONNEXION_OK:
-            self.joueur_local = Joueur(self.connecteur.nom_joueur)
-
-        elif message.type == const.MSG_PARTIE_REPRISE:
-            joueur_data = message.obtenir_donnee("joueur_etat")
-            est_mon_tour = message.obtenir_donnee("est_mon_tour", False)
-            nom_adversaire = message.obtenir_donnee("nom_adversaire", const.NOM_SERVEUR)
+        # Gestion des autres messages (aiguillage direct sur le type)
+        traitement = InterfaceConsole.AIGUILLAGE.get(message.type)
+        if traitement is not None:
+            traitement(self, message)
 
-            if joueur_data:
-                self.joueur_local = Joueur.from_dict(joueur_data)
-                self.est_mon_tour = est_mon_tour
-                self.statut_connexion = const.STATUS_CONNECTE
-                self.etat_actuel = ETAT_LOCAL_JEU
-                print("\n[JEU] Partie sauvegardée chargée. Reprise du jeu.")
+    def _sur_connexion_ok(self, message: Message):
+        self.joueur_local = Joueur(self.connecteur.nom_joueur)
 
-                # hum
-                if nom_adversaire == const.NOM_SERVEUR:
-                    print("Appuyez pour continuer ...")
+    def _sur_partie_reprise(self, message: Message):
+        joueur_data = message.obtenir_donnee("joueur_etat")
+        instantane = message.obtenir_donnee("joueur_instantane")
+        if instantane:
+            try:
+                joueur_data = Instantane.decoder_joueur(Instantane.depuis_texte(instantane))
+            except ValueError as e:
+                print(f"\n[ERREUR] Données de reprise invalides: {e}")
+        est_mon_tour = message.obtenir_donnee("est_mon_tour", False)
+        nom_adversaire = message.obtenir_donnee("nom_adversaire", const.NOM_SERVEUR)
+
+        if joueur_data:
+            self.joueur_local = Joueur.from_dict(joueur_data)
+            self.est_mon_tour = est_mon_tour
+            self.statut_connexion = const.STATUS_CONNECTE
+            self.etat_actuel = ETAT_LOCAL_JEU
+            print("\n[JEU] Partie sauvegardée chargée. Reprise du jeu.")
 
-        elif message.type == const.MSG_NOUVELLE_PARTIE:
-            self._menu_choix_mode()
+            # hum
+            if nom_adversaire == const.NOM_SERVEUR:
+                print("Appuyez pour continuer ...")
 
-        elif message.type == const.MSG_ATTENTE_ADVERSAIRE:
-            print("\n[JEU] En attente d'un adversaire...")
-            self.etat_actuel = ETAT_LOCAL_ATTENTE
+    def _sur_nouvelle_partie(self, message: Message):
+        self._menu_choix_mode()
 
-        elif message.type == const.MSG_ADVERSAIRE_TROUVE:
-            self.adversaire_nom = message.obtenir_donnee("adversaire")
-            print(f"\n[JEU] Adversaire trouvé: {self.adversaire_nom}. Préparez le placement!")
-            print("Appuyez pour continuer ...")
-            self.gerer_placement_navires()
-            self.etat_actuel = ETAT_LOCAL_PLACEMENT
+    def _sur_attente_adversaire(self, message: Message):
+        print("\n[JEU] En attente d'un adversaire...")
+        self.etat_actuel = ETAT_LOCAL_ATTENTE
 
-        elif message.type == const.MSG_DEBUT_PARTIE:
-            print("\n[JEU] La partie commence!")
-            self.etat_actuel = ETAT_LOCAL_JEU
+    def _sur_adversaire_trouve(self, message: Message):
+        self.adversaire_nom = message.obtenir_donnee("adversaire")
+        print(f"\n[JEU] Adversaire trouvé: {self.adversaire_nom}. Préparez le placement!")
+        print("Appuyez pour continuer ...")
+        self.gerer_placement_navires()
+        self.etat_actuel = ETAT_LOCAL_PLACEMENT
 
-        elif message.type == const.MSG_VOTRE_TOUR:
-            self.est_mon_tour = True
-            print("\n<<< C'est votre tour. >>>")
-
-        elif message.type == const.MSG_TOUR_ADVERSAIRE:
-            self.est_mon_tour = False
-            print("\n<<< Tour de l'adversaire. >>>")
-
-        elif message.type == const.MSG_REPONSE_TIR:
-            resultat = message.obtenir_donnee("resultat")
-            x = message.obtenir_donnee("x")
-            y = message.obtenir_donnee("y")
-
-            if not self.est_mon_tour:
-                self.joueur_local.enregistrer_tir(x, y, resultat)
-                print(f"\n[RÉSULTAT] Tir en ({x},{y}): {resultat}!")
-                if resultat == const.TIR_COULE:
-                    print(f"  -> Navire coulé: {message.obtenir_donnee('bateau_coule')}")
-                    self.etat_actuel = ETAT_LOCAL_JEU_TERMINE
-
-            else:  # Tir adverse reçu
-                print(f"\n[ADVERSE] Tir reçu en ({x},{y}). Résultat: {resultat}!")
-
-        elif message.type == const.MSG_REPONSE_TIR_RECU:
-            resultat = message.obtenir_donnee("resultat")
-            adversaire = message.obtenir_donnee("adversaire")
-            x = message.obtenir_donnee("x")
-            y = message.obtenir_donnee("y")
-
-            if not self.est_mon_tour:
-                self.joueur_local.recevoir_tir(x, y)
-                print(f"\n[RÉSULTAT '{adversaire}'] Tir en ({x},{y}): {resultat}!")
-                if resultat == const.TIR_COULE:
-                    print(f"  -> Navire coulé: {message.obtenir_donnee('bateau_coule')}")
-
-            else:  # Tir adverse reçu
-                print(f"\n[ADVERSE] Tir reçu en ({x},{y}). Résultat: {resultat}!")
-
-        elif message.type == const.MSG_CHAT_GLOBAL:
-            envoyeur = message.obtenir_donnee("envoyeur")
-            msg = message.obtenir_donnee("message")
-            print(f"\n[CHAT - {envoyeur}] {msg}")
-
-        elif message.type == const.MSG_FIN_PARTIE:
-            status = message.obtenir_donnee("status") # mode pvp
-            nom_gagnant = message.obtenir_donnee("gagnant") # mode solo
-            detail = message.obtenir_donnee("message")
-            print(f"\n### FIN DE PARTIE ###")
-            if status:
-                print(f"{status}", end='')
-            if nom_gagnant:
-                print(f"{nom_gagnant}", end='')
-
-            print(f"{detail}")
-            # Afin de ne pas se déconnecter après la fin d'une partie
-            # self.etat_actuel = ETAT_LOCAL_CHOIX_MODE
-            # self._menu_choix_mode()
-
-        elif message.type == const.MSG_ERREUR:
-            print(f"\n[ERREUR SERVEUR] {message.obtenir_donnee('message')}")
+    def _sur_debut_partie(self, message: Message):
+        print("\n[JEU] La partie commence!")
+        self.etat_actuel = ETAT_LOCAL_JEU
+
+    def _sur_votre_tour(self, message: Message):
+        self.est_mon_tour = True
+        print("\n<<< C'est votre tour. >>>")
+
+    def _sur_tour_adversaire(self, message: Message):
+        self.est_mon_tour = False
+        print("\n<<< Tour de l'adversaire. >>>")
+
+    def _sur_reponse_tir(self, message: Message):
+        resultat = message.obtenir_donnee("resultat")
+        x = message.obtenir_donnee("x")
+        y = message.obtenir_donnee("y")
+
+        if not self.est_mon_tour:
+            self.joueur_local.enregistrer_tir(x, y, resultat)
+            print(f"\n[RÉSULTAT] Tir en ({x},{y}): {resultat}!")
+            if resultat == const.TIR_COULE:
+                print(f"  -> Navire coulé: {message.obtenir_donnee('bateau_coule')}")
+                self.etat_actuel = ETAT_LOCAL_JEU_TERMINE
+
+        else:  # Tir adverse reçu
+            print(f"\n[ADVERSE] Tir reçu en ({x},{y}). Résultat: {resultat}!")
+
+    def _sur_reponse_tir_recu(self, message: Message):
+        resultat = message.obtenir_donnee("resultat")
+        adversaire = message.obtenir_donnee("adversaire")
+        x = message.obtenir_donnee("x")
+        y = message.obtenir_donnee("y")
+
+        if not self.est_mon_tour:
+            self.joueur_local.recevoir_tir(x, y)
+            self.dernier_tir_recu = (x, y)
+            print(f"\n[RÉSULTAT '{adversaire}'] Tir en ({x},{y}): {resultat}!")
+            if resultat == const.TIR_COULE:
+                print(f"  -> Navire coulé: {message.obtenir_donnee('bateau_coule')}")
+
+        else:  # Tir adverse reçu
+            print(f"\n[ADVERSE] Tir reçu en ({x},{y}). Résultat: {resultat}!")
+
+    def _sur_chat_global(self, message: Message):
+        envoyeur = message.obtenir_donnee("envoyeur")
+        msg = message.obtenir_donnee("message")
+        print(f"\n[CHAT - {envoyeur}] {msg}")
+
+    def _sur_fin_partie(self, message: Message):
+        status = message.obtenir_donnee("status") # mode pvp
+        nom_gagnant = message.obtenir_donnee("gagnant") # mode solo
+        detail = message.obtenir_donnee("message")
+        print(f"\n### FIN DE PARTIE ###")
+        if status:
+            print(f"{status}", end='')
+        if nom_gagnant:
+            print(f"{nom_gagnant}", end='')
+
+        print(f"{detail}")
+        # Afin de ne pas se déconnecter après la fin d'une partie
+        # self.etat_actuel = ETAT_LOCAL_CHOIX_MODE
+        # self._menu_choix_mode()
+
+    def _sur_erreur(self, message: Message):
+        print(f"\n[ERREUR SERVEUR] {message.obtenir_donnee('message')}")
+
+    # Type de message serveur -> traitement
+    AIGUILLAGE = {
+        const.MSG_CONNEXION_OK: _sur_connexion_ok,
+        const.MSG_PARTIE_REPRISE: _sur_partie_reprise,
+        const.MSG_NOUVELLE_PARTIE: _sur_nouvelle_partie,
+        const.MSG_ATTENTE_ADVERSAIRE: _sur_attente_adversaire,
+        const.MSG_ADVERSAIRE_TROUVE: _sur_adversaire_trouve,
+        const.MSG_DEBUT_PARTIE: _sur_debut_partie,
+        const.MSG_VOTRE_TOUR: _sur_votre_tour,
+        const.MSG_TOUR_ADVERSAIRE: _sur_tour_adversaire,
+        const.MSG_REPONSE_TIR: _sur_reponse_tir,
+        const.MSG_REPONSE_TIR_RECU: _sur_reponse_tir_recu,
+        const.MSG_CHAT_GLOBAL: _sur_chat_global,
+        const.MSG_FIN_PARTIE: _sur_fin_partie,
+        const.MSG_ERREUR: _sur_erreur,
+    }
 
     # --- 6. Affichage Console ---
     @staticmethod
@@ -528,4 +625,4 @@ class InterfaceConsole:
         print(f"Mode: {self.mode_jeu} | État: {self.etat_actuel} | Tour: {'VOUS' if self.est_mon_tour else 'Adversaire'}")
         print("-" * 70)
 
-        self.joueur_local.afficher_etat_complet()
\ No newline at end of file
+        self.joueur_local.afficher_etat_complet(self.dernier_tir_recu, self.dernier_tir_envoye)
\ No newline at end of file
@@ -4,7 +4,7 @@ import time
 from typing import Tuple, Callable, Any
 
 from commun import constantes as const
-from commun.reseau.protocole import Protocole
+from commun.reseau.protocole import Protocole, LecteurTrames
 from commun.reseau.message import Message
 
 
@@ -21,8 +21,11 @@ class ConnecteurClient:
 
         self.socket_udp: socket.socket | None = None
         self.socket_tcp: socket.socket | None = None
+        self.lecteur: LecteurTrames | None = None
         self.tcp_connecte = False
         self.nom_joueur: str | None = None
+        # Codec des messages TCP, fixé par le serveur dans MSG_CONNEXION_OK
+        self.codec = const.CODEC_JSON
 
         # Callback pour passer les messages reçus à l'InterfaceConsole
         self.callback_traiter_message: Callable[[Message], None] | None = None
@@ -58,16 +61,25 @@ class ConnecteurClient:
         message_str = const.SEPARATEUR.join([message_obj.type, nom, mdp])
 
         try:
-            # Envoi vers le serveur d'authentification (AuthentificationUDP)
-            self.socket_udp.sendto(message_str.encode(const.ENCODAGE), (self.host_serveur, self.port_auth))
+            for essai in range(const.NB_ESSAIS_AUTH):
+                # Envoi vers le serveur d'authentification (AuthentificationUDP)
+                self.socket_udp.sendto(message_str.encode(const.ENCODAGE), (self.host_serveur, self.port_auth))
 
-            # Réception de la réponse du serveur d'authentification UDP
-            data, _ = self.socket_udp.recvfrom(1024)
-            reponse_str = data.decode(const.ENCODAGE)
-            parties = reponse_str.split(const.SEPARATEUR)
+                # Réception de la réponse du serveur d'authentification UDP
+                data, _ = self.socket_udp.recvfrom(1024)
+                reponse_str = data.decode(const.ENCODAGE)
+                parties = reponse_str.split(const.SEPARATEUR)
 
-            status = parties[0]
-            message = parties[1]
+                status = parties[0]
+                message = parties[1]
+
+                if status != const.MSG_AUTH_OCCUPE:
+                    break
+
+                # Serveur saturé : nouvel essai après le délai qu'il suggère
+                if essai < const.NB_ESSAIS_AUTH - 1:
+                    delai = float(parties[2]) if len(parties) > 2 else const.DELAI_REESSAI_AUTH
+                    time.sleep(delai * (essai + 1))
 
             if status == const.MSG_AUTH_SUCCESS:
                 self.nom_joueur = nom
@@ -95,10 +107,13 @@ class ConnecteurClient:
         try:
             self.socket_tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket_tcp.connect((host_tcp, port_tcp))
+            self.socket_tcp.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.lecteur = LecteurTrames(self.socket_tcp, const.CLIENT)
             self.tcp_connecte = True
 
             # Étape 1 TCP: Envoyer le MSG_CONNEXION à EcouteurServeur
-            msg_connexion = Message.creer_connexion(self.nom_joueur)
+            self.codec = const.CODEC_JSON
+            msg_connexion = Message.creer_connexion(self.nom_joueur, const.CODECS_SUPPORTES)
             if Protocole.envoyer_message(self.socket_tcp, msg_connexion, const.CLIENT):
                 self.demarrer_ecoute()  # Lancer le thread de réception immédiatement
                 return True
@@ -115,7 +130,7 @@ class ConnecteurClient:
             print("Erreur: Non connecté au serveur TCP.")
             return False
 
-        return Protocole.envoyer_message(self.socket_tcp, message, const.CLIENT)
+        return Protocole.envoyer_message(self.socket_tcp, message, const.CLIENT, self.codec)
 
     def demarrer_ecoute(self):
         """ Démarre le thread d'écoute des messages TCP entrants. """
@@ -130,7 +145,7 @@ class ConnecteurClient:
         while self.actif:
             try:
                 # Utiliser le protocole pour recevoir le message entier
-                data = Protocole.recevoir_message(self.socket_tcp, const.CLIENT)
+                data = self.lecteur.lire_trame()
 
                 if data is None:
                     # Serveur déconnecté ou erreur de Protocole
@@ -139,6 +154,10 @@ class ConnecteurClient:
 
                 message = Message.deserialiser(data)
 
+                if message.type == const.MSG_CONNEXION_OK:
+                    # Le serveur indique le codec à utiliser pour la suite de la session
+                    self.codec = message.obtenir_donnee("codec", self.codec)
+
                 if self.callback_traiter_message:
                     # Voir dans InterfaceConsole quelle est la Callback qui traite les messages reçus.
                     self.callback_traiter_message(message)
@@ -0,0 +1,103 @@
+import random
+from array import array
+
+from commun import constantes as const
+from .grille import Grille
+from .grille_creuse import GrilleCreuse
+
+
+class CiblesRestantes:
+    """
+    Cases que l'IA n'a pas encore visées, dans un tableau compact (clé y * largeur + x) :
+    un tir se tire en temps constant et vise toujours une case nouvelle.
+
+    Une case visée est retirée en temps constant : la dernière case du tableau prend sa
+    place (la position de chaque case est tenue dans un second tableau). Deux octets par
+    case et par tableau jusqu'à 65 535 cases, quatre au-delà.
+
+    Sur une grille de suivi creuse (très grandes grilles), ces tableaux ne sont construits
+    que lorsque plus de PART_VISEE_TIRAGE_CREUX des cases ont été visées : jusque-là, un
+    tir est tiré par rejet sur la grille de suivi elle-même (deux essais en moyenne au
+    plus), sans mémoire ni parcours proportionnels à la taille de la grille.
+    """
+
+    __slots__ = ("largeur", "_nb_cases", "_suivi", "_cases", "_positions")
+
+    def __init__(self, grille_suivi: Grille):
+        """ Cases de la grille de suivi qui ne sont ni touchées ni ratées. """
+        self.largeur = grille_suivi.largeur
+        self._nb_cases = grille_suivi.largeur * grille_suivi.hauteur
+        # Grille de suivi creuse lue directement (tirage par rejet), None une fois les tableaux construits
+        self._suivi: GrilleCreuse | None = None
+        self._cases: array | None = None
+        self._positions: array | None = None
+        if isinstance(grille_suivi, GrilleCreuse) and not self._trop_visee(grille_suivi):
+            self._suivi = grille_suivi
+        else:
+            self._indexer(grille_suivi)
+
+    def _trop_visee(self, grille_suivi: GrilleCreuse) -> bool:
+        return self._nb_cases - CiblesRestantes._nb_restantes(grille_suivi) \
+            > self._nb_cases * const.PART_VISEE_TIRAGE_CREUX
+
+    @staticmethod
+    def _nb_restantes(grille_suivi: GrilleCreuse) -> int:
+        return grille_suivi.nb_cases(const.CASE_EAU) + grille_suivi.nb_cases(const.CASE_NAVIRE)
+
+    def _indexer(self, grille_suivi: Grille) -> None:
+        """ Construit les tableaux des cases restantes (parcours de toute la grille). """
+        code = 'H' if self._nb_cases < 0xFFFF else 'I'
+        self._cases = array(code, (y * self.largeur + x
+                                   for y in range(grille_suivi.hauteur)
+                                   for x, case in enumerate(grille_suivi.ligne(y))
+                                   if case == const.CASE_EAU or case == const.CASE_NAVIRE))
+        # Position de chaque case dans _cases, nb_cases pour une case déjà visée
+        self._positions = array(code, [self._nb_cases]) * self._nb_cases
+        for position, cle in enumerate(self._cases):
+            self._positions[cle] = position
+
+    def __len__(self) -> int:
+        if self._suivi is not None:
+            return CiblesRestantes._nb_restantes(self._suivi)
+        return len(self._cases)
+
+    def tirer(self, rng: random.Random | None = None) -> tuple[int, int]:
+        """
+        Une case pas encore visée, au hasard (elle reste dans les cibles jusqu'à retirer()).
+
+        Raises:
+            ValueError: Si toutes les cases ont été visées.
+        """
+        rng = rng if rng is not None else random
+        if self._suivi is not None:
+            if not len(self):
+                raise ValueError("Toutes les cases ont été visées")
+            while True:
+                y, x = divmod(rng.randrange(self._nb_cases), self.largeur)
+                case = self._suivi.obtenir(x, y)
+                if case == const.CASE_EAU or case == const.CASE_NAVIRE:
+                    return x, y
+        cle = self._cases[rng.randrange(len(self._cases))]
+        return cle % self.largeur, cle // self.largeur
+
+    def retirer(self, x: int, y: int) -> None:
+        """
+        La case (x, y) vient d'être visée (sans effet si elle l'était déjà ou hors de la grille).
+        Sur une grille creuse, elle doit déjà être marquée dans la grille de suivi.
+        """
+        if self._suivi is not None:
+            if self._trop_visee(self._suivi):
+                self._indexer(self._suivi)
+                self._suivi = None
+            return
+        cle = y * self.largeur + x
+        if not (0 <= x < self.largeur and 0 <= cle < len(self._positions)):
+            return
+        position = self._positions[cle]
+        if position >= len(self._cases) or self._cases[position] != cle:
+            return
+        derniere = self._cases.pop()
+        if derniere != cle:
+            self._cases[position] = derniere
+            self._positions[derniere] = position
+        self._positions[cle] = len(self._positions)
@@ -0,0 +1,75 @@
+from typing import Any, NamedTuple
+
+from commun import constantes as const
+
+
+class ConfigurationPartie(NamedTuple):
+    """
+    Paramètres d'une partie, choisis par le client dans CHOIX_MODE : taille de la grille
+    (carrée) et flotte (nom, taille) de chaque joueur.
+
+    La configuration standard reprend TAILLE_GRILLE et NAVIRES. En PvP, deux joueurs ne
+    sont appariés que s'ils ont choisi la même configuration.
+    """
+    taille_grille: int
+    navires: tuple[tuple[str, int], ...]
+
+    @staticmethod
+    def standard() -> 'ConfigurationPartie':
+        """ Configuration par défaut (constantes lues à l'appel). """
+        return ConfigurationPartie(const.TAILLE_GRILLE, tuple((nom, taille) for nom, taille in const.NAVIRES))
+
+    def valider(self) -> 'ConfigurationPartie':
+        """
+        Vérifie que la configuration est jouable et dans les limites du serveur.
+
+        Raises:
+            ValueError: Taille de grille, nombre ou taille des navires hors limites.
+        """
+        if not const.TAILLE_GRILLE_MIN <= self.taille_grille <= const.TAILLE_GRILLE_MAX:
+            raise ValueError(f"Taille de grille hors de [{const.TAILLE_GRILLE_MIN}, {const.TAILLE_GRILLE_MAX}]")
+        if not 1 <= len(self.navires) <= const.NB_MAX_NAVIRES:
+            raise ValueError(f"Nombre de navires hors de [1, {const.NB_MAX_NAVIRES}]")
+        for nom, taille in self.navires:
+            if not nom or len(nom) > const.TAILLE_MAX_NOM_NAVIRE:
+                raise ValueError(f"Nom de navire invalide: {nom!r}")
+            if not 1 <= taille <= self.taille_grille:
+                raise ValueError(f"Taille du navire {nom} hors de [1, {self.taille_grille}]")
+        if sum(taille for _, taille in self.navires) > self.taille_grille ** 2 * const.TAUX_MAX_OCCUPATION_FLOTTE:
+            raise ValueError("Flotte trop grande pour la grille")
+        return self
+
+    def verifier_positions(self, positions: list[dict[str, Any]]) -> None:
+        """
+        Vérifie que des positions reçues (PLACEMENT_NAVIRES) placent exactement cette flotte.
+
+        Raises:
+            ValueError: Si les navires placés ne sont pas ceux de la configuration.
+        """
+        try:
+            places = sorted((pos["nom"], pos["taille"]) for pos in positions)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Positions invalides: {e}") from e
+        if places != sorted(self.navires):
+            raise ValueError("Les navires placés ne correspondent pas à la configuration de la partie")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"taille_grille": self.taille_grille, "navires": [list(navire) for navire in self.navires]}
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> 'ConfigurationPartie':
+        """
+        Configuration reçue dans CHOIX_MODE, validée.
+
+        Raises:
+            ValueError: Si les données sont mal formées ou hors limites.
+        """
+        try:
+            taille_grille = data["taille_grille"]
+            navires = tuple((nom, taille) for nom, taille in data["navires"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Configuration mal formée: {e}") from e
+        if type(taille_grille) is not int or any(type(nom) is not str or type(taille) is not int
+                                                 for nom, taille in navires):
+            raise ValueError("Configuration mal formée: types invalides")
+        return ConfigurationPartie(taille_grille, navires).valider()
@@ -0,0 +1,124 @@
+from typing import Any, Iterator
+
+from commun import constantes as const
+
+
+class Grille:
+    """
+    Grille d'un joueur (ses navires, ou le suivi de ses tirs) : une valeur CASE_* par case.
+
+    Quatre moteurs implémentent cette interface :
+        * GrilleListe    : listes de listes, la représentation historique,
+        * GrilleOctets   : un bytearray (un octet par case), compact et rapide case par case,
+        * GrilleBitboard : un entier par état de case (un bit par case) ; un segment
+                           se teste ou se marque en une opération,
+        * GrilleCreuse   : les seules cases qui ne sont pas de l'eau (très grandes grilles).
+    Le moteur est choisi à la création : MOTEUR_GRILLE par défaut, GrilleCreuse au-delà
+    de SEUIL_GRILLE_CREUSE cases. Joueur ne passe que par cette interface.
+
+    Pour les appelants existants, grille[y][x] reste disponible en lecture (ligne y),
+    ainsi que len() et l'itération sur les lignes. Les écritures passent par definir().
+    """
+
+    __slots__ = ("largeur", "hauteur")
+
+    def __init__(self, largeur: int = const.TAILLE_GRILLE, hauteur: int = const.TAILLE_GRILLE):
+        self.largeur = largeur
+        self.hauteur = hauteur
+
+    @staticmethod
+    def _classe(moteur: str | None, nb_cases: int) -> type['Grille']:
+        from .grille_bitboard import GrilleBitboard
+        from .grille_creuse import GrilleCreuse
+        from .grille_liste import GrilleListe
+        from .grille_octets import GrilleOctets
+
+        if moteur is None:
+            moteur = const.MOTEUR_GRILLE if nb_cases <= const.SEUIL_GRILLE_CREUSE else const.GRILLE_CREUSE
+        if moteur == const.GRILLE_CREUSE:
+            return GrilleCreuse
+        if moteur == const.GRILLE_OCTETS:
+            return GrilleOctets
+        if moteur == const.GRILLE_BITBOARD:
+            return GrilleBitboard
+        if moteur == const.GRILLE_LISTE:
+            return GrilleListe
+        raise ValueError(f"Moteur de grille inconnu: {moteur}")
+
+    @staticmethod
+    def creer(largeur: int = const.TAILLE_GRILLE, hauteur: int = const.TAILLE_GRILLE,
+              moteur: str | None = None) -> 'Grille':
+        """ Grille vide (CASE_EAU partout) du moteur demandé (par défaut : voir ci-dessus). """
+        return Grille._classe(moteur, largeur * hauteur)(largeur, hauteur)
+
+    @staticmethod
+    def depuis_listes(lignes: list[list[int]], moteur: str | None = None) -> 'Grille':
+        """ Grille à partir de sa forme en listes (to_dict / from_dict). """
+        return Grille._classe(moteur, len(lignes) * len(lignes[0]) if lignes else 0).depuis_lignes(lignes)
+
+    @staticmethod
+    def depuis_donnees(data: list[list[int]] | dict[str, Any]) -> 'Grille':
+        """ Grille à partir de sa forme sérialisée (en_donnees) : listes, ou dictionnaire d'une grille creuse. """
+        if isinstance(data, dict):
+            from .grille_creuse import GrilleCreuse
+            return GrilleCreuse.depuis_cases(data)
+        return Grille.depuis_listes(data)
+
+    @classmethod
+    def depuis_lignes(cls, lignes: list[list[int]]) -> 'Grille':
+        grille = cls(len(lignes[0]) if lignes else 0, len(lignes))
+        for y, ligne in enumerate(lignes):
+            for x, valeur in enumerate(ligne):
+                if valeur != const.CASE_EAU:
+                    grille.definir(x, y, valeur)
+        return grille
+
+    def vide(self) -> 'Grille':
+        """ Grille vide de même moteur et de mêmes dimensions. """
+        return type(self)(self.largeur, self.hauteur)
+
+    def contient(self, x: int, y: int) -> bool:
+        return 0 <= x < self.largeur and 0 <= y < self.hauteur
+
+    # --- À implémenter par chaque moteur ---
+
+    def obtenir(self, x: int, y: int) -> int:
+        """ Valeur (CASE_*) de la case (x, y), qui doit être dans la grille. """
+        raise NotImplementedError
+
+    def definir(self, x: int, y: int, valeur: int) -> None:
+        raise NotImplementedError
+
+    def segment_libre(self, x: int, y: int, taille: int, horizontal: bool) -> bool:
+        """ Vrai si les `taille` cases depuis (x, y) sont dans la grille et toutes CASE_EAU. """
+        raise NotImplementedError
+
+    def marquer_segment(self, x: int, y: int, taille: int, horizontal: bool, valeur: int) -> None:
+        """ Donne la valeur aux `taille` cases depuis (x, y) (segment dans la grille). """
+        raise NotImplementedError
+
+    def contient_valeur(self, valeur: int) -> bool:
+        """ Vrai si au moins une case a cette valeur (ex: CASE_NAVIRE, un navire encore intact). """
+        raise NotImplementedError
+
+    def ligne(self, y: int) -> list[int]:
+        raise NotImplementedError
+
+    def en_listes(self) -> list[list[int]]:
+        """ Copie de la grille en listes de listes. """
+        return [self.ligne(y) for y in range(self.hauteur)]
+
+    def en_donnees(self) -> list[list[int]] | dict[str, Any]:
+        """ Forme sérialisée (to_dict) : listes de listes, sauf pour les grilles creuses. """
+        return self.en_listes()
+
+    # --- Compatibilité : lecture par grille[y][x] ---
+
+    def __getitem__(self, y: int) -> list[int]:
+        return self.ligne(y)
+
+    def __len__(self) -> int:
+        return self.hauteur
+
+    def __iter__(self) -> Iterator[list[int]]:
+        return (self.ligne(y) for y in range(self.hauteur))
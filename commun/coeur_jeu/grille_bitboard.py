@@ -0,0 +1,111 @@
+from commun import constantes as const
+from .grille import Grille
+
+
+class GrilleBitboard(Grille):
+    """
+    Grille en bitboards : un entier par état de case (navire, touché, raté), dont le
+    bit y * largeur + x représente la case (x, y). Une case sans aucun bit est de l'eau.
+
+    Un segment de navire est un masque (horizontal : bits consécutifs, vertical : un
+    bit par ligne) : son test d'occupation et son marquage sont une opération sur les
+    entiers, et « reste-t-il un navire intact » se lit sur un seul entier.
+    """
+
+    __slots__ = ("_navire", "_touche", "_rate")
+
+    # Masques verticaux (un bit par ligne) par (largeur, taille), décalés ensuite en (x, y)
+    _masques_verticaux: dict[tuple[int, int], int] = {}
+
+    def __init__(self, largeur: int = const.TAILLE_GRILLE, hauteur: int = const.TAILLE_GRILLE):
+        super().__init__(largeur, hauteur)
+        self._navire = 0
+        self._touche = 0
+        self._rate = 0
+
+    def _masque_segment(self, x: int, y: int, taille: int, horizontal: bool) -> int:
+        if horizontal:
+            return ((1 << taille) - 1) << (y * self.largeur + x)
+        cle = (self.largeur, taille)
+        masque = GrilleBitboard._masques_verticaux.get(cle)
+        if masque is None:
+            masque = sum(1 << (i * self.largeur) for i in range(taille))
+            GrilleBitboard._masques_verticaux[cle] = masque
+        return masque << (y * self.largeur + x)
+
+    def obtenir(self, x: int, y: int) -> int:
+        bit = 1 << (y * self.largeur + x)
+        if self._navire & bit:
+            return const.CASE_NAVIRE
+        if self._touche & bit:
+            return const.CASE_TOUCHE
+        if self._rate & bit:
+            return const.CASE_RATE
+        return const.CASE_EAU
+
+    def definir(self, x: int, y: int, valeur: int) -> None:
+        bit = 1 << (y * self.largeur + x)
+        # Une case n'a qu'un état : seul le masque qui contient son bit est à effacer
+        if self._navire & bit:
+            self._navire ^= bit
+        elif self._touche & bit:
+            self._touche ^= bit
+        elif self._rate & bit:
+            self._rate ^= bit
+        if valeur == const.CASE_NAVIRE:
+            self._navire |= bit
+        elif valeur == const.CASE_TOUCHE:
+            self._touche |= bit
+        elif valeur == const.CASE_RATE:
+            self._rate |= bit
+
+    def _marquer(self, masque: int, valeur: int) -> None:
+        self._navire &= ~masque
+        self._touche &= ~masque
+        self._rate &= ~masque
+        if valeur == const.CASE_NAVIRE:
+            self._navire |= masque
+        elif valeur == const.CASE_TOUCHE:
+            self._touche |= masque
+        elif valeur == const.CASE_RATE:
+            self._rate |= masque
+
+    def segment_libre(self, x: int, y: int, taille: int, horizontal: bool) -> bool:
+        if horizontal:
+            if not (0 <= y < self.hauteur and 0 <= x and x + taille <= self.largeur):
+                return False
+        elif not (0 <= x < self.largeur and 0 <= y and y + taille <= self.hauteur):
+            return False
+        return not (self._navire | self._touche | self._rate) & self._masque_segment(x, y, taille, horizontal)
+
+    def marquer_segment(self, x: int, y: int, taille: int, horizontal: bool, valeur: int) -> None:
+        self._marquer(self._masque_segment(x, y, taille, horizontal), valeur)
+
+    def contient_valeur(self, valeur: int) -> bool:
+        if valeur == const.CASE_NAVIRE:
+            return self._navire != 0
+        if valeur == const.CASE_TOUCHE:
+            return self._touche != 0
+        if valeur == const.CASE_RATE:
+            return self._rate != 0
+        occupees = self._navire | self._touche | self._rate
+        return occupees != (1 << (self.largeur * self.hauteur)) - 1
+
+    def ligne(self, y: int) -> list[int]:
+        """ Copie de la ligne y (lecture seule : les écritures passent par definir). """
+        decalage = y * self.largeur
+        navire = self._navire >> decalage
+        touche = self._touche >> decalage
+        rate = self._rate >> decalage
+        ligne = []
+        for x in range(self.largeur):
+            bit = 1 << x
+            if navire & bit:
+                ligne.append(const.CASE_NAVIRE)
+            elif touche & bit:
+                ligne.append(const.CASE_TOUCHE)
+            elif rate & bit:
+                ligne.append(const.CASE_RATE)
+            else:
+                ligne.append(const.CASE_EAU)
+        return ligne
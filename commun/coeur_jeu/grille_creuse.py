@@ -0,0 +1,90 @@
+from typing import Any
+
+from commun import constantes as const
+from .grille import Grille
+
+
+class GrilleCreuse(Grille):
+    """
+    Grille creuse : seules les cases qui ne sont pas de l'eau sont stockées, dans un
+    dictionnaire y * largeur + x -> CASE_*. La mémoire dépend du nombre de navires et de
+    tirs, pas de la taille de la grille (ex: 1000x1000 avec des centaines de navires).
+
+    Le nombre de cases de chaque valeur est tenu à jour : contient_valeur() ne parcourt
+    pas la grille. Sa forme sérialisée (en_donnees) est un dictionnaire, et non des listes.
+    """
+
+    __slots__ = ("_cases", "_nb_valeurs")
+
+    VALEURS = (const.CASE_EAU, const.CASE_NAVIRE, const.CASE_TOUCHE, const.CASE_RATE)
+
+    def __init__(self, largeur: int = const.TAILLE_GRILLE, hauteur: int = const.TAILLE_GRILLE):
+        super().__init__(largeur, hauteur)
+        self._cases: dict[int, int] = {}
+        self._nb_valeurs = [0, 0, 0, 0]  # Cases stockées de chaque valeur, indexé par CASE_* (CASE_EAU reste à 0)
+
+    @classmethod
+    def depuis_cases(cls, data: dict[str, Any]) -> 'GrilleCreuse':
+        """ Grille depuis sa forme en_donnees(). Lève ValueError si elle est mal formée. """
+        try:
+            grille = cls(data["largeur"], data["hauteur"])
+            for x, y, valeur in data["cases"]:
+                if not grille.contient(x, y) or valeur not in GrilleCreuse.VALEURS:
+                    raise ValueError(f"Case invalide: {(x, y, valeur)}")
+                grille.definir(x, y, valeur)
+        except (KeyError, TypeError, IndexError) as e:
+            raise ValueError(f"Grille creuse mal formée: {e}") from e
+        return grille
+
+    def obtenir(self, x: int, y: int) -> int:
+        return self._cases.get(y * self.largeur + x, const.CASE_EAU)
+
+    def definir(self, x: int, y: int, valeur: int) -> None:
+        cle = y * self.largeur + x
+        ancienne = self._cases.pop(cle, const.CASE_EAU)
+        if ancienne != const.CASE_EAU:
+            self._nb_valeurs[ancienne] -= 1
+        if valeur != const.CASE_EAU:
+            self._cases[cle] = valeur
+            self._nb_valeurs[valeur] += 1
+
+    def segment_libre(self, x: int, y: int, taille: int, horizontal: bool) -> bool:
+        if horizontal:
+            if not (0 <= y < self.hauteur and 0 <= x and x + taille <= self.largeur):
+                return False
+            pas = 1
+        else:
+            if not (0 <= x < self.largeur and 0 <= y and y + taille <= self.hauteur):
+                return False
+            pas = self.largeur
+        debut = y * self.largeur + x
+        cases = self._cases
+        return not any(cle in cases for cle in range(debut, debut + taille * pas, pas))
+
+    def marquer_segment(self, x: int, y: int, taille: int, horizontal: bool, valeur: int) -> None:
+        for i in range(taille):
+            if horizontal:
+                self.definir(x + i, y, valeur)
+            else:
+                self.definir(x, y + i, valeur)
+
+    def contient_valeur(self, valeur: int) -> bool:
+        if valeur == const.CASE_EAU:
+            return len(self._cases) < self.largeur * self.hauteur
+        return self._nb_valeurs[valeur] > 0
+
+    def nb_cases(self, valeur: int) -> int:
+        """ Nombre de cases de cette valeur, sans parcourir la grille. """
+        if valeur == const.CASE_EAU:
+            return self.largeur * self.hauteur - len(self._cases)
+        return self._nb_valeurs[valeur]
+
+    def ligne(self, y: int) -> list[int]:
+        """ Copie de la ligne y (lecture seule : les écritures passent par definir). """
+        debut = y * self.largeur
+        return [self._cases.get(cle, const.CASE_EAU) for cle in range(debut, debut + self.largeur)]
+
+    def en_donnees(self) -> dict[str, Any]:
+        """ Largeur, hauteur et cases non vides [x, y, valeur] (jamais de listes denses). """
+        return {"largeur": self.largeur, "hauteur": self.hauteur,
+                "cases": [[cle % self.largeur, cle // self.largeur, valeur] for cle, valeur in self._cases.items()]}
@@ -0,0 +1,49 @@
+from commun import constantes as const
+from .grille import Grille
+
+
+class GrilleListe(Grille):
+    """ Grille en listes de listes (lignes[y][x]), la représentation historique. """
+
+    __slots__ = ("lignes",)
+
+    def __init__(self, largeur: int = const.TAILLE_GRILLE, hauteur: int = const.TAILLE_GRILLE,
+                 lignes: list[list[int]] | None = None):
+        super().__init__(largeur, hauteur)
+        self.lignes = lignes if lignes is not None else [[const.CASE_EAU] * largeur for _ in range(hauteur)]
+
+    @classmethod
+    def depuis_lignes(cls, lignes: list[list[int]]) -> 'GrilleListe':
+        """ Reprend les listes telles quelles (sans copie). """
+        return cls(len(lignes[0]) if lignes else 0, len(lignes), lignes)
+
+    def obtenir(self, x: int, y: int) -> int:
+        return self.lignes[y][x]
+
+    def definir(self, x: int, y: int, valeur: int) -> None:
+        self.lignes[y][x] = valeur
+
+    def segment_libre(self, x: int, y: int, taille: int, horizontal: bool) -> bool:
+        if horizontal:
+            if not (0 <= y < self.hauteur and 0 <= x and x + taille <= self.largeur):
+                return False
+            return all(case == const.CASE_EAU for case in self.lignes[y][x:x + taille])
+        if not (0 <= x < self.largeur and 0 <= y and y + taille <= self.hauteur):
+            return False
+        return all(self.lignes[y + i][x] == const.CASE_EAU for i in range(taille))
+
+    def marquer_segment(self, x: int, y: int, taille: int, horizontal: bool, valeur: int) -> None:
+        if horizontal:
+            self.lignes[y][x:x + taille] = [valeur] * taille
+        else:
+            for i in range(taille):
+                self.lignes[y + i][x] = valeur
+
+    def contient_valeur(self, valeur: int) -> bool:
+        return any(valeur in ligne for ligne in self.lignes)
+
+    def ligne(self, y: int) -> list[int]:
+        return self.lignes[y]
+
+    def en_listes(self) -> list[list[int]]:
+        return [list(ligne) for ligne in self.lignes]
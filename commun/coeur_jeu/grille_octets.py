@@ -0,0 +1,56 @@
+from itertools import chain
+
+from commun import constantes as const
+from .grille import Grille
+
+
+class GrilleOctets(Grille):
+    """
+    Grille en un seul bytearray : l'octet y * largeur + x est la valeur CASE_* de la case
+    (x, y). Environ une centaine d'octets pour une grille 10x10, contre quelques
+    kilo-octets de listes de listes ; un segment se teste et se marque par tranche.
+    """
+
+    __slots__ = ("_cases",)
+
+    def __init__(self, largeur: int = const.TAILLE_GRILLE, hauteur: int = const.TAILLE_GRILLE):
+        super().__init__(largeur, hauteur)
+        self._cases = bytearray(largeur * hauteur)  # CASE_EAU vaut 0
+
+    @classmethod
+    def depuis_lignes(cls, lignes: list[list[int]]) -> 'GrilleOctets':
+        grille = cls(len(lignes[0]) if lignes else 0, len(lignes))
+        grille._cases[:] = bytes(chain.from_iterable(lignes))
+        return grille
+
+    def _tranche(self, x: int, y: int, taille: int, horizontal: bool) -> slice:
+        debut = y * self.largeur + x
+        if horizontal:
+            return slice(debut, debut + taille)
+        return slice(debut, debut + (taille - 1) * self.largeur + 1, self.largeur)
+
+    def obtenir(self, x: int, y: int) -> int:
+        return self._cases[y * self.largeur + x]
+
+    def definir(self, x: int, y: int, valeur: int) -> None:
+        self._cases[y * self.largeur + x] = valeur
+
+    def segment_libre(self, x: int, y: int, taille: int, horizontal: bool) -> bool:
+        largeur = self.largeur
+        debut = y * largeur + x
+        # CASE_EAU vaut 0 : un segment libre n'a que des octets nuls
+        if horizontal:
+            return (0 <= y < self.hauteur and 0 <= x and x + taille <= largeur
+                    and not any(self._cases[debut:debut + taille]))
+        return (0 <= x < largeur and 0 <= y and y + taille <= self.hauteur
+                and not any(self._cases[debut:debut + (taille - 1) * largeur + 1:largeur]))
+
+    def marquer_segment(self, x: int, y: int, taille: int, horizontal: bool, valeur: int) -> None:
+        self._cases[self._tranche(x, y, taille, horizontal)] = bytes((valeur,)) * taille
+
+    def contient_valeur(self, valeur: int) -> bool:
+        return valeur in self._cases
+
+    def ligne(self, y: int) -> list[int]:
+        """ Copie de la ligne y (lecture seule : les écritures passent par definir). """
+        return list(self._cases[y * self.largeur:(y + 1) * self.largeur])
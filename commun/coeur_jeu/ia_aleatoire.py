@@ -0,0 +1,18 @@
+import random
+
+from commun import constantes as const
+from .cibles_restantes import CiblesRestantes
+from .grille import Grille
+from .strategie_ia import StrategieIa
+
+
+class IaAleatoire(StrategieIa):
+    """ IA « aléatoire » : une case pas encore visée au hasard, en temps constant (voir CiblesRestantes). """
+
+    NOM = const.IA_ALEATOIRE
+    COUT = const.COUT_IA_CONSTANT
+
+    __slots__ = ()
+
+    def choisir_tir(self, grille_suivi: Grille, cibles: CiblesRestantes, rng: random.Random | None = None) -> tuple[int, int]:
+        return cibles.tirer(rng)
@@ -0,0 +1,27 @@
+import random
+
+from commun import constantes as const
+from .cibles_restantes import CiblesRestantes
+from .grille import Grille
+from .strategie_ia import StrategieIa
+
+
+class IaChasseCible(StrategieIa):
+    """
+    IA « chasse-cible » : tant qu'aucun navire touché n'est à flot, une case au hasard
+    (chasse) ; ensuite, les cases qui prolongent les touches (mode cible) jusqu'à couler
+    le navire. Le coût d'un tir est borné par le nombre de touches en cours.
+    """
+
+    NOM = const.IA_CHASSE_CIBLE
+    COUT = const.COUT_IA_LEGER
+
+    __slots__ = ()
+
+    def choisir_tir(self, grille_suivi: Grille, cibles: CiblesRestantes, rng: random.Random | None = None) -> tuple[int, int]:
+        tir = self._cibler(grille_suivi, rng)
+        return tir if tir is not None else self._chasser(cibles, rng)
+
+    def _chasser(self, cibles: CiblesRestantes, rng: random.Random | None = None) -> tuple[int, int]:
+        """ Tir sans touche en cours. """
+        return cibles.tirer(rng)
@@ -0,0 +1,207 @@
+import random
+from typing import Any, Iterable
+
+from commun import constantes as const
+from .cibles_restantes import CiblesRestantes
+from .configuration_partie import ConfigurationPartie
+from .grille import Grille
+from .strategie_ia import StrategieIa
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : la densité est alors calculée en Python
+    np = None
+
+
+class IaDensite(StrategieIa):
+    """
+    IA « densité » : vise la case où les navires restants de l'adversaire peuvent le plus
+    souvent encore se trouver.
+
+    Pour chaque navire à flot et chaque orientation, tous les placements qui ne croisent
+    ni un tir raté ni un navire coulé sont comptés sur chaque case qu'ils couvrent (carte
+    de densité). Un placement qui passe par k cases touchées (d'un navire pas encore coulé)
+    compte POIDS_TOUCHE_IA ** k : après une touche, l'IA achève le navire (mode cible)
+    au lieu de chercher ailleurs. Les cases d'un navire coulé (annoncé par son nom) sont
+    déduites des touches (voir StrategieIa._cases_coulees).
+
+    Avec NumPy, la carte se calcule sans boucle Python par case : les cases bloquées et
+    touchées de chaque fenêtre glissante (placement) sont des différences de sommes
+    cumulées, pour toutes les lignes à la fois ; sans NumPy, le même calcul est fait
+    ligne par ligne. Le calcul porte sur toute la grille jusqu'à
+    TAILLE_MAX_FENETRE_IA cases ; au-delà, sur une fenêtre autour de la dernière touche
+    (et tir au hasard dans les cases restantes sans touche en cours).
+
+    Le calcul de la carte (calculer) ne dépend que de l'état de l'IA et des lignes de la
+    fenêtre (preparer) : le serveur le fait dans son groupe de processus (COUT_IA_LOURD).
+    """
+
+    NOM = const.IA_DENSITE
+    COUT = const.COUT_IA_LOURD
+
+    __slots__ = ("vectorise",)
+
+    def __init__(self, configuration: ConfigurationPartie, grille_suivi: Grille, coules: Iterable[str] = (),
+                 vectorise: bool | None = None):
+        """
+        Args:
+            configuration, grille_suivi, coules: Voir StrategieIa.
+            vectorise: Calcul avec NumPy (None : si NumPy est installé).
+        """
+        super().__init__(configuration, grille_suivi, coules)
+        self.vectorise = np is not None if vectorise is None else vectorise and np is not None
+
+    def choisir_tir(self, grille_suivi: Grille, cibles: CiblesRestantes, rng: random.Random | None = None) -> tuple[int, int]:
+        """ Case pas encore visée de densité maximale (au hasard entre les ex æquo). """
+        travail = self.preparer(grille_suivi)
+        if travail is None:
+            return cibles.tirer(rng)
+        return self.conclure(self.calculer(travail), travail, cibles, rng)
+
+    def preparer(self, grille_suivi: Grille) -> tuple[tuple[int, int, int, int], list[list[int]]] | None:
+        """ (fenêtre, cases de la grille de suivi dans la fenêtre), None pour un tir au hasard. """
+        fenetre = self.fenetre()
+        if fenetre is None:
+            return None
+        x0, y0, x1, y1 = fenetre
+        return fenetre, [grille_suivi.ligne(y)[x0:x1] for y in range(y0, y1)]
+
+    def calculer(self, travail: tuple[tuple[int, int, int, int], list[list[int]]]) -> list[tuple[int, int]]:
+        """ Cases de densité maximale, relatives au coin de la fenêtre (aucune si aucun navire ne peut s'y trouver). """
+        fenetre, lignes = travail
+        if self.vectorise:
+            return self._meilleures_numpy(lignes, fenetre)
+        return self._meilleures_python(lignes, fenetre)
+
+    def conclure(self, resultat: list[tuple[int, int]], travail: Any, cibles: CiblesRestantes,
+                 rng: random.Random | None = None) -> tuple[int, int]:
+        """ Une des meilleures cases au hasard, en coordonnées de la grille (au hasard dans les cibles sans meilleure case). """
+        if not resultat:
+            return cibles.tirer(rng)
+        x, y = resultat[(rng if rng is not None else random).randrange(len(resultat))]
+        (x0, y0, _, _), _ = travail
+        return x0 + x, y0 + y
+
+    def fenetre(self) -> tuple[int, int, int, int] | None:
+        """ (x0, y0, x1, y1) de la zone où calculer la densité, None pour un tir au hasard. """
+        if not self._flotte:
+            return None
+        if self.largeur * self.hauteur <= const.TAILLE_MAX_FENETRE_IA:
+            return 0, 0, self.largeur, self.hauteur
+        if not self._touches:
+            return None
+        y, x = divmod(next(reversed(self._touches)), self.largeur)
+        # Les navires qui passent par la dernière touche, dans la limite de la fenêtre
+        marge = min(max(self._flotte, default=1) - 1, (int(const.TAILLE_MAX_FENETRE_IA ** 0.5) - 1) // 2)
+        return (max(0, x - marge), max(0, y - marge),
+                min(self.largeur, x + marge + 1), min(self.hauteur, y + marge + 1))
+
+    def _coulees_fenetre(self, fenetre: tuple[int, int, int, int]) -> list[tuple[int, int]]:
+        """ Cases des navires coulés dans la fenêtre, relatives à son coin. """
+        x0, y0, x1, y1 = fenetre
+        coulees = []
+        for cle in self._coulees:
+            y, x = divmod(cle, self.largeur)
+            if x0 <= x < x1 and y0 <= y < y1:
+                coulees.append((x - x0, y - y0))
+        return coulees
+
+    # --- Carte de densité ---
+
+    def _meilleures_numpy(self, lignes: list[list[int]], fenetre: tuple[int, int, int, int]) -> list[tuple[int, int]]:
+        cases = np.array(lignes, dtype=np.int8)
+        coulee = np.zeros(cases.shape, dtype=bool)
+        for x, y in self._coulees_fenetre(fenetre):
+            coulee[y, x] = True
+        touche = (cases == const.CASE_TOUCHE) & ~coulee
+        bloque = (cases == const.CASE_RATE) | coulee
+
+        densite = np.zeros(cases.shape)
+        # Lignes, puis colonnes (vues transposées : densite.T s'écrit dans densite). Sommes
+        # sur les fenêtres glissantes de `taille` cases par différences de sommes cumulées
+        for colonnes, (bloque_l, touche_l, densite_l) in enumerate(((bloque, touche, densite),
+                                                                    (bloque.T, touche.T, densite.T))):
+            hauteur, longueur = bloque_l.shape
+            cumul_bloque = np.zeros((hauteur, longueur + 1), dtype=np.int32)
+            cumul_touche = np.zeros((hauteur, longueur + 1), dtype=np.int32)
+            np.cumsum(bloque_l, axis=1, out=cumul_bloque[:, 1:])
+            np.cumsum(touche_l, axis=1, out=cumul_touche[:, 1:])
+            differences = np.zeros((hauteur, longueur + 1))
+            for taille, nombre in self._flotte.items():
+                if taille > longueur or (colonnes and taille == 1):
+                    continue  # Un navire d'une case n'a qu'un placement : compté avec les lignes
+                libres = cumul_bloque[:, taille:] == cumul_bloque[:, :-taille]
+                nb_touches = cumul_touche[:, taille:] - cumul_touche[:, :-taille]
+                poids = libres * (nombre * float(const.POIDS_TOUCHE_IA) ** nb_touches)
+                # Chaque placement compte sur ses `taille` cases : +poids au début, -poids après la fin
+                differences[:, :poids.shape[1]] += poids
+                differences[:, taille:] -= poids
+            densite_l += np.cumsum(differences[:, :longueur], axis=1)
+
+        densite[(cases == const.CASE_TOUCHE) | (cases == const.CASE_RATE)] = 0.0
+        maximum = densite.max()
+        if maximum <= 0.0:
+            return []
+        ys, xs = np.nonzero(densite == maximum)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def _meilleures_python(self, lignes: list[list[int]], fenetre: tuple[int, int, int, int]) -> list[tuple[int, int]]:
+        coulees = set(self._coulees_fenetre(fenetre))
+        bloque = [[case == const.CASE_RATE or (x, y) in coulees for x, case in enumerate(ligne)]
+                  for y, ligne in enumerate(lignes)]
+        touche = [[case == const.CASE_TOUCHE and (x, y) not in coulees for x, case in enumerate(ligne)]
+                  for y, ligne in enumerate(lignes)]
+
+        densite = self._densite_lignes(bloque, touche)
+        colonnes = self._densite_lignes([list(c) for c in zip(*bloque)], [list(c) for c in zip(*touche)], colonnes=True)
+        for x, colonne in enumerate(colonnes):
+            for y, valeur in enumerate(colonne):
+                densite[y][x] += valeur
+
+        maximum = 0.0
+        meilleures = []
+        for y, ligne in enumerate(lignes):
+            for x, case in enumerate(ligne):
+                if case == const.CASE_TOUCHE or case == const.CASE_RATE:
+                    continue
+                valeur = densite[y][x]
+                if valeur > maximum:
+                    maximum = valeur
+                    meilleures = [(x, y)]
+                elif valeur == maximum and valeur > 0.0:
+                    meilleures.append((x, y))
+        return meilleures
+
+    def _densite_lignes(self, bloque: list[list[bool]], touche: list[list[bool]],
+                        colonnes: bool = False) -> list[list[float]]:
+        """
+        Densité des placements horizontaux de chaque ligne (différences cumulées).
+        colonnes=True (lignes transposées) : sans les navires d'une case, déjà comptés.
+        """
+        poids_touche = float(const.POIDS_TOUCHE_IA)
+        densite = []
+        for bloque_l, touche_l in zip(bloque, touche):
+            longueur = len(bloque_l)
+            differences = [0.0] * (longueur + 1)
+            for taille, nombre in self._flotte.items():
+                if taille > longueur or (colonnes and taille == 1):
+                    continue
+                # Cases bloquées et touchées de la fenêtre [debut, debut + taille), glissée d'une case à la fois
+                nb_bloquees = sum(bloque_l[:taille])
+                nb_touches = sum(touche_l[:taille])
+                for debut in range(longueur - taille + 1):
+                    if debut:
+                        fin = debut + taille - 1
+                        nb_bloquees += bloque_l[fin] - bloque_l[debut - 1]
+                        nb_touches += touche_l[fin] - touche_l[debut - 1]
+                    if not nb_bloquees:
+                        poids = nombre * poids_touche ** nb_touches
+                        differences[debut] += poids
+                        differences[debut + taille] -= poids
+            ligne = []
+            cumul = 0.0
+            for difference in differences[:longueur]:
+                cumul += difference
+                ligne.append(cumul)
+            densite.append(ligne)
+        return densite
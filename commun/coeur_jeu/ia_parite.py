@@ -0,0 +1,31 @@
+import random
+
+from commun import constantes as const
+from .cibles_restantes import CiblesRestantes
+from .ia_chasse_cible import IaChasseCible
+
+
+class IaParite(IaChasseCible):
+    """
+    IA « parité » : chasse-cible, où la chasse ne vise que les cases d'un damier dont le
+    pas est la taille du plus petit navire restant ((x + y) multiple du pas). Tout navire
+    restant couvre au moins une case du damier : il faut jusqu'à `pas` fois moins de tirs
+    pour le trouver.
+
+    Les cases du damier sont tirées parmi les cibles restantes (ESSAIS_TIRAGE_PARITE
+    tirages au plus, puis une case au hasard) : le coût d'un tir reste borné.
+    """
+
+    NOM = const.IA_PARITE
+    COUT = const.COUT_IA_LEGER
+
+    __slots__ = ()
+
+    def _chasser(self, cibles: CiblesRestantes, rng: random.Random | None = None) -> tuple[int, int]:
+        pas = min(self._flotte, default=1)
+        x, y = cibles.tirer(rng)
+        for _ in range(const.ESSAIS_TIRAGE_PARITE if pas > 1 else 0):
+            if (x + y) % pas == 0:
+                break
+            x, y = cibles.tirer(rng)
+        return x, y
@@ -0,0 +1,271 @@
+import base64
+import struct
+from itertools import chain
+from typing import Any
+
+from commun import constantes as const
+
+
+class Instantane:
+    """
+    Format binaire compact et versionné des dictionnaires de Partie, Joueur et Navire
+    (to_dict / from_dict) : sauvegardes, données de reprise (PARTIE_REPRISE).
+
+    Disposition (entiers non signés, gros-boutiste) :
+        en-tête  : MAGIE (2 o), VERSION (1 o), genre GENRE_PARTIE / GENRE_JOUEUR (1 o)
+        partie   : état (1 o), drapeaux (1 o : tour du joueur 1, gagnant présent,
+                   stratégie de l'IA présente), [gagnant : texte], [stratégie : texte],
+                   joueur 1, joueur 2
+        joueur   : nom (texte), lignes (1 o), colonnes (1 o), nombre de navires (1 o),
+                   grille puis grille de suivi (2 bits par case, 4 cases par octet),
+                   navires
+        navire   : nom (texte), taille, x, y, drapeaux (vertical, positionné) (1 o chacun),
+                   cases touchées (2 o : bit i = i-ème case du navire)
+        texte    : longueur (1 o) puis UTF-8
+
+    Les cases touchées sont repérées par leur rang sur le navire : un navire touché
+    hors de ses propres cases n'est pas représentable. Dans ce cas, pour une grille
+    creuse (dictionnaire, voir GrilleCreuse), ou pour toute valeur hors des plages
+    ci-dessus, l'encodage lève ValueError : l'appelant garde alors le format JSON.
+    """
+
+    MAGIE = b"BN"
+    VERSION = 1
+    GENRE_PARTIE = ord("P")
+    GENRE_JOUEUR = ord("J")
+
+    ETATS = (const.ETAT_EN_ATTENTE, const.ETAT_EN_COURS, const.ETAT_TERMINEE,
+             const.ETAT_ABANDONNEE, const.ETAT_MIS_EN_PAUSE)
+    CODES_ETATS = {etat: code for code, etat in enumerate(ETATS)}
+
+    TOUR_JOUEUR1 = 0x01
+    AVEC_GAGNANT = 0x02
+    AVEC_STRATEGIE_IA = 0x04  # Absente des instantanés antérieurs : même disposition qu'avant
+    VERTICAL = 0x01
+    POSITIONNE = 0x02
+
+    ENTETE = struct.Struct("!2sBB")
+    PARTIE = struct.Struct("!BB")
+    JOUEUR = struct.Struct("!BBB")
+    NAVIRE = struct.Struct("!BBBBH")
+    TAILLE_NAVIRE_MAX = 16  # Bits du masque des cases touchées
+    OCTET_MAX = 0xFF
+
+    # Octet -> ses 4 cases (la première dans les 2 bits de poids faible)
+    CASES_OCTETS = tuple((o & 3, (o >> 2) & 3, (o >> 4) & 3, o >> 6) for o in range(256))
+
+    # --- Encodage ---
+
+    @staticmethod
+    def encoder_partie(partie: dict[str, Any]) -> bytes:
+        """ Instantané d'une partie (Partie.to_dict). Lève ValueError si elle n'est pas représentable. """
+        code_etat = Instantane.CODES_ETATS.get(partie["etat"])
+        if code_etat is None:
+            raise ValueError(f"État inconnu: {partie['etat']!r}")
+        gagnant = partie["gagnant"]
+        strategie_ia = partie.get("strategie_ia")
+        drapeaux = (Instantane.TOUR_JOUEUR1 if partie["tour_joueur1"] else 0) | \
+                   (Instantane.AVEC_GAGNANT if gagnant is not None else 0) | \
+                   (Instantane.AVEC_STRATEGIE_IA if strategie_ia is not None else 0)
+        morceaux = [Instantane.ENTETE.pack(Instantane.MAGIE, Instantane.VERSION, Instantane.GENRE_PARTIE),
+                    Instantane.PARTIE.pack(code_etat, drapeaux)]
+        if gagnant is not None:
+            Instantane._ajouter_texte(morceaux, gagnant)
+        if strategie_ia is not None:
+            Instantane._ajouter_texte(morceaux, strategie_ia)
+        Instantane._ajouter_joueur(morceaux, partie["joueur1"])
+        Instantane._ajouter_joueur(morceaux, partie["joueur2"])
+        return b"".join(morceaux)
+
+    @staticmethod
+    def encoder_joueur(joueur: dict[str, Any]) -> bytes:
+        """ Instantané d'un joueur (Joueur.to_dict). Lève ValueError s'il n'est pas représentable. """
+        morceaux = [Instantane.ENTETE.pack(Instantane.MAGIE, Instantane.VERSION, Instantane.GENRE_JOUEUR)]
+        Instantane._ajouter_joueur(morceaux, joueur)
+        return b"".join(morceaux)
+
+    @staticmethod
+    def _ajouter_texte(morceaux: list[bytes], texte: str) -> None:
+        octets = texte.encode(const.ENCODAGE)
+        if len(octets) > Instantane.OCTET_MAX:
+            raise ValueError(f"Texte trop long: {texte[:20]!r}...")
+        morceaux.append(bytes((len(octets),)))
+        morceaux.append(octets)
+
+    @staticmethod
+    def _ajouter_joueur(morceaux: list[bytes], joueur: dict[str, Any]) -> None:
+        grille, grille_suivi, navires = joueur["grille"], joueur["grille_suivi"], joueur["navires"]
+        if not isinstance(grille, list) or not isinstance(grille_suivi, list):
+            raise ValueError("Grille creuse non représentable")
+        lignes = len(grille)
+        colonnes = len(grille[0]) if lignes else 0
+        if len(grille_suivi) != lignes or len(navires) > Instantane.OCTET_MAX:
+            raise ValueError("Joueur non représentable")
+        Instantane._ajouter_texte(morceaux, joueur["nom"])
+        try:
+            morceaux.append(Instantane.JOUEUR.pack(lignes, colonnes, len(navires)))
+        except struct.error as e:
+            raise ValueError(f"Grille trop grande: {e}") from e
+        morceaux.append(Instantane._compacter_grille(grille, colonnes))
+        morceaux.append(Instantane._compacter_grille(grille_suivi, colonnes))
+        for navire in navires:
+            Instantane._ajouter_navire(morceaux, navire)
+
+    @staticmethod
+    def _compacter_grille(grille: list[list[int]], colonnes: int) -> bytes:
+        """ 2 bits par case, ligne par ligne ; le dernier octet est complété par des zéros. """
+        if any(len(ligne) != colonnes for ligne in grille):
+            raise ValueError("Grille non rectangulaire")
+        cases = list(chain.from_iterable(grille))
+        if cases and (min(cases) < 0 or max(cases) > 3):
+            raise ValueError("Valeur de case hors de [0, 3]")
+        cases.extend([0] * (-len(cases) % 4))
+        return bytes([a | b << 2 | c << 4 | d << 6 for a, b, c, d in zip(*[iter(cases)] * 4)])
+
+    @staticmethod
+    def _ajouter_navire(morceaux: list[bytes], navire: dict[str, Any]) -> None:
+        taille, x, y = navire["taille"], navire["x"], navire["y"]
+        vertical = navire["orientation"] == const.VERTICAL
+        if not vertical and navire["orientation"] != const.HORIZONTAL:
+            raise ValueError(f"Orientation inconnue: {navire['orientation']!r}")
+        if taille > Instantane.TAILLE_NAVIRE_MAX:
+            raise ValueError(f"Navire trop long: {taille}")
+
+        masque = 0
+        for cx, cy in navire["cases_touchees"]:
+            rang = cy - y if vertical else cx - x
+            if (cx, cy) != ((x, y + rang) if vertical else (x + rang, y)) or not 0 <= rang < taille:
+                raise ValueError(f"Case touchée hors du navire: {(cx, cy)}")
+            masque |= 1 << rang
+
+        drapeaux = (Instantane.VERTICAL if vertical else 0) | \
+                   (Instantane.POSITIONNE if navire["positionne"] else 0)
+        Instantane._ajouter_texte(morceaux, navire["nom"])
+        try:
+            morceaux.append(Instantane.NAVIRE.pack(taille, x, y, drapeaux, masque))
+        except struct.error as e:
+            raise ValueError(f"Navire non représentable: {e}") from e
+
+    # --- Décodage ---
+
+    @staticmethod
+    def decoder_partie(data: bytes) -> dict[str, Any]:
+        """ Dictionnaire de partie (pour Partie.from_dict). Lève ValueError si l'instantané est invalide. """
+        try:
+            position = Instantane._lire_entete(data, Instantane.GENRE_PARTIE)
+            code_etat, drapeaux = Instantane.PARTIE.unpack_from(data, position)
+            position += Instantane.PARTIE.size
+            gagnant = None
+            if drapeaux & Instantane.AVEC_GAGNANT:
+                gagnant, position = Instantane._lire_texte(data, position)
+            strategie_ia = None
+            if drapeaux & Instantane.AVEC_STRATEGIE_IA:
+                strategie_ia, position = Instantane._lire_texte(data, position)
+            joueur1, position = Instantane._lire_joueur(data, position)
+            joueur2, position = Instantane._lire_joueur(data, position)
+            Instantane._verifier_fin(data, position)
+            partie = {
+                "joueur1": joueur1,
+                "joueur2": joueur2,
+                "etat": Instantane.ETATS[code_etat],
+                "tour_joueur1": bool(drapeaux & Instantane.TOUR_JOUEUR1),
+                "gagnant": gagnant
+            }
+            if strategie_ia is not None:
+                partie["strategie_ia"] = strategie_ia
+            return partie
+        except (IndexError, struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"Instantané de partie invalide: {e}") from e
+
+    @staticmethod
+    def decoder_joueur(data: bytes) -> dict[str, Any]:
+        """ Dictionnaire de joueur (pour Joueur.from_dict). Lève ValueError si l'instantané est invalide. """
+        try:
+            position = Instantane._lire_entete(data, Instantane.GENRE_JOUEUR)
+            joueur, position = Instantane._lire_joueur(data, position)
+            Instantane._verifier_fin(data, position)
+            return joueur
+        except (IndexError, struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"Instantané de joueur invalide: {e}") from e
+
+    @staticmethod
+    def est_instantane(data: bytes) -> bool:
+        """ Distingue un instantané d'un JSON (qui commence par '{'). """
+        return data[:len(Instantane.MAGIE)] == Instantane.MAGIE
+
+    @staticmethod
+    def _lire_entete(data: bytes, genre_attendu: int) -> int:
+        magie, version, genre = Instantane.ENTETE.unpack_from(data)
+        if magie != Instantane.MAGIE or genre != genre_attendu:
+            raise ValueError("Ce n'est pas un instantané du genre attendu")
+        if version > Instantane.VERSION:
+            raise ValueError(f"Version d'instantané non prise en charge: {version}")
+        return Instantane.ENTETE.size
+
+    @staticmethod
+    def _verifier_fin(data: bytes, position: int) -> None:
+        if position != len(data):
+            raise ValueError("Octets en trop")
+
+    @staticmethod
+    def _lire_texte(data: bytes, position: int) -> tuple[str, int]:
+        fin = position + 1 + data[position]
+        if fin > len(data):
+            raise IndexError("texte tronqué")
+        return str(data[position + 1:fin], const.ENCODAGE), fin
+
+    @staticmethod
+    def _lire_joueur(data: bytes, position: int) -> tuple[dict[str, Any], int]:
+        nom, position = Instantane._lire_texte(data, position)
+        lignes, colonnes, nb_navires = Instantane.JOUEUR.unpack_from(data, position)
+        position += Instantane.JOUEUR.size
+        grille, position = Instantane._lire_grille(data, position, lignes, colonnes)
+        grille_suivi, position = Instantane._lire_grille(data, position, lignes, colonnes)
+        navires = []
+        for _ in range(nb_navires):
+            navire, position = Instantane._lire_navire(data, position)
+            navires.append(navire)
+        return {"nom": nom, "grille": grille, "grille_suivi": grille_suivi, "navires": navires}, position
+
+    @staticmethod
+    def _lire_grille(data: bytes, position: int, lignes: int, colonnes: int) -> tuple[list[list[int]], int]:
+        if not colonnes:
+            return [[] for _ in range(lignes)], position
+        nb_cases = lignes * colonnes
+        fin = position + (nb_cases + 3) // 4
+        if fin > len(data):
+            raise IndexError("grille tronquée")
+        cases_octets = Instantane.CASES_OCTETS
+        cases = list(chain.from_iterable([cases_octets[o] for o in data[position:fin]]))
+        return [cases[i:i + colonnes] for i in range(0, nb_cases, colonnes)], fin
+
+    @staticmethod
+    def _lire_navire(data: bytes, position: int) -> tuple[dict[str, Any], int]:
+        nom, position = Instantane._lire_texte(data, position)
+        taille, x, y, drapeaux, masque = Instantane.NAVIRE.unpack_from(data, position)
+        vertical = bool(drapeaux & Instantane.VERTICAL)
+        cases_touchees = [(x, y + rang) if vertical else (x + rang, y)
+                          for rang in range(taille) if masque >> rang & 1]
+        return {
+            "nom": nom,
+            "taille": taille,
+            "x": x,
+            "y": y,
+            "orientation": const.VERTICAL if vertical else const.HORIZONTAL,
+            "cases_touchees": cases_touchees,
+            "positionne": bool(drapeaux & Instantane.POSITIONNE),
+        }, position + Instantane.NAVIRE.size
+
+    # --- Transport dans un message JSON ---
+
+    @staticmethod
+    def en_texte(data: bytes) -> str:
+        """ Instantané en base64, pour un champ de message JSON. """
+        return base64.b64encode(data).decode("ascii")
+
+    @staticmethod
+    def depuis_texte(texte: str) -> bytes:
+        try:
+            return base64.b64decode(texte, validate=True)
+        except ValueError as e:  # binascii.Error
+            raise ValueError(f"Instantané base64 invalide: {e}") from e
@@ -1,50 +1,85 @@
 import random
 
 from commun import constantes as const
+from .configuration_partie import ConfigurationPartie
+from .grille import Grille
 from .navire import Navire
+from .placeur_flotte import PlaceurFlotte
 from typing import Any
 
 class Joueur:
-    def __init__(self, nom: str="Joueur", grille: list[list[int]] = None, grille_suivi: list[list[int]] = None, navires: list[Navire] = None):
+    __slots__ = ("nom", "grille", "grille_suivi", "navires", "_navires_par_case", "_nb_navires_a_flot")
+
+    def __init__(self, nom: str="Joueur", grille: list[list[int]] | dict | Grille = None,
+                 grille_suivi: list[list[int]] | dict | Grille = None, navires: list[Navire] = None,
+                 configuration: ConfigurationPartie | None = None):
         """
         Initialise un joueur avec ses grilles
 
         Args:
             nom: Nom du joueur
+            grille, grille_suivi: Grilles existantes (Grille, ou forme sérialisée comme dans
+                to_dict), vides si None.
+            configuration: Taille des grilles vides et flotte à placer (standard si None).
         """
         self.nom = nom
+        configuration = configuration if configuration is not None else ConfigurationPartie.standard()
         # Grille principale (où sont placés les navires du joueur)
-        self.grille = grille if grille is not None else Joueur._creer_grille_vide()
+        self.grille = Joueur._creer_grille(grille, configuration.taille_grille)
 
         # Grille de suivi (pour tracer les tirs effectués sur l'adversaire)
-        self.grille_suivi = grille_suivi if grille_suivi is not None else Joueur._creer_grille_vide()
+        self.grille_suivi = Joueur._creer_grille(grille_suivi, configuration.taille_grille)
 
         # Liste des navires
         self.navires = navires if navires is not None else []
         if not self.navires:
-            self._initialiser_navires()
+            self._initialiser_navires(configuration)
 
-    @staticmethod
-    def _creer_grille_vide() -> list[list[int]]:
-        """ Crée une grille vide 10x10. """
-        return [[const.CASE_EAU for _ in range(const.TAILLE_GRILLE)]
-                for _ in range(const.TAILLE_GRILLE)]
+        # Index case (y * largeur + x) -> navire qui l'occupe, et nombre de navires pas encore
+        # coulés : un tir, un navire coulé et la fin de partie se résolvent sans parcourir la flotte
+        self._navires_par_case: dict[int, Navire] = {}
+        self._nb_navires_a_flot = 0
+        self._indexer_navires()
 
-    def _initialiser_navires(self) -> None:
+    @staticmethod
+    def _creer_grille(grille: list[list[int]] | dict | Grille | None, taille: int) -> Grille:
+        """ Grille du joueur : vide (taille x taille) si None, reconstruite si sérialisée. """
+        if grille is None:
+            return Grille.creer(taille, taille)
+        if isinstance(grille, Grille):
+            return grille
+        return Grille.depuis_donnees(grille)
+
+    def _initialiser_navires(self, configuration: ConfigurationPartie) -> None:
         """
-        Initialise la liste des navires selon le protocole.
+        Initialise la liste des navires selon la configuration de la partie.
 
-        Cette méthode parcourt la liste des navires définie dans le protocole (const.NAVIRES),
-        qui contient des tuples (nom, taille) pour chaque type de navire du jeu.
+        Cette méthode parcourt la flotte de la configuration (const.NAVIRES pour la configuration
+        standard), qui contient des tuples (nom, taille) pour chaque type de navire du jeu.
         Pour chaque navire, elle crée une instance de Navire avec le nom et la taille fournis,
         puis ajoute cette instance à la liste des navires du joueur (self.navires).
 
         Cela permet de préparer tous les navires requis pour une partie, en respectant les règles
         du jeu et la configuration standard définie par le protocole.
         """
-        for nom, taille in const.NAVIRES:
+        for nom, taille in configuration.navires:
             self.navires.append(Navire(nom, taille))
 
+    def configuration(self) -> ConfigurationPartie:
+        """ Configuration de la partie du joueur (taille de sa grille, sa flotte). """
+        return ConfigurationPartie(self.grille.largeur, tuple((navire.nom, navire.taille) for navire in self.navires))
+
+    def _indexer_navires(self) -> None:
+        """ Reconstruit l'index des cases et le compte des navires à flot depuis self.navires. """
+        largeur = self.grille.largeur
+        self._navires_par_case = {y * largeur + x: navire
+                                  for navire in self.navires for x, y in navire.obtenir_coordonnees()}
+        self._nb_navires_a_flot = sum(1 for navire in self.navires if not navire.est_coule())
+
+    def navire_en(self, x: int, y: int) -> Navire | None:
+        """ Navire qui occupe la case (x, y), None si c'est de l'eau. """
+        return self._navires_par_case.get(y * self.grille.largeur + x)
+
     def placement_valide(self, navire: Navire, x: int, y: int, orientation: str) -> bool:
         """
         Vérifie si le placement d'un navire est valide
@@ -58,23 +93,8 @@ class Joueur:
         Returns:
             bool: True si le placement est valide, False sinon
         """
-        # Vérifier que le navire ne dépasse pas de la grille
-        if orientation == const.HORIZONTAL:
-            if x + navire.taille > const.TAILLE_GRILLE:
-                return False
-        else:  # VERTICAL
-            if y + navire.taille > const.TAILLE_GRILLE:
-                return False
-
-        # Vérifier qu'aucune case n'est déjà occupée
-        for i in range(navire.taille):
-            pos_x = x + i if orientation == const.HORIZONTAL else x
-            pos_y = y if orientation == const.HORIZONTAL else y + i
-
-            if self.grille[pos_y][pos_x] != const.CASE_EAU:
-                return False
-
-        return True
+        # Le navire ne dépasse pas de la grille et aucune de ses cases n'est déjà occupée
+        return self.grille.segment_libre(x, y, navire.taille, orientation == const.HORIZONTAL)
 
     def placer_navire(self, navire: Navire, x: int, y: int, orientation: str) -> bool:
         """
@@ -97,8 +117,9 @@ class Joueur:
         navire.positionner(x, y, orientation)
 
         # Marquer les cases sur la grille
+        self.grille.marquer_segment(x, y, navire.taille, orientation == const.HORIZONTAL, const.CASE_NAVIRE)
         for coord_x, coord_y in navire.obtenir_coordonnees():
-            self.grille[coord_y][coord_x] = const.CASE_NAVIRE
+            self._navires_par_case[coord_y * self.grille.largeur + coord_x] = navire
 
         return True
 
@@ -124,10 +145,10 @@ class Joueur:
         son nom est retourné dans navire_coulé.
         """
         # 1. Vérification des limites de la grille
-        if not (0 <= x < const.TAILLE_GRILLE and 0 <= y < const.TAILLE_GRILLE):
+        if not self.grille.contient(x, y):
             return const.TIR_RATE, None
 
-        etat_actuel = self.grille[y][x]
+        etat_actuel = self.grille.obtenir(x, y)
 
         # 2. Vérification des tirs redondants
         if etat_actuel == const.CASE_TOUCHE or etat_actuel == const.CASE_RATE:
@@ -135,77 +156,67 @@ class Joueur:
 
             # 3. Tir dans l'eau
         if etat_actuel == const.CASE_EAU:
-            self.grille[y][x] = const.CASE_RATE
+            self.grille.definir(x, y, const.CASE_RATE)
             return const.TIR_RATE, None
 
         # 4. Tir sur un navire (CASE_NAVIRE)
         if etat_actuel == const.CASE_NAVIRE:
-            self.grille[y][x] = const.CASE_TOUCHE  # Marquer la case comme touchée
+            self.grille.definir(x, y, const.CASE_TOUCHE)  # Marquer la case comme touchée
 
-            navire_touche = None
-            for navire in self.navires:
-                # La méthode navire.est_touche met à jour le set cases_touchees interne
-                if navire.est_touche(x, y):
-                    navire_touche = navire
-                    break
-
-            if navire_touche and navire_touche.est_coule():
-                return const.TIR_COULE, navire_touche.nom
+            navire_touche = self._navires_par_case.get(y * self.grille.largeur + x)
+            if navire_touche is not None and navire_touche.est_touche(x, y):
+                if navire_touche.est_coule():
+                    self._nb_navires_a_flot -= 1
+                    return const.TIR_COULE, navire_touche.nom
 
             return const.TIR_TOUCHE, None
 
         return const.TIR_RATE, None  # Cas par défaut
 
-    def _placer_navire_aleatoire_unique(self, nom: str, taille: int) -> bool:
+    def _placer_navire_aleatoire_unique(self, nom: str, taille: int, rng: random.Random | None = None) -> bool:
         """
-        Tente de placer un navire de nom et taille donnés aléatoirement sur la grille.
+        Place un navire de nom et taille donnés aléatoirement sur la grille (uniformément
+        parmi les placements libres, voir PlaceurFlotte).
 
         Args:
             nom: Le nom du navire à placer.
             taille: La taille du navire à placer.
+            rng: Générateur des tirages (module random si None).
 
         Returns:
-            bool: True si le placement a réussi, False si impossible après 1000 essais.
+            bool: True si le placement a réussi, False si le navire ne tient nulle part.
         """
-        for _ in range(1000):
-            x = random.randint(0, const.TAILLE_GRILLE - 1)
-            y = random.randint(0, const.TAILLE_GRILLE - 1)
-            orientation = random.choice([const.HORIZONTAL, const.VERTICAL])
-
-            navire = Navire(nom, taille)
-            if self.placer_navire(navire, x, y, orientation):
-                return True
-
-        return False
+        placements = PlaceurFlotte(self.grille, rng).tirer([taille])
+        if placements is None:
+            return False
+        self._positionner_navires([Navire(nom, taille)], placements)
+        return True
 
-    def placer_navires_aleatoire(self) -> None | Exception:
+    def placer_navires_aleatoire(self, rng: random.Random | None = None) -> None | Exception:
         """
         Place tous les navires du joueur aléatoirement sur la grille.
 
-        Pour chaque navire de self.navires, tente de le placer aléatoirement
-        (position et orientation).
+        Chaque navire est placé uniformément parmi les placements libres (voir PlaceurFlotte) ;
+        la flotte est toujours placée dès qu'une disposition existe.
+
+        Args:
+            rng: Générateur des tirages (module random si None), pour un placement reproductible.
 
         Raises:
-            Exception: Si un des navires ne peut pas être placé après 1000 essais.
+            Exception: Si aucune disposition de la flotte n'existe (la grille n'est pas modifiée).
         """
-        for navire in self.navires:
-            place = False
-            tentatives = 0
-            max_tentatives = 1000
-
-            while not place and tentatives < max_tentatives:
-                x = random.randint(0, const.TAILLE_GRILLE - 1)
-                y = random.randint(0, const.TAILLE_GRILLE - 1)
-                orientation = random.choice([const.HORIZONTAL, const.VERTICAL])
-
-                if self.placer_navire(navire, x, y, orientation):
-                    print(f"Navire {self.nom} : x = {x}, y = {y}, orientation = {orientation}")
-                    place = True
-
-                tentatives += 1
-
-            if not place:
-                raise Exception(f"Impossible de placer le navire {navire.nom}")
+        placements = PlaceurFlotte(self.grille, rng).tirer([navire.taille for navire in self.navires])
+        if placements is None:
+            raise Exception(f"Impossible de placer la flotte de {self.nom}")
+        self._positionner_navires(self.navires, placements)
+
+    def _positionner_navires(self, navires: list[Navire], placements: list[tuple[int, int, bool]]) -> None:
+        """ Positionne et indexe des navires dont PlaceurFlotte a déjà marqué les cases sur la grille. """
+        largeur = self.grille.largeur
+        for navire, (x, y, horizontal) in zip(navires, placements):
+            navire.positionner(x, y, const.HORIZONTAL if horizontal else const.VERTICAL)
+            for coord_x, coord_y in navire.obtenir_coordonnees():
+                self._navires_par_case[coord_y * largeur + coord_x] = navire
 
     def tous_navires_coules(self) -> bool:
         """
@@ -214,7 +225,7 @@ class Joueur:
         Returns:
             bool: True si tous les navires sont coulés, False sinon.
         """
-        return all(navire.est_coule() for navire in self.navires)
+        return self._nb_navires_a_flot == 0
 
 
 
@@ -227,19 +238,22 @@ class Joueur:
             y: Ordonnée visée.
             resultat: Résultat du tir (TIR_RATE, TIR_TOUCHE ou TIR_COULE).
 
-        Marque la case tirée comme touchée (X) ou ratée (O) selon le résultat.
+        Marque la case tirée comme touchée (X) ou ratée (O) selon le résultat ; un tir hors
+        de la grille n'est pas enregistré.
         """
+        if not self.grille_suivi.contient(x, y):
+            return
         if resultat == const.TIR_RATE:
-            self.grille_suivi[y][x] = const.CASE_RATE
+            self.grille_suivi.definir(x, y, const.CASE_RATE)
         else:  # TOUCHE ou COULE
-            self.grille_suivi[y][x] = const.CASE_TOUCHE
+            self.grille_suivi.definir(x, y, const.CASE_TOUCHE)
 
     def to_dict(self) -> dict[str, Any]:
         """ Sérialise l'état complet du joueur pour la sauvegarde JSON. """
         return {
             "nom": self.nom,
-            "grille": self.grille,
-            "grille_suivi": self.grille_suivi,
+            "grille": self.grille.en_donnees(),
+            "grille_suivi": self.grille_suivi.en_donnees(),
             "navires": [navire.to_dict() for navire in self.navires]  # Utilise la méthode de Navire
         }
 
@@ -255,13 +269,15 @@ class Joueur:
             navires=navires
         )
 
-    def afficher_grille(self, afficher_navires: bool = True) -> None:
+    def afficher_grille(self, afficher_navires: bool = True, centre: tuple[int, int] | None = None) -> None:
         """
         Affiche la grille du joueur dans la console.
 
         Args:
             afficher_navires: Affiche les navires sur la grille si True, sinon affiche uniquement l'eau 
             et les résultats des tirs (pour masquer la position des navires à l'adversaire).
+            centre: Case autour de laquelle centrer l'affichage quand la grille dépasse
+            TAILLE_MAX_AFFICHAGE cases de côté (coin supérieur gauche si None).
 
         La grille montre :
             ~ : case d'eau
@@ -271,26 +287,9 @@ class Joueur:
         """
 
         print(f"\n--- GRILLE DE {self.nom.upper()} ---\n")
-        print("   ", end="")
-        for i in range(const.TAILLE_GRILLE):
-            print(f" {i} ", end="")
-        print()
-
-        for y in range(const.TAILLE_GRILLE):
-            print(f" {y} ", end="")
-            for x in range(const.TAILLE_GRILLE):
-                case = self.grille[y][x]
-                if case == const.CASE_EAU:
-                    print(" ~ ", end="")
-                elif case == const.CASE_NAVIRE:
-                    print(" B " if afficher_navires else " ~ ", end="")
-                elif case == const.CASE_TOUCHE:
-                    print(" X ", end="")
-                elif case == const.CASE_RATE:
-                    print(" O ", end="")
-            print()
+        Joueur._afficher_cases(self.grille, afficher_navires, centre)
 
-    def afficher_grille_suivi(self) -> None:
+    def afficher_grille_suivi(self, centre: tuple[int, int] | None = None) -> None:
         """
         Affiche la grille de suivi des tirs dans la console.
 
@@ -300,23 +299,39 @@ class Joueur:
             O : tir raté (case déjà visée, sans navire).
         """
         print("\n--- GRILLE DE SUIVI (TIRS ADVERSES) ---\n")
-        print("   ", end="")
-        for i in range(const.TAILLE_GRILLE):
-            print(f" {i} ", end="")
+        Joueur._afficher_cases(self.grille_suivi, False, centre)
+
+    @staticmethod
+    def _afficher_cases(grille: Grille, afficher_navires: bool, centre: tuple[int, int] | None) -> None:
+        """
+        Affiche au plus TAILLE_MAX_AFFICHAGE x TAILLE_MAX_AFFICHAGE cases de la grille (autour
+        de `centre`) : seules les lignes affichées sont lues, quelle que soit la taille de la grille.
+        """
+        cote = const.TAILLE_MAX_AFFICHAGE
+        cx, cy = centre if centre is not None else (0, 0)
+        x0 = max(0, min(cx - cote // 2, grille.largeur - cote))
+        y0 = max(0, min(cy - cote // 2, grille.hauteur - cote))
+        x1 = min(grille.largeur, x0 + cote)
+        y1 = min(grille.hauteur, y0 + cote)
+        largeur = len(str(max(grille.largeur, grille.hauteur) - 1))
+        symboles = dict(const.symboles)
+        if not afficher_navires:
+            symboles[const.CASE_NAVIRE] = symboles[const.CASE_EAU]
+
+        print(" " * (largeur + 2), end="")
+        for i in range(x0, x1):
+            print(f" {i:>{largeur}} ", end="")
         print()
 
-        for y in range(const.TAILLE_GRILLE):
-            print(f" {y} ", end="")
-            for x in range(const.TAILLE_GRILLE):
-                case = self.grille_suivi[y][x]
-                if case == const.CASE_EAU:
-                    print(" ~ ", end="")
-                elif case == const.CASE_TOUCHE:
-                    print(" X ", end="")
-                elif case == const.CASE_RATE:
-                    print(" O ", end="")
+        for y in range(y0, y1):
+            print(f" {y:>{largeur}} ", end="")
+            for case in grille.ligne(y)[x0:x1]:
+                print(f" {symboles[case]:>{largeur}} ", end="")
             print()
 
+        if (x1 - x0, y1 - y0) != (grille.largeur, grille.hauteur):
+            print(f"(colonnes {x0}-{x1 - 1}, lignes {y0}-{y1 - 1} d'une grille {grille.largeur}x{grille.hauteur})")
+
     def obtenir_positions_navires(self) -> list[dict[str, str|int]]:
         """
         Retourne les positions de tous les navires pour sérialisation.
@@ -344,19 +359,30 @@ class Joueur:
             positions: Liste de dictionnaires avec les positions des navires.
 
         Returns:
-            bool: True si tous les navires ont été placés, False sinon.
+            bool: True si tous les navires ont été placés, False sinon (la flotte et la
+            grille restent alors celles d'avant l'appel).
+
+        Raises:
+            ValueError: Si les navires placés ne sont pas ceux de la flotte du joueur
+            (configuration de la partie).
         """
+        self.configuration().verifier_positions(positions)
+        anciens = self.navires, self.grille
+
         # Réinitialiser les navires
         self.navires = []
-        self.grille = [[const.CASE_EAU for _ in range(const.TAILLE_GRILLE)]
-                       for _ in range(const.TAILLE_GRILLE)]
+        self.grille = self.grille.vide()
+        self._indexer_navires()
 
         # Placer chaque navire
         for pos in positions:
             navire = Navire(pos["nom"], pos["taille"])
             if not self.placer_navire(navire, pos["x"], pos["y"], pos["orientation"]):
+                self.navires, self.grille = anciens
+                self._indexer_navires()
                 return False
             self.navires.append(navire)
+            self._nb_navires_a_flot += 1
 
         return True
 
@@ -366,9 +392,15 @@ class Joueur:
 
         Cette méthode affiche pour chaque navire son nom, sa taille et son état courant
         (nombre de cases touchées sur la taille totale ou 'coulé' si le navire est complètement détruit).
+        Au-delà de TAILLE_MAX_AFFICHAGE navires, seuls ceux qui sont touchés sans être coulés sont détaillés.
         """
         print(f"\n--- Navires de {self.nom} ---")
-        for navire in self.navires:
+        navires = self.navires
+        if len(navires) > const.TAILLE_MAX_AFFICHAGE:
+            navires = [navire for navire in navires if 0 < navire.points_vie < navire.taille]
+            print(f"  {len(self.navires) - self._nb_navires_a_flot} coulés, {len(navires)} touchés, "
+                  f"{self._nb_navires_a_flot - len(navires)} intacts")
+        for navire in navires[:const.TAILLE_MAX_AFFICHAGE]:
             print(f"  {navire}")
 
     def __str__(self):
@@ -378,18 +410,22 @@ class Joueur:
 
         return f"Joueur: {self.nom} | Statut: {navires_coules}/{total_navires} navires coulés."
 
-    def afficher_etat_complet(self):
-        """Affiche le nom du joueur, l'état de la flotte et les deux grilles."""
+    def afficher_etat_complet(self, centre: tuple[int, int] | None = None,
+                              centre_suivi: tuple[int, int] | None = None):
+        """
+        Affiche le nom du joueur, l'état de la flotte et les deux grilles
+        (centrées sur `centre` et `centre_suivi` si elles sont trop grandes pour la console).
+        """
 
         print("\n" + "=" * 40)
         print(self.__str__())  # Utilise la méthode __str__ pour le résumé
         print("-" * 40)
 
         # 1. Affichage de la grille principale (ses propres navires)
-        self.afficher_grille()
+        self.afficher_grille(centre=centre)
 
         # 2. Affichage de la grille de suivi (ses tirs sur l'adversaire)
-        self.afficher_grille_suivi()
+        self.afficher_grille_suivi(centre_suivi)
 
         # 3. Affichage de l'état détaillé des navires
         self.afficher_navires()  # Supposons que cette méthode affiche chaque navire.
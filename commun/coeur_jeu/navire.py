@@ -1,6 +1,9 @@
 from commun.constantes import HORIZONTAL
 
 class Navire:
+    # Pas de __dict__ par instance : une partie active en porte une dizaine (voir BUDGET_MEMOIRE_PARTIE)
+    __slots__ = ("nom", "taille", "x", "y", "orientation", "positionne", "_touchees")
+
     def __init__(self, nom: str, taille: int, x: int=0, y: int=0, orientation: str=None):
         """
         Initialise un navire
@@ -17,7 +20,7 @@ class Navire:
         self.x = x
         self.y = y
         self.orientation = orientation if orientation is not None else HORIZONTAL
-        self.cases_touchees: set[tuple[int, int]] = set()  # Ensemble des positions touchées
+        self._touchees = 0  # Cases touchées : le bit i est la i-ème case du navire
         self.positionne = False
 
     def positionner(self, x: int, y: int, orientation: str) -> None:
@@ -76,11 +79,44 @@ class Navire:
             bool: True si le navire est touché (le tir touche au moins une case occupée par ce navire),
                   False sinon.
         """
-        if (x, y) in self.obtenir_coordonnees():
-            self.cases_touchees.add((x, y))
+        if self.occupe(x, y):
+            self._touchees |= 1 << self._rang(x, y)
             return True
         return False
 
+    def _rang(self, x: int, y: int) -> int:
+        """ Rang de la case (x, y) dans le navire (0 pour la case de départ). """
+        return x - self.x if self.orientation == HORIZONTAL else y - self.y
+
+    @property
+    def cases_touchees(self) -> set[tuple[int, int]]:
+        """ Ensemble des positions touchées (calculé depuis le masque des cases touchées). """
+        if self.orientation == HORIZONTAL:
+            return {(self.x + i, self.y) for i in range(self.taille) if self._touchees >> i & 1}
+        return {(self.x, self.y + i) for i in range(self.taille) if self._touchees >> i & 1}
+
+    @cases_touchees.setter
+    def cases_touchees(self, cases) -> None:
+        """ Les positions qui ne sont pas sur le navire sont ignorées. """
+        self._touchees = 0
+        for x, y in cases:
+            rang = self._rang(x, y)
+            if 0 <= rang < self.taille and (y == self.y if self.orientation == HORIZONTAL else x == self.x):
+                self._touchees |= 1 << rang
+
+    def occupe(self, x: int, y: int) -> bool:
+        """ Vrai si le navire (positionné) occupe la case (x, y), sans construire ses coordonnées. """
+        if not self.positionne:
+            return False
+        if self.orientation == HORIZONTAL:
+            return y == self.y and self.x <= x < self.x + self.taille
+        return x == self.x and self.y <= y < self.y + self.taille
+
+    @property
+    def points_vie(self) -> int:
+        """ Cases du navire encore intactes. """
+        return self.taille - self._touchees.bit_count()
+
     def est_coule(self) -> bool:
         """
         Vérifie si le navire est complètement coulé.
@@ -89,7 +125,7 @@ class Navire:
             bool: True si le nombre de cases touchées équivaut à la taille du navire, 
                   False sinon.
         """
-        return len(self.cases_touchees) == self.taille
+        return self.points_vie == 0
 
     def to_dict(self) -> dict:
         """
@@ -115,7 +151,7 @@ class Navire:
                         data["x"],
                         data["y"],
                         data["orientation"])
-        navire.cases_touchees = set(tuple(c) for c in data.get("cases_touchees", []))
+        navire.cases_touchees = data.get("cases_touchees", [])
         navire.positionne = data.get("positionne", False)
         return navire
 
@@ -126,5 +162,5 @@ class Navire:
         Returns:
             str: Représentation textuelle du navire.
         """
-        etat = "coulé" if self.est_coule() else f"{len(self.cases_touchees)}/{self.taille} touché"
+        etat = "coulé" if self.est_coule() else f"{self.taille - self.points_vie}/{self.taille} touché"
         return f"{self.nom} ({self.taille} cases) - {etat}"
\ No newline at end of file
@@ -1,27 +1,42 @@
+import random
+
 from commun import constantes as const
+from .cibles_restantes import CiblesRestantes
 from .joueur import Joueur
-from typing import Any
+from .strategie_ia import StrategieIa
+from typing import Any, Callable
 
 from ..constantes import NOM_SERVEUR
 
 
 class Partie:
-    def __init__(self, joueur1: Joueur, joueur2: Joueur=None, etat: str = const.ETAT_EN_ATTENTE, est_tour_joueur1: bool = True, gagnant: str = None):
+    __slots__ = ("joueur1", "joueur2", "etat", "est_tour_joueur1", "gagnant", "strategie_ia", "_cibles_ia", "_ia")
+
+    def __init__(self, joueur1: Joueur, joueur2: Joueur=None, etat: str = const.ETAT_EN_ATTENTE, est_tour_joueur1: bool = True, gagnant: str = None,
+                 strategie_ia: str | None = None):
         """
         Initialise une partie. Utilisé pour la création et la reprise.
 
         Args:
             joueur1: Premier joueur (client)
-            joueur2: Deuxième joueur (serveur ou autre client)
+            joueur2: Deuxième joueur (serveur ou autre client) ; par défaut l'IA, avec la
+                même configuration (taille de grille, flotte) que joueur1
             etat: État initial de la partie (pour la reprise)
             est_tour_joueur1: Indicateur de tour (pour la reprise)
             gagnant: Nom du gagnant (pour la reprise)
+            strategie_ia: Stratégie de tir de l'IA en Solo (IA_*, None : celle de DIFFICULTE_IA)
         """
         self.joueur1 = joueur1
-        self.joueur2 = joueur2 if joueur2 else Joueur(NOM_SERVEUR)
+        self.joueur2 = joueur2 if joueur2 else Joueur(NOM_SERVEUR, configuration=joueur1.configuration())
         self.etat = etat
         self.est_tour_joueur1 = est_tour_joueur1
         self.gagnant = gagnant
+        self.strategie_ia = strategie_ia
+        # Cases que l'IA (joueur2) n'a pas encore visées : créées au premier tir de l'IA
+        # (jamais en PvP), reconstruites depuis sa grille de suivi après une reprise
+        self._cibles_ia: CiblesRestantes | None = None
+        # Stratégie de l'IA, avec son état sur la flotte de joueur1, créée comme _cibles_ia
+        self._ia: StrategieIa | None = None
 
     def demarrer(self) -> None:
         """
@@ -50,7 +65,8 @@ class Partie:
             y: Coordonnée y du tir
 
         Returns:
-            Tuple (resultat, navire_coule, partie_terminee)
+            Tuple (resultat, navire_coule, partie_terminee) ; (MSG_ERREUR, détail, False) pour un tir
+            refusé (partie non en cours, case hors de la grille), le tour ne change pas.
         """
         if self.etat != const.ETAT_EN_COURS:
             return const.MSG_ERREUR, "Partie non en cours", False
@@ -59,6 +75,10 @@ class Partie:
         cible = self.joueur2 if self.est_tour_joueur1 else self.joueur1
         tireur = self.joueur1 if self.est_tour_joueur1 else self.joueur2
 
+        # Les grilles ne vérifient pas les coordonnées : hors limites, une autre case serait marquée
+        if not cible.grille.contient(x, y):
+            return const.MSG_ERREUR, "Tir hors de la grille", False
+
         # 1. Effectuer le tir
         resultat, navire_coule = cible.recevoir_tir(x, y)
 
@@ -66,6 +86,10 @@ class Partie:
         if resultat != const.TIR_DEJA_TIRE:
             # 2. Enregistrer le tir dans la grille de suivi du tireur
             tireur.enregistrer_tir(x, y, resultat)
+            if self._cibles_ia is not None and tireur is self.joueur2:
+                self._cibles_ia.retirer(x, y)
+                if self._ia is not None:
+                    self._ia.noter_tir(x, y, resultat, navire_coule)
 
             # Vérifier si la partie est terminée
             if cible.tous_navires_coules():
@@ -83,7 +107,66 @@ class Partie:
         Crée et configure le Joueur 2 (l'IA) si la partie est en mode Solo.
         """
         if self.joueur2 is None or self.joueur2.nom == NOM_SERVEUR:
-            self.joueur2 = Joueur(NOM_SERVEUR)
+            self.joueur2 = Joueur(NOM_SERVEUR, configuration=self.joueur1.configuration())
+
+    def choisir_tir_ia(self, rng: random.Random | None = None,
+                       calculateur: Callable[[StrategieIa, Any], Any | None] | None = None) -> tuple[int, int]:
+        """
+        Case que l'IA (joueur2) n'a pas encore visée, choisie par sa stratégie (strategie_ia,
+        voir StrategieIa).
+
+        Args:
+            rng: Générateur aléatoire (None : module random).
+            calculateur: Fait le calcul coûteux du tir à la place de la stratégie
+                         (StrategieIa.calculer, ex : dans un autre processus, voir
+                         CalculateurIa). None s'il n'a pas abouti à temps : l'IA joue alors
+                         son tir rapide (StrategieIa.tir_rapide).
+
+        Raises:
+            ValueError: Si l'IA a déjà visé toutes les cases, ou si sa stratégie est inconnue.
+        """
+        if calculateur is None:
+            return self.conclure_tir_ia(None, None, rng)
+        ia, travail = self.preparer_tir_ia()
+        return self.conclure_tir_ia(travail, calculateur(ia, travail) if travail is not None else None, rng)
+
+    def preparer_tir_ia(self) -> tuple[StrategieIa, Any | None]:
+        """
+        Premier temps de choisir_tir_ia() pour qui fait le calcul lui-même (ex : en l'attendant
+        sans bloquer) : la stratégie de l'IA et le travail de son calcul coûteux (None : rien à
+        calculer). Le tir est ensuite donné par conclure_tir_ia().
+        """
+        ia = self._strategie_ia()
+        return ia, ia.preparer(self.joueur2.grille_suivi)
+
+    def conclure_tir_ia(self, travail: Any | None, resultat: Any | None,
+                        rng: random.Random | None = None) -> tuple[int, int]:
+        """
+        Second temps : le tir de l'IA d'après le résultat du calcul de `travail` (None s'il n'a
+        pas abouti à temps : tir rapide). Sans travail, la stratégie choisit seule.
+        """
+        ia = self._strategie_ia()
+        suivi = self.joueur2.grille_suivi
+        if travail is None:
+            return ia.choisir_tir(suivi, self._cibles_ia, rng)
+        if resultat is None:
+            return ia.tir_rapide(suivi, self._cibles_ia, rng)
+        return ia.conclure(resultat, travail, self._cibles_ia, rng)
+
+    def _strategie_ia(self) -> StrategieIa:
+        """ Stratégie de l'IA, créée (avec les cibles restantes) à son premier tir. """
+        if self._cibles_ia is None:
+            self._cibles_ia = CiblesRestantes(self.joueur2.grille_suivi)
+        if self._ia is None:
+            # Seuls les noms des navires coulés (annoncés) sont transmis, pas leurs positions
+            coules = [navire.nom for navire in self.joueur1.navires if navire.est_coule()]
+            self._ia = StrategieIa.creer(self.obtenir_strategie_ia(), self.joueur1.configuration(),
+                                         self.joueur2.grille_suivi, coules)
+        return self._ia
+
+    def obtenir_strategie_ia(self) -> str:
+        """ Stratégie de tir de l'IA (IA_*) : celle de la partie, sinon celle de DIFFICULTE_IA. """
+        return self.strategie_ia if self.strategie_ia is not None else const.DIFFICULTES_IA[const.DIFFICULTE_IA]
 
     def abandonner(self, joueur_abandonne: str) -> None:
         """
@@ -138,13 +221,16 @@ class Partie:
 
     def to_dict(self) -> dict[str, Any]:
         """ Sérialise l'état complet de la partie pour la sauvegarde JSON. """
-        return {
+        donnees = {
             "joueur1": self.joueur1.to_dict(),  # Utilise la sérialisation de Joueur
             "joueur2": self.joueur2.to_dict(),
             "etat": self.etat,
             "tour_joueur1": self.est_tour_joueur1,
             "gagnant": self.gagnant
         }
+        if self.strategie_ia is not None:
+            donnees["strategie_ia"] = self.strategie_ia  # Absente des sauvegardes antérieures
+        return donnees
 
     @staticmethod
     def from_dict(data: dict[str, Any]) -> 'Partie':
@@ -158,5 +244,6 @@ class Partie:
             joueur2=joueur2,
             etat=data["etat"],
             est_tour_joueur1=data["tour_joueur1"],
-            gagnant=data["gagnant"]
+            gagnant=data["gagnant"],
+            strategie_ia=data.get("strategie_ia")
         )
\ No newline at end of file
@@ -0,0 +1,220 @@
+import random
+
+from commun import constantes as const
+from .grille import Grille
+
+
+class PlaceurFlotte:
+    """
+    Placement aléatoire d'une flotte : chaque navire est placé uniformément parmi les
+    placements légaux (x, y, horizontal) de la grille telle qu'elle est occupée à ce moment.
+
+    Un placement est tiré uniformément parmi tous ceux de la grille vide et gardé s'il est
+    libre (le résultat reste uniforme parmi les placements libres) ; après
+    ESSAIS_TIRAGE_PLACEMENT tirages occupés, les placements libres sont énumérés et l'un
+    d'eux est tiré. Sur les petites grilles (au plus TAILLE_MAX_TABLES_PLACEMENT cases),
+    les placements d'un navire de taille donnée sont précalculés une fois en masques de
+    bits (table en cache par largeur, hauteur et taille) : un placement se teste contre
+    l'occupation en une opération. Au-delà, ils sont numérotés et testés sur la grille.
+
+    Si un navire n'a plus aucun placement libre, le navire précédent est déplacé (retour
+    arrière) : une flotte est toujours placée dès qu'une disposition existe. Une flotte
+    dense est d'abord cherchée par quelques recherches courtes (RETOURS_MAX_PLACEMENT
+    retours par navire), reprises depuis le début, avant la recherche complète. Les tirages
+    passent par `rng` (le module random par défaut, donc random.seed() s'applique).
+    """
+
+    # (largeur, hauteur, taille) -> [(masque des cases, x, y, horizontal)]
+    _tables: dict[tuple[int, int, int], list[tuple[int, int, int, bool]]] = {}
+
+    def __init__(self, grille: Grille, rng: random.Random | None = None):
+        self.grille = grille
+        self.rng = rng if rng is not None else random
+        self._masques = grille.largeur * grille.hauteur <= const.TAILLE_MAX_TABLES_PLACEMENT
+        self._occupation = self._lire_occupation() if self._masques else 0
+
+    @staticmethod
+    def table(largeur: int, hauteur: int, taille: int) -> list[tuple[int, int, int, bool]]:
+        """ Tous les placements d'un navire de `taille` cases sur une grille vide, avec leur masque. """
+        cle = (largeur, hauteur, taille)
+        table = PlaceurFlotte._tables.get(cle)
+        if table is None:
+            if len(PlaceurFlotte._tables) >= const.NB_MAX_TABLES_PLACEMENT:
+                PlaceurFlotte._tables.clear()
+            ligne = (1 << taille) - 1
+            colonne = sum(1 << (i * largeur) for i in range(taille))
+            table = [(ligne << (y * largeur + x), x, y, True)
+                     for y in range(hauteur) for x in range(largeur - taille + 1)]
+            table += [(colonne << (y * largeur + x), x, y, False)
+                      for y in range(hauteur - taille + 1) for x in range(largeur)]
+            PlaceurFlotte._tables[cle] = table
+        return table
+
+    def _grille_occupee(self) -> bool:
+        """ La grille a-t-elle une case qui n'est pas de l'eau ? """
+        return any(self.grille.contient_valeur(valeur) for valeur in (const.CASE_NAVIRE, const.CASE_TOUCHE, const.CASE_RATE))
+
+    def _lire_occupation(self) -> int:
+        """ Masque des cases qui ne sont pas de l'eau (0 sans lire les cases si la grille est vide). """
+        grille = self.grille
+        if not self._grille_occupee():
+            return 0
+        occupation = 0
+        for y in range(grille.hauteur):
+            for x, case in enumerate(grille.ligne(y)):
+                if case != const.CASE_EAU:
+                    occupation |= 1 << (y * grille.largeur + x)
+        return occupation
+
+    def tirer(self, tailles: list[int]) -> list[tuple[int, int, bool]] | None:
+        """
+        Tire une disposition des navires de `tailles` sur les cases libres de la grille, et
+        marque leurs cases (CASE_NAVIRE).
+
+        Returns:
+            list | None: (x, y, horizontal) de chaque navire, dans l'ordre de `tailles`, ou
+            None si aucune disposition n'existe (la grille n'est alors pas modifiée).
+        """
+        # Les plus grands navires d'abord : les retours arrière sont alors rares
+        ordre = sorted(range(len(tailles)), key=lambda i: -tailles[i])
+        triees = [tailles[i] for i in ordre]
+        if sum(triees) > self._nb_cases_libres():
+            return None
+
+        # Recherches courtes reprises depuis le début (une flotte dense se place vite avec
+        # d'autres premiers tirages), puis une recherche complète
+        for _ in range(const.REPRISES_PLACEMENT):
+            choisis = self._chercher(triees, const.RETOURS_MAX_PLACEMENT * len(triees))
+            if choisis is not PlaceurFlotte._ABANDON:
+                break
+        else:
+            choisis = self._chercher(triees, None)
+        if choisis is None:
+            return None
+
+        if self._masques:
+            for (_, x, y, horizontal), taille in zip(choisis, triees):
+                self.grille.marquer_segment(x, y, taille, horizontal, const.CASE_NAVIRE)
+        placements: list[tuple[int, int, bool]] = [(0, 0, True)] * len(tailles)
+        for rang, i in enumerate(ordre):
+            placements[i] = choisis[rang][-3:]
+        return placements
+
+    # Résultat de _chercher quand son nombre de retours arrière est épuisé
+    _ABANDON: list = []
+
+    def _chercher(self, tailles: list[int], retours_max: int | None) -> list[tuple] | None:
+        """
+        Recherche avec retour arrière : placements choisis (marqués), None si aucune disposition
+        n'existe, ou _ABANDON (rien de marqué) après `retours_max` retours arrière.
+        """
+        # Placements libres restants à chaque profondeur, énumérés au premier retour
+        # (None tant que le navire a été placé par un simple tirage)
+        restants: list[list[tuple] | None] = []
+        choisis: list[tuple] = []
+        nb_retours = 0
+        while len(choisis) < len(tailles):
+            taille = tailles[len(choisis)]
+            placement = None
+            if len(restants) == len(choisis):
+                restants.append(None)
+                placement = self._tirer_libre(taille)
+                if placement is None:
+                    restants[-1] = self._enumerer_libres(taille)
+            if placement is None:
+                if not restants[-1]:
+                    # Aucun placement pour ce navire : le précédent est déplacé
+                    restants.pop()
+                    if not choisis:
+                        return None
+                    precedent = choisis.pop()
+                    self._effacer(precedent, tailles[len(choisis)])
+                    nb_retours += 1
+                    if retours_max is not None and nb_retours > retours_max:
+                        for rang, place in enumerate(choisis):
+                            self._effacer(place, tailles[rang])
+                        return PlaceurFlotte._ABANDON
+                    if restants[-1] is None:
+                        restants[-1] = [libre for libre in self._enumerer_libres(tailles[len(choisis)])
+                                        if libre != precedent]
+                    continue
+                placement = self._retirer_au_hasard(restants[-1])
+            self._marquer(placement, taille)
+            choisis.append(placement)
+        return choisis
+
+    def _nb_cases_libres(self) -> int:
+        grille = self.grille
+        nb_cases = grille.largeur * grille.hauteur
+        if self._masques:
+            return nb_cases - self._occupation.bit_count()
+        if not self._grille_occupee():
+            return nb_cases
+        return nb_cases - sum(1 for y in range(grille.hauteur) for case in grille.ligne(y) if case != const.CASE_EAU)
+
+    # --- Placements d'un navire : masques (petites grilles) ou cases de la grille ---
+
+    def _tirer_libre(self, taille: int) -> tuple | None:
+        """ Un placement libre tiré uniformément, ou None après ESSAIS_TIRAGE_PLACEMENT tirages occupés. """
+        rng = self.rng
+        if self._masques:
+            table = PlaceurFlotte.table(self.grille.largeur, self.grille.hauteur, taille)
+            if not table:
+                return None
+            occupation = self._occupation
+            for _ in range(const.ESSAIS_TIRAGE_PLACEMENT):
+                placement = table[rng.randrange(len(table))]
+                if not placement[0] & occupation:
+                    return placement
+            return None
+
+        nb_placements = self._nb_placements(taille)
+        if nb_placements == 0:
+            return None
+        for _ in range(const.ESSAIS_TIRAGE_PLACEMENT):
+            placement = self._placement(taille, rng.randrange(nb_placements))
+            if self.grille.segment_libre(placement[0], placement[1], taille, placement[2]):
+                return placement
+        return None
+
+    def _enumerer_libres(self, taille: int) -> list[tuple]:
+        if self._masques:
+            occupation = self._occupation
+            return [placement for placement in PlaceurFlotte.table(self.grille.largeur, self.grille.hauteur, taille)
+                    if not placement[0] & occupation]
+        libre = self.grille.segment_libre
+        return [placement for placement in (self._placement(taille, i) for i in range(self._nb_placements(taille)))
+                if libre(placement[0], placement[1], taille, placement[2])]
+
+    def _nb_placements(self, taille: int) -> int:
+        largeur, hauteur = self.grille.largeur, self.grille.hauteur
+        return max(0, largeur - taille + 1) * hauteur + largeur * max(0, hauteur - taille + 1)
+
+    def _placement(self, taille: int, indice: int) -> tuple[int, int, bool]:
+        """ Placement numéro `indice` : les horizontaux ligne par ligne, puis les verticaux. """
+        largeur = self.grille.largeur
+        par_ligne = max(0, largeur - taille + 1)
+        nb_horizontaux = par_ligne * self.grille.hauteur
+        if indice < nb_horizontaux:
+            y, x = divmod(indice, par_ligne)
+            return x, y, True
+        y, x = divmod(indice - nb_horizontaux, largeur)
+        return x, y, False
+
+    def _marquer(self, placement: tuple, taille: int) -> None:
+        if self._masques:
+            self._occupation |= placement[0]
+        else:
+            self.grille.marquer_segment(placement[0], placement[1], taille, placement[2], const.CASE_NAVIRE)
+
+    def _effacer(self, placement: tuple, taille: int) -> None:
+        if self._masques:
+            self._occupation &= ~placement[0]
+        else:
+            self.grille.marquer_segment(placement[0], placement[1], taille, placement[2], const.CASE_EAU)
+
+    def _retirer_au_hasard(self, elements: list) -> tuple:
+        """ Retire et retourne un élément au hasard (échange avec le dernier, puis pop). """
+        i = self.rng.randrange(len(elements))
+        elements[i], elements[-1] = elements[-1], elements[i]
+        return elements.pop()
@@ -0,0 +1,260 @@
+import random
+from collections import Counter
+from typing import Any, Iterable
+
+from commun import constantes as const
+from .cibles_restantes import CiblesRestantes
+from .configuration_partie import ConfigurationPartie
+from .grille import Grille
+from .grille_creuse import GrilleCreuse
+
+
+class StrategieIa:
+    """
+    Stratégie de tir de l'IA Solo : d'après sa grille de suivi et les résultats de ses
+    tirs (noter_tir), la prochaine case à viser.
+
+    Quatre stratégies implémentent cette interface (registre : StrategieIa.classes(),
+    nom IA_* -> classe) :
+        * IaAleatoire   : une case pas encore visée, au hasard,
+        * IaChasseCible : au hasard, puis les voisines des touches (mode cible),
+        * IaParite      : chasse-cible, en ne chassant que sur un damier,
+        * IaDensite     : carte de densité des navires restants.
+    Chaque stratégie déclare la classe de coût CPU d'un tir (COUT, un COUT_IA_*) : le
+    serveur calcule les tirs COUT_IA_LOURD hors du thread de la session et les plafonne
+    sous charge (voir CalculateurIa) ; la stratégie joue alors tir_rapide().
+
+    L'IA ne voit que ce qu'un joueur voit : la configuration de la partie, sa grille de
+    suivi et le nom de chaque navire coulé (annoncé par REPONSE_TIR). Les cases d'un navire
+    coulé sont déduites de ses propres touches (voir _cases_coulees) ; après une reprise,
+    l'état est reconstruit de la même façon depuis la grille de suivi (voir __init__).
+    """
+
+    NOM = ""
+    COUT = const.COUT_IA_CONSTANT
+
+    __slots__ = ("largeur", "hauteur", "_tailles", "_flotte", "_coulees", "_touches")
+
+    def __init__(self, configuration: ConfigurationPartie, grille_suivi: Grille, coules: Iterable[str] = ()):
+        """
+        État de l'IA d'après sa grille de suivi et les noms des navires déjà coulés (reprise).
+
+        Un groupe de touches voisines qui se découpe exactement en navires coulés (voir
+        _decouper) leur est attribué ; les autres restent des touches en cours.
+        """
+        self.largeur = grille_suivi.largeur
+        self.hauteur = grille_suivi.hauteur
+        self._tailles = dict(configuration.navires)  # Nom -> taille (un navire coulé n'est annoncé que par son nom)
+        # Tailles des navires à flot (taille -> nombre), cases des navires coulés, et cases
+        # touchées des navires à flot (dans l'ordre des tirs : la dernière est la plus récente)
+        self._flotte: Counter[int] = Counter(taille for _, taille in configuration.navires)
+        self._coulees: set[int] = set()
+        self._touches: dict[int, None] = dict.fromkeys(StrategieIa._touches_suivi(grille_suivi))
+
+        tailles_coulees = Counter()
+        for nom in coules:
+            taille = self._tailles.get(nom)
+            if taille is not None and self._flotte[taille]:
+                self._retirer_de_la_flotte(taille)
+                tailles_coulees[taille] += 1
+        for groupe in self._groupes_touches():
+            if len(groupe) > sum(taille * nombre for taille, nombre in tailles_coulees.items()):
+                continue
+            navires = self._decouper(set(groupe), tailles_coulees)
+            for cases in navires or ():
+                tailles_coulees[len(cases)] -= 1
+                self._couler(cases)
+
+    @staticmethod
+    def _touches_suivi(grille_suivi: Grille) -> list[int]:
+        """ Clés des cases touchées de la grille de suivi (sans parcourir une grille creuse). """
+        if not grille_suivi.contient_valeur(const.CASE_TOUCHE):
+            return []
+        largeur = grille_suivi.largeur
+        if isinstance(grille_suivi, GrilleCreuse):
+            return sorted(y * largeur + x for x, y, valeur in grille_suivi.en_donnees()["cases"]
+                          if valeur == const.CASE_TOUCHE)
+        return [y * largeur + x for y in range(grille_suivi.hauteur)
+                for x, case in enumerate(grille_suivi.ligne(y)) if case == const.CASE_TOUCHE]
+
+    def _groupes_touches(self) -> list[list[int]]:
+        """ Touches en cours regroupées par voisinage (4-connexité). """
+        groupes, vues = [], set()
+        for depart in self._touches:
+            if depart in vues:
+                continue
+            groupe, pile = [], [depart]
+            vues.add(depart)
+            while pile:
+                cle = pile.pop()
+                groupe.append(cle)
+                y, x = divmod(cle, self.largeur)
+                for vx, vy in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                    voisine = self._cle(vx, vy)
+                    if self._touchee(vx, vy) and voisine not in vues:
+                        vues.add(voisine)
+                        pile.append(voisine)
+            groupes.append(groupe)
+        return groupes
+
+    def _decouper(self, cases: set[int], tailles: Counter[int]) -> list[list[int]] | None:
+        """
+        Découpage des cases en segments droits des tailles disponibles (taille -> nombre),
+        None s'il n'y en a pas. La première case (la plus haute, puis la plus à gauche)
+        commence forcément un segment : il n'y a que deux orientations à essayer par taille.
+        """
+        if not cases:
+            return []
+        y, x = divmod(min(cases), self.largeur)
+        for taille in [t for t, nombre in tailles.items() if nombre > 0]:
+            for dx, dy in ((1, 0), (0, 1)) if taille > 1 else ((1, 0),):
+                if x + (taille - 1) * dx >= self.largeur or y + (taille - 1) * dy >= self.hauteur:
+                    continue
+                segment = [self._cle(x + i * dx, y + i * dy) for i in range(taille)]
+                if not cases.issuperset(segment):
+                    continue
+                tailles[taille] -= 1
+                reste = self._decouper(cases.difference(segment), tailles)
+                tailles[taille] += 1
+                if reste is not None:
+                    return [segment] + reste
+        return None
+
+    @staticmethod
+    def classes() -> dict[str, type['StrategieIa']]:
+        """ Registre des stratégies : nom (IA_*) -> classe. """
+        from .ia_aleatoire import IaAleatoire
+        from .ia_chasse_cible import IaChasseCible
+        from .ia_densite import IaDensite
+        from .ia_parite import IaParite
+
+        return {classe.NOM: classe for classe in (IaAleatoire, IaChasseCible, IaParite, IaDensite)}
+
+    @staticmethod
+    def creer(nom: str, configuration: ConfigurationPartie, grille_suivi: Grille,
+              coules: Iterable[str] = ()) -> 'StrategieIa':
+        """
+        Stratégie `nom` (IA_*) dans une partie de cette configuration (voir __init__).
+
+        Raises:
+            ValueError: Si la stratégie est inconnue.
+        """
+        classe = StrategieIa.classes().get(nom)
+        if classe is None:
+            raise ValueError(f"Stratégie d'IA inconnue: {nom}")
+        return classe(configuration, grille_suivi, coules)
+
+    def _cle(self, x: int, y: int) -> int:
+        return y * self.largeur + x
+
+    def noter_tir(self, x: int, y: int, resultat: str, navire_coule: str | None = None) -> None:
+        """ Résultat d'un tir de l'IA (navire_coule : le nom du navire coulé par ce tir, s'il y en a un). """
+        if resultat == const.TIR_TOUCHE:
+            self._touches[self._cle(x, y)] = None
+        elif resultat == const.TIR_COULE:
+            taille = self._tailles.get(navire_coule)
+            if taille is not None and self._flotte[taille]:
+                self._retirer_de_la_flotte(taille)
+            self._couler(self._cases_coulees(x, y, taille or 1))
+
+    def _retirer_de_la_flotte(self, taille: int) -> None:
+        self._flotte[taille] -= 1
+        if not self._flotte[taille]:
+            del self._flotte[taille]
+
+    def _couler(self, cles: Iterable[int]) -> None:
+        for cle in cles:
+            self._coulees.add(cle)
+            self._touches.pop(cle, None)
+
+    def _cases_coulees(self, x: int, y: int, taille: int) -> list[int]:
+        """
+        Cases du navire de `taille` coulé par le tir en (x, y) : `taille` touches alignées
+        qui passent par (x, y). Entre plusieurs possibilités (navires voisins), celle dont
+        l'alignement de touches a exactement la taille du navire est préférée, puis celle
+        qui finit en (x, y) (le dernier tir achève le plus souvent un bout du navire).
+        Sans possibilité (touches mal attribuées auparavant), la seule case (x, y).
+        """
+        candidats = []
+        for dx, dy in ((1, 0), (0, 1)):
+            avant = 0
+            while self._touchee(x - (avant + 1) * dx, y - (avant + 1) * dy):
+                avant += 1
+            apres = 0
+            while self._touchee(x + (apres + 1) * dx, y + (apres + 1) * dy):
+                apres += 1
+            # Décalage du début du navire par rapport à (x, y), dans l'alignement [-avant, apres]
+            for debut in range(max(-avant, 1 - taille), min(0, apres - taille + 1) + 1):
+                exact = avant + apres + 1 == taille
+                bout = debut == 0 or debut == 1 - taille
+                cases = [self._cle(x + (debut + i) * dx, y + (debut + i) * dy) for i in range(taille)]
+                candidats.append((not exact, not bout, cases))
+        if not candidats:
+            return [self._cle(x, y)]
+        return min(candidats, key=lambda candidat: candidat[:2])[2]
+
+    # --- À implémenter par chaque stratégie ---
+
+    def choisir_tir(self, grille_suivi: Grille, cibles: CiblesRestantes, rng: random.Random | None = None) -> tuple[int, int]:
+        """
+        Prochaine case à viser, pas encore visée.
+
+        Raises:
+            ValueError: Si toutes les cases ont été visées.
+        """
+        raise NotImplementedError
+
+    def tir_rapide(self, grille_suivi: Grille, cibles: CiblesRestantes, rng: random.Random | None = None) -> tuple[int, int]:
+        """ Tir de repli quand le tir n'a pas pu être calculé à temps : mode cible, sinon au hasard. """
+        tir = self._cibler(grille_suivi, rng)
+        return tir if tir is not None else cibles.tirer(rng)
+
+    # --- Calcul déporté (stratégies COUT_IA_LOURD) ---
+    # choisir_tir() = conclure(calculer(preparer(...))) ; seul calculer() est coûteux, et
+    # ne dépend que de la stratégie et du travail préparé : il peut s'exécuter ailleurs.
+
+    def preparer(self, grille_suivi: Grille) -> Any | None:
+        """ Travail à calculer pour le prochain tir, None si choisir_tir() ne calcule rien de coûteux. """
+        return None
+
+    def calculer(self, travail: Any) -> Any:
+        raise NotImplementedError
+
+    def conclure(self, resultat: Any, travail: Any, cibles: CiblesRestantes,
+                 rng: random.Random | None = None) -> tuple[int, int]:
+        raise NotImplementedError
+
+    # --- Mode cible ---
+
+    def _touchee(self, x: int, y: int) -> bool:
+        return 0 <= x < self.largeur and 0 <= y < self.hauteur and self._cle(x, y) in self._touches
+
+    def _cibler(self, grille_suivi: Grille, rng: random.Random | None = None) -> tuple[int, int] | None:
+        """
+        Case pas encore visée qui prolonge les touches en cours, None sans touche en cours :
+        de la plus récente à la plus ancienne, les bouts d'un alignement de touches, sinon
+        les voisines de la touche.
+        """
+        rng = rng if rng is not None else random
+
+        def libre(x: int, y: int) -> bool:
+            return 0 <= x < self.largeur and 0 <= y < self.hauteur \
+                and grille_suivi.obtenir(x, y) not in (const.CASE_TOUCHE, const.CASE_RATE)
+
+        for cle in reversed(self._touches):
+            y, x = divmod(cle, self.largeur)
+            bouts = []
+            for dx, dy in ((1, 0), (0, 1)):
+                if not (self._touchee(x + dx, y + dy) or self._touchee(x - dx, y - dy)):
+                    continue
+                for sens in (1, -1):
+                    bx, by = x, y
+                    while self._touchee(bx, by):
+                        bx, by = bx + sens * dx, by + sens * dy
+                    if libre(bx, by):
+                        bouts.append((bx, by))
+            if not bouts:
+                bouts = [(vx, vy) for vx, vy in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)) if libre(vx, vy)]
+            if bouts:
+                return bouts[rng.randrange(len(bouts))]
+        return None
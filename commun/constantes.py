@@ -1,10 +1,49 @@
 
-# Dimensions de la grille
+# Dimensions de la grille (configuration standard ; chaque partie peut choisir la sienne dans CHOIX_MODE)
 TAILLE_GRILLE = 10
+TAILLE_GRILLE_MIN = 2
+TAILLE_GRILLE_MAX = 1000
+# Représentation des grilles (voir commun/coeur_jeu/grille.py)
+GRILLE_LISTE = "LISTE"  # Listes de listes de CASE_*
+GRILLE_OCTETS = "OCTETS"  # Un bytearray, un octet par case
+GRILLE_BITBOARD = "BITBOARD"  # Un entier par état de case, un bit par case
+GRILLE_CREUSE = "CREUSE"  # Seules les cases qui ne sont pas de l'eau sont stockées
+MOTEUR_GRILLE = GRILLE_OCTETS
+SEUIL_GRILLE_CREUSE = 100 * 100  # Cases au-delà desquelles une grille est créée creuse, quel que soit MOTEUR_GRILLE
+TAILLE_MAX_AFFICHAGE = 30  # Cases affichées au plus par côté (fenêtre sur les grilles plus grandes)
+# Placement aléatoire des flottes (voir commun/coeur_jeu/placeur_flotte.py)
+TAILLE_MAX_TABLES_PLACEMENT = 32 * 32  # Cases jusqu'auxquelles les placements sont précalculés en masques de bits
+NB_MAX_TABLES_PLACEMENT = 256  # Tables (largeur, hauteur, taille de navire) gardées en cache
+ESSAIS_TIRAGE_PLACEMENT = 64  # Tirages d'un placement au hasard avant d'énumérer les placements libres
+REPRISES_PLACEMENT = 20  # Recherches courtes (reprises depuis le début) avant la recherche complète
+RETOURS_MAX_PLACEMENT = 4  # Retours arrière par navire au plus dans une recherche courte
+# Mémoire visée par partie active (deux joueurs, flotte complète, grille 10x10, moteur par défaut),
+# mesurée par benchmarks/bench_memoire_parties.py
+BUDGET_MEMOIRE_PARTIE = 4 * 1024
 
 # Configuration du système de sauvegarde
 FICHIER_SAUVEGARDE_UTILISATEURS = "donnees_utilisateurs.json"
 TAILLE_MIN_MDP = 4
+# Journal des modifications (ajout seul), rejoué au démarrage puis compacté dans le fichier de sauvegarde
+SUFFIXE_JOURNAL = ".journal"
+SEUIL_COMPACTION_JOURNAL = 10000  # Enregistrements du journal au-delà desquels il est compacté
+SYNCHRONISER_JOURNAL = True  # fsync à chaque lot d'écritures (résiste aussi à une panne du système)
+# Écriture différée : les modifications sont écrites par lots par un thread de persistance
+DELAI_ECRITURE_DIFFEREE = 0.05  # s maximum entre une modification et l'écriture de son lot
+TAILLE_LOT_ECRITURE_DIFFEREE = 512  # Modifications au-delà desquelles le lot est écrit sans attendre
+DELAI_REESSAI_ECRITURE_DIFFEREE = 1.0  # s d'attente après un lot en échec, avant le lot suivant
+# Parties sauvegardées : un fichier par joueur (stockage JSON), chargé à la demande
+SUFFIXE_DEPOT_PARTIES = ".parties"
+BUDGET_CACHE_PARTIES = 8 * 1024 * 1024  # Octets de parties récemment chargées gardées en mémoire
+# Points de contrôle des parties Solo en cours : instantané de base + tirs joués depuis (ajout seul)
+SUFFIXE_POINTS_CONTROLE = ".points_controle"
+INTERVALLE_POINTS_CONTROLE = 20  # Tirs au-delà desquels un nouvel instantané de base remplace le journal
+SYNCHRONISER_POINTS_CONTROLE = False  # fsync à chaque tir (sinon : résiste à l'arrêt brutal du serveur seulement)
+# Stockage des utilisateurs : fichier JSON + journal, ou base SQLite (mode WAL)
+STOCKAGE_JSON = "JSON"
+STOCKAGE_SQLITE = "SQLITE"
+STOCKAGE_UTILISATEURS = STOCKAGE_JSON
+FICHIER_BASE_UTILISATEURS = "donnees_utilisateurs.sqlite3"
 ENCODAGE = "utf-8"
 
 # ----------------------------------------------------------------------
@@ -20,6 +59,11 @@ NAVIRES = [
     ("Torpilleur", 2)
 ]
 
+# Flottes choisies par les clients (ConfigurationPartie)
+NB_MAX_NAVIRES = 1000
+TAILLE_MAX_NOM_NAVIRE = 32
+TAUX_MAX_OCCUPATION_FLOTTE = 0.3  # Part maximale des cases de la grille occupée par la flotte
+
 # Orientations
 HORIZONTAL = "H"
 VERTICAL = "V"
@@ -33,11 +77,52 @@ PORT_AUTH = 5554  # Port UDP pour l'authentification
 PORT_JEU = 5555  # Port TCP pour le jeu
 NB_MAX_CONNEXIONS = 5
 
+# Authentification UDP : groupe de travailleurs fixe et file de requêtes bornée
+NB_TRAVAILLEURS_AUTH = 8
+TAILLE_FILE_AUTH = 256  # Au-delà, le serveur répond MSG_AUTH_OCCUPE
+DELAI_REESSAI_AUTH = 0.5  # Attente (s) suggérée au client avant de réessayer
+NB_ESSAIS_AUTH = 3  # Tentatives du client tant que le serveur répond MSG_AUTH_OCCUPE
+TAILLE_ECHANTILLON_LATENCES = 10000  # Latences récentes conservées pour les statistiques
+
+# Serveurs de jeu annoncés par l'authentification UDP (AnnuaireJeu)
+# Liste de (hôte, port) ; l'hôte None désigne cette machine (son IP locale, résolue au démarrage)
+POINTS_ACCES_JEU: list[tuple[str | None, int]] = [(None, PORT_JEU)]
+DELAI_RAFRAICHISSEMENT_ANNUAIRE = 60.0  # s entre deux résolutions DNS des points d'accès
+DELAI_MESURE_CHARGE = 1.0  # s entre deux relevés du nombre de connexions des serveurs de jeu
+# Politiques de choix du serveur de jeu annoncé à un client authentifié
+REPARTITION_TOURNIQUET = "TOURNIQUET"  # Chacun son tour
+REPARTITION_MOINS_CHARGE = "MOINS_CHARGE"  # Le serveur qui a le moins de connexions
+POLITIQUE_REPARTITION_JEU = REPARTITION_TOURNIQUET
+
+# Modes réseau du serveur de jeu (choisis au lancement de ServeurPrincipal)
+MODE_RESEAU_THREADS = "THREADS"  # Un thread par client (GestionnaireClient)
+MODE_RESEAU_ASYNCIO = "ASYNCIO"  # Une coroutine par client sur une seule boucle asyncio
+NB_MAX_CONNEXIONS_ASYNCIO = 4096  # File d'attente de listen() en mode asyncio
+
+# Parties PvP : chaque partie est un acteur, exécuté par un groupe de threads partagé
+NB_TRAVAILLEURS_PARTIES = 8
+
 # Taille de l'entête en octets (4 octets = max 4 GB, suffisant ici)
 TAILLE_ENTETE = 4
+# Taille maximale acceptée pour un message (protège contre un entête corrompu ou malveillant)
+TAILLE_MAX_MESSAGE = 16 * 1024 * 1024
 
 SEPARATEUR = "|" # Séparateur pour la sérialisation
 
+# Codecs des messages TCP (négociés pendant MSG_CONNEXION / MSG_CONNEXION_OK)
+CODEC_JSON = "JSON"
+CODEC_BINAIRE = "BINAIRE"  # Structures fixes pour les messages fréquents, JSON pour les autres
+CODECS_SUPPORTES = [CODEC_BINAIRE, CODEC_JSON]  # Par ordre de préférence
+
+# File d'envoi propre à chaque connexion (un pair lent ne bloque pas les autres sessions)
+TAILLE_FILE_ENVOI = 256  # Lots de messages en attente (mode thread par client)
+TAILLE_MAX_TAMPON_ENVOI = 1024 * 1024  # Octets en attente dans le transport (mode asyncio)
+DELAI_MAX_BLOCAGE_ENVOI = 2.0  # Attente maximale (s) de l'écrivain qui vide la file à la fermeture
+# Politiques de débordement de la file d'envoi
+DEBORDEMENT_IGNORER_CHAT = "IGNORER_CHAT"  # Le chat est ignoré, les autres messages déconnectent le pair
+DEBORDEMENT_DECONNECTER = "DECONNECTER"  # Le pair est déconnecté dès que sa file est pleine
+POLITIQUE_DEBORDEMENT_ENVOI = DEBORDEMENT_IGNORER_CHAT
+
 # Entity
 CLIENT = "CLIENT"
 SERVEUR_AUTH = "SERVEUR_AUTH"
@@ -58,6 +143,7 @@ MSG_AUTH_LOGIN = "AUTH_LOGIN"
 MSG_AUTH_REGISTER = "AUTH_REGISTER"
 MSG_AUTH_SUCCESS = "AUTH_SUCCESS"
 MSG_AUTH_FAILED = "AUTH_FAILED"
+MSG_AUTH_OCCUPE = "AUTH_OCCUPE"  # Serveur saturé : réessayer plus tard
 
 # Messages de jeu
 MSG_CHOIX_MODE = "CHOIX_MODE"
@@ -91,6 +177,37 @@ MSG_SAUVEGARDER_PARTIE = "SAUVEGARDER_PARTIE" # Ajouté pour déclencher la sauv
 
 # Nom serveur IA
 NOM_SERVEUR = "SERVEUR_IA"
+# Stratégies de tir de l'IA (mode Solo, voir commun/coeur_jeu/strategie_ia.py)
+IA_ALEATOIRE = "ALEATOIRE"  # Une case pas encore visée, au hasard
+IA_CHASSE_CIBLE = "CHASSE_CIBLE"  # Au hasard, puis les voisines des touches jusqu'à couler le navire
+IA_PARITE = "PARITE"  # Chasse-cible, la chasse sur un damier à la taille du plus petit navire restant
+IA_DENSITE = "DENSITE"  # Carte de densité des navires restants (voir commun/coeur_jeu/ia_densite.py)
+# Classe de coût CPU d'un tir, déclarée par chaque stratégie
+COUT_IA_CONSTANT = "CONSTANT"  # Temps constant
+COUT_IA_LEGER = "LEGER"  # Borné par les touches en cours et quelques tirages
+COUT_IA_LOURD = "LOURD"  # Carte de toute la grille (ou d'une fenêtre) : groupe de processus, plafonné sous charge
+# Niveaux de difficulté (champ facultatif de CHOIX_MODE) -> stratégie de l'IA
+DIFFICULTE_FACILE = "FACILE"
+DIFFICULTE_MOYENNE = "MOYENNE"
+DIFFICULTE_DIFFICILE = "DIFFICILE"
+DIFFICULTE_EXPERTE = "EXPERTE"
+DIFFICULTES_IA = {
+    DIFFICULTE_FACILE: IA_ALEATOIRE,
+    DIFFICULTE_MOYENNE: IA_CHASSE_CIBLE,
+    DIFFICULTE_DIFFICILE: IA_PARITE,
+    DIFFICULTE_EXPERTE: IA_DENSITE,
+}
+DIFFICULTE_IA = DIFFICULTE_EXPERTE  # Sans difficulté choisie (et pour les parties sauvegardées avant ce choix)
+PART_VISEE_TIRAGE_CREUX = 0.5  # Part visée d'une grille creuse jusqu'à laquelle les cibles restantes sont tirées par rejet
+ESSAIS_TIRAGE_PARITE = 32  # Tirages au plus d'une case du damier (IA_PARITE), puis une case au hasard
+POIDS_TOUCHE_IA = 100  # Poids d'un placement par case touchée qu'il couvre (mode cible)
+TAILLE_MAX_FENETRE_IA = 32 * 32  # Cases au plus de la carte de densité (fenêtre sur les grilles plus grandes)
+BUDGET_TIR_IA = 0.002  # s visées par choix de tir sur une grille 10x10, mesuré par benchmarks/bench_ia.py
+# Cartes de densité calculées par un groupe de processus partagé (hors du GIL des sessions)
+NB_PROCESSUS_IA = 2  # 0 : calcul dans le thread de la session
+DEMARRAGE_PROCESSUS_IA = "spawn"  # Méthode de démarrage multiprocessing (sûre avec les threads du serveur)
+DELAI_TIR_IA = 0.02  # s d'attente au plus d'un tir calculé ; au-delà, tir rapide de repli
+CALCULS_IA_LOURDS_PAR_PROCESSUS = 2  # Calculs COUT_IA_LOURD en cours au plus par processus ; au-delà, tir rapide
 
 # Modes de jeu
 MODE_VS_SERVEUR = "VS_SERVEUR"
@@ -150,6 +267,10 @@ CHOIX_MENU_QUITTER = "3"
 CHOIX_MODE_SOLO = "1"
 CHOIX_MODE_PVP = "2"
 
+# Options de configuration de la partie (grille et flotte)
+CHOIX_CONFIG_STANDARD = "1"
+CHOIX_CONFIG_PERSONNALISEE = "2"
+
 #Options de reprise de la partie
 CHOIX_REPRENDRE_PARTIE = "1"
 CHOIX_NOUVELLE_PARTIE = "2"
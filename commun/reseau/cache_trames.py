@@ -0,0 +1,115 @@
+from .. import constantes as const
+from .message import Message
+
+
+class CacheTrames:
+    """
+    Cache des trames complètes (entête de taille + contenu) des messages fréquents
+    dont le contenu ne prend qu'un petit nombre de valeurs :
+
+        * messages sans données (VOTRE_TOUR, TOUR_ADVERSAIRE, PLACEMENT_OK, ...),
+        * REPONSE_TIR, dont le domaine est borné par la grille
+          (résultat x colonnes x lignes, plus les navires coulés).
+
+    La clé contient le codec et toutes les valeurs du message, le navire coulé étant
+    désigné par son rang dans NAVIRES : une trame en cache est donc toujours identique
+    à celle que produirait Protocole.tampons_trame(), et le nombre de clés possibles ne
+    dépasse pas la capacité calculée à partir de TAILLE_GRILLE et de NAVIRES ; si ces
+    constantes changent, le cache est vidé et redimensionné au prochain appel.
+    Les tirs des parties configurées (grille plus grande, ou navires nommés par le
+    client) ne sont pas mis en cache : ils sont encodés normalement.
+    """
+
+    # Messages sans données
+    TYPES_CONSTANTS = frozenset({
+        const.MSG_VOTRE_TOUR,
+        const.MSG_TOUR_ADVERSAIRE,
+        const.MSG_PLACEMENT_OK,
+        const.MSG_ATTENTE_ADVERSAIRE,
+        const.MSG_NOUVELLE_PARTIE,
+    })
+
+    # Messages paramétrés par des coordonnées de la grille
+    TYPES_COORDONNEES = frozenset({
+        const.MSG_REPONSE_TIR,
+    })
+
+    RESULTATS_TIR = (const.TIR_RATE, const.TIR_TOUCHE, const.TIR_COULE, const.TIR_DEJA_TIRE)
+
+    # Borne absolue, quelle que soit la taille de la grille
+    CAPACITE_MAX = 1 << 16
+
+    _trames: dict[tuple, bytes] = {}
+    _signature: tuple | None = None
+    _capacite = 0
+    _rangs_navires: dict[str, int] = {}  # Rang de chaque navire de NAVIRES, par nom
+
+    # Statistiques
+    nb_succes = 0
+    nb_echecs = 0
+
+    @staticmethod
+    def obtenir(message: Message, codec: str) -> bytes | None:
+        """
+        Retourne la trame complète du message, depuis le cache ou après l'avoir encodée
+        et mise en cache.
+
+        Returns:
+            bytes | None: La trame, ou None si le message n'est pas éligible au cache
+            (l'appelant l'encode alors normalement).
+        """
+        type_message = message.type
+        if type_message not in CacheTrames.TYPES_CONSTANTS and type_message not in CacheTrames.TYPES_COORDONNEES:
+            return None
+        if type(message) is not Message.CLASSES[type_message]:
+            return None  # Message générique : contenu non garanti
+
+        trames = CacheTrames._trames_courantes()
+        if type_message in CacheTrames.TYPES_CONSTANTS:
+            cle = (codec, type_message)
+        else:
+            taille = const.TAILLE_GRILLE
+            if not (type(message.x) is int and 0 <= message.x < taille
+                    and type(message.y) is int and 0 <= message.y < taille
+                    and message.resultat in CacheTrames.RESULTATS_TIR):
+                return None
+            nom_navire = message.bateau_coule
+            if nom_navire is None:
+                rang = -1
+            else:
+                rang = CacheTrames._rangs_navires.get(nom_navire) if type(nom_navire) is str else None
+                if rang is None:
+                    return None  # Navire d'une flotte configurée : nom choisi par le client
+            cle = (codec, type_message, message.resultat, message.x, message.y, rang)
+
+        trame = trames.get(cle)
+        if trame is not None:
+            CacheTrames.nb_succes += 1
+            return trame
+
+        CacheTrames.nb_echecs += 1
+        data = message.serialiser(codec)
+        trame = len(data).to_bytes(const.TAILLE_ENTETE, byteorder='big') + data
+        if len(trames) < CacheTrames._capacite:
+            trames[cle] = trame
+        return trame
+
+    @staticmethod
+    def vider() -> None:
+        """ Vide le cache (la capacité est recalculée au prochain appel). """
+        CacheTrames._trames = {}
+        CacheTrames._signature = None
+
+    @staticmethod
+    def _trames_courantes() -> dict[tuple, bytes]:
+        """ Retourne le dictionnaire du cache, réinitialisé si la grille ou la flotte ont changé. """
+        signature = (const.TAILLE_GRILLE, tuple(nom for nom, _ in const.NAVIRES))
+        if signature != CacheTrames._signature:
+            # Un REPONSE_TIR par (résultat, case, navire coulé ou aucun)
+            par_codec = len(CacheTrames.TYPES_CONSTANTS) \
+                + const.TAILLE_GRILLE ** 2 * len(CacheTrames.RESULTATS_TIR) * (len(const.NAVIRES) + 1)
+            CacheTrames._capacite = min(CacheTrames.CAPACITE_MAX, par_codec * len(const.CODECS_SUPPORTES))
+            CacheTrames._rangs_navires = {nom: rang for rang, nom in enumerate(signature[1])}
+            CacheTrames._trames = {}
+            CacheTrames._signature = signature
+        return CacheTrames._trames
@@ -0,0 +1,155 @@
+import struct
+from typing import Any, Callable
+
+from ..constantes import *
+from .schemas import SCHEMAS, Schema, COORD, RESULTAT, TEXTE
+
+
+class CodecBinaire:
+    """
+    Codec binaire compact pour les messages les plus fréquents d'une partie.
+
+    Chaque message est précédé d'un code de type sur un octet, suivi d'une structure
+    fixe (struct). Les codes sont tous inférieurs à ord('{') : le premier octet suffit
+    à distinguer une trame binaire d'une trame JSON, sans état côté réception.
+    Les messages sans structure fixe (chat, placement, reprise, ...) ou dont les
+    données sortent des plages prévues restent encodés en JSON.
+
+    Les encodeurs et décodeurs sont construits une seule fois, au chargement du
+    module, à partir de la table SCHEMAS (voir schemas.py). Ils travaillent sur le
+    tuple des valeurs des champs, dans l'ordre du schéma (champ optionnel en dernier).
+    """
+
+    # Codes des résultats de tir
+    CODES_RESULTATS = {
+        TIR_RATE: 0,
+        TIR_TOUCHE: 1,
+        TIR_COULE: 2,
+        TIR_DEJA_TIRE: 3,
+    }
+    RESULTATS_CODES = {code: resultat for resultat, code in CODES_RESULTATS.items()}
+
+    COORD_MAX = 0xFFFF
+    TEXTE_MAX = 0xFF
+
+    # Format struct de chaque genre de champ (un texte est précédé de sa longueur)
+    FORMATS_GENRES = {COORD: "H", RESULTAT: "B", TEXTE: "B"}
+
+    # Remplis par _compiler() : type -> encodeur, code -> (type, décodeur)
+    ENCODEURS: dict[str, Callable[[tuple], bytes | None]] = {}
+    DECODEURS: dict[int, tuple[str, Callable[[Any], tuple]]] = {}
+
+    @staticmethod
+    def encoder(type_message: str, valeurs: tuple) -> bytes | None:
+        """
+        Encode un message en binaire.
+
+        Returns:
+            bytes | None: La trame binaire, ou None si le message n'a pas de format
+            binaire (il doit alors être encodé en JSON).
+        """
+        encodeur = CodecBinaire.ENCODEURS.get(type_message)
+        if encodeur is None:
+            return None
+        return encodeur(valeurs)
+
+    @staticmethod
+    def decoder(data: bytes | bytearray | memoryview) -> tuple[str, tuple]:
+        """
+        Décode une trame binaire.
+
+        Returns:
+            tuple[str, tuple]: (type du message, valeurs des champs).
+
+        Raises:
+            ValueError: Si la trame est invalide.
+        """
+        try:
+            type_message, decodeur = CodecBinaire.DECODEURS[data[0]]
+            return type_message, decodeur(data)
+        except (IndexError, KeyError, struct.error, UnicodeDecodeError) as e:
+            raise ValueError(f"Trame binaire invalide: {e}") from e
+
+    @staticmethod
+    def a_un_format_binaire(type_message: str) -> bool:
+        return type_message in CodecBinaire.ENCODEURS
+
+    @staticmethod
+    def _compiler(schema: Schema) -> tuple[Callable[[tuple], bytes | None], Callable[[Any], tuple]]:
+        """ Construit l'encodeur et le décodeur d'un schéma. """
+        genres = tuple(genre for _, genre in schema.champs)
+        entete = struct.Struct("!B" + "".join(CodecBinaire.FORMATS_GENRES[g] for g in genres))
+        code = schema.code
+        nb_champs = len(genres)
+        avec_optionnel = schema.optionnel is not None
+        textes = TEXTE in genres
+        codes_resultats = CodecBinaire.CODES_RESULTATS
+        resultats_codes = CodecBinaire.RESULTATS_CODES
+        coord_max = CodecBinaire.COORD_MAX
+        texte_max = CodecBinaire.TEXTE_MAX
+
+        def encodeur(valeurs: tuple) -> bytes | None:
+            fixes = [code]
+            morceaux = []
+            for genre, valeur in zip(genres, valeurs):
+                if genre == COORD:
+                    if type(valeur) is not int or not 0 <= valeur <= coord_max:
+                        return None
+                    fixes.append(valeur)
+                elif genre == RESULTAT:
+                    code_resultat = codes_resultats.get(valeur)
+                    if code_resultat is None:
+                        return None
+                    fixes.append(code_resultat)
+                else:  # TEXTE
+                    if not isinstance(valeur, str):
+                        return None
+                    octets = valeur.encode(ENCODAGE)
+                    if len(octets) > texte_max:
+                        return None
+                    fixes.append(len(octets))
+                    morceaux.append(octets)
+
+            if avec_optionnel:
+                optionnel = valeurs[nb_champs]
+                if optionnel is not None:
+                    # Une chaîne vide ne se distinguerait pas d'un champ absent
+                    if not isinstance(optionnel, str) or not optionnel:
+                        return None
+                    morceaux.append(optionnel.encode(ENCODAGE))
+
+            data = entete.pack(*fixes)
+            return data + b"".join(morceaux) if morceaux else data
+
+        def decodeur(data) -> tuple:
+            fixes = entete.unpack_from(data)
+            position = entete.size
+            if not textes:
+                valeurs = [resultats_codes[v] if g == RESULTAT else v for g, v in zip(genres, fixes[1:])]
+            else:
+                valeurs = []
+                for genre, valeur in zip(genres, fixes[1:]):
+                    if genre == TEXTE:
+                        fin = position + valeur
+                        if fin > len(data):
+                            raise IndexError("texte tronqué")
+                        valeur = str(data[position:fin], ENCODAGE)
+                        position = fin
+                    elif genre == RESULTAT:
+                        valeur = resultats_codes[valeur]
+                    valeurs.append(valeur)
+
+            if avec_optionnel:
+                valeurs.append(str(data[position:], ENCODAGE) if len(data) > position else None)
+            elif len(data) != position:
+                raise IndexError("octets en trop")
+            return tuple(valeurs)
+
+        return encodeur, decodeur
+
+
+for _type_message, _schema in SCHEMAS.items():
+    if _schema.code is not None:
+        _encodeur, _decodeur = CodecBinaire._compiler(_schema)
+        CodecBinaire.ENCODEURS[_type_message] = _encodeur
+        CodecBinaire.DECODEURS[_schema.code] = (_type_message, _decodeur)
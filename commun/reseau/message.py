@@ -1,9 +1,27 @@
 import json
 from ..constantes import *
+from .codec_binaire import CodecBinaire
+from .schemas import SCHEMAS, Schema
 from typing import Any
 
 
 class Message:
+    """
+    Message générique (type + dictionnaire de données).
+
+    Les types décrits dans schemas.SCHEMAS sont représentés par des sous-classes
+    typées générées (MessageTir, MessageReponseTir, ...) : un attribut par champ,
+    sans dictionnaire. Leur propriété `donnees` reconstruit le dictionnaire à la
+    demande, pour les appelants qui utilisent encore l'API générique (lecture seule).
+    """
+    __slots__ = ("type", "donnees")
+
+    # Premier octet d'une trame JSON (distingue JSON et binaire à la réception)
+    OCTET_JSON = ord("{")
+
+    # Classes typées par type de message (remplie à la fin du module)
+    CLASSES: dict[str, type['Message']] = {}
+
     def __init__(self, type_message: str, donnees: dict[str, Any] | None = None):
         """
         Initialise un message
@@ -11,10 +29,20 @@ class Message:
         self.type = type_message
         self.donnees = donnees if donnees is not None else {}
 
-    def serialiser(self) -> bytes:
+    def serialiser(self, codec: str = CODEC_JSON) -> bytes:
         """
-        Convertit le message en chaîne JSON pour l'envoi sur le réseau
+        Convertit le message en octets pour l'envoi sur le réseau.
+
+        Avec CODEC_BINAIRE, les messages qui ont une structure fixe sont encodés en
+        binaire, les autres restent en JSON.
         """
+        if codec == CODEC_BINAIRE and CodecBinaire.a_un_format_binaire(self.type):
+            valeurs = self._valeurs()
+            if valeurs is not None:
+                data = CodecBinaire.encoder(self.type, valeurs)
+                if data is not None:
+                    return data
+
         message_dict = {
             "type": self.type,
             "donnees": self.donnees
@@ -24,25 +52,52 @@ class Message:
         return json_str.encode(ENCODAGE)
 
     @staticmethod
-    def deserialiser(data: bytes) -> 'Message':
+    def deserialiser(data: bytes | bytearray | memoryview) -> 'Message':
         """
         Crée un message à partir de données reçues du réseau
+        (accepte aussi une memoryview rendue par LecteurTrames, sans copie intermédiaire).
+        Le codec est détecté sur le premier octet : '{' pour JSON, un code de type sinon.
         """
         try:
+            if len(data) and data[0] != Message.OCTET_JSON:
+                type_message, valeurs = CodecBinaire.decoder(data)
+                return Message.CLASSES[type_message](*valeurs)
+
             # Utilisation de l'encodage défini dans les constantes
-            json_str = data.decode(ENCODAGE)
+            json_str = str(data, ENCODAGE)
             message_dict = json.loads(json_str)
 
             if "type" not in message_dict:
                 # Le message doit contenir un type
                 raise ValueError("Message JSON sans clé 'type'.")
 
-            return Message(message_dict["type"], message_dict.get("donnees", {}))
+            return Message.depuis_dict(message_dict["type"], message_dict.get("donnees", {}))
 
         except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
             print(f"Erreur lors de la désérialisation: {e}")
             return Message(MSG_ERREUR, {"message": "Données corrompues ou format invalide"})
 
+    @staticmethod
+    def depuis_dict(type_message: str, donnees: dict[str, Any]) -> 'Message':
+        """
+        Construit le message typé correspondant à `type_message`, ou un Message
+        générique si le type n'a pas de schéma ou si les données ne le respectent pas.
+        """
+        classe = Message.CLASSES.get(type_message)
+        if classe is not None:
+            message = classe.depuis_donnees(donnees)
+            if message is not None:
+                return message
+        return Message(type_message, donnees)
+
+    def _valeurs(self) -> tuple | None:
+        """ Valeurs des champs dans l'ordre du schéma (None si les données ne le respectent pas). """
+        classe = Message.CLASSES.get(self.type)
+        if classe is None:
+            return None
+        message = classe.depuis_donnees(self.donnees)
+        return message._valeurs() if message is not None else None
+
     def obtenir_type(self) -> str:
         return self.type
 
@@ -53,16 +108,32 @@ class Message:
         return self.donnees.get(cle, valeur_defaut)
 
     @staticmethod
-    def creer_connexion(nom_joueur: str):
-        return Message(MSG_CONNEXION, {"nom": nom_joueur})
+    def creer_connexion(nom_joueur: str, codecs: list[str] | None = None):
+        donnees = {"nom": nom_joueur}
+        if codecs:
+            donnees["codecs"] = codecs  # Codecs acceptés par le client
+        return Message(MSG_CONNEXION, donnees)
 
     @staticmethod
-    def creer_connexion_ok(message: str = ""):
-        return Message(MSG_CONNEXION_OK, {"message": message})
+    def creer_connexion_ok(message: str = "", codec: str | None = None):
+        donnees = {"message": message}
+        if codec:
+            donnees["codec"] = codec  # Codec retenu par le serveur pour la suite de la session
+        return Message(MSG_CONNEXION_OK, donnees)
 
     @staticmethod
-    def creer_choix_mode(mode: str):
-        return Message(MSG_CHOIX_MODE, {"mode": mode})
+    def creer_choix_mode(mode: str, configuration: dict[str, Any] | None = None, difficulte: str | None = None):
+        """
+        Choix du mode, et de la difficulté de l'IA en Solo (DIFFICULTE_*, par défaut
+        DIFFICULTE_IA) ; une configuration de partie (ConfigurationPartie.to_dict) fait
+        passer le message en JSON.
+        """
+        if configuration is None:
+            return MessageChoixMode(mode, difficulte)
+        donnees = {"mode": mode, "configuration": configuration}
+        if difficulte is not None:
+            donnees["difficulte"] = difficulte
+        return Message(MSG_CHOIX_MODE, donnees)
 
     # Messages d'Authentification (UDP)
     @staticmethod
@@ -84,7 +155,7 @@ class Message:
     @staticmethod
     def creer_nouvelle_partie():
         """Commande du client pour commencer une nouvelle partie (supprimer l'ancienne sauvegarde)"""
-        return Message(MSG_NOUVELLE_PARTIE, {})
+        return MessageNouvellePartie()
 
     @staticmethod
     def creer_sauvegarder_partie():
@@ -95,31 +166,31 @@ class Message:
     @staticmethod
     def creer_chat(message: str):
         """Crée un message de chat à envoyer à l'adversaire/serveur"""
-        return Message(MSG_CHAT, {"message": message})
+        return MessageChat(message)
 
     @staticmethod
     def creer_attente_adversaire():
-        return Message(MSG_ATTENTE_ADVERSAIRE, {})
+        return MessageAttenteAdversaire()
 
     @staticmethod
     def creer_adversaire_trouve(nom_adversaire: str):
-        return Message(MSG_ADVERSAIRE_TROUVE, {"adversaire": nom_adversaire})
+        return MessageAdversaireTrouve(nom_adversaire)
 
     @staticmethod
     def creer_votre_tour():
-        return Message(MSG_VOTRE_TOUR, {})
+        return MessageVotreTour()
 
     @staticmethod
     def creer_tour_adversaire():
-        return Message(MSG_TOUR_ADVERSAIRE, {})
+        return MessageTourAdversaire()
 
     @staticmethod
     def creer_placement_navires(positions_navires: list[dict[str, Any]]):
-        return Message(MSG_PLACEMENT_NAVIRES, {"navires": positions_navires})
+        return MessagePlacementNavires(positions_navires)
 
     @staticmethod
     def creer_placement_ok():
-        return Message(MSG_PLACEMENT_OK, {})
+        return MessagePlacementOk()
 
     @staticmethod
     def creer_debut_partie(nom_joueur: str=None, mode: str=None):
@@ -136,21 +207,15 @@ class Message:
 
     @staticmethod
     def creer_tir(x: int, y: int):
-        return Message(MSG_TIR, {"x": x, "y": y})
+        return MessageTir(x, y)
 
     @staticmethod
     def creer_reponse_tir(resultat: str, x: int, y: int, bateau_coule: str | None = None):
-        donnees = {"resultat": resultat, "x": x, "y": y}
-        if bateau_coule:
-            donnees["bateau_coule"] = bateau_coule
-        return Message(MSG_REPONSE_TIR, donnees)
+        return MessageReponseTir(resultat, x, y, bateau_coule or None)
 
     @staticmethod
     def creer_reponse_tir_recu(resultat: str, x: int, y: int, tireur: str, bateau_coule: str | None = None):
-        donnees = {"resultat": resultat, "x": x, "y": y, "adversaire": tireur}
-        if bateau_coule:
-            donnees["bateau_coule"] = bateau_coule
-        return Message(MSG_REPONSE_TIR_RECU, donnees)
+        return MessageReponseTirRecu(resultat, x, y, tireur, bateau_coule or None)
 
     @staticmethod
     def creer_fin_partie(gagnant: str, message: str = ""):
@@ -165,4 +230,86 @@ class Message:
         return Message(MSG_ERREUR, {"message": message_erreur})
 
     def __str__(self):
-        return f"Message[{self.type}]: {self.donnees}"
\ No newline at end of file
+        return f"Message[{self.type}]: {self.donnees}"
+
+
+def _nom_classe(type_message: str) -> str:
+    """ MSG 'REPONSE_TIR_RECU' -> 'MessageReponseTirRecu' """
+    return "Message" + "".join(mot.capitalize() for mot in type_message.split("_"))
+
+
+def _generer_classe(type_message: str, schema: Schema) -> type[Message]:
+    """
+    Génère la classe typée d'un schéma : __slots__ = champs, constructeur positionnel
+    compilé une fois (comme namedtuple/dataclasses), accès direct aux attributs.
+    """
+    obligatoires = tuple(nom for nom, _ in schema.champs)
+    champs = obligatoires + ((schema.optionnel,) if schema.optionnel else ())
+
+    parametres = ", ".join(("self",) + obligatoires + ((f"{schema.optionnel}=None",) if schema.optionnel else ()))
+    corps = "".join(f"\n    self.{c} = {c}" for c in champs) or "\n    pass"
+    espace: dict[str, Any] = {}
+    exec(f"def __init__({parametres}):{corps}", espace)
+
+    valeurs_source = f"({', '.join(f'self.{c}' for c in champs)}{',' if len(champs) == 1 else ''})"
+    exec(f"def _valeurs(self):\n    return {valeurs_source}", espace)
+
+    # depuis_donnees(cls, d) : instance construite depuis un dictionnaire reçu,
+    # ou None s'il ne correspond pas exactement au schéma
+    nb_obligatoires = len(obligatoires)
+    arguments = [f"d[{c!r}]" for c in obligatoires]
+    if schema.optionnel:
+        arguments.append(f"d.get({schema.optionnel!r})")
+        taille = f"{nb_obligatoires} + ({schema.optionnel!r} in d)"
+    else:
+        taille = str(nb_obligatoires)
+    exec(f"def depuis_donnees(cls, d):\n"
+         f"    if type(d) is not dict or len(d) != {taille}:\n"
+         f"        return None\n"
+         f"    try:\n"
+         f"        return cls({', '.join(arguments)})\n"
+         f"    except KeyError:\n"
+         f"        return None", espace)
+
+    def donnees(self) -> dict[str, Any]:
+        resultat = {c: getattr(self, c) for c in obligatoires}
+        if schema.optionnel:
+            valeur = getattr(self, schema.optionnel)
+            if valeur is not None:
+                resultat[schema.optionnel] = valeur
+        return resultat
+
+    def obtenir_donnee(self, cle: str, valeur_defaut: Any = None) -> Any:
+        valeur = getattr(self, cle, None) if cle in champs else None
+        return valeur_defaut if valeur is None else valeur
+
+    return type(_nom_classe(type_message), (Message,), {
+        "__slots__": champs,
+        "__doc__": f"Message {type_message} (généré depuis schemas.SCHEMAS).",
+        "type": type_message,
+        "champs": champs,
+        "__init__": espace["__init__"],
+        "_valeurs": espace["_valeurs"],
+        "donnees": property(donnees),
+        "obtenir_donnees": donnees,
+        "depuis_donnees": classmethod(espace["depuis_donnees"]),
+        "obtenir_donnee": obtenir_donnee,
+    })
+
+
+for _type_message, _schema in SCHEMAS.items():
+    Message.CLASSES[_type_message] = _generer_classe(_type_message, _schema)
+
+MessageVotreTour = Message.CLASSES[MSG_VOTRE_TOUR]
+MessageTourAdversaire = Message.CLASSES[MSG_TOUR_ADVERSAIRE]
+MessageTir = Message.CLASSES[MSG_TIR]
+MessageReponseTir = Message.CLASSES[MSG_REPONSE_TIR]
+MessageReponseTirRecu = Message.CLASSES[MSG_REPONSE_TIR_RECU]
+MessagePlacementOk = Message.CLASSES[MSG_PLACEMENT_OK]
+MessageAttenteAdversaire = Message.CLASSES[MSG_ATTENTE_ADVERSAIRE]
+MessageAdversaireTrouve = Message.CLASSES[MSG_ADVERSAIRE_TROUVE]
+MessageChoixMode = Message.CLASSES[MSG_CHOIX_MODE]
+MessageNouvellePartie = Message.CLASSES[MSG_NOUVELLE_PARTIE]
+MessagePlacementNavires = Message.CLASSES[MSG_PLACEMENT_NAVIRES]
+MessageChat = Message.CLASSES[MSG_CHAT]
+MessageChatGlobal = Message.CLASSES[MSG_CHAT_GLOBAL]
@@ -1,6 +1,7 @@
 import socket
 from .message import Message
-from ..constantes import TAILLE_ENTETE
+from .cache_trames import CacheTrames
+from ..constantes import TAILLE_ENTETE, TAILLE_MAX_MESSAGE, CODEC_JSON
 
 class Protocole:
     """
@@ -8,38 +9,37 @@ class Protocole:
     pour garantir l'intégrité des données sur le flux TCP.
     """
 
+    # Nombre maximal de tampons passés à un seul sendmsg (IOV_MAX vaut au moins 16 sous POSIX)
+    NB_MAX_TAMPONS = 64
+
     @staticmethod
-    def recevoir_message(socket_actif: socket.socket, entity: str) -> bytes | None:
+    def recevoir_message(socket_actif: socket.socket, entity: str) -> bytearray | None:
         """
         Reçoit un message complet du socket en lisant d'abord l'entête de taille.
+
+        Variante sans état (une allocation par message). Pour une connexion de longue
+        durée, préférer un LecteurTrames, qui réutilise son tampon.
         """
         try:
-            # 1. Recevoir l'entête de taille (4 bytes)
-            taille_data = socket_actif.recv(TAILLE_ENTETE)
+            # 1. Recevoir l'entête de taille (4 bytes), éventuellement en plusieurs fois
+            taille_data = Protocole._recevoir_exactement(socket_actif, TAILLE_ENTETE)
 
             # Si le socket est fermé ou vide, on retourne None
-            if not taille_data:
+            if taille_data is None:
                 return None
 
             # 2. Décodage de la taille (big-endian pour l'ordre des octets)
             taille = int.from_bytes(taille_data, byteorder='big')
+            if taille > TAILLE_MAX_MESSAGE:
+                print(f"[{entity}] Erreur de réception: message trop grand ({taille} octets).")
+                return None
 
-            # 3. Recevoir le message complet
-            data = b''
-            bytes_recus = 0
-
-            while bytes_recus < taille:
-                # Recevoir le paquet restant
-                paquet_manquant = taille - bytes_recus
-                paquet = socket_actif.recv(paquet_manquant)
-
-                # Si le paquet est vide, le client s'est déconnecté prématurément
-                if not paquet:
-                    print(f"[{entity}] Erreur de réception: Fin de flux prématurée.")
-                    return None
-
-                data += paquet
-                bytes_recus += len(paquet)
+            # 3. Recevoir le message complet directement dans un tampon pré-alloué
+            data = Protocole._recevoir_exactement(socket_actif, taille)
+            if data is None:
+                # Le client s'est déconnecté prématurément
+                print(f"[{entity}] Erreur de réception: Fin de flux prématurée.")
+                return None
 
             return data
 
@@ -49,23 +49,181 @@ class Protocole:
             return None
 
     @staticmethod
-    def envoyer_message(socket_actif: socket.socket, message: Message, entity: str) -> bool:
+    def _recevoir_exactement(socket_actif: socket.socket, taille: int) -> bytearray | None:
+        """
+        Remplit un tampon de `taille` octets avec recv_into.
+        Retourne None si le flux se termine avant.
+        """
+        data = bytearray(taille)
+        vue = memoryview(data)
+        bytes_recus = 0
+
+        while bytes_recus < taille:
+            n = socket_actif.recv_into(vue[bytes_recus:])
+            if n == 0:
+                return None
+            bytes_recus += n
+
+        return data
+
+    @staticmethod
+    def encadrer(message: Message, codec: str = CODEC_JSON) -> bytes:
+        """
+        Retourne la trame complète (entête de taille + message sérialisé) d'un message.
+        """
+        return b''.join(Protocole.tampons_trame(message, codec))
+
+    @staticmethod
+    def tampons_trame(message: Message, codec: str = CODEC_JSON) -> list[bytes]:
+        """
+        Retourne la trame d'un message sous forme de tampons [entête, contenu],
+        à transmettre tels quels à envoyer_tampons() (sans concaténation).
+        Les messages fréquents à contenu constant sortent directement du CacheTrames
+        (un seul tampon, déjà encadré).
+        """
+        trame = CacheTrames.obtenir(message, codec)
+        if trame is not None:
+            return [trame]
+
+        data = message.serialiser(codec)
+        return [len(data).to_bytes(TAILLE_ENTETE, byteorder='big'), data]
+
+    @staticmethod
+    def envoyer_message(socket_actif: socket.socket, message: Message, entity: str, codec: str = CODEC_JSON) -> bool:
         """
         Envoie un message sur le socket en utilisant le protocole d'entête de taille.
+        L'entête et le contenu partent dans le même appel système.
+        """
+        return Protocole.envoyer_tampons(socket_actif, Protocole.tampons_trame(message, codec), entity)
+
+    @staticmethod
+    def envoyer_messages(socket_actif: socket.socket, messages: list[Message], entity: str,
+                         codec: str = CODEC_JSON) -> bool:
+        """
+        Envoie plusieurs messages en une seule écriture vectorisée (regroupement des envois).
+        """
+        tampons = []
+        for message in messages:
+            tampons.extend(Protocole.tampons_trame(message, codec))
+        return Protocole.envoyer_tampons(socket_actif, tampons, entity)
+
+    @staticmethod
+    def envoyer_tampons(socket_actif: socket.socket, tampons: list[bytes], entity: str) -> bool:
+        """
+        Écrit une liste de tampons avec sendmsg (écriture vectorisée), en reprenant
+        après un envoi partiel. Sans sendmsg (Windows), les tampons sont concaténés.
         """
         try:
-            data = message.serialiser()
-            taille = len(data)
+            if not hasattr(socket_actif, "sendmsg"):
+                socket_actif.sendall(b''.join(tampons))
+                return True
 
-            # 1. Envoyer d'abord la taille (4 bytes, big-endian)
-            taille_bytes = taille.to_bytes(TAILLE_ENTETE, byteorder='big')
-            socket_actif.sendall(taille_bytes)
+            vues = [memoryview(t) for t in tampons]
+            while vues:
+                envoyes = socket_actif.sendmsg(vues[:Protocole.NB_MAX_TAMPONS])
 
-            # 2. Envoyer le message
-            socket_actif.sendall(data)
+                # Retirer les tampons entièrement envoyés, tronquer le premier restant
+                while vues and envoyes >= len(vues[0]):
+                    envoyes -= len(vues[0])
+                    vues.pop(0)
+                if envoyes:
+                    vues[0] = vues[0][envoyes:]
 
             return True
 
         except Exception as e:
             print(f"[{entity}] Erreur d'envoi: {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+class LecteurTrames:
+    """
+    Lecteur de trames (entête de taille + message) propre à une connexion.
+
+    Les octets reçus sont accumulés dans un bytearray réutilisé, rempli par recv_into.
+    lire_trame() renvoie une memoryview sur le contenu d'une trame complète, sans copie :
+    la vue n'est valide que jusqu'au prochain appel de lire_trame().
+    Si plusieurs trames arrivent dans le même recv (messages envoyés à la suite),
+    elles sont découpées depuis le tampon sans nouvel appel système.
+    """
+
+    def __init__(self, socket_actif: socket.socket, entity: str, taille_initiale: int = 4096):
+        self.socket_actif = socket_actif
+        self.entity = entity
+        self._tampon = bytearray(taille_initiale)
+        self._vue = memoryview(self._tampon)
+        self._debut = 0  # Début des octets non consommés
+        self._fin = 0  # Fin des octets reçus
+
+        # Statistiques (appels système de lecture et octets recopiés dans le tampon)
+        self.nb_appels_recv = 0
+        self.octets_copies = 0
+
+    def lire_trame(self) -> memoryview | None:
+        """
+        Retourne le contenu de la prochaine trame complète.
+
+        Returns:
+            memoryview | None: Contenu du message, ou None si la connexion est fermée
+            ou en erreur.
+        """
+        try:
+            while True:
+                disponibles = self._fin - self._debut
+
+                if disponibles >= TAILLE_ENTETE:
+                    taille = int.from_bytes(self._vue[self._debut:self._debut + TAILLE_ENTETE], byteorder='big')
+                    if taille > TAILLE_MAX_MESSAGE:
+                        print(f"[{self.entity}] Erreur de réception: message trop grand ({taille} octets).")
+                        return None
+
+                    taille_trame = TAILLE_ENTETE + taille
+                    if disponibles >= taille_trame:
+                        # Trame complète dans le tampon
+                        debut_message = self._debut + TAILLE_ENTETE
+                        self._debut += taille_trame
+                        return self._vue[debut_message:self._debut]
+                else:
+                    taille_trame = TAILLE_ENTETE
+
+                if not self._remplir(taille_trame):
+                    return None
+
+        except Exception as e:
+            # Gérer les erreurs de socket (timeout, connexion reset)
+            print(f"[{self.entity}] Erreur de réception: {e}")
+            return None
+
+    def _remplir(self, taille_trame: int) -> bool:
+        """
+        Lit depuis le socket de quoi compléter la trame en cours (taille_trame octets
+        à partir de self._debut). Retourne False si le flux est terminé.
+        """
+        disponibles = self._fin - self._debut
+
+        if disponibles == 0:
+            self._debut = self._fin = 0
+        elif self._debut + taille_trame > len(self._tampon):
+            if taille_trame > len(self._tampon):
+                # Trame plus grande que le tampon : nouveau tampon (les vues déjà rendues
+                # gardent l'ancien en vie, on ne peut donc pas le redimensionner)
+                nouveau = bytearray(max(taille_trame, 2 * len(self._tampon)))
+                nouveau[:disponibles] = self._vue[self._debut:self._fin]
+                self._tampon = nouveau
+                self._vue = memoryview(nouveau)
+            else:
+                # Compactage : ramener la trame partielle au début du tampon
+                self._vue[:disponibles] = self._vue[self._debut:self._fin]
+            self.octets_copies += disponibles
+            self._debut, self._fin = 0, disponibles
+
+        n = self.socket_actif.recv_into(self._vue[self._fin:])
+        self.nb_appels_recv += 1
+
+        if n == 0:
+            if disponibles:
+                print(f"[{self.entity}] Erreur de réception: Fin de flux prématurée.")
+            return False
+
+        self._fin += n
+        return True
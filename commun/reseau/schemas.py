@@ -0,0 +1,46 @@
+from typing import NamedTuple
+
+from ..constantes import *
+
+# Genres de champs
+COORD = "COORD"  # Entier non signé sur 2 octets
+RESULTAT = "RESULTAT"  # Résultat de tir (TIR_*), 1 octet en binaire
+TEXTE = "TEXTE"  # Chaîne courte (au plus 255 octets en binaire)
+JSON = "JSON"  # Valeur libre (message sans format binaire)
+
+
+class Schema(NamedTuple):
+    """
+    Description d'un type de message.
+
+    Attributes:
+        code: Code du type en binaire (None : message toujours encodé en JSON).
+        champs: Champs obligatoires (nom, genre), dans l'ordre d'encodage.
+        optionnel: Nom d'un champ texte facultatif, placé en fin de trame binaire.
+    """
+    code: int | None
+    champs: tuple[tuple[str, str], ...] = ()
+    optionnel: str | None = None
+
+
+# Table unique des messages à format fixe : les classes typées (message.py) et le
+# codec binaire (codec_binaire.py) sont générés à partir de cette table.
+# Les codes binaires doivent rester inférieurs à ord('{').
+SCHEMAS: dict[str, Schema] = {
+    MSG_VOTRE_TOUR: Schema(1),
+    MSG_TOUR_ADVERSAIRE: Schema(2),
+    MSG_TIR: Schema(3, (("x", COORD), ("y", COORD))),
+    MSG_REPONSE_TIR: Schema(4, (("resultat", RESULTAT), ("x", COORD), ("y", COORD)), "bateau_coule"),
+    MSG_REPONSE_TIR_RECU: Schema(5, (("resultat", RESULTAT), ("x", COORD), ("y", COORD), ("adversaire", TEXTE)),
+                                 "bateau_coule"),
+    MSG_PLACEMENT_OK: Schema(6),
+    MSG_ATTENTE_ADVERSAIRE: Schema(7),
+    MSG_ADVERSAIRE_TROUVE: Schema(8, (("adversaire", TEXTE),)),
+    MSG_CHOIX_MODE: Schema(9, (("mode", TEXTE),), "difficulte"),
+    MSG_NOUVELLE_PARTIE: Schema(10),
+
+    # Contenu libre : classes typées, mais toujours en JSON
+    MSG_PLACEMENT_NAVIRES: Schema(None, (("navires", JSON),)),
+    MSG_CHAT: Schema(None, (("message", JSON),)),
+    MSG_CHAT_GLOBAL: Schema(None, (("envoyeur", JSON), ("message", JSON))),
+}
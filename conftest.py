@@ -0,0 +1 @@
+""" Racine du dépôt pour pytest : les tests (tests/) importent commun et serveur depuis ici. """
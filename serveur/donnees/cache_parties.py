@@ -0,0 +1,77 @@
+import collections
+import threading
+
+from commun import constantes as const
+
+
+class CacheParties:
+    """
+    Cache LRU des parties sauvegardées récemment lues ou écrites, par nom de joueur.
+
+    Les parties y sont gardées encodées (voir DepotParties.encoder) : la taille de
+    chaque entrée est connue exactement, et chaque charger_partie reconstruit sa
+    propre Partie (une instance partagée serait modifiée par la session qui la joue).
+    Au-delà du budget (en octets), les entrées les moins récemment utilisées sont
+    retirées.
+
+    Les lectures sur disque se font hors verrou. Une lecture n'est mise en cache que
+    si aucune écriture n'a eu lieu depuis son début (jeton()) : une lecture lente ne
+    peut pas remplacer une partie plus récente.
+    """
+
+    def __init__(self, budget: int = const.BUDGET_CACHE_PARTIES):
+        self.budget = budget
+        self.taille = 0
+        self._entrees: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self._verrou = threading.Lock()
+        self._ecritures = 0  # Compteur d'écritures (jeton des lectures)
+        self.nb_succes = 0
+        self.nb_echecs = 0
+
+    def obtenir(self, nom: str) -> bytes | None:
+        with self._verrou:
+            blob = self._entrees.get(nom)
+            if blob is None:
+                self.nb_echecs += 1
+                return None
+            self._entrees.move_to_end(nom)
+            self.nb_succes += 1
+            return blob
+
+    def jeton(self) -> int:
+        """ À prendre avant une lecture sur disque, puis à passer à ajouter_lu(). """
+        return self._ecritures
+
+    def ajouter_lu(self, nom: str, blob: bytes, jeton: int) -> None:
+        """ Met en cache une partie lue sur disque, si aucune écriture n'a eu lieu depuis jeton. """
+        with self._verrou:
+            if jeton == self._ecritures:
+                self._placer(nom, blob)
+
+    def ecrire(self, nom: str, blob: bytes | None) -> None:
+        """ Partie qui vient d'être écrite sur disque (None : supprimée). """
+        with self._verrou:
+            self._ecritures += 1
+            if blob is None:
+                ancien = self._entrees.pop(nom, None)
+                if ancien is not None:
+                    self.taille -= len(ancien)
+            else:
+                self._placer(nom, blob)
+
+    def _placer(self, nom: str, blob: bytes) -> None:
+        ancien = self._entrees.pop(nom, None)
+        if ancien is not None:
+            self.taille -= len(ancien)
+        if len(blob) > self.budget:
+            return
+        self._entrees[nom] = blob
+        self.taille += len(blob)
+        while self.taille > self.budget:
+            _, retire = self._entrees.popitem(last=False)
+            self.taille -= len(retire)
+
+    def statistiques(self) -> dict[str, int]:
+        with self._verrou:
+            return {"entrees": len(self._entrees), "taille": self.taille, "budget": self.budget,
+                    "succes": self.nb_succes, "echecs": self.nb_echecs}
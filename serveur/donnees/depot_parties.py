@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+from typing import Any
+
+from commun import constantes as const
+from commun.coeur_jeu.instantane import Instantane
+
+
+class DepotParties:
+    """
+    Parties sauvegardées du stockage JSON, un fichier par joueur.
+
+    Le fichier d'un joueur est nommé d'après le hash de son nom (noms de fichiers
+    sûrs quel que soit le nom) et rangé dans l'un des 256 sous-dossiers désignés par
+    les deux premiers caractères de ce hash : aucun dossier ne grossit démesurément.
+    Rien n'est chargé au démarrage ; une partie n'est lue que par lire().
+
+    Chaque fichier est remplacé d'un bloc (fichier temporaire puis os.replace) : une
+    partie lue est toujours complète, l'ancienne ou la nouvelle.
+    """
+
+    def __init__(self, dossier: str):
+        self.dossier = dossier
+        os.makedirs(dossier, exist_ok=True)
+
+    def _chemin(self, nom: str) -> str:
+        cle = hashlib.sha256(nom.encode(const.ENCODAGE)).hexdigest()
+        return os.path.join(self.dossier, cle[:2], cle + ".partie")
+
+    # --- Lecture ---
+
+    def existe(self, nom: str) -> bool:
+        return os.path.exists(self._chemin(nom))
+
+    def lire(self, nom: str) -> bytes | None:
+        """ Partie sauvegardée encodée (voir encoder), ou None. """
+        try:
+            with open(self._chemin(nom), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    # --- Écriture (thread de persistance) ---
+
+    def ecrire_lot(self, modifications: list[tuple[str, bytes | None]]) -> None:
+        """
+        Applique un lot de (nom, partie encodée ou None pour la supprimer). Les fichiers
+        sont synchronisés avant d'être substitués, puis chaque dossier modifié une fois.
+        """
+        dossiers = set()
+        for nom, blob in modifications:
+            chemin = self._chemin(nom)
+            dossier = os.path.dirname(chemin)
+            if blob is None:
+                try:
+                    os.remove(chemin)
+                except FileNotFoundError:
+                    continue
+            else:
+                os.makedirs(dossier, exist_ok=True)
+                temporaire = chemin + ".tmp"
+                with open(temporaire, 'wb') as f:
+                    f.write(blob)
+                    if const.SYNCHRONISER_JOURNAL:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(temporaire, chemin)
+            dossiers.add(dossier)
+
+        if const.SYNCHRONISER_JOURNAL:
+            for dossier in dossiers:
+                descripteur = os.open(dossier, os.O_RDONLY)
+                try:
+                    os.fsync(descripteur)
+                finally:
+                    os.close(descripteur)
+
+    # --- Format ---
+
+    @staticmethod
+    def encoder(partie_dict: dict[str, Any]) -> bytes:
+        """
+        Partie sauvegardée encodée, dans un fichier du dépôt ou un blob SQLite : instantané
+        binaire (voir Instantane), ou JSON compact si la partie n'y est pas représentable.
+        """
+        try:
+            return Instantane.encoder_partie(partie_dict)
+        except ValueError:
+            return json.dumps(partie_dict, separators=(',', ':')).encode(const.ENCODAGE)
+
+    @staticmethod
+    def decoder(blob: bytes) -> dict[str, Any]:
+        """ Accepte les deux formats (les parties sauvegardées avant l'instantané sont en JSON). """
+        if Instantane.est_instantane(blob):
+            return Instantane.decoder_partie(blob)
+        return json.loads(blob)
@@ -0,0 +1,163 @@
+import collections
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+from commun import constantes as const
+
+
+class EcrivainDiffere(threading.Thread):
+    """
+    Thread de persistance en écriture différée, commun aux stockages d'utilisateurs.
+
+    Les modifications sont soumises sans attendre le disque (soumettre()) ; ce thread
+    les regroupe et les passe par lots à `ecrire_lot`, qui les écrit et les rend
+    durables en une fois (un seul fsync ou une seule transaction par lot). Un lot est
+    écrit DELAI_ECRITURE_DIFFEREE secondes après sa première modification, ou dès
+    qu'il atteint TAILLE_LOT_ECRITURE_DIFFEREE modifications, ou dès qu'une modification
+    dont l'appelant attend la durabilité y entre.
+
+    `ecrire_lot(lot)` retourne le résultat de chaque modification du lot (dans l'ordre),
+    ou lève une exception qui est alors transmise à toutes les modifications du lot.
+    Après un lot en échec, le thread attend DELAI_REESSAI_ECRITURE_DIFFEREE avant le
+    lot suivant : c'est à `ecrire_lot` de soumettre à nouveau ce qui doit l'être.
+    """
+
+    def __init__(self, ecrire_lot: Callable[[list[Any]], list[Any]], nom: str = "EcrivainDiffere",
+                 delai: float = const.DELAI_ECRITURE_DIFFEREE, taille_lot: int = const.TAILLE_LOT_ECRITURE_DIFFEREE):
+        super().__init__(name=nom)
+        self.daemon = True
+        self.ecrire_lot = ecrire_lot
+        self.delai = delai
+        self.taille_lot = taille_lot
+        self.delai_reessai = const.DELAI_REESSAI_ECRITURE_DIFFEREE
+        # (modification, futur, instant de soumission, un appelant attend) ; None : arrêt
+        self._file: queue.Queue[tuple[Any, Future, float, bool] | None] = queue.Queue()
+
+        # --- Instrumentation ---
+        self._verrou_stats = threading.Lock()
+        self.nb_lots = 0
+        self.nb_modifications = 0
+        self.taille_lot_max = 0
+        self.nb_echecs = 0
+        self.latence_max = 0.0
+        self._latences: collections.deque[float] = collections.deque(maxlen=const.TAILLE_ECHANTILLON_LATENCES)
+
+    # --- Soumission ---
+
+    def soumettre(self, modification: Any, urgent: bool = False) -> Future:
+        """
+        Ajoute une modification au prochain lot, sans attendre. Le futur retourné reçoit
+        son résultat une fois le lot durable. urgent=True (l'appelant va attendre ce
+        futur) fait écrire le lot sans attendre la fin du délai.
+        """
+        futur = Future()
+        self._file.put((modification, futur, time.perf_counter(), urgent))
+        return futur
+
+    def vider(self) -> None:
+        """ Attend que toutes les modifications déjà soumises soient durables. """
+        self.soumettre(None, urgent=True).result()
+
+    def stop(self) -> None:
+        """ Écrit les modifications en attente puis arrête le thread. """
+        self._file.put(None)
+        self.join()
+
+    # --- Thread de persistance ---
+
+    def run(self):
+        arret = False
+        while not arret:
+            element = self._file.get()
+            if element is None:
+                break
+            lot = [element]
+            echeance = element[2] + self.delai
+            urgent = element[3]
+            while len(lot) < self.taille_lot:
+                # Un appelant attend : le lot est complété par ce qui est déjà en file, sans attendre le délai
+                reste = 0 if urgent else echeance - time.perf_counter()
+                try:
+                    element = self._file.get_nowait() if reste <= 0 else self._file.get(timeout=reste)
+                except queue.Empty:
+                    break
+                if element is None:
+                    arret = True  # Le lot en cours est écrit avant l'arrêt
+                    break
+                lot.append(element)
+                urgent = urgent or element[3]
+            if not self._ecrire(lot) and not arret:
+                time.sleep(self.delai_reessai)  # Disque plein ou indisponible : pas de nouvelle tentative immédiate
+
+    def _ecrire(self, lot: list[tuple[Any, Future, float, bool]]) -> bool:
+        """
+        Écrit un lot (les marqueurs None de vider() n'y sont pas transmis), puis débloque
+        les appelants. Retourne False si le lot n'a pas pu être écrit.
+        """
+        modifications = [modification for modification, _, _, _ in lot if modification is not None]
+        try:
+            resultats = iter(self.ecrire_lot(modifications) if modifications else [])
+            erreur = None
+        except Exception as e:
+            print(f"{self.name}: Échec de l'écriture d'un lot de {len(modifications)} modifications: {e}")
+            resultats, erreur = None, e
+
+        fin = time.perf_counter()
+        for modification, futur, _, _ in lot:
+            if erreur is not None:
+                futur.set_exception(erreur)
+            elif modification is None:
+                futur.set_result(None)
+            else:
+                resultat = next(resultats)
+                if isinstance(resultat, Exception):
+                    futur.set_exception(resultat)
+                else:
+                    futur.set_result(resultat)
+
+        with self._verrou_stats:
+            self.nb_lots += 1
+            if erreur is not None:
+                self.nb_echecs += 1
+            self.nb_modifications += len(modifications)
+            self.taille_lot_max = max(self.taille_lot_max, len(modifications))
+            for modification, _, instant, _ in lot:
+                if modification is None:
+                    continue
+                latence = fin - instant
+                self._latences.append(latence)
+                if latence > self.latence_max:
+                    self.latence_max = latence
+        return erreur is None
+
+    def statistiques(self) -> dict[str, Any]:
+        """
+        Instrumentation de l'écriture différée : modifications en attente, nombre et
+        taille des lots, lots en échec, latence de vidage (soumission -> durabilité, en secondes) sur
+        les TAILLE_ECHANTILLON_LATENCES dernières modifications.
+        """
+        with self._verrou_stats:
+            latences = sorted(self._latences)
+            nb_lots = self.nb_lots
+            nb_echecs = self.nb_echecs
+            nb_modifications = self.nb_modifications
+            latence_max = self.latence_max
+
+        def centile(p: float) -> float:
+            return latences[min(len(latences) - 1, int(p * len(latences)))] if latences else 0.0
+
+        return {
+            "en_attente": self._file.qsize(),
+            "lots": nb_lots,
+            "echecs": nb_echecs,
+            "modifications": nb_modifications,
+            "taille_lot_moyenne": nb_modifications / nb_lots if nb_lots else 0.0,
+            "taille_lot_max": self.taille_lot_max,
+            "latence_moyenne": sum(latences) / len(latences) if latences else 0.0,
+            "latence_p50": centile(0.50),
+            "latence_p99": centile(0.99),
+            "latence_max": latence_max,
+        }
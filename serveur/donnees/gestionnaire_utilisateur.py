@@ -1,144 +1,98 @@
-import json
-import hashlib
-import os
 from typing import Any
 
 from commun import constantes as const
-from commun.coeur_jeu.partie import Partie
+from .depot_parties import DepotParties
+from .gestionnaire_utilisateur_base import GestionnaireUtilisateurBase
+from .journal_utilisateurs import JournalUtilisateurs
 
 
-class GestionnaireUtilisateur:
+class GestionnaireUtilisateur(GestionnaireUtilisateurBase):
     """
     Gère la persistance des données utilisateur (hashs de mot de passe) et des parties
-    sauvegardées via un fichier JSON sur le serveur.
-    """
-
-    def __init__(self, chemin_fichier: str):
-        self.chemin_fichier = chemin_fichier
-        self.data: dict[str, Any] = self._charger_donnees()
-
-    def _charger_donnees(self) -> dict[str, Any]:
-        """ Charge le fichier JSON ou initialise une structure vide. """
-        if os.path.exists(self.chemin_fichier):
-            with open(self.chemin_fichier, 'r', encoding=const.ENCODAGE) as f:
-                try:
-                    return json.load(f)
-                except json.JSONDecodeError:
-                    print(f"Erreur de décodage JSON dans {self.chemin_fichier}. Fichier de données réinitialisé.")
+    sauvegardées via un fichier JSON sur le serveur (écriture différée, cache des parties
+    et points de contrôle : voir GestionnaireUtilisateurBase).
 
-        # Structure initiale
-        return {"utilisateurs": {}}
+    Les données sont gardées en mémoire ; chaque modification est ajoutée au journal
+    (voir JournalUtilisateurs) au lieu de réécrire tout le fichier. Les enregistrements
+    utilisateur sont remplacés, jamais modifiés sur place : une copie superficielle
+    de self.data suffit donc à la compaction en arrière-plan.
 
-    def _sauvegarder_donnees(self) -> None:
-        """ Sauvegarde l'état actuel de self.data dans le fichier JSON. """
-        # Écrit de manière indentée pour la lisibilité
-        with open(self.chemin_fichier, 'w', encoding=const.ENCODAGE) as f:
-            json.dump(self.data, f, indent=4)
-
-
-    @staticmethod
-    def _crypter_mdp(mot_de_passe: str) -> str:
-        """
-        Crypte un mot de passe en utilisant SHA-256 (standard hashlib).
-        """
-        # Utilise l'encodage défini dans les constantes
-        hash_objet = hashlib.sha256(mot_de_passe.encode(const.ENCODAGE))
-        return hash_objet.hexdigest()
+    Les parties sauvegardées ne sont pas dans ces données : chacune a son fichier
+    (DepotParties, <fichier>.parties/), lu seulement par charger_partie. Le démarrage
+    et la mémoire ne dépendent donc pas du nombre de parties sauvegardées.
+    """
 
-    @staticmethod
-    def _verifier_mdp(mdp_clair: str, mdp_crypte: str) -> bool:
-        """
-        Vérifie si le mot de passe en clair correspond au hash stocké.
-        """
-        return GestionnaireUtilisateur._crypter_mdp(mdp_clair) == mdp_crypte
+    def __init__(self, chemin_fichier: str):
+        self.journal = JournalUtilisateurs(chemin_fichier)
+        self.depot = DepotParties(chemin_fichier + const.SUFFIXE_DEPOT_PARTIES)
+        self.data: dict[str, Any] = {}
+        super().__init__(chemin_fichier, "EcrivainJournal")
 
-    # --- Authentification (Utilisé par AuthentificationUDP) ---
+    def _ouvrir_stockage(self) -> None:
+        self.data = self._charger_donnees()
+        self._extraire_parties()
 
-    def _utilisateur_existe(self, nom: str) -> bool:
-        """ Vérifie si un utilisateur existe dans la base de données. """
-        return nom in self.data["utilisateurs"]
+    def _charger_donnees(self) -> dict[str, Any]:
+        """ Charge le fichier JSON et rejoue le journal (structure vide si aucun fichier). """
+        return self.journal.charger()
 
-    def enregistrer_utilisateur(self, nom: str, mdp: str) -> bool:
+    def _extraire_parties(self) -> None:
         """
-        Crée un nouvel utilisateur.
-
-        Retourne True en cas de succès, False si le nom est déjà pris ou le mdp est invalide.
+        Ancien format : les parties sauvegardées étaient dans les enregistrements utilisateur.
+        Elles sont déplacées dans le dépôt, puis l'instantané est réécrit sans elles.
         """
-        if self._utilisateur_existe(nom) or len(mdp) < const.TAILLE_MIN_MDP:
-            return False
-
-        mdp_hash = GestionnaireUtilisateur._crypter_mdp(mdp)
-
-        self.data["utilisateurs"][nom] = {
-            "mdp_hash": mdp_hash,
-            "partie_sauvegardee": None  # Aucune partie sauvegardée au départ
-        }
+        utilisateurs = self.data["utilisateurs"]
+        anciens = [nom for nom, u in utilisateurs.items() if "partie_sauvegardee" in u]
+        if not anciens:
+            return
+        self.depot.ecrire_lot([(nom, DepotParties.encoder(utilisateurs[nom]["partie_sauvegardee"]))
+                               for nom in anciens if utilisateurs[nom]["partie_sauvegardee"] is not None])
+        for nom in anciens:
+            utilisateurs[nom] = {"mdp_hash": utilisateurs[nom]["mdp_hash"]}
         self._sauvegarder_donnees()
-        return True
+        print(f"GestionnaireUtilisateur: {len(anciens)} enregistrements convertis (parties dans {self.depot.dossier}).")
 
-    def verifier_authentification(self, nom: str, mdp: str) -> bool:
+    def _ecrire_modifications(self, lot: list[tuple[str, str, Any]],
+                              blobs: list[bytes | None]) -> list[int]:
         """
-        Vérifie l'existence et les identifiants de l'utilisateur.
-
-        Retourne True si l'authentification réussit, False sinon.
+        Utilisateurs ajoutés au journal, parties écrites dans le dépôt, chacun synchronisé une fois
+        (rejouer deux fois un enregistrement du journal est sans effet).
         """
-        if not self._utilisateur_existe(nom):
-            return False
-
-        utilisateur = self.data["utilisateurs"][nom]
-        mdp_crypte = utilisateur.get("mdp_hash")
-
-        return GestionnaireUtilisateur._verifier_mdp(mdp, mdp_crypte)
+        enregistrements = [{"op": JournalUtilisateurs.OP_UTILISATEUR, "nom": nom, "u": {"mdp_hash": valeur}}
+                           for op, nom, valeur in lot if op == GestionnaireUtilisateur.OP_UTILISATEUR]
+        if enregistrements:
+            self.journal.ajouter_lot(enregistrements)
+        # La dernière modification de chaque joueur suffit
+        parties = {nom: blob for (op, nom, _), blob in zip(lot, blobs) if op == GestionnaireUtilisateur.OP_PARTIE}
+        if parties:
+            self.depot.ecrire_lot(list(parties.items()))
+        return [1] * len(lot)
 
-    # --- Sauvegarde et Reprise de Partie (Utilisé par GestionnaireClient) ---
-
-    def sauvegarder_partie(self, nom_joueur: str, partie: Partie) -> None:
-        """
-        Sauvegarde l'état complet de la partie pour un joueur.
-        Si la partie est 'EN_COURS', elle est marquée 'MIS_EN_PAUSE' avant la sauvegarde.
-        """
-        if not self._utilisateur_existe(nom_joueur):
-            # Normalement ne devrait pas arriver après l'authentification
-            return
+    def _utilisateur_enregistre(self, nom: str, mdp_hash: str) -> None:
+        """ Ajoute l'utilisateur aux données, et lance la compaction si le journal est trop long. """
+        self.data["utilisateurs"][nom] = {"mdp_hash": mdp_hash}  # Partie sauvegardée : dans le dépôt
+        if self.journal.doit_compacter():
+            self.journal.compacter_en_arriere_plan(self._copie_donnees())
 
-        # Mise à jour de l'état si elle est en cours et est sauvegardée
-        if partie.etat == const.ETAT_EN_COURS:
-            partie.etat = const.ETAT_MIS_EN_PAUSE
+    def _copie_donnees(self) -> dict[str, Any]:
+        return {**self.data, "utilisateurs": dict(self.data["utilisateurs"])}
 
-        partie_dict = partie.to_dict()
+    def _sauvegarder_donnees(self) -> None:
+        """ Réécrit le fichier JSON complet à partir des données en mémoire et vide le journal. """
+        with self._verrou:
+            self.journal.compacter(self._copie_donnees())
 
-        self.data["utilisateurs"][nom_joueur]["partie_sauvegardee"] = partie_dict
+    def _fermer_stockage(self) -> None:
+        """ Compacte le journal dans le fichier de sauvegarde. """
         self._sauvegarder_donnees()
+        self.journal.fermer()
 
-    def charger_partie(self, nom_joueur: str) -> Partie|None:
-        """
-        Charge la partie sauvegardée pour un joueur et la désérialise.
+    def _lire_utilisateur(self, nom: str) -> str | None:
+        utilisateur = self.data["utilisateurs"].get(nom)
+        return utilisateur.get("mdp_hash") if utilisateur is not None else None
 
-        Retourne l'objet Partie ou None si aucune partie n'est trouvée.
-        """
-        if not self._utilisateur_existe(nom_joueur):
-            return None
+    def _lire_partie(self, nom_joueur: str) -> bytes | None:
+        return self.depot.lire(nom_joueur)
 
-        partie_dict = self.data["utilisateurs"][nom_joueur].get("partie_sauvegardee")
-
-        if partie_dict is None:
-            return None
-
-        return Partie.from_dict(partie_dict)
-
-    def partie_existe(self, nom_joueur: str) -> bool:
-        """
-        Vérifie si une partie mise en pause est disponible pour ce joueur.
-        """
-        if not self._utilisateur_existe(nom_joueur):
-            return False
-
-        return self.data["utilisateurs"][nom_joueur].get("partie_sauvegardee") is not None
-
-    def supprimer_partie_sauvegardee(self, nom_joueur: str) -> None:
-        """
-        Supprime la référence à la partie sauvegardée (ex: après une victoire/défaite ou reprise).
-        """
-        if self._utilisateur_existe(nom_joueur):
-            self.data["utilisateurs"][nom_joueur]["partie_sauvegardee"] = None
-            self._sauvegarder_donnees()
\ No newline at end of file
+    def _partie_stockee(self, nom_joueur: str) -> bool:
+        return self.depot.existe(nom_joueur)
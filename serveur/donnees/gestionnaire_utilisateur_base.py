@@ -0,0 +1,267 @@
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Any
+
+from commun import constantes as const
+from commun.coeur_jeu.partie import Partie
+from .cache_parties import CacheParties
+from .depot_parties import DepotParties
+from .ecrivain_differe import EcrivainDiffere
+from .points_controle import PointsControle
+
+
+class GestionnaireUtilisateurBase:
+    """
+    Partie commune des stockages des utilisateurs (hashs de mot de passe) et des parties
+    sauvegardées : GestionnaireUtilisateur (fichier JSON et journal) et
+    GestionnaireUtilisateurSQLite.
+
+    Les modifications sont visibles immédiatement ; leur écriture est différée
+    (EcrivainDiffere) : l'appelant n'attend le disque que s'il le demande (durable=True).
+    En attendant, la dernière modification de chaque utilisateur et de chaque partie est
+    gardée dans _utilisateurs_en_attente et _parties_en_attente, consultés avant le
+    stockage ; un lot en échec est soumis à nouveau. Les parties récemment lues ou
+    écrites sont gardées dans un cache au budget borné (CacheParties).
+
+    Les parties Solo en cours ont un point de contrôle (PointsControle,
+    <fichier>.points_controle/) ; celles qu'un arrêt brutal a interrompues sont
+    reconstruites au démarrage et deviennent des parties sauvegardées.
+
+    Chaque stockage fournit l'ouverture et la fermeture (_ouvrir_stockage,
+    _fermer_stockage), les lectures (_lire_utilisateur, _lire_partie, _partie_stockee)
+    et l'écriture d'un lot (_ecrire_modifications).
+    """
+
+    # Modifications soumises à l'écrivain : (type, nom, valeur)
+    OP_UTILISATEUR = "U"  # valeur : hash du mot de passe
+    OP_PARTIE = "P"  # valeur : partie sauvegardée (dict) ou None pour la supprimer
+
+    def __init__(self, chemin_fichier: str, nom_ecrivain: str):
+        self.chemin_fichier = chemin_fichier
+        self._verrou = threading.RLock()  # Modifications concurrentes (authentification UDP, sessions)
+        self.cache = CacheParties()
+        # Modifications soumises et pas encore écrites, par nom (la dernière de chaque joueur)
+        self._utilisateurs_en_attente: dict[str, tuple[str, str, Any]] = {}
+        self._parties_en_attente: dict[str, tuple[str, str, Any]] = {}
+        self._ouvrir_stockage()
+        self.ecrivain = EcrivainDiffere(self._ecrire_lot, nom_ecrivain)
+        self.ecrivain.start()
+        self.points_controle = PointsControle(chemin_fichier + const.SUFFIXE_POINTS_CONTROLE)
+        self._recuperer_points_controle()
+
+    # --- Stockage (fourni par chaque variante) ---
+
+    def _ouvrir_stockage(self) -> None:
+        """ Ouvre ou crée le stockage (avant le démarrage de l'écrivain). """
+        raise NotImplementedError
+
+    def _fermer_stockage(self) -> None:
+        """ Ferme le stockage (après l'arrêt de l'écrivain). """
+        raise NotImplementedError
+
+    def _lire_utilisateur(self, nom: str) -> str | None:
+        """ Hash du mot de passe stocké de l'utilisateur, None s'il n'existe pas. """
+        raise NotImplementedError
+
+    def _lire_partie(self, nom_joueur: str) -> bytes | None:
+        """ Partie sauvegardée stockée du joueur (encodée, voir DepotParties.encoder), None si aucune. """
+        raise NotImplementedError
+
+    def _partie_stockee(self, nom_joueur: str) -> bool:
+        """ Vérifie si une partie sauvegardée du joueur est stockée (sans la lire). """
+        raise NotImplementedError
+
+    def _ecrire_modifications(self, lot: list[tuple[str, str, Any]],
+                              blobs: list[bytes | None]) -> list[int | Exception]:
+        """
+        Écrit un lot de modifications (thread de l'écrivain) ; blobs : parties encodées, dans l'ordre du lot.
+        Retourne, pour chaque modification, le nombre d'enregistrements écrits (0 : partie d'un
+        joueur inconnu, ignorée) ou l'exception qui la fait échouer seule. Lève une exception si
+        le lot entier n'est pas écrit.
+        """
+        raise NotImplementedError
+
+    # --- Écritures (différées, par lots) ---
+
+    def _en_attente(self, op: str) -> dict[str, tuple[str, str, Any]]:
+        """ Modifications en attente d'écriture du type `op`, par nom. """
+        return self._utilisateurs_en_attente if op == GestionnaireUtilisateurBase.OP_UTILISATEUR \
+            else self._parties_en_attente
+
+    def _soumettre(self, modification: tuple[str, str, Any], durable: bool) -> Future:
+        """ Garde la modification en mémoire et la soumet à l'écrivain (sous le verrou : même ordre dans les deux). """
+        with self._verrou:
+            self._en_attente(modification[0])[modification[1]] = modification
+            return self.ecrivain.soumettre(modification, urgent=durable)
+
+    def _ecrire_lot(self, lot: list[tuple[str, str, Any]]) -> list[int | Exception]:
+        """ Écrit un lot de modifications (thread de l'écrivain), puis met à jour le cache des parties. """
+        # Parties encodées ici, hors du chemin des sessions
+        blobs = [DepotParties.encoder(valeur) if op == GestionnaireUtilisateurBase.OP_PARTIE and valeur is not None
+                 else None for op, _, valeur in lot]
+        try:
+            resultats = self._ecrire_modifications(lot, blobs)
+        except Exception:
+            # Pas écrites : les modifications restent lues depuis la mémoire et sont soumises à nouveau
+            with self._verrou:
+                for modification in lot:
+                    if self._en_attente(modification[0]).get(modification[1]) is modification:
+                        self.ecrivain.soumettre(modification)
+            raise
+
+        for (op, nom, _), blob, resultat in zip(lot, blobs, resultats):
+            if op == GestionnaireUtilisateurBase.OP_PARTIE and not isinstance(resultat, Exception):
+                self.cache.ecrire(nom, blob if resultat else None)
+
+        # Écrites : les lectures repassent par le stockage (sauf modification plus récente)
+        with self._verrou:
+            for modification in lot:
+                en_attente = self._en_attente(modification[0])
+                if en_attente.get(modification[1]) is modification:
+                    del en_attente[modification[1]]
+        return resultats
+
+    def _recuperer_points_controle(self) -> None:
+        """
+        Sauvegarde les parties des points de contrôle restés sur disque (arrêt brutal du
+        serveur), puis efface ces points de contrôle une fois les sauvegardes écrites.
+        """
+        recuperees = self.points_controle.recuperer()
+        if not recuperees:
+            return
+        for nom, partie in recuperees:
+            if not partie.est_terminee():
+                self.sauvegarder_partie(nom, partie)
+        self.ecrivain.vider()
+        for nom, _ in recuperees:
+            self.points_controle.fermer(nom)
+        print(f"{type(self).__name__}: {len(recuperees)} parties en cours récupérées depuis leurs points de contrôle.")
+
+    def fermer(self) -> None:
+        """ Écrit les modifications en attente puis ferme le stockage (arrêt du serveur). """
+        self.ecrivain.stop()
+        self._fermer_stockage()
+
+    def statistiques(self) -> dict[str, Any]:
+        """ Instrumentation de l'écriture différée (voir EcrivainDiffere.statistiques, dont les lots en échec) et du cache des parties. """
+        return {**self.ecrivain.statistiques(), "cache_parties": self.cache.statistiques()}
+
+    @staticmethod
+    def _crypter_mdp(mot_de_passe: str) -> str:
+        """
+        Crypte un mot de passe en utilisant SHA-256 (standard hashlib).
+        """
+        # Utilise l'encodage défini dans les constantes
+        hash_objet = hashlib.sha256(mot_de_passe.encode(const.ENCODAGE))
+        return hash_objet.hexdigest()
+
+    @staticmethod
+    def _verifier_mdp(mdp_clair: str, mdp_crypte: str) -> bool:
+        """
+        Vérifie si le mot de passe en clair correspond au hash stocké.
+        """
+        return GestionnaireUtilisateurBase._crypter_mdp(mdp_clair) == mdp_crypte
+
+    # --- Authentification (Utilisé par AuthentificationUDP) ---
+
+    def _utilisateur_existe(self, nom: str) -> bool:
+        """ Vérifie si un utilisateur existe (inscription en attente ou stockée). """
+        return nom in self._utilisateurs_en_attente or self._lire_utilisateur(nom) is not None
+
+    def _utilisateur_enregistre(self, nom: str, mdp_hash: str) -> None:
+        """ Appelé sous le verrou après la soumission d'une inscription (données en mémoire du stockage). """
+
+    def enregistrer_utilisateur(self, nom: str, mdp: str, durable: bool = False) -> bool:
+        """
+        Crée un nouvel utilisateur (durable=True : attend son écriture sur disque).
+
+        Retourne True en cas de succès, False si le nom est déjà pris ou le mdp est invalide.
+        """
+        if len(mdp) < const.TAILLE_MIN_MDP or self._utilisateur_existe(nom):
+            return False
+
+        mdp_hash = GestionnaireUtilisateurBase._crypter_mdp(mdp)
+        with self._verrou:
+            # Entre deux inscriptions simultanées du même nom, une seule est soumise
+            if self._utilisateur_existe(nom):
+                return False
+            futur = self._soumettre((GestionnaireUtilisateurBase.OP_UTILISATEUR, nom, mdp_hash), durable)
+            self._utilisateur_enregistre(nom, mdp_hash)
+        if durable:
+            futur.result()
+        return True
+
+    def verifier_authentification(self, nom: str, mdp: str) -> bool:
+        """
+        Vérifie l'existence et les identifiants de l'utilisateur.
+
+        Retourne True si l'authentification réussit, False sinon.
+        """
+        en_attente = self._utilisateurs_en_attente.get(nom)
+        mdp_crypte = en_attente[2] if en_attente is not None else self._lire_utilisateur(nom)
+        if mdp_crypte is None:
+            return False
+
+        return GestionnaireUtilisateurBase._verifier_mdp(mdp, mdp_crypte)
+
+    # --- Sauvegarde et Reprise de Partie (Utilisé par GestionnaireClient) ---
+
+    def sauvegarder_partie(self, nom_joueur: str, partie: Partie, durable: bool = False) -> None:
+        """
+        Sauvegarde l'état complet de la partie pour un joueur.
+        Si la partie est 'EN_COURS', elle est marquée 'MIS_EN_PAUSE' avant la sauvegarde.
+        durable=True : attend son écriture sur disque.
+        """
+        if not self._utilisateur_existe(nom_joueur):
+            # Normalement ne devrait pas arriver après l'authentification
+            return
+
+        # Mise à jour de l'état si elle est en cours et est sauvegardée
+        if partie.etat == const.ETAT_EN_COURS:
+            partie.etat = const.ETAT_MIS_EN_PAUSE
+
+        # La copie (to_dict) est faite ici ; l'encodage, par l'écrivain
+        self._modifier_partie(nom_joueur, partie.to_dict(), durable)
+
+    def charger_partie(self, nom_joueur: str) -> Partie|None:
+        """
+        Charge la partie sauvegardée pour un joueur et la désérialise.
+
+        Retourne l'objet Partie ou None si aucune partie n'est trouvée.
+        """
+        en_attente = self._parties_en_attente.get(nom_joueur)
+        if en_attente is not None:
+            return Partie.from_dict(en_attente[2]) if en_attente[2] is not None else None
+
+        blob = self.cache.obtenir(nom_joueur)
+        if blob is None:
+            jeton = self.cache.jeton()
+            blob = self._lire_partie(nom_joueur)
+            if blob is None:
+                return None
+            self.cache.ajouter_lu(nom_joueur, blob, jeton)
+
+        return Partie.from_dict(DepotParties.decoder(blob))
+
+    def partie_existe(self, nom_joueur: str) -> bool:
+        """
+        Vérifie si une partie mise en pause est disponible pour ce joueur.
+        """
+        en_attente = self._parties_en_attente.get(nom_joueur)
+        if en_attente is not None:
+            return en_attente[2] is not None
+        return self.cache.obtenir(nom_joueur) is not None or self._partie_stockee(nom_joueur)
+
+    def supprimer_partie_sauvegardee(self, nom_joueur: str, durable: bool = False) -> None:
+        """
+        Supprime la partie sauvegardée (ex: après une victoire/défaite ou reprise).
+        """
+        if self.partie_existe(nom_joueur):
+            self._modifier_partie(nom_joueur, None, durable)
+
+    def _modifier_partie(self, nom_joueur: str, partie_dict: dict[str, Any] | None, durable: bool) -> None:
+        """ Soumet la nouvelle partie sauvegardée du joueur (None : suppression) à l'écrivain. """
+        futur = self._soumettre((GestionnaireUtilisateurBase.OP_PARTIE, nom_joueur, partie_dict), durable)
+        if durable:
+            futur.result()
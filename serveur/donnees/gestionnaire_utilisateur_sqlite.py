@@ -0,0 +1,140 @@
+import sqlite3
+import threading
+from typing import Any
+
+from commun import constantes as const
+from .gestionnaire_utilisateur_base import GestionnaireUtilisateurBase
+
+
+class GestionnaireUtilisateurSQLite(GestionnaireUtilisateurBase):
+    """
+    Variante de GestionnaireUtilisateur (même interface, voir GestionnaireUtilisateurBase)
+    stockée dans une base SQLite en mode WAL.
+
+    Les utilisateurs et les parties sauvegardées sont dans deux tables indexées par le
+    nom du joueur : verifier_authentification, partie_existe et charger_partie sont
+    des lectures ponctuelles sur la clé primaire, rien n'est chargé au démarrage.
+
+    Lectures : chaque thread (travailleurs de l'authentification UDP, sessions de jeu)
+    a sa propre connexion ; en mode WAL, elles ne bloquent pas et ne sont pas bloquées
+    par l'écrivain.
+    Écritures : différées (voir GestionnaireUtilisateurBase), validées par lots dans une
+    seule transaction. Les points de contrôle des parties en cours sont des fichiers à
+    côté de la base (PointsControle), comme pour le stockage JSON.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS utilisateurs ("
+        " nom TEXT PRIMARY KEY,"
+        " mdp_hash TEXT NOT NULL"
+        ") WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS parties_sauvegardees ("
+        " nom TEXT PRIMARY KEY REFERENCES utilisateurs(nom),"
+        " partie BLOB NOT NULL"
+        ") WITHOUT ROWID",
+    )
+
+    SQL_INSERER_UTILISATEUR = "INSERT OR IGNORE INTO utilisateurs (nom, mdp_hash) VALUES (?, ?)"
+    # La partie n'est enregistrée que si le joueur existe
+    SQL_SAUVEGARDER_PARTIE = ("INSERT OR REPLACE INTO parties_sauvegardees (nom, partie) "
+                              "SELECT nom, ? FROM utilisateurs WHERE nom = ?")
+    SQL_SUPPRIMER_PARTIE = "DELETE FROM parties_sauvegardees WHERE nom = ?"
+
+    def __init__(self, chemin_fichier: str):
+        self._locales = threading.local()
+        self._connexions: list[sqlite3.Connection] = []
+        self._verrou_connexions = threading.Lock()
+        self._connexion_ecriture: sqlite3.Connection | None = None
+        super().__init__(chemin_fichier, "EcrivainSQLite")
+
+    def _ouvrir_stockage(self) -> None:
+        # Le schéma et le mode WAL (persistant dans le fichier) sont créés avant tout accès concurrent
+        connexion = self._ouvrir()
+        connexion.execute("PRAGMA journal_mode=WAL")
+        for requete in GestionnaireUtilisateurSQLite.SCHEMA:
+            connexion.execute(requete)
+        connexion.close()
+
+    # --- Connexions ---
+
+    def _ouvrir(self) -> sqlite3.Connection:
+        # isolation_level=None : les transactions sont ouvertes explicitement par l'écrivain.
+        # Chaque connexion n'est utilisée que par un thread ; fermer() les ferme depuis le thread d'arrêt.
+        connexion = sqlite3.connect(self.chemin_fichier, isolation_level=None, timeout=30.0,
+                                    check_same_thread=False)
+        # En mode WAL, NORMAL ne synchronise qu'aux points de contrôle : une transaction validée
+        # survit à l'arrêt du processus (pas forcément à une panne du système)
+        connexion.execute("PRAGMA synchronous=FULL" if const.SYNCHRONISER_JOURNAL else "PRAGMA synchronous=NORMAL")
+        return connexion
+
+    def _connexion(self) -> sqlite3.Connection:
+        """ Connexion de lecture du thread appelant (ouverte à sa première lecture). """
+        connexion = getattr(self._locales, "connexion", None)
+        if connexion is None:
+            connexion = self._ouvrir()
+            connexion.execute("PRAGMA query_only=ON")
+            self._locales.connexion = connexion
+            with self._verrou_connexions:
+                self._connexions.append(connexion)
+        return connexion
+
+    def _lire(self, requete: str, parametres: tuple) -> tuple | None:
+        return self._connexion().execute(requete, parametres).fetchone()
+
+    # --- Écritures (différées, validées par lots) ---
+
+    def _ecrire_modifications(self, lot: list[tuple[str, str, Any]],
+                              blobs: list[bytes | None]) -> list[int | Exception]:
+        """ Valide un lot de modifications dans une seule transaction (thread de l'écrivain). """
+        if self._connexion_ecriture is None:
+            self._connexion_ecriture = self._ouvrir()
+        connexion = self._connexion_ecriture
+
+        resultats: list[int | Exception] = []
+        try:
+            connexion.execute("BEGIN IMMEDIATE")
+            for (op, nom, valeur), blob in zip(lot, blobs):
+                try:
+                    resultats.append(GestionnaireUtilisateurSQLite._appliquer(connexion, op, nom, valeur, blob))
+                except sqlite3.Error as e:
+                    # Seule cette modification échoue ; les autres modifications du lot sont conservées
+                    resultats.append(e)
+            connexion.execute("COMMIT")
+        except sqlite3.Error:
+            if connexion.in_transaction:
+                connexion.execute("ROLLBACK")
+            raise
+        return resultats
+
+    @staticmethod
+    def _appliquer(connexion: sqlite3.Connection, op: str, nom: str, valeur: Any, blob: bytes | None) -> int:
+        """ Exécute une modification. Retourne le nombre de lignes modifiées. """
+        if op == GestionnaireUtilisateurSQLite.OP_UTILISATEUR:
+            requete, parametres = GestionnaireUtilisateurSQLite.SQL_INSERER_UTILISATEUR, (nom, valeur)
+        elif valeur is None:
+            requete, parametres = GestionnaireUtilisateurSQLite.SQL_SUPPRIMER_PARTIE, (nom,)
+        else:
+            requete, parametres = GestionnaireUtilisateurSQLite.SQL_SAUVEGARDER_PARTIE, (blob, nom)
+        return connexion.execute(requete, parametres).rowcount
+
+    def _fermer_stockage(self) -> None:
+        """ Ferme les connexions. """
+        with self._verrou_connexions:
+            if self._connexion_ecriture is not None:
+                self._connexion_ecriture.close()
+            for connexion in self._connexions:
+                connexion.close()
+            self._connexions.clear()
+
+    # --- Lectures (clé primaire) ---
+
+    def _lire_utilisateur(self, nom: str) -> str | None:
+        ligne = self._lire("SELECT mdp_hash FROM utilisateurs WHERE nom = ?", (nom,))
+        return ligne[0] if ligne is not None else None
+
+    def _lire_partie(self, nom_joueur: str) -> bytes | None:
+        ligne = self._lire("SELECT partie FROM parties_sauvegardees WHERE nom = ?", (nom_joueur,))
+        return ligne[0] if ligne is not None else None
+
+    def _partie_stockee(self, nom_joueur: str) -> bool:
+        return self._lire("SELECT 1 FROM parties_sauvegardees WHERE nom = ?", (nom_joueur,)) is not None
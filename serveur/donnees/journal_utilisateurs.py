@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+from typing import Any
+
+from commun import constantes as const
+
+
+class JournalUtilisateurs:
+    """
+    Persistance des données utilisateur par journal d'écriture anticipée.
+
+    Chaque modification ajoute un enregistrement JSON d'une ligne au journal
+    (<fichier>.journal) ; le fichier de sauvegarde n'est plus réécrit à chaque
+    modification. Les enregistrements arrivent par lots (écriture différée, voir
+    EcrivainDiffere), synchronisés sur disque en une fois. Au démarrage, l'instantané (le fichier de sauvegarde) est chargé
+    puis le journal est rejoué. Quand le journal dépasse SEUIL_COMPACTION_JOURNAL
+    enregistrements, un thread réécrit l'instantané (fichier temporaire puis
+    os.replace) et le journal repart de zéro.
+
+    Les enregistrements affectent une valeur (utilisateur complet ou partie
+    sauvegardée) : les rejouer deux fois est sans effet, ce qui permet de relire le
+    journal en cours de compaction après un arrêt brutal. Une dernière ligne
+    incomplète (arrêt pendant un ajout) est ignorée.
+    """
+
+    # Types d'enregistrement
+    OP_UTILISATEUR = "U"  # {"op": "U", "nom": ..., "u": enregistrement utilisateur}
+    # {"op": "P", "nom": ..., "p": partie sauvegardée ou None}. Ancien format, rejoué seulement :
+    # les parties sont désormais dans DepotParties (c'est aussi le type de leurs modifications différées)
+    OP_PARTIE = "P"
+
+    SUFFIXE_COMPACTION = ".compaction"
+
+    def __init__(self, chemin_fichier: str):
+        self.chemin_fichier = chemin_fichier
+        self.chemin_journal = chemin_fichier + const.SUFFIXE_JOURNAL
+        self.chemin_journal_compaction = self.chemin_journal + JournalUtilisateurs.SUFFIXE_COMPACTION
+        self.nb_enregistrements = 0
+        self._fichier_journal = None
+        self._thread_compaction: threading.Thread | None = None
+        # Le thread de persistance ajoute pendant que le gestionnaire bascule le journal
+        self._verrou_fichier = threading.Lock()
+
+    # --- Chargement ---
+
+    def charger(self, lecture_seule: bool = False) -> dict[str, Any]:
+        """
+        Charge l'instantané, puis rejoue le journal en cours de compaction et le journal courant.
+        lecture_seule=True (outils) : aucun fichier n'est modifié ni créé, le journal n'est pas
+        ouvert en ajout.
+        """
+        donnees = {"utilisateurs": {}}
+        if os.path.exists(self.chemin_fichier):
+            with open(self.chemin_fichier, 'r', encoding=const.ENCODAGE) as f:
+                try:
+                    donnees = json.load(f)
+                except json.JSONDecodeError:
+                    print(f"Erreur de décodage JSON dans {self.chemin_fichier}. Fichier de données réinitialisé.")
+
+        self._rejouer(self.chemin_journal_compaction, donnees, tronquer=not lecture_seule)
+        self.nb_enregistrements = self._rejouer(self.chemin_journal, donnees, tronquer=not lecture_seule)
+
+        if not lecture_seule:
+            self._fichier_journal = open(self.chemin_journal, 'a', encoding=const.ENCODAGE)
+        return donnees
+
+    @staticmethod
+    def _rejouer(chemin: str, donnees: dict[str, Any], tronquer: bool = True) -> int:
+        """
+        Applique les enregistrements d'un journal aux données. Retourne leur nombre.
+        Le journal est tronqué (tronquer=True) après le dernier enregistrement lisible, pour
+        que les ajouts suivants ne soient pas masqués par une ligne incomplète.
+        """
+        if not os.path.exists(chemin):
+            return 0
+
+        nb = 0
+        taille_valide = 0
+        with open(chemin, 'rb') as f:
+            for ligne in f:
+                try:
+                    JournalUtilisateurs.appliquer(donnees, json.loads(ligne.decode(const.ENCODAGE)))
+                except (ValueError, KeyError):
+                    print(f"Journal {chemin}: enregistrement {nb + 1} illisible, fin du rejeu.")
+                    break
+                nb += 1
+                taille_valide += len(ligne)
+
+        if tronquer and taille_valide < os.path.getsize(chemin):
+            os.truncate(chemin, taille_valide)
+        return nb
+
+    @staticmethod
+    def appliquer(donnees: dict[str, Any], enregistrement: dict[str, Any]) -> None:
+        """ Applique un enregistrement du journal aux données en mémoire. """
+        utilisateurs = donnees["utilisateurs"]
+        nom = enregistrement["nom"]
+        if enregistrement["op"] == JournalUtilisateurs.OP_UTILISATEUR:
+            utilisateurs[nom] = enregistrement["u"]
+        elif nom in utilisateurs:
+            utilisateurs[nom] = {**utilisateurs[nom], "partie_sauvegardee": enregistrement["p"]}
+
+    # --- Écriture ---
+
+    def ajouter_lot(self, enregistrements: list[dict[str, Any]]) -> list[None]:
+        """ Ajoute un lot d'enregistrements à la fin du journal, avec un seul fsync (thread de persistance). """
+        lignes = "".join(json.dumps(e, separators=(',', ':')) + "\n" for e in enregistrements)
+        with self._verrou_fichier:
+            self._fichier_journal.write(lignes)
+            self._fichier_journal.flush()
+            if const.SYNCHRONISER_JOURNAL:
+                os.fsync(self._fichier_journal.fileno())
+            self.nb_enregistrements += len(enregistrements)
+        return [None] * len(enregistrements)
+
+    def doit_compacter(self) -> bool:
+        return self.nb_enregistrements >= const.SEUIL_COMPACTION_JOURNAL and not self.compaction_en_cours()
+
+    def compaction_en_cours(self) -> bool:
+        return self._thread_compaction is not None and self._thread_compaction.is_alive()
+
+    def compacter_en_arriere_plan(self, donnees: dict[str, Any]) -> None:
+        """
+        Démarre la compaction. `donnees` est une copie des données (les enregistrements
+        utilisateur y sont remplacés, jamais modifiés sur place), prise sous le verrou
+        du gestionnaire au même instant que la bascule du journal faite ici.
+        Les enregistrements soumis avant la copie mais pas encore écrits le seront dans
+        le nouveau journal : les rejouer sur l'instantané, dans l'ordre, est sans effet.
+        """
+        self._basculer_journal()
+        self._thread_compaction = threading.Thread(target=self._ecrire_instantane, args=(donnees,),
+                                                   name="CompactionJournal", daemon=True)
+        self._thread_compaction.start()
+
+    def compacter(self, donnees: dict[str, Any]) -> None:
+        """ Compaction synchrone (arrêt du serveur, outils). """
+        self.attendre_compaction()
+        self._basculer_journal()
+        self._ecrire_instantane(donnees)
+
+    def attendre_compaction(self) -> None:
+        if self._thread_compaction is not None:
+            self._thread_compaction.join()
+
+    def _basculer_journal(self) -> None:
+        """ Le journal courant devient le journal en cours de compaction ; un nouveau journal vide est ouvert. """
+        with self._verrou_fichier:
+            self._fichier_journal.close()
+            if os.path.exists(self.chemin_journal_compaction):
+                # Compaction précédente inachevée (échec, arrêt brutal) : ses enregistrements sont conservés
+                with open(self.chemin_journal, 'rb') as source, open(self.chemin_journal_compaction, 'ab') as cible:
+                    cible.write(source.read())
+                os.remove(self.chemin_journal)
+            else:
+                os.replace(self.chemin_journal, self.chemin_journal_compaction)
+            self._fichier_journal = open(self.chemin_journal, 'a', encoding=const.ENCODAGE)
+            self.nb_enregistrements = 0
+
+    def _ecrire_instantane(self, donnees: dict[str, Any]) -> None:
+        """ Écrit l'instantané dans un fichier temporaire, le substitue à l'ancien, puis supprime le journal compacté. """
+        temporaire = self.chemin_fichier + ".tmp"
+        try:
+            with open(temporaire, 'w', encoding=const.ENCODAGE) as f:
+                json.dump(donnees, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporaire, self.chemin_fichier)
+            os.remove(self.chemin_journal_compaction)
+        except OSError as e:
+            # Le journal compacté est conservé : il sera rejoué au prochain démarrage
+            print(f"Journal: Échec de la compaction de {self.chemin_fichier}: {e}")
+
+    def fermer(self) -> None:
+        self.attendre_compaction()
+        if self._fichier_journal:
+            self._fichier_journal.close()
+            self._fichier_journal = None
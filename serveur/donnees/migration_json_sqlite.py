@@ -0,0 +1,102 @@
+"""
+Conversion du fichier de sauvegarde JSON (et de son journal) en base SQLite.
+
+Le fichier JSON est chargé comme au démarrage du serveur (instantané puis rejeu du
+journal), mais en lecture seule, puis tous les utilisateurs et leurs parties
+sauvegardées (dépôt <fichier>.parties/, ou ancien format dans l'enregistrement)
+sont insérés dans une seule transaction. Les utilisateurs déjà présents dans la base
+sont remplacés.
+
+Les parties en cours interrompues par un arrêt brutal (points de contrôle,
+<fichier>.points_controle/) sont reconstruites et migrées comme parties sauvegardées,
+comme le ferait le démarrage du serveur JSON : elles remplacent la sauvegarde du dépôt.
+
+Les fichiers JSON (instantané, journal, dépôt, points de contrôle) ne sont pas modifiés.
+
+Utilisation (depuis la racine du dépôt, serveur arrêté) :
+    python -m serveur.donnees.migration_json_sqlite [fichier.json] [base.sqlite3]
+"""
+import os
+import sqlite3
+import sys
+import time
+
+from commun import constantes as const
+from .depot_parties import DepotParties
+from .gestionnaire_utilisateur_sqlite import GestionnaireUtilisateurSQLite
+from .journal_utilisateurs import JournalUtilisateurs
+from .points_controle import PointsControle
+
+DOSSIER_SERVEUR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _parties_interrompues(dossier: str, utilisateurs: dict) -> dict[str, bytes]:
+    """
+    Parties (encodées) des points de contrôle du dossier, par joueur, mises en pause comme
+    au démarrage du serveur. Les parties terminées sont ignorées ; les fichiers restent en place.
+    """
+    if not os.path.isdir(dossier):  # PointsControle créerait le dossier
+        return {}
+    reprises = {}
+    for nom, partie in PointsControle(dossier).recuperer():
+        if nom not in utilisateurs or partie.est_terminee():
+            continue
+        if partie.etat == const.ETAT_EN_COURS:
+            partie.etat = const.ETAT_MIS_EN_PAUSE
+        reprises[nom] = DepotParties.encoder(partie.to_dict())
+    return reprises
+
+
+def migrer(chemin_json: str, chemin_base: str) -> tuple[int, int]:
+    """ Copie les utilisateurs et parties du fichier JSON dans la base. Retourne (nb utilisateurs, nb parties). """
+    utilisateurs = JournalUtilisateurs(chemin_json).charger(lecture_seule=True)["utilisateurs"]
+    depot = DepotParties(chemin_json + const.SUFFIXE_DEPOT_PARTIES)
+    reprises = _parties_interrompues(chemin_json + const.SUFFIXE_POINTS_CONTROLE, utilisateurs)
+
+    def partie(nom: str, utilisateur: dict) -> bytes | None:
+        if nom in reprises:
+            return reprises[nom]
+        if utilisateur.get("partie_sauvegardee") is not None:  # Ancien format
+            return DepotParties.encoder(utilisateur["partie_sauvegardee"])
+        return depot.lire(nom)
+
+    # Crée le schéma (mode WAL) puis arrête l'écrivain : l'import passe par sa propre transaction
+    GestionnaireUtilisateurSQLite(chemin_base).fermer()
+
+    connexion = sqlite3.connect(chemin_base, isolation_level=None)
+    nb_parties = 0
+    try:
+        connexion.execute("BEGIN IMMEDIATE")
+        connexion.executemany("INSERT OR REPLACE INTO utilisateurs (nom, mdp_hash) VALUES (?, ?)",
+                              ((nom, u["mdp_hash"]) for nom, u in utilisateurs.items()))
+        parties = [(nom, blob) for nom, blob in ((nom, partie(nom, u)) for nom, u in utilisateurs.items())
+                   if blob is not None]
+        connexion.executemany("DELETE FROM parties_sauvegardees WHERE nom = ?", ((nom,) for nom in utilisateurs))
+        connexion.executemany("INSERT INTO parties_sauvegardees (nom, partie) VALUES (?, ?)", parties)
+        nb_parties = len(parties)
+        connexion.execute("COMMIT")
+    except Exception:
+        if connexion.in_transaction:
+            connexion.execute("ROLLBACK")
+        raise
+    finally:
+        connexion.close()
+    return len(utilisateurs), nb_parties
+
+
+def main():
+    chemin_json = sys.argv[1] if len(sys.argv) > 1 else os.path.join(DOSSIER_SERVEUR, const.FICHIER_SAUVEGARDE_UTILISATEURS)
+    chemin_base = sys.argv[2] if len(sys.argv) > 2 else os.path.join(DOSSIER_SERVEUR, const.FICHIER_BASE_UTILISATEURS)
+
+    if not os.path.exists(chemin_json):
+        print(f"Fichier introuvable: {chemin_json}")
+        sys.exit(1)
+
+    debut = time.perf_counter()
+    nb_utilisateurs, nb_parties = migrer(chemin_json, chemin_base)
+    print(f"{nb_utilisateurs} utilisateurs et {nb_parties} parties sauvegardées migrés vers {chemin_base} "
+          f"en {time.perf_counter() - debut:.2f} s.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+import functools
+import hashlib
+import os
+import struct
+import threading
+from typing import Callable
+
+from commun import constantes as const
+from commun.coeur_jeu.partie import Partie
+from .depot_parties import DepotParties
+
+
+class PointsControle:
+    """
+    Points de contrôle des parties Solo en cours, un fichier par joueur.
+
+    Le fichier commence par un instantané de base de la partie, suivi des tirs joués
+    depuis (2 octets chacun, x puis y, ajoutés en fin de fichier) : un tour ne coûte
+    que quelques octets d'écriture. Tous les `intervalle` tirs (ou pour un tir hors
+    de [0, 255]), un nouvel instantané remplace le fichier d'un bloc (fichier
+    temporaire puis os.replace) et les tirs repartent de zéro.
+
+    Après un arrêt brutal du serveur, recuperer() reconstruit chaque partie en
+    rejouant ses tirs sur son instantané : au plus le tour en cours est perdu.
+
+    Chaque opération a une variante *_differe qui prend tout de suite ce qu'il faut de la
+    partie et retourne l'écriture, à faire plus tard dans un autre thread (une session
+    asyncio n'écrit pas sur le disque depuis la boucle d'événements). Les écritures d'un
+    même joueur doivent alors être faites dans l'ordre des appels.
+
+    Format : longueurs du nom (2 o) et de l'instantané (4 o), nom, instantané
+    (DepotParties.encoder), puis les tirs. Un dernier tir incomplet est ignoré.
+    """
+
+    ENTETE = struct.Struct("!HI")
+    TIR = struct.Struct("!BB")
+    COORD_MAX = 0xFF
+
+    def __init__(self, dossier: str, intervalle: int = const.INTERVALLE_POINTS_CONTROLE):
+        self.dossier = dossier
+        self.intervalle = intervalle
+        os.makedirs(dossier, exist_ok=True)
+        # Tirs ajoutés depuis l'instantané de base, par joueur dont la partie est suivie
+        self._nb_tirs: dict[str, int] = {}
+        self._verrou = threading.Lock()
+
+    def _chemin(self, nom: str) -> str:
+        cle = hashlib.sha256(nom.encode(const.ENCODAGE)).hexdigest()
+        return os.path.join(self.dossier, cle[:2], cle + ".pc")
+
+    # --- Parties en cours (sessions) ---
+
+    def ouvrir(self, nom: str, partie: Partie) -> None:
+        """ Commence à suivre la partie du joueur : écrit son instantané de base. """
+        self.ouvrir_differe(nom, partie)()
+
+    def ouvrir_differe(self, nom: str, partie: Partie) -> Callable[[], None]:
+        base = PointsControle._encoder_base(nom, partie)
+        with self._verrou:
+            self._nb_tirs[nom] = 0
+        return functools.partial(self._ecrire_base, nom, base)
+
+    def ajouter_tir(self, nom: str, partie: Partie, x: int, y: int) -> None:
+        """ Tir qui vient d'être joué sur la partie du joueur (sans effet si elle n'est pas suivie). """
+        ecriture = self.ajouter_tir_differe(nom, partie, x, y)
+        if ecriture is not None:
+            ecriture()
+
+    def ajouter_tir_differe(self, nom: str, partie: Partie, x: int, y: int) -> Callable[[], None] | None:
+        with self._verrou:
+            nb_tirs = self._nb_tirs.get(nom)
+            if nb_tirs is None:
+                return None
+            rebaser = nb_tirs + 1 >= self.intervalle or not (0 <= x <= self.COORD_MAX and 0 <= y <= self.COORD_MAX)
+            self._nb_tirs[nom] = 0 if rebaser else nb_tirs + 1
+
+        if rebaser:
+            return functools.partial(self._ecrire_base, nom, PointsControle._encoder_base(nom, partie))
+        return functools.partial(self._ajouter, nom, PointsControle.TIR.pack(x, y))
+
+    def est_suivie(self, nom: str) -> bool:
+        return nom in self._nb_tirs
+
+    def fermer(self, nom: str) -> None:
+        """ La partie du joueur n'est plus suivie (terminée, sauvegardée ou quittée) : son fichier est effacé. """
+        self.fermer_differe(nom)()
+
+    def fermer_differe(self, nom: str) -> Callable[[], None]:
+        with self._verrou:
+            self._nb_tirs.pop(nom, None)
+        return functools.partial(self._effacer, nom)
+
+    # --- Écritures ---
+
+    @staticmethod
+    def _encoder_base(nom: str, partie: Partie) -> bytes:
+        """ Entête, nom et instantané de la partie : le début du fichier. """
+        nom_octets = nom.encode(const.ENCODAGE)
+        instantane = DepotParties.encoder(partie.to_dict())
+        return PointsControle.ENTETE.pack(len(nom_octets), len(instantane)) + nom_octets + instantane
+
+    def _ajouter(self, nom: str, tir: bytes) -> None:
+        with open(self._chemin(nom), 'ab') as f:
+            f.write(tir)
+            if const.SYNCHRONISER_POINTS_CONTROLE:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _effacer(self, nom: str) -> None:
+        try:
+            os.remove(self._chemin(nom))
+        except FileNotFoundError:
+            pass
+
+    def _ecrire_base(self, nom: str, base: bytes) -> None:
+        chemin = self._chemin(nom)
+        os.makedirs(os.path.dirname(chemin), exist_ok=True)
+        temporaire = chemin + ".tmp"
+        with open(temporaire, 'wb') as f:
+            f.write(base)
+            if const.SYNCHRONISER_POINTS_CONTROLE:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temporaire, chemin)
+
+    # --- Reprise après un arrêt brutal ---
+
+    def recuperer(self) -> list[tuple[str, Partie]]:
+        """
+        Reconstruit les parties de tous les points de contrôle présents (instantané + tirs).
+        Les fichiers illisibles sont signalés et laissés en place.
+        """
+        parties = []
+        for racine, _, fichiers in os.walk(self.dossier):
+            for fichier in fichiers:
+                if not fichier.endswith(".pc"):
+                    continue
+                chemin = os.path.join(racine, fichier)
+                try:
+                    with open(chemin, 'rb') as f:
+                        parties.append(PointsControle.rejouer(f.read()))
+                except (ValueError, KeyError, TypeError, struct.error) as e:
+                    print(f"PointsControle: point de contrôle illisible {chemin}: {e}")
+        return parties
+
+    @staticmethod
+    def rejouer(data: bytes) -> tuple[str, Partie]:
+        """ (nom du joueur, partie) d'un fichier de point de contrôle. """
+        taille_nom, taille = PointsControle.ENTETE.unpack_from(data)
+        fin_nom = PointsControle.ENTETE.size + taille_nom
+        debut_tirs = fin_nom + taille
+        if debut_tirs > len(data):
+            raise ValueError("instantané tronqué")
+        nom = str(data[PointsControle.ENTETE.size:fin_nom], const.ENCODAGE)
+        partie = Partie.from_dict(DepotParties.decoder(data[fin_nom:debut_tirs]))
+        fin_tirs = debut_tirs + (len(data) - debut_tirs) // PointsControle.TIR.size * PointsControle.TIR.size
+        for x, y in PointsControle.TIR.iter_unpack(data[debut_tirs:fin_tirs]):
+            partie.traiter_tir(x, y)
+        return nom, partie
@@ -0,0 +1,66 @@
+import collections
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable
+
+from commun.coeur_jeu.partie import Partie
+
+
+class ActeurPartie:
+    """
+    Acteur d'une partie PvP : toutes les opérations sur la partie (placement, tirs,
+    chat, abandon, départ d'un joueur) sont déposées dans sa boîte aux lettres et
+    appliquées une par une, dans l'ordre d'arrivée.
+
+    La boîte est vidée par un exécuteur partagé entre toutes les parties : deux
+    opérations d'une même partie ne s'exécutent jamais en même temps, alors que des
+    parties différentes avancent en parallèle, sans verrou global.
+    L'état propre à la partie (objet Partie, placement des joueurs) n'est modifié
+    que depuis l'acteur.
+    """
+
+    def __init__(self, game_id: str, partie: Partie, executeur: Executor) -> None:
+        self.game_id = game_id
+        self.partie = partie
+        self.executeur = executeur
+
+        # Noms des joueurs -> navires placés ?
+        self.etat_placement: dict[str, bool] = {partie.joueur1.nom: False, partie.joueur2.nom: False}
+        # Joueurs partis (déconnexion, abandon) : la partie est retirée quand ils le sont tous
+        self.joueurs_partis: set[str] = set()
+        self.terminee = False
+
+        self._boite: collections.deque[tuple[Callable[..., Any], tuple]] = collections.deque()
+        self._verrou = threading.Lock()  # Protège uniquement la boîte et _planifie
+        self._planifie = False
+        self.nb_operations = 0
+
+    def deposer(self, operation: Callable[..., Any], *args: Any) -> None:
+        """ Ajoute une opération à la boîte ; l'acteur est planifié s'il était inactif. """
+        with self._verrou:
+            self._boite.append((operation, args))
+            if self._planifie:
+                return
+            self._planifie = True
+        self.executeur.submit(self._executer)
+
+    def _executer(self) -> None:
+        """ Applique les opérations en attente, une par une, jusqu'à vider la boîte. """
+        while True:
+            with self._verrou:
+                if not self._boite:
+                    self._planifie = False
+                    return
+                operation, args = self._boite.popleft()
+
+            try:
+                operation(*args)
+            except Exception as e:
+                print(f"[ActeurPartie {self.game_id}] Erreur lors du traitement: {e}")
+            self.nb_operations += 1
+
+    def nom_adversaire(self, nom_joueur: str) -> str:
+        return self.partie.joueur2.nom if nom_joueur == self.partie.joueur1.nom else self.partie.joueur1.nom
+
+    def taille_boite(self) -> int:
+        return len(self._boite)
@@ -0,0 +1,283 @@
+import asyncio
+import collections
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as DelaiDepasse
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+
+from commun import constantes as const
+from commun.coeur_jeu.partie import Partie
+from commun.coeur_jeu.strategie_ia import StrategieIa
+
+
+class CalculateurIa:
+    """
+    Calcule les tirs coûteux de l'IA Solo (stratégies COUT_IA_LOURD, ex : la carte de
+    densité d'IaDensite) dans un groupe de processus partagé par toutes les sessions : le
+    calcul (StrategieIa.calculer) ne tient ni le GIL ni le thread de la session.
+
+    Chaque tir a un délai (DELAI_TIR_IA) : passé ce délai, le calcul est abandonné et
+    l'IA joue son tir rapide (StrategieIa.tir_rapide). Un calcul abandonné qui a déjà
+    commencé occupe encore son processus jusqu'à la fin. Sous charge, au-delà de
+    CALCULS_IA_LOURDS_PAR_PROCESSUS calculs en cours par processus, les tirs lourds sont
+    plafonnés : tir rapide d'emblée, sans calcul. Latence des tirs, replis et saturation
+    du groupe sont mesurés (voir statistiques()).
+
+    Une session asyncio attend le calcul sans bloquer la boucle d'événements
+    (choisir_tir_asyncio) ; les autres sessions attendent dans leur thread (choisir_tir).
+
+    Les processus sont démarrés au premier tir (ou par demarrer()). Sans processus
+    (NB_PROCESSUS_IA = 0), les calculs lourds sont faits dans le thread appelant, avec le
+    même plafond ; les stratégies COUT_IA_CONSTANT et COUT_IA_LEGER y jouent toujours.
+    """
+
+    def __init__(self, nb_processus: int = const.NB_PROCESSUS_IA, delai: float = const.DELAI_TIR_IA) -> None:
+        self.nb_processus = nb_processus
+        self.delai = delai
+        self.plafond = max(1, nb_processus) * const.CALCULS_IA_LOURDS_PAR_PROCESSUS
+        self._executeur: ProcessPoolExecutor | None = None
+        self._verrou = threading.Lock()  # Protège l'exécuteur et les statistiques
+
+        # Statistiques (voir statistiques())
+        self.nb_tirs = 0
+        self.nb_lourds = 0
+        self.nb_calcules = 0
+        self.nb_replis = 0
+        self.nb_plafonnes = 0
+        self.nb_erreurs = 0
+        self.en_cours = 0
+        self.en_cours_max = 0
+        self.nb_soumis_sature = 0
+        self.latence_max = 0.0
+        self._latences: collections.deque[float] = collections.deque(maxlen=const.TAILLE_ECHANTILLON_LATENCES)
+
+    def demarrer(self) -> None:
+        """ Démarre les processus à l'avance, pour que les premiers tirs ne paient pas leur lancement. """
+        if self.nb_processus <= 0:
+            return
+        executeur = self._obtenir_executeur()
+        for futur in [executeur.submit(_prechauffer) for _ in range(self.nb_processus)]:
+            futur.result()
+
+    def fermer(self) -> None:
+        """ Arrête les processus (les calculs en attente sont annulés). """
+        with self._verrou:
+            executeur, self._executeur = self._executeur, None
+        if executeur is not None:
+            executeur.shutdown(wait=True, cancel_futures=True)
+
+    def choisir_tir(self, partie: Partie) -> tuple[int, int]:
+        """
+        Tir de l'IA (joueur2) de la partie ; un calcul lourd est fait par le groupe de
+        processus dans la limite du délai (voir Partie.choisir_tir_ia).
+
+        Raises:
+            ValueError: Si l'IA a déjà visé toutes les cases.
+        """
+        debut = time.perf_counter()
+        tir = partie.choisir_tir_ia(calculateur=self._calculer)
+        self._noter_tir(time.perf_counter() - debut)
+        return tir
+
+    async def choisir_tir_asyncio(self, partie: Partie) -> tuple[int, int]:
+        """
+        choisir_tir() pour une session asyncio : le calcul lourd est attendu (au plus le
+        délai) sans bloquer la boucle d'événements, qui sert les autres sessions pendant ce temps.
+
+        Raises:
+            ValueError: Si l'IA a déjà visé toutes les cases.
+        """
+        debut = time.perf_counter()
+        ia, travail = partie.preparer_tir_ia()
+        resultat = None
+        if travail is not None and ia.COUT != const.COUT_IA_LOURD:
+            resultat = ia.calculer(travail)
+        elif travail is not None:
+            futur = self._lancer(ia, travail)
+            if futur is not None:
+                try:
+                    # Le délai dépassé annule aussi le futur du groupe (sans effet si le calcul a commencé)
+                    resultat = await asyncio.wait_for(asyncio.wrap_future(futur), self.delai)
+                except asyncio.TimeoutError:
+                    self._noter_repli()
+                except Exception as e:
+                    self._noter_erreur(e)
+                else:
+                    self._noter_calcul()
+        tir = partie.conclure_tir_ia(travail, resultat)
+        self._noter_tir(time.perf_counter() - debut)
+        return tir
+
+    def _calculer(self, ia: StrategieIa, travail: Any) -> Any | None:
+        """ ia.calculer(travail), dans un processus du groupe pour un calcul lourd ; None pour un tir rapide. """
+        if ia.COUT != const.COUT_IA_LOURD:
+            return ia.calculer(travail)
+
+        futur = self._lancer(ia, travail)
+        if futur is None:
+            return None
+        try:
+            resultat = futur.result(timeout=self.delai)
+        except DelaiDepasse:
+            futur.cancel()  # Sans effet si le calcul a déjà commencé
+            self._noter_repli()
+            return None
+        except Exception as e:
+            self._noter_erreur(e)
+            return None
+        self._noter_calcul()
+        return resultat
+
+    def _lancer(self, ia: StrategieIa, travail: Any) -> Future | None:
+        """
+        Lance un calcul lourd : futur de son résultat (déjà calculé sans processus), None
+        s'il est plafonné (tir rapide).
+        """
+        # La place sous le plafond est réservée avec le test : rendue par _terminer
+        with self._verrou:
+            self.nb_lourds += 1
+            if self.en_cours >= self.plafond:
+                self.nb_plafonnes += 1
+                return None
+            if 0 < self.nb_processus <= self.en_cours:
+                self.nb_soumis_sature += 1
+            self._compter_calcul()
+
+        if self.nb_processus > 0:
+            try:
+                return self._soumettre(ia, travail)
+            except Exception as e:
+                futur = Future()
+                futur.set_exception(e)
+                return futur
+
+        futur = Future()
+        try:
+            futur.set_result(ia.calculer(travail))
+        except Exception as e:
+            futur.set_exception(e)
+        finally:
+            self._terminer(None)
+        return futur
+
+    def _noter_tir(self, latence: float) -> None:
+        with self._verrou:
+            self.nb_tirs += 1
+            self._latences.append(latence)
+            if latence > self.latence_max:
+                self.latence_max = latence
+
+    def _noter_calcul(self) -> None:
+        with self._verrou:
+            self.nb_calcules += 1
+
+    def _noter_repli(self) -> None:
+        with self._verrou:
+            self.nb_replis += 1
+
+    def _noter_erreur(self, e: Exception) -> None:
+        """ Processus arrêté brutalement, état impossible à transmettre... : le tir est un tir rapide. """
+        logging.exception(f"[CalculateurIa] Calcul du tir impossible: {e}")
+        with self._verrou:
+            self.nb_erreurs += 1
+            self.nb_replis += 1
+            if isinstance(e, BrokenProcessPool) and self._executeur is not None:
+                self._executeur.shutdown(wait=False, cancel_futures=True)
+                self._executeur = None  # Un nouveau groupe est démarré au tir suivant
+
+    def _soumettre(self, ia: StrategieIa, travail: Any) -> Future:
+        """ Soumet un calcul dont la place est réservée : rendue à sa fin, ou ici s'il n'a pas pu être soumis. """
+        try:
+            futur = self._obtenir_executeur().submit(ia.calculer, travail)
+        except Exception:
+            self._terminer(None)
+            raise
+        futur.add_done_callback(self._terminer)
+        return futur
+
+    def _compter_calcul(self) -> None:
+        """ Un calcul lourd commence (verrou tenu). """
+        self.en_cours += 1
+        if self.en_cours > self.en_cours_max:
+            self.en_cours_max = self.en_cours
+
+    def _terminer(self, _futur: Future | None) -> None:
+        """ Un calcul soumis est terminé (ou annulé, ou n'a pas pu être soumis). """
+        with self._verrou:
+            self.en_cours -= 1
+
+    def _obtenir_executeur(self) -> ProcessPoolExecutor:
+        with self._verrou:
+            if self._executeur is None:
+                self._executeur = ProcessPoolExecutor(
+                    max_workers=self.nb_processus,
+                    mp_context=multiprocessing.get_context(const.DEMARRAGE_PROCESSUS_IA),
+                    initializer=_surveiller_serveur)
+            return self._executeur
+
+    def statistiques(self) -> dict[str, Any]:
+        """
+        Instrumentation des tirs de l'IA : tirs choisis, dont tirs lourds (calculés à temps,
+        joués en repli après le délai ou une erreur, plafonnés sous charge), latence d'un
+        tir (en secondes, sur les TAILLE_ECHANTILLON_LATENCES derniers) et saturation du
+        groupe (calculs en cours, maximum, et part des calculs soumis alors que tous les
+        processus étaient occupés).
+        """
+        with self._verrou:
+            latences = sorted(self._latences)
+            stats = {
+                "tirs": self.nb_tirs,
+                "lourds": self.nb_lourds,
+                "calcules": self.nb_calcules,
+                "replis": self.nb_replis,
+                "plafonnes": self.nb_plafonnes,
+                "erreurs": self.nb_erreurs,
+                "en_cours": self.en_cours,
+                "en_cours_max": self.en_cours_max,
+                "soumis_sature": self.nb_soumis_sature,
+                "latence_max": self.latence_max,
+            }
+        lourds = stats["lourds"]
+        soumis = lourds - stats["plafonnes"]
+
+        def centile(p: float) -> float:
+            return latences[min(len(latences) - 1, int(p * len(latences)))] if latences else 0.0
+
+        stats.update({
+            "taux_repli": stats["replis"] / lourds if lourds else 0.0,
+            "taux_plafonne": stats["plafonnes"] / lourds if lourds else 0.0,
+            "taux_saturation": stats["soumis_sature"] / soumis if soumis and self.nb_processus > 0 else 0.0,
+            "latence_moyenne": sum(latences) / len(latences) if latences else 0.0,
+            "latence_p50": centile(0.50),
+            "latence_p95": centile(0.95),
+            "latence_p99": centile(0.99),
+        })
+        return stats
+
+
+def _prechauffer() -> None:
+    """ Démarre un processus du groupe, et y importe les stratégies (et NumPy). """
+    StrategieIa.classes()
+
+
+def _surveiller_serveur() -> None:
+    """
+    Initialisation d'un processus du groupe : il s'arrête avec le serveur, même tué
+    brutalement (sans cela, il attendrait indéfiniment des calculs). CTRL+C est laissé
+    au serveur, qui arrête le groupe (CalculateurIa.fermer).
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    serveur = multiprocessing.parent_process()
+    if serveur is None:
+        return
+
+    def attendre_arret() -> None:
+        serveur.join()
+        os._exit(0)
+
+    threading.Thread(target=attendre_arret, name="SurveillanceServeur", daemon=True).start()
@@ -1,23 +1,45 @@
+import contextlib
+import logging
 import threading
 import uuid  # Pour générer un ID unique par partie
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from commun import constantes as const
 from commun.coeur_jeu.joueur import Joueur
 from commun.coeur_jeu.partie import Partie
+from .acteur_partie import ActeurPartie
+from .calculateur_ia import CalculateurIa
 
 
 class GestionnairePartie:
     """
-    Centralise le matchmaking PvP, la gestion des sessions de jeu actives, 
+    Centralise le matchmaking PvP, la gestion des sessions de jeu actives,
     et le relais des commandes entre joueurs.
+
+    Chaque partie PvP est confiée à un ActeurPartie : les méthodes publiques
+    (placement, tir, chat, départ d'un joueur) déposent l'opération dans la boîte
+    de l'acteur et rendent la main aussitôt. Les méthodes _appliquer_* sont
+    exécutées par l'acteur, une à la fois pour une partie donnée.
+    lock_attente ne protège que le matchmaking et l'enregistrement des parties.
     """
-    
+
     def __init__(self):
         from serveur.reseau.gestionnaire_client import GestionnaireClient
-        
+
         # {ID_PARTIE: Partie}
         self.parties_actives: dict[str, Partie] = {}
 
+        # {ID_PARTIE: ActeurPartie}
+        self.acteurs: dict[str, ActeurPartie] = {}
+
+        # Threads partagés par les acteurs de toutes les parties
+        self.executeur = ThreadPoolExecutor(max_workers=const.NB_TRAVAILLEURS_PARTIES,
+                                            thread_name_prefix="ActeurPartie")
+
+        # Processus partagés par les sessions Solo pour calculer les tirs de l'IA
+        self.calculateur_ia = CalculateurIa()
+
         # File d'attente pour le matchmaking [GestionnaireClient, ...]
         self.clients_en_attente: list[GestionnaireClient] = []
 
@@ -28,18 +50,17 @@ class GestionnairePartie:
         # {Nom_joueur: ID_PARTIE}
         self.client_partie_map: dict[str, str] = {}
 
-        # {game_id: {nom_joueur_1: bool, nom_joueur_2: bool}}
-        # Pour s'assurer que les deux joueurs aient bien placé leurs navires
-        self.etat_placement: dict[str, dict[str, bool]] = {}
-
     def mettre_en_attente(self, client: 'GestionnaireClient') -> None:
         """
         Ajoute un client à la file d'attente et tente de former un match.
         """
         with self.lock_attente:
-            if len(self.clients_en_attente) >= 1:
+            # Premier client en attente qui a choisi la même configuration de partie (grille, flotte)
+            rang = next((i for i, attente in enumerate(self.clients_en_attente)
+                         if attente.configuration == client.configuration), None)
+            if rang is not None:
                 # Adversaire trouvé !
-                adversaire = self.clients_en_attente.pop(0)
+                adversaire = self.clients_en_attente.pop(rang)
 
                 # S'assurer que le client n'est pas déjà dans la map (cas de figure peu probable, mais sécurisant).
                 if adversaire.nom_joueur in self.client_partie_map:
@@ -57,76 +78,135 @@ class GestionnairePartie:
 
     def demarrer_partie_pvp(self, client1: 'GestionnaireClient', client2: 'GestionnaireClient') -> None:
         """
-        Crée l'objet Partie, l'enregistre et notifie les deux clients.
+        Crée l'objet Partie et son acteur, les enregistre et notifie les deux clients.
         """
 
         # 1. Créer la partie
         # Les joueurs doivent être créés avec leur nom; les navires seront placés par le client
-        joueur1 = Joueur(client1.nom_joueur)
-        joueur2 = Joueur(client2.nom_joueur)
+        joueur1 = Joueur(client1.nom_joueur, configuration=client1.configuration)
+        joueur2 = Joueur(client2.nom_joueur, configuration=client2.configuration)
 
         nouvelle_partie = Partie(joueur1, joueur2)
         game_id = str(uuid.uuid4())
-
-        self.etat_placement[game_id] = {
-            client1.nom_joueur: False,
-            client2.nom_joueur: False,
-        }
+        acteur = ActeurPartie(game_id, nouvelle_partie, self.executeur)
 
         # 2. Enregistrer la partie et la map
         self.parties_actives[game_id] = nouvelle_partie
+        self.acteurs[game_id] = acteur
         self.client_partie_map[client1.nom_joueur] = game_id
         self.client_partie_map[client2.nom_joueur] = game_id
 
-        # 3. Notifier les clients et leur assigner la partie
-        # C'est ici que les GestionnairesClient vont recevoir leur objet Partie
-        # Les clients sont retirés de la file d'attente (fait dans mettre_en_attente)
-
-        # NOTE : Cette partie doit être gérée dans GestionnaireClient pour éviter
-        # une dépendance bidirectionnelle trop forte. On passe l'information.
-
-        # Les deux clients doivent maintenant passer à la phase de PLACEMENT
-
         # Mise à jour des clients avec les infos de la partie
         client1.partie_en_cours = nouvelle_partie
         client1.joueur_local = joueur1  # Le client gère Joueur1
         client2.partie_en_cours = nouvelle_partie
         client2.joueur_local = joueur2  # Le client gère Joueur2
 
-        # Envoyer les messages d'adversaire trouvé et de début de partie
-        client1.notifier_match_trouve(client2.nom_joueur)
-        client2.notifier_match_trouve(client1.nom_joueur)
+        # 3. Envoyer les messages d'adversaire trouvé (les deux clients passent à la phase de PLACEMENT)
+        acteur.deposer(self._appliquer_match_trouve, client1, client2)
 
         print(f"[GestionnairePartie] Partie {game_id} lancée: {client1.nom_joueur} vs {client2.nom_joueur}. En attente de placement.")
 
         # Après le placement (géré par les clients), la partie sera formellement démarrée
         # et le premier tour sera notifié.
 
-    def notifier_client_pret(self, client_pret: 'GestionnaireClient', client_actif_map: dict) -> None:
+    # --- Commandes des clients (déposées dans l'acteur de leur partie) ---
+
+    def placer_navires(self, client: 'GestionnaireClient', positions: list[dict[str, Any]],
+                       clients_actifs_map: dict) -> None:
         """
-        Marque un client comme prêt (navires placés) et vérifie si l'adversaire l'est aussi.
-        Si les deux sont prêts, lance la partie et le premier tour.
+        Place les navires d'un joueur PvP, puis le marque prêt (voir notifier_client_pret).
         """
-        game_id = self.client_partie_map.get(client_pret.nom_joueur)
+        acteur = self._acteur_de(client.nom_joueur)
+        if acteur is None:
+            client.notifier_erreur("Partie non trouvée ou inactive.")
+            return
+        acteur.deposer(self._appliquer_placement, acteur, client, positions, clients_actifs_map)
 
-        if not game_id or not (partie := self.parties_actives.get(game_id)):
-            client_pret.notifier_erreur("Partie non trouvée ou inactive.")
+    def traiter_tir(self, tireur_client: 'GestionnaireClient', clients_actifs_map: dict, x: int, y: int) -> None:
+        """
+        Relais un tir du client vers l'acteur de sa partie.
+        """
+        acteur = self._acteur_de(tireur_client.nom_joueur)
+        if acteur is None:
+            tireur_client.notifier_erreur("Partie non trouvée.")
             return
+        acteur.deposer(self._appliquer_tir, acteur, tireur_client, clients_actifs_map, x, y)
 
-        # 1. Marquer le joueur actuel comme prêt
-        with self.lock_attente:  # Verrouiller si la map est partagée/modifiée
-            self.etat_placement[game_id][client_pret.nom_joueur] = True
+    def transmettre_chat(self, envoyeur_client: 'GestionnaireClient', message: str, clients_actifs_map: dict) -> None:
+        """
+        Relais un message de chat à l'adversaire.
+        (Nécessite la map des clients actifs.)
+        """
+        acteur = self._acteur_de(envoyeur_client.nom_joueur)
+        if acteur is not None:
+            acteur.deposer(self._appliquer_chat, acteur, envoyeur_client, message, clients_actifs_map)
+
+    def quitter_partie(self, client: 'GestionnaireClient', type_message: str, clients_actifs_map: dict) -> None:
+        """
+        Départ d'un joueur (MSG_DECONNEXION, MSG_ABANDON ou MSG_SAUVEGARDER_PARTIE) :
+        il est retiré de la file d'attente et, s'il joue, de sa partie.
+        Peut être appelée plusieurs fois pour une même session.
+        """
+        with self.lock_attente:
+            if client in self.clients_en_attente:
+                self.clients_en_attente.remove(client)
+
+        acteur = self._acteur_de(client.nom_joueur)
+        if acteur is not None:
+            acteur.deposer(self._appliquer_depart, acteur, client, type_message, clients_actifs_map)
+
+    def _acteur_de(self, nom_joueur: str) -> ActeurPartie | None:
+        """ Acteur de la partie en cours du joueur (None s'il n'en a pas). """
+        game_id = self.client_partie_map.get(nom_joueur)
+        return self.acteurs.get(game_id) if game_id else None
+
+    # --- Opérations exécutées par l'acteur de la partie ---
+
+    @staticmethod
+    def _appliquer_match_trouve(client1: 'GestionnaireClient', client2: 'GestionnaireClient') -> None:
+        client1.notifier_match_trouve(client2.nom_joueur)
+        client2.notifier_match_trouve(client1.nom_joueur)
+
+    def _appliquer_placement(self, acteur: ActeurPartie, client: 'GestionnaireClient',
+                             positions: list[dict[str, Any]], clients_actifs_map: dict) -> None:
+        if acteur.terminee:
+            client.notifier_erreur("Partie non trouvée ou inactive.")
+            return
 
-            # 2. Vérifier l'état de l'adversaire
-            etat_partie = self.etat_placement[game_id]
+        try:
+            # Placement des navires du joueur (client)
+            if not client.joueur_local.placer_navires_depuis_positions(positions):
+                raise ValueError("collision ou navire hors de la grille")
+        except Exception as e:
+            # Si le placement échoue (coordonnées invalides, etc.)
+            logging.exception(f"[{client.nom_joueur}] Erreur de placement: {e}]")
+            client.notifier_erreur(f"Erreur de placement: {e}. Réessayez.")
+            return
+
+        client.notifier_placement_ok()
+        print(f"[{client.nom_joueur}] Placement PvP validé. En attente de l'adversaire...")
 
-            # Trouver le nom de l'adversaire dans le dictionnaire d'état
-            nom_adversaire = next(nom for nom in etat_partie if nom != client_pret.nom_joueur)
+        # Le client est prêt
+        self.notifier_client_pret(acteur, client, clients_actifs_map)
+
+    def notifier_client_pret(self, acteur: ActeurPartie, client_pret: 'GestionnaireClient',
+                             client_actif_map: dict) -> None:
+        """
+        Marque un client comme prêt (navires placés) et vérifie si l'adversaire l'est aussi.
+        Si les deux sont prêts, lance la partie et le premier tour.
+        (Exécutée par l'acteur de la partie.)
+        """
+        partie = acteur.partie
 
-            # L'état est-il prêt pour les DEUX joueurs ?
-            les_deux_sont_prets = all(etat_partie.values())
+        # 1. Marquer le joueur actuel comme prêt
+        acteur.etat_placement[client_pret.nom_joueur] = True
 
-        if les_deux_sont_prets:
+        # 2. Vérifier l'état de l'adversaire
+        nom_adversaire = acteur.nom_adversaire(client_pret.nom_joueur)
+
+        # L'état est-il prêt pour les DEUX joueurs ?
+        if all(acteur.etat_placement.values()):
             # --- Lancement de la Partie PvP ---
             print(f"[GestionnairePartie] Les deux joueurs sont prêts. Démarrage du jeu.")
 
@@ -137,18 +217,118 @@ class GestionnairePartie:
                 # 3. Démarrer la partie métier
                 partie.demarrer()
 
-                # 4. Notifier le début de partie aux deux clients
-                client_pret.notifier_debut_partie(adversaire_client.nom_joueur, const.MODE_VS_JOUEUR)
-                adversaire_client.notifier_debut_partie(client_pret.nom_joueur, const.MODE_VS_JOUEUR)
+                with GestionnairePartie.regrouper_envois(client_pret, adversaire_client):
+                    # 4. Notifier le début de partie aux deux clients
+                    client_pret.notifier_debut_partie(adversaire_client.nom_joueur, const.MODE_VS_JOUEUR)
+                    adversaire_client.notifier_debut_partie(client_pret.nom_joueur, const.MODE_VS_JOUEUR)
 
-                # 5. Lancer le premier tour
-                GestionnairePartie.lancer_tour(partie, client_pret, adversaire_client)
+                    # 5. Lancer le premier tour
+                    GestionnairePartie.lancer_tour(partie, client_pret, adversaire_client)
 
             else:
                 # Nettoyage si l'adversaire est parti
-                self.retirer_partie(client_pret.nom_joueur)  # Cela retire aussi la partie et l'autre joueur
+                acteur.terminee = True
+                self._retirer_acteur(acteur)  # Cela retire aussi la partie et l'autre joueur
                 client_pret.notifier_erreur("Adversaire déconnecté après placement. Fin de partie.")
 
+    def _appliquer_tir(self, acteur: ActeurPartie, tireur_client: 'GestionnaireClient', clients_actifs_map: dict,
+                       x: int, y: int) -> tuple[str, str | None, bool] | None:
+        """
+        Traite un tir du client sur la partie de l'acteur.
+        """
+        partie = acteur.partie
+        if acteur.terminee:
+            return const.MSG_ERREUR, "Partie non trouvée", False
+
+        # 1. Vérification du tour (logique dans Partie.traiter_tir)
+        if (partie.est_tour_joueur1 and tireur_client.nom_joueur == partie.joueur1.nom) or \
+                (not partie.est_tour_joueur1 and tireur_client.nom_joueur == partie.joueur2.nom):
+
+            # 2. Traitement du tir par la couche métier
+            resultat, navire_coule, partie_terminee = partie.traiter_tir(x, y)
+            if resultat == const.MSG_ERREUR:
+                # Tir refusé (hors de la grille) : le tireur garde la main
+                with GestionnairePartie.regrouper_envois(tireur_client):
+                    tireur_client.notifier_erreur(navire_coule)
+                    tireur_client.notifier_tour(True)
+                return resultat, navire_coule, partie_terminee
+
+            # 3. Trouver le GestionnaireClient de l'adversaire
+            nom_adversaire = acteur.nom_adversaire(tireur_client.nom_joueur)
+            adversaire_client = GestionnairePartie.trouver_gestionnaire_client(nom_adversaire, clients_actifs_map)
+            print(f"[GESTIONNAIRE PARTIE]: adversaire = {adversaire_client.nom_joueur if adversaire_client else None}")
+            # 4. Déléguer l'envoi de la notification au GestionnaireClient tireur et à son adversaire
+            # (tous les messages de ce tir partent en une seule écriture par client)
+            with GestionnairePartie.regrouper_envois(tireur_client, adversaire_client):
+
+                # Le tireur reçoit le résultat
+                tireur_client.notifier_resultat_tir(x, y, resultat, navire_coule)
+
+                # L'adversaire est notifié du coup
+                if adversaire_client:
+                    adversaire_client.notifier_tir_recu(x, y, resultat, tireur_client.nom_joueur, navire_coule)
+
+                    # Gérer le changement de tour
+                    if not partie_terminee:
+                        if resultat != const.TIR_DEJA_TIRE:
+                            try:
+                                tireur_client.notifier_tour(False)  # Tour de l'adversaire
+                                adversaire_client.notifier_tour(True)  # C'est mon tour
+                            except Exception as e:
+                                print(f"[ERREUR CRITIQUE (GestionnairePartie)] lors de la bascule de tour : {e}")
+                    else:
+                        client_vainqueur = tireur_client
+                        client_perdant = adversaire_client
+
+                        self.terminer_partie_pvp(client_vainqueur, client_perdant, partie)
+                        return None
+
+            return resultat, navire_coule, partie_terminee
+        else:
+            return const.MSG_ERREUR, "Ce n'est pas votre tour", False
+
+    def _appliquer_chat(self, acteur: ActeurPartie, envoyeur_client: 'GestionnaireClient', message: str,
+                        clients_actifs_map: dict) -> None:
+        # 1. Trouver l'adversaire
+        nom_adversaire = acteur.nom_adversaire(envoyeur_client.nom_joueur)
+        adversaire_client = self.trouver_gestionnaire_client(nom_adversaire, clients_actifs_map)
+
+        if adversaire_client:
+            # 2. Le GestionnaireClient adverse envoie le message
+            adversaire_client.envoyer_chat(envoyeur_client.nom_joueur, message)
+
+    def _appliquer_depart(self, acteur: ActeurPartie, client: 'GestionnaireClient', type_message: str,
+                          clients_actifs_map: dict) -> None:
+        nom_joueur = client.nom_joueur
+        if nom_joueur in acteur.joueurs_partis:
+            return
+
+        if not acteur.terminee:
+            if type_message == const.MSG_SAUVEGARDER_PARTIE:
+                # Le joueur local est j1 ou j2 dans la partie en cours.
+                client.gestionnaire_utilisateurs.sauvegarder_partie(nom_joueur, acteur.partie)
+                print(f"[{nom_joueur}] Partie sauvegardée avec succès.")
+
+            elif type_message == const.MSG_ABANDON:
+                acteur.partie.abandonner(nom_joueur)
+                client.gestionnaire_utilisateurs.supprimer_partie_sauvegardee(nom_joueur)
+                acteur.terminee = True
+
+                # L'adversaire gagne par abandon
+                adversaire_client = self.trouver_gestionnaire_client(acteur.nom_adversaire(nom_joueur),
+                                                                     clients_actifs_map)
+                if adversaire_client:
+                    adversaire_client.notifier_fin_partie("VICTOIRE", f" {nom_joueur} a abandonné la partie.")
+
+        acteur.joueurs_partis.add(nom_joueur)
+
+        if acteur.terminee or len(acteur.joueurs_partis) == len(acteur.etat_placement):
+            self._retirer_acteur(acteur)
+        else:
+            with self.lock_attente:
+                if self.client_partie_map.get(nom_joueur) == acteur.game_id:
+                    del self.client_partie_map[nom_joueur]
+
     @staticmethod
     def lancer_tour(partie: Partie, client1: 'GestionnaireClient', client2: 'GestionnaireClient'):
         """ Détermine qui commence (J1 ou J2) et envoie le message de tour aux clients. """
@@ -164,6 +344,19 @@ class GestionnairePartie:
             client_joueur1.notifier_tour(False)
             client_joueur2.notifier_tour(True)
 
+    @staticmethod
+    @contextlib.contextmanager
+    def regrouper_envois(*clients: 'GestionnaireClient|None'):
+        """
+        Regroupe les messages envoyés à chacun des clients pendant le bloc `with` :
+        chaque client reçoit tous ses messages de l'événement en une seule écriture.
+        """
+        with contextlib.ExitStack() as pile:
+            for client in clients:
+                if client:
+                    pile.enter_context(client.regrouper_envois())
+            yield
+
     @staticmethod
     def trouver_gestionnaire_client(nom_joueur: str, clients_actifs_map: dict) -> 'GestionnaireClient|None':
         """
@@ -177,68 +370,12 @@ class GestionnairePartie:
         Trouve le GestionnaireClient adversaire dans une partie active.
         (Nécessite la map fournie par l'EcouteurServeur pour trouver l'instance de l'adversaire.)
         """
-        game_id = self.client_partie_map.get(nom_joueur)
-        if not game_id:
+        acteur = self._acteur_de(nom_joueur)
+        if not acteur:
             return None
 
-        partie = self.parties_actives.get(game_id)
-        if not partie:
-            return None
-
-        # Déterminer le nom de l'adversaire
-        nom_adversaire = partie.joueur2.nom if partie.joueur1.nom == nom_joueur else partie.joueur1.nom
-
         # Utiliser la méthode mise à jour
-        return GestionnairePartie.trouver_gestionnaire_client(nom_adversaire, clients_actifs_map)
-
-    def traiter_tir(self, tireur_client: 'GestionnaireClient', clients_actifs_map: dict, x: int, y: int) -> tuple[str, str | None, bool]|None:
-        """
-        Relais et traite un tir du client sur la partie active.
-        """
-        game_id = self.client_partie_map.get(tireur_client.nom_joueur)
-        if not game_id:
-            return const.MSG_ERREUR, "Partie non trouvée", False
-
-        partie = self.parties_actives[game_id]
-
-        # 1. Vérification du tour (logique dans Partie.traiter_tir)
-        if (partie.est_tour_joueur1 and tireur_client.nom_joueur == partie.joueur1.nom) or \
-                (not partie.est_tour_joueur1 and tireur_client.nom_joueur == partie.joueur2.nom):
-
-            # 2. Traitement du tir par la couche métier
-            resultat, navire_coule, partie_terminee = partie.traiter_tir(x, y)
-
-            # 3. Trouver le GestionnaireClient de l'adversaire
-            nom_adversaire = partie.joueur2.nom if tireur_client.nom_joueur == partie.joueur1.nom else partie.joueur1.nom
-            adversaire_client = GestionnairePartie.trouver_gestionnaire_client(nom_adversaire, clients_actifs_map)
-            print(f"[GESTIONNAIRE PARTIE]: adversaire = {adversaire_client.nom_joueur}")
-            # 4. Déléguer l'envoi de la notification au GestionnaireClient tireur et à son adversaire
-
-            # Le tireur reçoit le résultat
-            tireur_client.notifier_resultat_tir(x, y, resultat, navire_coule)
-
-            # L'adversaire est notifié du coup
-            if adversaire_client:
-                adversaire_client.notifier_tir_recu(x, y, resultat, tireur_client.nom_joueur, navire_coule)
-
-                # Gérer le changement de tour
-                if not partie_terminee:
-                    if resultat != const.TIR_DEJA_TIRE:
-                        try:
-                            tireur_client.notifier_tour(False)  # Tour de l'adversaire
-                            adversaire_client.notifier_tour(True)  # C'est mon tour
-                        except Exception as e:
-                            print(f"[ERREUR CRITIQUE (GestionnairePartie)] lors de la bascule de tour : {e}")
-                else:
-                    client_vainqueur = tireur_client
-                    client_perdant = adversaire_client
-
-                    self.terminer_partie_pvp(client_vainqueur, client_perdant, partie)
-                    return None
-
-            return resultat, navire_coule, partie_terminee
-        else:
-            return const.MSG_ERREUR, "Ce n'est pas votre tour", False
+        return GestionnairePartie.trouver_gestionnaire_client(acteur.nom_adversaire(nom_joueur), clients_actifs_map)
 
     def terminer_partie_pvp(self, vainqueur: 'GestionnaireClient', perdant: 'GestionnaireClient', partie: Partie) -> None:
         """
@@ -257,30 +394,23 @@ class GestionnairePartie:
         # Ceci retire la partie de parties_actives et client_partie_map pour les deux joueurs.
         self.retirer_partie(vainqueur.nom_joueur)
 
-    def transmettre_chat(self, envoyeur_client: 'GestionnaireClient', message: str, clients_actifs_map: dict) -> None:
-        """
-        Relais un message de chat à l'adversaire.
-        (Nécessite la map des clients actifs.)
-        """
-        # 1. Trouver l'adversaire
-        adversaire_client = self.trouver_adversaire(envoyeur_client.nom_joueur, clients_actifs_map)
-
-        if adversaire_client:
-            # 2. Le GestionnaireClient adverse envoie le message directement sur son socket
-            adversaire_client.envoyer_chat(envoyeur_client.nom_joueur, message)
-
     def retirer_partie(self, nom_joueur: str) -> None:
         """
         Retire la partie de la structure après une fin (victoire/abandon).
         """
-        game_id = self.client_partie_map.pop(nom_joueur, None)
-        if game_id:
-            # On vérifie si l'autre joueur est encore dans la map pour éviter la double suppression
-            for joueur_nom, _id in list(self.client_partie_map.items()):
-                if _id == game_id:
-                    del self.client_partie_map[joueur_nom]
-                    break
-
-            if game_id in self.parties_actives:
-                del self.parties_actives[game_id]
-                print(f"[PARTIE] Partie {game_id} retirée.")
\ No newline at end of file
+        acteur = self._acteur_de(nom_joueur)
+        if acteur:
+            acteur.terminee = True
+            self._retirer_acteur(acteur)
+
+    def _retirer_acteur(self, acteur: ActeurPartie) -> None:
+        """ Retire la partie de l'acteur, et les entrées de ses joueurs dans client_partie_map. """
+        with self.lock_attente:
+            # Un joueur peut déjà avoir été associé à une nouvelle partie
+            for nom_joueur in acteur.etat_placement:
+                if self.client_partie_map.get(nom_joueur) == acteur.game_id:
+                    del self.client_partie_map[nom_joueur]
+
+            self.acteurs.pop(acteur.game_id, None)
+            if self.parties_actives.pop(acteur.game_id, None) is not None:
+                print(f"[PARTIE] Partie {acteur.game_id} retirée.")
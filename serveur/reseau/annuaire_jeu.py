@@ -0,0 +1,133 @@
+import itertools
+import socket
+import threading
+from typing import Callable, NamedTuple
+
+from commun import constantes as const
+
+
+class PointAccesJeu(NamedTuple):
+    """ Serveur de jeu annoncé aux clients authentifiés. """
+    hote: str | None  # None : cette machine
+    port: int
+    charge: Callable[[], int] | None = None  # Nombre de connexions ouvertes, si connu
+
+
+class AnnuaireJeu(threading.Thread):
+    """
+    Annuaire des serveurs de jeu vers lesquels l'authentification UDP redirige les clients.
+
+    Les adresses sont résolues une fois à la construction, puis rafraîchies par ce
+    thread toutes les DELAI_RAFRAICHISSEMENT_ANNUAIRE secondes : choisir() ne fait
+    jamais d'appel au résolveur. La charge des serveurs qui la fournissent est relevée
+    toutes les DELAI_MESURE_CHARGE secondes ; entre deux relevés, chaque client
+    annoncé compte pour une connexion de plus.
+
+    La politique de répartition est le nom d'une politique de POLITIQUES
+    (REPARTITION_TOURNIQUET, REPARTITION_MOINS_CHARGE), ou une fonction
+    (annuaire, indices candidats) -> indice choisi.
+    """
+
+    def __init__(self, points: list[PointAccesJeu], politique: str | Callable = const.POLITIQUE_REPARTITION_JEU):
+        super().__init__(name="AnnuaireJeu")
+        self.daemon = True
+        if not points:
+            raise ValueError("Aucun serveur de jeu à annoncer.")
+        if isinstance(politique, str):
+            if politique not in AnnuaireJeu.POLITIQUES:
+                raise ValueError(f"Politique de répartition inconnue: {politique}")
+            politique = AnnuaireJeu.POLITIQUES[politique]
+        self.points = points
+        self.politique = politique
+
+        # Adresse résolue de chaque point (None tant qu'aucune résolution n'a réussi)
+        self.adresses: list[str | None] = [None] * len(points)
+        # Charge relevée + clients annoncés depuis le relevé
+        self.charges: list[int | None] = [None] * len(points)
+        self._verrou = threading.Lock()
+        self._compteur = itertools.count()
+        self._arret = threading.Event()
+
+        self.rafraichir_adresses()
+        self.mesurer_charges()
+
+    # --- Choix du serveur (chemin critique de l'authentification) ---
+
+    def choisir(self) -> tuple[str, int] | None:
+        """ Retourne l'adresse (IP, port) du serveur de jeu à annoncer, ou None si aucun n'est joignable. """
+        candidats = [i for i, adresse in enumerate(self.adresses) if adresse is not None]
+        if not candidats:
+            return None
+
+        with self._verrou:
+            i = self.politique(self, candidats)
+            if self.charges[i] is not None:
+                self.charges[i] += 1
+        return self.adresses[i], self.points[i].port
+
+    def _tourniquet(self, candidats: list[int]) -> int:
+        return candidats[next(self._compteur) % len(candidats)]
+
+    def _moins_charge(self, candidats: list[int]) -> int:
+        """ Le moins chargé parmi les serveurs de charge connue (tourniquet entre ex aequo, ou si aucune n'est connue). """
+        connus = [i for i in candidats if self.charges[i] is not None]
+        if not connus:
+            return self._tourniquet(candidats)
+        charge_min = min(self.charges[i] for i in connus)
+        return self._tourniquet([i for i in connus if self.charges[i] == charge_min])
+
+    POLITIQUES = {
+        const.REPARTITION_TOURNIQUET: _tourniquet,
+        const.REPARTITION_MOINS_CHARGE: _moins_charge,
+    }
+
+    # --- Rafraîchissement en arrière-plan ---
+
+    def run(self):
+        """ Relève les charges et rafraîchit périodiquement les adresses, jusqu'à stop(). """
+        prochaine_resolution = const.DELAI_RAFRAICHISSEMENT_ANNUAIRE
+        while not self._arret.wait(const.DELAI_MESURE_CHARGE):
+            self.mesurer_charges()
+            prochaine_resolution -= const.DELAI_MESURE_CHARGE
+            if prochaine_resolution <= 0:
+                self.rafraichir_adresses()
+                prochaine_resolution = const.DELAI_RAFRAICHISSEMENT_ANNUAIRE
+
+    def rafraichir_adresses(self) -> None:
+        """ Résout à nouveau chaque point d'accès ; en cas d'échec, l'adresse précédente est conservée. """
+        for i, point in enumerate(self.points):
+            try:
+                self.adresses[i] = AnnuaireJeu._ip_locale() if point.hote is None \
+                    else socket.getaddrinfo(point.hote, point.port, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+            except OSError as e:
+                print(f"Annuaire Jeu: Échec de la résolution de {point.hote}:{point.port}: {e}")
+
+    def mesurer_charges(self) -> None:
+        """ Relève le nombre de connexions des serveurs de jeu qui le fournissent. """
+        for i, point in enumerate(self.points):
+            if point.charge is None:
+                continue
+            try:
+                charge = point.charge()
+            except Exception as e:
+                print(f"Annuaire Jeu: Échec de la mesure de charge de {point.hote}:{point.port}: {e}")
+                continue
+            with self._verrou:
+                self.charges[i] = charge
+
+    @staticmethod
+    def _ip_locale() -> str:
+        """
+        IP de cette machine sur l'interface de sortie par défaut. Le socket UDP n'envoie
+        rien : connect() ne fait que choisir la route (gethostbyname(gethostname())
+        renvoie souvent 127.0.1.1, injoignable pour les autres machines).
+        """
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            try:
+                s.connect(("192.0.2.1", 9))  # Adresse de documentation (RFC 5737), jamais contactée
+                return s.getsockname()[0]
+            except OSError:
+                return socket.gethostbyname(socket.gethostname())
+
+    def stop(self) -> None:
+        self._arret.set()
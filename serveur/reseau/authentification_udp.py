@@ -1,24 +1,49 @@
+import collections
+import queue
 import socket
 import threading
+import time
+from typing import Any
 
 from commun import constantes as const
-from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from serveur.donnees.gestionnaire_utilisateur_base import GestionnaireUtilisateurBase
+from .annuaire_jeu import AnnuaireJeu, PointAccesJeu
 
 
 class AuthentificationUDP(threading.Thread):
     """
     Gère l'écoute UDP pour les requêtes d'authentification (login et inscription).
+
+    Le thread d'écoute ne fait que recevoir : chaque datagramme est placé dans une
+    file bornée (TAILLE_FILE_AUTH), vidée par NB_TRAVAILLEURS_AUTH threads
+    travailleurs. Quand la file est pleine, le datagramme est refusé par une réponse
+    MSG_AUTH_OCCUPE (le client réessaie plus tard) au lieu de créer un thread de plus.
     """
 
-    def __init__(self, gestionnaire_utilisateurs: GestionnaireUtilisateur, host: str = const.SERVEUR,
-                 port: int = const.PORT_AUTH):
+    def __init__(self, gestionnaire_utilisateurs: GestionnaireUtilisateurBase, host: str = const.SERVEUR,
+                 port: int = const.PORT_AUTH, annuaire: AnnuaireJeu | None = None):
         super().__init__()
         self.host = host if host != const.SERVEUR else '0.0.0.0'  # Écoute sur toutes les interfaces
         self.port = port
         self.gestionnaire_utilisateurs = gestionnaire_utilisateurs
+        # Serveurs de jeu annoncés aux clients authentifiés (par défaut : cette machine, PORT_JEU)
+        self.annuaire = annuaire if annuaire is not None else AnnuaireJeu([PointAccesJeu(None, const.PORT_JEU)])
         self.socket_udp: socket.socket|None = None
         self.actif = True
 
+        # Requêtes en attente : (données, adresse, instant de réception) ; None arrête un travailleur
+        self.file_requetes: queue.Queue[tuple[bytes, tuple[str, int], float] | None] = \
+            queue.Queue(maxsize=const.TAILLE_FILE_AUTH)
+        self.travailleurs: list[threading.Thread] = []
+
+        # Statistiques (voir statistiques())
+        self._verrou_stats = threading.Lock()
+        self.nb_requetes_traitees = 0
+        self.nb_rejets = 0
+        self.profondeur_max = 0
+        self.latence_max = 0.0
+        self._latences: collections.deque[float] = collections.deque(maxlen=const.TAILLE_ECHANTILLON_LATENCES)
+
     def run(self):
         """ Boucle principale du thread d'écoute UDP. """
         try:
@@ -27,15 +52,21 @@ class AuthentificationUDP(threading.Thread):
             self.socket_udp.bind((self.host, self.port))
             print(f"UDP Auth: Écoute sur {self.host}:{self.port}")
 
+            for i in range(const.NB_TRAVAILLEURS_AUTH):
+                travailleur = threading.Thread(target=self._boucle_travailleur, name=f"AuthUDP-{i}")
+                travailleur.daemon = True  # S'arrête automatiquement avec le thread principal
+                travailleur.start()
+                self.travailleurs.append(travailleur)
+
             while self.actif:
                 try:
                     # Taille du buffer pour recevoir les données
                     data, adresse_client = self.socket_udp.recvfrom(1024)
+                    if not self.actif:
+                        break
 
-                    # Traiter la requête dans un thread pour ne pas bloquer la boucle
-                    t = threading.Thread(target=self._traiter_requete, args=(data, adresse_client))
-                    t.daemon = True # S'arrête automatiquement avec le thread principal
-                    t.start()
+                    # La requête est traitée par un travailleur pour ne pas bloquer la boucle
+                    self._soumettre(data, adresse_client)
 
                 except socket.timeout as time_out:
                     print(f"UDP Auth Time out : {time_out}")
@@ -47,10 +78,72 @@ class AuthentificationUDP(threading.Thread):
         except Exception as e:
             print(f"UDP Auth Échec de la liaison du socket: {e}")
         finally:
+            self._arreter_travailleurs()
             if self.socket_udp:
                 self.socket_udp.close()
             print("UDP Auth: Arrêté.")
 
+    def _soumettre(self, data: bytes, adresse_client: tuple[str, int]) -> None:
+        """ Place la requête dans la file des travailleurs, ou la refuse si la file est pleine. """
+        try:
+            self.file_requetes.put_nowait((data, adresse_client, time.perf_counter()))
+        except queue.Full:
+            self.nb_rejets += 1
+            self._repondre_occupe(adresse_client)
+            return
+
+        profondeur = self.file_requetes.qsize()
+        if profondeur > self.profondeur_max:
+            self.profondeur_max = profondeur
+
+    def _boucle_travailleur(self) -> None:
+        """ Thread travailleur : traite les requêtes de la file une par une. """
+        while (requete := self.file_requetes.get()) is not None:
+            data, adresse_client, instant_reception = requete
+            self._traiter_requete(data, adresse_client)
+
+            latence = time.perf_counter() - instant_reception
+            with self._verrou_stats:
+                self.nb_requetes_traitees += 1
+                self._latences.append(latence)
+                if latence > self.latence_max:
+                    self.latence_max = latence
+
+    def _arreter_travailleurs(self) -> None:
+        """ Abandonne les requêtes en attente et arrête les travailleurs. """
+        try:
+            while True:
+                self.file_requetes.get_nowait()
+        except queue.Empty:
+            pass
+        for _ in self.travailleurs:
+            self.file_requetes.put(None)
+
+    def statistiques(self) -> dict[str, Any]:
+        """
+        Instrumentation de la file d'authentification : profondeur actuelle et maximale,
+        requêtes traitées et refusées, latence (réception -> réponse, en secondes) sur
+        les TAILLE_ECHANTILLON_LATENCES dernières requêtes.
+        """
+        with self._verrou_stats:
+            latences = sorted(self._latences)
+            traitees = self.nb_requetes_traitees
+            latence_max = self.latence_max
+
+        def centile(p: float) -> float:
+            return latences[min(len(latences) - 1, int(p * len(latences)))] if latences else 0.0
+
+        return {
+            "profondeur": self.file_requetes.qsize(),
+            "profondeur_max": self.profondeur_max,
+            "requetes_traitees": traitees,
+            "rejets": self.nb_rejets,
+            "latence_moyenne": sum(latences) / len(latences) if latences else 0.0,
+            "latence_p50": centile(0.50),
+            "latence_p99": centile(0.99),
+            "latence_max": latence_max,
+        }
+
     def _traiter_requete(self, data: bytes, adresse_client: tuple[str, int]):
         """
         Analyse la donnée UDP et appelle la logique d'authentification.
@@ -91,15 +184,20 @@ class AuthentificationUDP(threading.Thread):
     def _repondre_auth(self, status: str, adresse_client: tuple[str, int], message: str, nom_joueur: str = ""):
         """
         Envoie la réponse d'authentification au client via UDP.
-        Le message de succès inclut l'adresse TCP pour la phase de jeu.
+        Le message de succès inclut l'adresse TCP du serveur de jeu choisi par l'annuaire.
         Format de réponse : STATUS|MESSAGE_TEXT|HOST_TCP|PORT_TCP
         """
+        point_acces = self.annuaire.choisir() if status == const.MSG_AUTH_SUCCESS else None
+        if status == const.MSG_AUTH_SUCCESS and point_acces is None:
+            status, message = const.MSG_AUTH_FAILED, "Aucun serveur de jeu disponible."
+
         reponse = [status, message]
 
         if status == const.MSG_AUTH_SUCCESS:
-            # Ajoute les informations de connexion TCP
-            reponse.append(socket.gethostbyname(socket.gethostname()))  # IP locale du serveur
-            reponse.append(str(const.PORT_JEU))
+            # Ajoute les informations de connexion TCP (serveur de jeu choisi par l'annuaire)
+            hote_jeu, port_jeu = point_acces
+            reponse.append(hote_jeu)
+            reponse.append(str(port_jeu))
 
             # Vérifie s'il existe une partie sauvegardée pour ce joueur
             if self.gestionnaire_utilisateurs.partie_existe(nom_joueur):
@@ -116,8 +214,25 @@ class AuthentificationUDP(threading.Thread):
         except Exception as e:
             print(f"UDP Auth Erreur d'envoi de réponse: {e}")
 
+    def _repondre_occupe(self, adresse_client: tuple[str, int]) -> None:
+        """
+        Refuse une requête faute de place dans la file.
+        Format de réponse : MSG_AUTH_OCCUPE|MESSAGE_TEXT|DELAI_REESSAI
+        """
+        reponse_str = const.SEPARATEUR.join([const.MSG_AUTH_OCCUPE, "Serveur occupé, réessayez plus tard.",
+                                             str(const.DELAI_REESSAI_AUTH)])
+        try:
+            self.socket_udp.sendto(reponse_str.encode(const.ENCODAGE), adresse_client)
+        except Exception as e:
+            print(f"UDP Auth Erreur d'envoi de réponse: {e}")
+
     def stop(self):
         """ Arrête la boucle du thread et ferme le socket. """
         self.actif = False
         if self.socket_udp:
+            try:
+                # Réveille recvfrom() : close() seul ne l'interrompt pas sous Linux
+                self.socket_udp.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass  # ENOTCONN (socket non connecté) : recvfrom() est tout de même réveillé
             self.socket_udp.close()
\ No newline at end of file
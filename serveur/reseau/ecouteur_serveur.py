@@ -4,7 +4,7 @@ import time
 
 from commun import constantes as const
 from .gestionnaire_client import GestionnaireClient
-from ..donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from ..donnees.gestionnaire_utilisateur_base import GestionnaireUtilisateurBase
 from ..logique_jeu.gestionnaire_partie import GestionnairePartie
 
 
@@ -15,7 +15,7 @@ class EcouteurServeur(threading.Thread):
     pour chaque nouvelle connexion.
     """
 
-    def __init__(self, gestionnaire_utilisateurs: GestionnaireUtilisateur, gestionnaire_partie: GestionnairePartie, host: str = const.SERVEUR, port: int = const.PORT_JEU):
+    def __init__(self, gestionnaire_utilisateurs: GestionnaireUtilisateurBase, gestionnaire_partie: GestionnairePartie, host: str = const.SERVEUR, port: int = const.PORT_JEU):
         super().__init__()
         # Écoute sur toutes les interfaces réseau
         self.host = host if host != const.SERVEUR else '0.0.0.0'
@@ -51,6 +51,9 @@ class EcouteurServeur(threading.Thread):
                     connexion_client, adresse_client = self.socket_tcp.accept()
                     print(f"TCP Écouteur Serveur: Nouvelle connexion de {adresse_client[0]}:{adresse_client[1]}")
 
+                    # Les envois sont déjà regroupés par événement de jeu : pas d'algorithme de Nagle
+                    connexion_client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
                     # 4. Créer et lancer le gestionnaire de ce client
                     # Lorsqu'on vient d'entrer ConnecteurClient.connecter_tcp()
                     # Toute cette partie est initialisée.
@@ -107,6 +110,23 @@ class EcouteurServeur(threading.Thread):
                 del self.clients_connectes_map[nom_joueur]
                 print(f"Écouteur Serveur: {nom_joueur} désenregistré de la map.")
 
+    def nombre_connexions(self) -> int:
+        """ Nombre de sessions TCP actuellement ouvertes. """
+        return sum(1 for c in self.clients_actifs if c.is_alive())
+
+    def statistiques_envoi(self) -> dict[str, float]:
+        """ Agrège l'instrumentation des files d'envoi de toutes les sessions ouvertes. """
+        stats = {"profondeur": 0, "profondeur_max": 0, "temps_bloque": 0.0,
+                 "messages_ignores": 0, "deconnexions_pour_lenteur": 0}
+        for client in list(self.clients_actifs):
+            s = client.statistiques_envoi()
+            stats["profondeur"] += s["profondeur"]
+            stats["profondeur_max"] = max(stats["profondeur_max"], s["profondeur_max"])
+            stats["temps_bloque"] += s["temps_bloque"]
+            stats["messages_ignores"] += s["messages_ignores"]
+            stats["deconnexions_pour_lenteur"] += s["deconnecte_pour_lenteur"]
+        return stats
+
     def _nettoyer_clients(self) -> None:
         """
         Supprime les threads GestionnaireClient qui ont terminé leur exécution.
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+
+from commun import constantes as const
+from .gestionnaire_client_asyncio import GestionnaireClientAsyncio
+from ..donnees.gestionnaire_utilisateur_base import GestionnaireUtilisateurBase
+from ..logique_jeu.gestionnaire_partie import GestionnairePartie
+
+
+class EcouteurServeurAsyncio(threading.Thread):
+    """
+    Variante asyncio de l'EcouteurServeur.
+
+    Un seul thread exécute une boucle d'événements qui accepte les connexions TCP et
+    lance une coroutine GestionnaireClientAsyncio par client. L'interface publique
+    (start, stop, join, callbacks de la map des clients) est identique à celle
+    d'EcouteurServeur afin que ServeurPrincipal puisse utiliser l'un ou l'autre.
+    """
+
+    def __init__(self, gestionnaire_utilisateurs: GestionnaireUtilisateurBase, gestionnaire_partie: GestionnairePartie, host: str = const.SERVEUR, port: int = const.PORT_JEU):
+        super().__init__()
+        # Écoute sur toutes les interfaces réseau
+        self.host = host if host != const.SERVEUR else '0.0.0.0'
+        self.port = port
+        self.gestionnaire_utilisateurs = gestionnaire_utilisateurs
+        self.gestionnaire_partie = gestionnaire_partie
+        self.clients_actifs: set[GestionnaireClientAsyncio] = set()
+        self.actif = True
+        self.clients_connectes_map: dict[str, GestionnaireClientAsyncio] = {}  # Map Nom -> Session Client
+        self.map_lock = threading.Lock()
+        self.boucle: asyncio.AbstractEventLoop | None = None
+        self._evenement_arret: asyncio.Event | None = None
+
+    def run(self):
+        """ Exécute la boucle d'événements jusqu'à l'appel de stop(). """
+        try:
+            asyncio.run(self._servir())
+        except Exception as e:
+            print(f"TCP Écouteur Serveur (asyncio) Échec de l'initialisation du serveur: {e}")
+        finally:
+            print("TCP Écouteur Serveur (asyncio): Arrêté.")
+
+    async def _servir(self) -> None:
+        """ Ouvre le socket d'écoute et attend le signal d'arrêt. """
+        self.boucle = asyncio.get_running_loop()
+        self._evenement_arret = asyncio.Event()
+
+        serveur = await asyncio.start_server(
+            self._accepter_client,
+            self.host,
+            self.port,
+            reuse_address=True,
+            backlog=const.NB_MAX_CONNEXIONS_ASYNCIO
+        )
+        print(f"TCP Écouteur Serveur (asyncio): Prêt. Attente de connexions sur {self.host}:{self.port}")
+
+        async with serveur:
+            if not self.actif:
+                return
+            await self._evenement_arret.wait()
+
+            # Arrêter tous les gestionnaires de clients, puis attendre leurs sauvegardes
+            clients = list(self.clients_actifs)
+            for client in clients:
+                client.stop()
+            for client in clients:
+                await client.terminer_ecritures()
+
+    async def _accepter_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ Callback appelée par asyncio pour chaque nouvelle connexion. """
+        gestionnaire = GestionnaireClientAsyncio(
+            reader,
+            writer,
+            self.gestionnaire_utilisateurs,
+            self.gestionnaire_partie
+        )
+        gestionnaire.set_callbacks(
+            self.enregistrer_client,
+            self.desenregistrer_client,
+            self.get_clients_map
+        )
+
+        self.clients_actifs.add(gestionnaire)
+        try:
+            await gestionnaire.executer()
+            await gestionnaire.terminer_ecritures()  # Reste suivi (arrêt du serveur) tant qu'il écrit
+        finally:
+            self.clients_actifs.discard(gestionnaire)
+
+    def get_clients_map(self) -> dict:
+        """ Retourne la map actuelle des sessions client actives. """
+        return self.clients_connectes_map
+
+    def enregistrer_client(self, nom_joueur: str, client_instance: GestionnaireClientAsyncio) -> None:
+        with self.map_lock:
+            self.clients_connectes_map[nom_joueur] = client_instance
+
+    def desenregistrer_client(self, nom_joueur: str) -> None:
+        with self.map_lock:
+            if nom_joueur in self.clients_connectes_map:
+                del self.clients_connectes_map[nom_joueur]
+
+    def nombre_connexions(self) -> int:
+        """ Nombre de sessions TCP actuellement ouvertes. """
+        return len(self.clients_actifs)
+
+    def statistiques_envoi(self) -> dict[str, float]:
+        """ Agrège l'instrumentation des files d'envoi de toutes les sessions ouvertes. """
+        stats = {"profondeur": 0, "profondeur_max": 0, "temps_bloque": 0.0,
+                 "messages_ignores": 0, "deconnexions_pour_lenteur": 0}
+        for client in list(self.clients_actifs):
+            s = client.statistiques_envoi()
+            stats["profondeur"] += s["profondeur"]
+            stats["profondeur_max"] = max(stats["profondeur_max"], s["profondeur_max"])
+            stats["temps_bloque"] += s["temps_bloque"]
+            stats["messages_ignores"] += s["messages_ignores"]
+            stats["deconnexions_pour_lenteur"] += s["deconnecte_pour_lenteur"]
+        return stats
+
+    def stop(self) -> None:
+        """
+        Arrête l'écouteur : ferme le socket d'écoute et toutes les sessions actives.
+        Peut être appelée depuis n'importe quel thread.
+        """
+        print("TCP Écouteur Serveur (asyncio): Arrêt demandé.")
+        self.actif = False
+
+        if self.boucle and self._evenement_arret and not self.boucle.is_closed():
+            try:
+                self.boucle.call_soon_threadsafe(self._evenement_arret.set)
+            except RuntimeError:
+                pass  # Boucle déjà fermée
+
+        # Attendre la fin du thread lui-même
+        if threading.get_ident() != self.ident and self.is_alive():
+            self.join()
@@ -0,0 +1,287 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+from commun import constantes as const
+from commun.coeur_jeu.partie import Partie
+from commun.reseau.message import Message
+from commun.reseau.protocole import Protocole
+from serveur.donnees.gestionnaire_utilisateur_base import GestionnaireUtilisateurBase
+from serveur.logique_jeu.gestionnaire_partie import GestionnairePartie
+from .session_client import SessionClient
+
+
+class GestionnaireClientAsyncio(SessionClient):
+    """
+    Gère la session TCP d'un client sous forme de coroutine (mode réseau asyncio).
+
+    Toutes les sessions partagent la même boucle d'événements : une connexion inactive
+    ou lente ne coûte qu'une coroutine suspendue au lieu d'un thread système.
+    Les envois passent par le tampon du StreamWriter et ne bloquent jamais la boucle ;
+    ce tampon joue le rôle de file d'envoi, bornée par TAILLE_MAX_TAMPON_ENVOI.
+    Les messages produits hors de la boucle (acteurs des parties PvP) y sont
+    renvoyés avant d'être écrits.
+
+    Rien n'attend sur la boucle : le tir de l'IA Solo est attendu par la coroutine
+    (CalculateurIa.choisir_tir_asyncio), les écritures sur disque (points de contrôle,
+    sauvegarde durable) sont faites dans l'ordre par le groupe de threads de la boucle
+    (voir _ecrire_en_arriere_plan), et les lectures de la partie sauvegardée aussi, la
+    coroutine attendant leur résultat (voir _lire_sauvegarde et _supprimer_sauvegarde).
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 gestionnaire_utilisateurs: GestionnaireUtilisateurBase, gestionnaire_partie: GestionnairePartie) -> None:
+        super().__init__(writer.get_extra_info("peername"), gestionnaire_utilisateurs, gestionnaire_partie)
+        self.reader = reader
+        self.writer = writer
+        self.boucle = asyncio.get_running_loop()
+        self._thread_boucle = threading.get_ident()
+        self._ferme = False
+        self._tour_ia_en_attente = False
+        self._ecritures: asyncio.Task | None = None  # Dernière écriture sur disque de la session
+        self._debut_blocage: float | None = None  # Tampon d'envoi au-dessus de sa limite haute depuis
+        # Partie sauvegardée lue avant le traitement du message qui en a besoin (voir _lire_sauvegarde)
+        self._sauvegarde_existe = False
+        self._sauvegarde: Partie | None = None
+        self._suppression_en_attente = False
+
+    async def executer(self) -> None:
+        """ Coroutine principale de la session (équivalent de GestionnaireClient.run). """
+        try:
+            # 1. Établissement de la session et choix du type de partie (reprise ou nouvelle)
+            msg_connexion = await self._recevoir_message()
+            if not msg_connexion:
+                return
+            await self._lire_sauvegarde(msg_connexion)
+            if not self._traiter_connexion(msg_connexion):
+                return
+
+            if self.attente_choix_reprise:
+                msg_choix = await self._recevoir_message()
+                if not msg_choix:
+                    return
+                await self._lire_sauvegarde(msg_choix)
+                continuer = self._traiter_choix_reprise(msg_choix)
+                await self._supprimer_sauvegarde()
+                if not continuer:
+                    return
+                await self._jouer_tour_ia()
+
+            # 2. Boucle de communication principale (Jeu/Chat/Déconnexion)
+            while self.actif:
+                message = await self._recevoir_message()
+                if not message:
+                    break  # Déconnexion ou erreur
+
+                continuer = self._traiter_message(message)
+                await self._supprimer_sauvegarde()
+                if not continuer:
+                    break
+                await self._jouer_tour_ia()
+
+        except ConnectionResetError:
+            print(f"[{self.nom_joueur}] Déconnexion inattendue.")
+        except Exception as e:
+            nom = self.nom_joueur if self.nom_joueur else str(self.adresse)
+            print(f"[{nom}] Erreur critique: {e}")
+        finally:
+            self.stop()
+
+    def _executer_tour_ia(self) -> None:
+        """ Le tour de l'IA est joué par executer() une fois le message en cours traité (voir _jouer_tour_ia). """
+        self._tour_ia_en_attente = True
+
+    async def _jouer_tour_ia(self) -> None:
+        """ Tour de l'IA demandé par le dernier message : son calcul est attendu sans bloquer la boucle. """
+        if not self._tour_ia_en_attente:
+            return
+        self._tour_ia_en_attente = False
+        print(f"[{self.nom_joueur}] Tour de l'IA en cours...")
+
+        if not self.partie_en_cours:
+            print(f"[{self.nom_joueur}] Erreur: Partie non active pour l'IA.")
+            return
+
+        x_tir, y_tir = await self.gestionnaire_partie.calculateur_ia.choisir_tir_asyncio(self.partie_en_cours)
+        if not self.actif:
+            return  # Session arrêtée pendant le calcul (la partie a été sauvegardée avant ce tir)
+
+        with self.regrouper_envois():
+            self._jouer_tir_ia(x_tir, y_tir)
+
+    # --- Partie sauvegardée : lue hors de la boucle, avant le traitement du message ---
+
+    async def _lire_sauvegarde(self, message: Message) -> None:
+        """ Fait dans un thread la lecture (dépôt ou base) dont le traitement du message aura besoin. """
+        gestionnaire = self.gestionnaire_utilisateurs
+        if message.type == const.MSG_CONNEXION:
+            nom = message.donnees.get("nom", "Inconnu")
+            self._sauvegarde_existe = await self.boucle.run_in_executor(None, gestionnaire.partie_existe, nom)
+        elif message.type == const.MSG_REPRENDRE_PARTIE:
+            self._sauvegarde = await self.boucle.run_in_executor(None, gestionnaire.charger_partie, self.nom_joueur)
+
+    def _partie_sauvegardee_existe(self) -> bool:
+        return self._sauvegarde_existe
+
+    def _charger_partie_sauvegardee(self) -> Partie | None:
+        partie, self._sauvegarde = self._sauvegarde, None
+        return partie
+
+    def _supprimer_partie_sauvegardee(self) -> None:
+        """ La suppression est faite par executer() une fois le message en cours traité (voir _supprimer_sauvegarde). """
+        self._suppression_en_attente = True
+
+    async def _supprimer_sauvegarde(self) -> None:
+        """
+        Suppression demandée par le dernier message : sa lecture (partie_existe) est faite dans un
+        thread, et attendue avant le message suivant (une sauvegarde ultérieure n'est pas effacée).
+        """
+        if not self._suppression_en_attente:
+            return
+        self._suppression_en_attente = False
+        await self.boucle.run_in_executor(None, self.gestionnaire_utilisateurs.supprimer_partie_sauvegardee,
+                                          self.nom_joueur)
+
+    async def _recevoir_message(self) -> Message | None:
+        """ Attend le prochain message complet du client (entête de taille puis contenu). """
+        try:
+            entete = await self.reader.readexactly(const.TAILLE_ENTETE)
+            taille = int.from_bytes(entete, byteorder='big')
+            if taille > const.TAILLE_MAX_MESSAGE:
+                print(f"[{self.nom_joueur}] Erreur de réception: message trop grand ({taille} octets).")
+                return None
+            data = await self.reader.readexactly(taille)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None
+
+        return Message.deserialiser(data)
+
+    def _emettre(self, messages: list[Message]) -> bool:
+        """
+        Place les trames dans le tampon d'envoi du transport (non bloquant).
+
+        Au-delà de TAILLE_MAX_TAMPON_ENVOI octets en attente, le chat est ignoré
+        (DEBORDEMENT_IGNORER_CHAT) et tout autre message entraîne la déconnexion du
+        client : écrire ne peut pas attendre ici sans bloquer toutes les sessions
+        de la boucle. Le temps passé par le tampon au-dessus de sa limite haute (le
+        transport aurait bloqué l'écrivain) est compté dans temps_bloque_envoi.
+        """
+        if threading.get_ident() != self._thread_boucle:
+            # Le transport n'est pas thread-safe : l'écriture est confiée à la boucle
+            if self.boucle.is_closed():
+                return False
+            self.boucle.call_soon_threadsafe(self._emettre, messages)
+            return True
+
+        if self.writer.is_closing():
+            return False
+
+        if self._profondeur_envoi() >= const.TAILLE_MAX_TAMPON_ENVOI:
+            if SessionClient._sont_facultatifs(messages) \
+                    and self.politique_debordement != const.DEBORDEMENT_DECONNECTER:
+                self.nb_messages_ignores += len(messages)
+            else:
+                self._deconnecter_pair_lent()
+            return False
+
+        try:
+            tampons = []
+            for message in messages:
+                tampons.extend(Protocole.tampons_trame(message, self.codec))
+            self.writer.writelines(tampons)
+        except Exception as e:
+            print(f"[{const.SERVEUR}] Erreur d'envoi: {e}")
+            return False
+
+        profondeur = self._profondeur_envoi()
+        if profondeur > self.profondeur_max_envoi:
+            self.profondeur_max_envoi = profondeur
+        if self._debut_blocage is None and profondeur > self.writer.transport.get_write_buffer_limits()[1]:
+            self._debut_blocage = time.perf_counter()
+            self.boucle.create_task(self._mesurer_blocage())
+        return True
+
+    async def _mesurer_blocage(self) -> None:
+        """ Attend que le tampon d'envoi redescende sous sa limite basse (ou la fin de la connexion). """
+        try:
+            await self.writer.drain()
+        except Exception:
+            pass  # Connexion perdue : le blocage s'arrête là
+        finally:
+            self.temps_bloque_envoi += time.perf_counter() - self._debut_blocage
+            self._debut_blocage = None
+
+    def statistiques_envoi(self) -> dict[str, Any]:
+        stats = super().statistiques_envoi()
+        debut = self._debut_blocage
+        if debut is not None:
+            stats["temps_bloque"] += time.perf_counter() - debut  # Blocage en cours
+        return stats
+
+    def _profondeur_envoi(self) -> int:
+        """ Octets écrits mais pas encore acceptés par le noyau. """
+        return self.writer.transport.get_write_buffer_size()
+
+    def _deconnecter_pair_lent(self) -> None:
+        """ Client trop lent : la connexion est coupée sans attendre la fin des envois. """
+        if not self.deconnecte_pour_lenteur:
+            self.deconnecte_pour_lenteur = True
+            print(f"[{self.nom_joueur}] Tampon d'envoi saturé : déconnexion du client.")
+        self.actif = False
+        self.writer.transport.abort()
+
+    # --- Écritures sur disque, hors de la boucle ---
+
+    def _ouvrir_point_controle(self) -> None:
+        points_controle = self.gestionnaire_utilisateurs.points_controle
+        self._ecrire_en_arriere_plan(points_controle.ouvrir_differe(self.nom_joueur, self.partie_en_cours))
+
+    def _noter_tir(self, x: int, y: int) -> None:
+        points_controle = self.gestionnaire_utilisateurs.points_controle
+        self._ecrire_en_arriere_plan(points_controle.ajouter_tir_differe(self.nom_joueur, self.partie_en_cours, x, y))
+
+    def _fermer_point_controle(self) -> None:
+        points_controle = self.gestionnaire_utilisateurs.points_controle
+        if self.nom_joueur and points_controle.est_suivie(self.nom_joueur):
+            self._ecrire_en_arriere_plan(points_controle.fermer_differe(self.nom_joueur))
+
+    def _sauvegarder_partie_durable(self) -> None:
+        """ Sauvegarde soumise depuis la boucle ; son attente sur disque passe avant les écritures suivantes. """
+        self.gestionnaire_utilisateurs.sauvegarder_partie(self.nom_joueur, self.partie_en_cours)
+        self._ecrire_en_arriere_plan(self.gestionnaire_utilisateurs.ecrivain.vider)
+
+    def _ecrire_en_arriere_plan(self, ecriture: Callable[[], None] | None) -> None:
+        """ Fait l'écriture dans un thread, après les écritures précédentes de la session. """
+        if ecriture is not None:
+            self._ecritures = self.boucle.create_task(self._ecrire_apres(self._ecritures, ecriture))
+
+    async def _ecrire_apres(self, precedente: asyncio.Task | None, ecriture: Callable[[], None]) -> None:
+        if precedente is not None:
+            await precedente
+        try:
+            await self.boucle.run_in_executor(None, ecriture)
+        except Exception as e:
+            logging.exception(f"[{self.nom_joueur}] Écriture sur disque impossible: {e}")
+
+    async def terminer_ecritures(self) -> None:
+        """ Attend les écritures sur disque déjà demandées par la session. """
+        if self._ecritures is not None:
+            await self._ecritures
+
+    def stop(self):
+        """ Termine la session et ferme la connexion. """
+        self.actif = False
+        if self._ferme:
+            return
+        self._ferme = True
+        try:
+            self._vider_envois()
+            self._signaler_depart()
+            if self.callback_desenregistrer and self.nom_joueur:
+                self.callback_desenregistrer(self.nom_joueur)
+            self.writer.close()
+        except Exception as e:
+            print(f"[{self.nom_joueur}] Erreur à la fermeture du socket: {e}")
+        print(f"[{self.nom_joueur}] Session terminée.")
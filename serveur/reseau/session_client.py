@@ -0,0 +1,615 @@
+import contextlib
+import logging
+import threading
+from typing import Any, Iterator
+
+from commun import constantes as const
+from commun.coeur_jeu.configuration_partie import ConfigurationPartie
+from commun.coeur_jeu.instantane import Instantane
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+from commun.reseau.message import Message, MessageChatGlobal
+from serveur.donnees.gestionnaire_utilisateur_base import GestionnaireUtilisateurBase
+from serveur.logique_jeu.gestionnaire_partie import GestionnairePartie
+
+
+class SessionClient:
+    """
+    Logique de session commune à tous les modes réseau du serveur.
+
+    Cette classe ne connaît pas le transport : elle traite des objets Message déjà
+    décodés et délègue l'écriture sur le réseau à _emettre(), que chaque
+    mode (thread par client, asyncio) implémente.
+    """
+
+    # Messages abandonnés en premier quand la file d'envoi déborde
+    TYPES_FACULTATIFS = frozenset({const.MSG_CHAT_GLOBAL})
+
+    def __init__(self, adresse: tuple[str, int], gestionnaire_utilisateurs: GestionnaireUtilisateurBase,
+                 gestionnaire_partie: GestionnairePartie) -> None:
+        self.adresse = adresse
+        self.gestionnaire_utilisateurs = gestionnaire_utilisateurs
+        self.actif = True
+        self.nom_joueur: str | None = None
+        self.partie_en_cours: Partie | None = None
+        self.joueur_local: Joueur | None = None
+        self.est_en_attente_pvp = False
+        self.gestionnaire_partie = gestionnaire_partie
+        self.mode_jeu: str | None = None
+        # Taille de grille et flotte choisies dans CHOIX_MODE (en PvP, seuls les joueurs de même configuration sont appariés)
+        self.configuration: ConfigurationPartie | None = None
+        self.attente_choix_reprise = False
+        # Codec des messages, négocié à la connexion (JSON tant que le client ne l'a pas choisi)
+        self.codec = const.CODEC_JSON
+        # Regroupement des envois : les messages produits par un même événement de jeu
+        # sont accumulés puis émis en une seule écriture (voir regrouper_envois)
+        self._verrou_envoi = threading.RLock()
+        self._niveau_regroupement = 0
+        self._messages_en_attente: list[Message] = []
+        # File d'envoi : politique de débordement et statistiques (voir statistiques_envoi)
+        self.politique_debordement = const.POLITIQUE_DEBORDEMENT_ENVOI
+        self.profondeur_max_envoi = 0
+        self.temps_bloque_envoi = 0.0  # Secondes d'écriture bloquée sur un client qui ne lit pas assez vite
+        self.nb_messages_ignores = 0
+        self.deconnecte_pour_lenteur = False
+        self.callback_enregistrer = None
+        self.callback_desenregistrer = None
+        # Ajout du callback pour obtenir la map des clients (PvP)
+        self.callback_get_map = None
+
+    def set_callbacks(self, func_enregistrer, func_desenregistrer, func_get_map=None):
+        """ Définit les fonctions pour s'enregistrer/désenregistrer et obtenir la map. """
+        self.callback_enregistrer = func_enregistrer
+        self.callback_desenregistrer = func_desenregistrer
+        self.callback_get_map = func_get_map
+
+    # --- Transport ---
+
+    def _envoyer_message_tcp(self, message: Message) -> bool:
+        """ Envoie un message au client (ou le met en attente pendant un regroupement). """
+        with self._verrou_envoi:
+            if self._niveau_regroupement:
+                self._messages_en_attente.append(message)
+                return True
+            return self._emettre([message])
+
+    @contextlib.contextmanager
+    def regrouper_envois(self) -> Iterator[None]:
+        """
+        Accumule tous les messages envoyés dans le bloc `with` et les émet en une
+        seule écriture à la sortie. Les blocs peuvent être imbriqués.
+        """
+        with self._verrou_envoi:
+            self._niveau_regroupement += 1
+        try:
+            yield
+        finally:
+            with self._verrou_envoi:
+                self._niveau_regroupement -= 1
+                if not self._niveau_regroupement:
+                    self._vider_envois()
+
+    def _vider_envois(self) -> None:
+        """ Émet immédiatement les messages en attente (ex: avant la fermeture de la connexion). """
+        with self._verrou_envoi:
+            if self._messages_en_attente:
+                messages, self._messages_en_attente = self._messages_en_attente, []
+                self._emettre(messages)
+
+    @staticmethod
+    def _sont_facultatifs(messages: list[Message]) -> bool:
+        """ Vrai si ces messages peuvent être abandonnés quand le pair ne suit pas (chat). """
+        return all(m.type in SessionClient.TYPES_FACULTATIFS for m in messages)
+
+    def statistiques_envoi(self) -> dict[str, Any]:
+        """
+        Instrumentation de la file d'envoi de la session : profondeur (actuelle et
+        maximale), temps bloqué à écrire sur la connexion (voir chaque mode réseau),
+        messages ignorés et déconnexion pour lenteur.
+        """
+        return {
+            "profondeur": self._profondeur_envoi(),
+            "profondeur_max": self.profondeur_max_envoi,
+            "temps_bloque": self.temps_bloque_envoi,
+            "messages_ignores": self.nb_messages_ignores,
+            "deconnecte_pour_lenteur": self.deconnecte_pour_lenteur,
+        }
+
+    # --- Transport (à implémenter par chaque mode réseau) ---
+
+    def _emettre(self, messages: list[Message]) -> bool:
+        """
+        Écrit effectivement une liste de messages sur la connexion (ou les confie à
+        la file d'envoi de la session), selon la politique de débordement.
+        """
+        raise NotImplementedError
+
+    def _profondeur_envoi(self) -> int:
+        """ Quantité actuellement en attente d'envoi (lots ou octets selon le mode). """
+        return 0
+
+    def _deconnecter_pair_lent(self) -> None:
+        """ Coupe la connexion d'un pair qui ne lit plus assez vite. """
+        raise NotImplementedError
+
+    def _pause(self, secondes: float) -> None:
+        """ Courte pause entre deux envois consécutifs (sans effet si le mode ne peut pas bloquer). """
+
+    def stop(self):
+        """ Arrête la session et ferme la connexion. """
+        raise NotImplementedError
+
+    # --- Phase d'initialisation ---
+
+    def _traiter_connexion(self, msg_connexion: Message) -> bool:
+        """
+        Traite le premier message de la session :
+        1. Réception du nom d'utilisateur (confirmé par UDP).
+        2. Annonce d'une éventuelle partie sauvegardée.
+
+        Si une partie sauvegardée existe, attente_choix_reprise passe à True et le
+        prochain message doit être transmis à _traiter_choix_reprise().
+        """
+        if msg_connexion.type != const.MSG_CONNEXION:
+            return False
+
+        self.nom_joueur = msg_connexion.donnees.get("nom", "Inconnu")
+        print(f"[{self.nom_joueur}] Connexion TCP établie.")
+
+        # Négociation du codec : premier codec du serveur accepté par le client
+        # (un client qui n'annonce rien ne comprend que le JSON)
+        codecs_client = msg_connexion.donnees.get("codecs") or [const.CODEC_JSON]
+        codec = next((c for c in const.CODECS_SUPPORTES if c in codecs_client), const.CODEC_JSON)
+
+        # La callback_enregistrer() est paramétrée dans EcouteurServeur
+        if self.callback_enregistrer and self.nom_joueur:
+            self.callback_enregistrer(self.nom_joueur, self)
+
+        # 2. Vérification de la sauvegarde
+        if self._partie_sauvegardee_existe():
+            msg_ok = Message.creer_connexion_ok(f"Bienvenue {self.nom_joueur}! Partie sauvegardée trouvée.", codec)
+            msg_ok.donnees["reprise"] = True  # Indicateur de reprise
+            self._envoyer_message_tcp(msg_ok)
+
+            # Attendre la décision du client (Reprendre/Nouvelle)
+            self.attente_choix_reprise = True
+
+        else:
+            msg_ok = Message.creer_connexion_ok(f"Bienvenue {self.nom_joueur}!", codec)
+            self._envoyer_message_tcp(msg_ok)
+
+        # CONNEXION_OK part toujours en JSON, le codec retenu s'applique ensuite
+        self.codec = codec
+        return True  # Continuer vers le choix de mode
+
+    def _traiter_choix_reprise(self, msg_choix: Message) -> bool:
+        """ Traite le choix du client concernant la partie sauvegardée. """
+        self.attente_choix_reprise = False
+
+        if msg_choix.type == const.MSG_REPRENDRE_PARTIE:
+            # Tente de charger la partie
+            partie = self._charger_partie_sauvegardee()
+
+            if partie:
+                partie.etat = const.ETAT_EN_COURS
+                self.partie_en_cours = partie
+                # On doit déterminer quel joueur est ce client dans l'objet Partie
+                self.joueur_local = partie.joueur1 if partie.joueur1.nom == self.nom_joueur else partie.joueur2
+                self.configuration = self.joueur_local.configuration()
+
+                # On récupère le nom de l'adversaire
+                nom_adversaire = partie.joueur2.nom if partie.joueur1.nom == self.nom_joueur else partie.joueur1.nom
+
+                est_tour_joueur1 = partie.est_tour_joueur1
+                est_mon_tour = (est_tour_joueur1 and self.joueur_local.nom == partie.joueur1.nom) or \
+                               (not est_tour_joueur1 and self.joueur_local.nom == partie.joueur2.nom)
+
+                # PRÉPARATION DES DONNÉES DE REPRISE (instantané binaire, JSON s'il n'est pas représentable)
+                joueur_data = self.joueur_local.to_dict()
+                msg_reprise_data = {
+                    "est_mon_tour": est_mon_tour,
+                    "nom_adversaire": nom_adversaire
+                }
+                try:
+                    msg_reprise_data["joueur_instantane"] = Instantane.en_texte(Instantane.encoder_joueur(joueur_data))
+                except ValueError:
+                    msg_reprise_data["joueur_etat"] = joueur_data
+
+                msg_reprise = Message.creer_message_reprise(msg_reprise_data)
+
+                # Si l'IA est identifiée:
+                if nom_adversaire == const.NOM_SERVEUR:
+
+                    # --- MODE SOLO (Reprise immédiate) ---
+                    self.mode_jeu = const.MODE_VS_SERVEUR
+                    self._ouvrir_point_controle()
+                    self._envoyer_message_tcp(msg_reprise)
+
+                    # L'IA étant déjà dans la partie, le GestionnaireClient passera directement
+                    # à la boucle de jeu principale et recevra le tour suivant du serveur.
+                    print(f"[{self.nom_joueur}] Partie Solo sauvegardée chargée.")
+                    return True
+
+                else:
+                    # --- MODE PvP (Attente de l'adversaire) ---
+                    self.mode_jeu = const.MODE_VS_JOUEUR
+
+                    # Le GestionnaireClient doit s'enregistrer auprès du GestionnairePartie
+                    # pour retrouver son adversaire ou attendre qu'il se connecte.
+
+                    # 1. Notifier le client qu'il doit attendre
+                    self.est_en_attente_pvp = True
+                    self.gestionnaire_partie.mettre_en_attente(self)  # Le client est mis en file d'attente/recherche
+
+                    # 2. Envoyer le message de confirmation (le client passera en état d'attente)
+                    self._envoyer_message_tcp(msg_reprise)
+                    print(f"[{self.nom_joueur}] Partie PvP chargée. Mis en attente de {nom_adversaire}.")
+                    return True
+
+            else:
+                # Échec du chargement (ne devrait pas arriver si partie_existe a dit oui)
+                self._envoyer_message_tcp(Message(const.MSG_ERREUR, {"detail": "Échec chargement"}))
+                return False
+
+        elif msg_choix.type == const.MSG_NOUVELLE_PARTIE:
+            # Supprimer l'ancienne sauvegarde
+            self._supprimer_partie_sauvegardee()
+            self._envoyer_message_tcp(Message.creer_connexion_ok("Nouvelle partie démarrée."))
+            self._pause(0.1) # un peu d'attente
+            self._envoyer_message_tcp(Message.creer_nouvelle_partie())
+            return True
+
+        return False
+
+    # --- Boucle de communication ---
+
+    def _traiter_message(self, message: Message) -> bool:
+        """
+        Traite une commande de jeu ou de chat (aiguillage direct sur le type du message).
+
+        Returns:
+            bool: False si la session doit se terminer, True sinon.
+        """
+        traitement = SessionClient.AIGUILLAGE.get(message.type)
+        if traitement is None:
+            return True
+        return traitement(self, message) is not False
+
+    def _recevoir_tir(self, message: Message) -> None:
+        self._traiter_tir_client(message.x, message.y)
+
+    def _recevoir_placement(self, message: Message) -> None:
+        self._gerer_placement_navires(message)
+
+    def _recevoir_chat(self, message: Message) -> None:
+        self._transmettre_chat(message.message)
+
+    def _recevoir_fin_session(self, message: Message) -> bool:
+        self._traiter_deconnexion_sauvegarde(message.type)
+        return False
+
+    def _recevoir_choix_mode(self, message: Message) -> None:
+        self._gerer_choix_mode(message.obtenir_donnee("mode"), message.obtenir_donnee("configuration"),
+                               message.obtenir_donnee("difficulte"))
+
+    # Type de message -> traitement (un retour False termine la session)
+    AIGUILLAGE = {
+        const.MSG_TIR: _recevoir_tir,
+        const.MSG_PLACEMENT_NAVIRES: _recevoir_placement,
+        const.MSG_CHAT: _recevoir_chat,
+        const.MSG_DECONNEXION: _recevoir_fin_session,
+        const.MSG_ABANDON: _recevoir_fin_session,
+        const.MSG_SAUVEGARDER_PARTIE: _recevoir_fin_session,
+        const.MSG_CHOIX_MODE: _recevoir_choix_mode,
+    }
+
+    def _gerer_choix_mode(self, mode: str, configuration: dict[str, Any] | None = None,
+                          difficulte: str | None = None) -> None:
+        """
+        Gère le choix du mode de jeu (Solo ou PvP), de la configuration de la partie (standard
+        si absente) et, en Solo, de la difficulté de l'IA (DIFFICULTE_IA si absente).
+        """
+        difficulte = difficulte if difficulte is not None else const.DIFFICULTE_IA
+        if not isinstance(difficulte, str) or difficulte not in const.DIFFICULTES_IA:
+            self.notifier_erreur(f"Difficulté inconnue: {difficulte}")
+            return
+
+        try:
+            self.configuration = ConfigurationPartie.from_dict(configuration) if configuration is not None \
+                else ConfigurationPartie.standard()
+        except ValueError as e:
+            self.notifier_erreur(f"Configuration de partie refusée: {e}")
+            return
+
+        self.mode_jeu = mode
+
+        if mode == const.MODE_VS_SERVEUR:
+            # Création du Joueur local et initialisation de la Partie Solo
+            self.joueur_local = Joueur(self.nom_joueur, configuration=self.configuration)
+
+            # On suppose que Partie(joueur) crée une partie Solo avec une IA en tant que joueur 2.
+            self.partie_en_cours = Partie(self.joueur_local, strategie_ia=const.DIFFICULTES_IA[difficulte])
+            self.partie_en_cours.initialiser_joueur_ia()  # Appel supposé pour créer l'IA (Joueur 2)
+
+            # Notifier le client que la partie est prête (le client doit maintenant placer)
+            self._envoyer_message_tcp(Message(const.MSG_DEBUT_PARTIE))
+            print(f"[{self.nom_joueur}] Envoi de MSG_DEBUT_PARTIE (difficulté {difficulte}), attente du placement.")
+
+        elif mode == const.MODE_VS_JOUEUR:
+            # Logique PvP
+            self.est_en_attente_pvp = True
+            self.gestionnaire_partie.mettre_en_attente(self)
+            self._envoyer_message_tcp(Message.creer_attente_adversaire())
+
+
+    def _gerer_placement_navires(self, message: Message):
+        """ Gère la réception des positions des navires du client et lance le jeu Solo. """
+        positions: list[dict[str, Any]] = message.obtenir_donnee("navires", [])
+
+        if not self.partie_en_cours or not self.joueur_local:
+            self._envoyer_message_tcp(Message.creer_erreur("Partie non initialisée pour le placement."))
+            return
+
+        if self.mode_jeu == const.MODE_VS_JOUEUR:
+            # --- MODE PvP (Logique déléguée) ---
+            # Le placement est appliqué par l'acteur de la partie, qui confirme au client
+            # et démarre la partie quand l'adversaire est prêt lui aussi.
+            self.gestionnaire_partie.placer_navires(self, positions, self.callback_get_map())
+            return
+
+        try:
+            # 1. Placement des navires du joueur (client)
+            if not self.joueur_local.placer_navires_depuis_positions(positions):
+                raise ValueError("collision ou navire hors de la grille")
+
+            if self.mode_jeu == const.MODE_VS_SERVEUR:
+                # 2. Placement des navires de l'IA (Joueur 2)
+                joueur_ia = self.partie_en_cours.joueur2
+                if joueur_ia:
+                    joueur_ia.placer_navires_aleatoire()
+
+                # 3. Démarrer la partie (et son point de contrôle, avant le premier tir)
+                self.partie_en_cours.demarrer()
+                self._ouvrir_point_controle()
+
+                with self.regrouper_envois():
+                    # 4. Confirmation au client
+                    self.notifier_placement_ok()
+                    print(f"[GestionnaireClient: {self.nom_joueur}] Placement validé, partie Solo lancée.")
+
+                    # 5. Lancer le premier tour
+                    self._lancer_tour_initial()
+            else:
+                # Mode non géré ou indéfini (Erreur)
+                self._envoyer_message_tcp(Message.creer_erreur("Mode de jeu non spécifié."))
+
+        except Exception as e:
+            # Si le placement échoue (coordonnées invalides, etc.)
+            logging.exception(f"[{self.nom_joueur}] Erreur de placement: {e}]")
+            self._envoyer_message_tcp(Message.creer_erreur(f"Erreur de placement: {e}. Réessayez."))
+
+    # Logique de début de tour
+    def _lancer_tour_initial(self):
+        """ Détermine le premier tour et notifie le client. """
+        # La partie en cours doit avoir une logique pour déterminer qui commence
+        if self.partie_en_cours.est_tour_joueur1:  # joueur1 est le client
+            self.notifier_tour(True)  # C'est le tour du client
+        else:
+            self.notifier_tour(False)  # C'est le tour de l'IA
+            # Si c'est le tour de l'IA, on exécute son action immédiatement
+            self._executer_tour_ia()
+
+    def _executer_tour_ia(self):
+        """ Exécute le tour de l'IA (Solo). """
+        print(f"[{self.nom_joueur}] Tour de l'IA en cours...")
+
+        if not self.partie_en_cours:
+            print(f"[{self.nom_joueur}] Erreur: Partie non active pour l'IA.")
+            return
+
+        # 1. L'IA choisit ses coordonnées (calculées hors de ce thread, dans la limite de DELAI_TIR_IA)
+        x_tir, y_tir = self.gestionnaire_partie.calculateur_ia.choisir_tir(self.partie_en_cours)
+        self._jouer_tir_ia(x_tir, y_tir)
+
+    def _jouer_tir_ia(self, x_tir: int, y_tir: int) -> None:
+        """ Joue le tir choisi par l'IA et notifie le client (suite de _executer_tour_ia). """
+        joueur_ia = self.partie_en_cours.joueur2
+
+        # 2. La Partie traite le tir (la méthode traiter_tir fait l'action et change de tour interne).
+        resultat, navire_coule, partie_terminee = self.partie_en_cours.traiter_tir(x_tir, y_tir)
+        self._noter_tir(x_tir, y_tir)
+
+        print(f"[{self.nom_joueur}] L'IA a tiré en ({x_tir}, {y_tir}). Résultat: {resultat}.")
+
+        # 3. Notifier le client du coup REÇU
+        # On utilise notifier_tir_recu pour signaler au client l'attaque sur sa propre grille
+        self.notifier_tir_recu(x_tir, y_tir, resultat, joueur_ia.nom, navire_coule)
+
+        if partie_terminee:
+            # L'IA a gagné!
+            self._fermer_point_controle()
+            self._envoyer_message_tcp(Message.creer_fin_partie(joueur_ia.nom, " vous a coulé!"))
+            self.stop()
+            return
+
+        # 5. Renvoyer le tour au client
+        # Le tour a déjà changé dans self.partie_en_cours.traiter_tir(),
+        # donc on notifie le joueur que c'est maintenant SON tour (True).
+        self.notifier_tour(True)
+        print(f"[{self.nom_joueur}] Tour de l'IA terminé. Votre tour.")
+
+    def notifier_erreur(self, texte: str):
+        msg_erreur = Message.creer_erreur(texte)
+        self._envoyer_message_tcp(msg_erreur)
+
+    def notifier_placement_ok(self):
+        """ Confirme au client que ses navires sont placés. """
+        self._envoyer_message_tcp(Message.creer_placement_ok())
+
+    def notifier_debut_partie(self, nom_adversaire: str, mode: str):
+        msg_erreur = Message.creer_debut_partie(nom_adversaire, mode)
+        self._envoyer_message_tcp(msg_erreur)
+
+    def notifier_match_trouve(self, nom_adversaire: str):
+        """ Notifie le client qu'un match a été trouvé. """
+        msg_adv = Message.creer_adversaire_trouve(nom_adversaire)
+        self._envoyer_message_tcp(msg_adv)
+
+    def notifier_tir_recu(self, x: int, y: int, resultat: str, tireur: str, navire_coule: str | None):
+        """ Notifie le client qu'il a reçu un tir. """
+        msg = Message.creer_reponse_tir_recu(resultat, x, y, tireur, navire_coule)
+        self._envoyer_message_tcp(msg)
+
+    def notifier_resultat_tir(self, x: int, y: int, resultat: str, navire_coule: str | None):
+        """ Notifie le client du résultat de son propre tir. """
+        msg = Message.creer_reponse_tir(resultat, x, y, navire_coule)
+        self._envoyer_message_tcp(msg)
+
+    def notifier_fin_partie(self, status: str, message: str):
+        msg = Message(const.MSG_FIN_PARTIE, {"status": status, "message": message})
+        self._envoyer_message_tcp(msg)
+
+    def notifier_tour(self, est_son_tour: bool):
+        """ Notifie le client si c'est son tour ou celui de l'adversaire. """
+        if est_son_tour:
+            self._envoyer_message_tcp(Message.creer_votre_tour())
+        else:
+            self._envoyer_message_tcp(Message.creer_tour_adversaire())
+
+    def envoyer_chat(self, nom_envoyeur: str, message: str):
+        """ Envoie un message de chat reçu d'un autre client. """
+        msg = MessageChatGlobal(nom_envoyeur, message)
+        self._envoyer_message_tcp(msg)
+
+    # --- Méthodes de traitement des commandes ---
+
+    def _traiter_tir_client(self, x: int, y: int) -> None:
+        """ Gère une commande de tir du client, en déléguant selon le mode de jeu. """
+
+        if not self.partie_en_cours or self.mode_jeu is None:
+            print(f"[GESTIONNAIRE CLIENT (traiter_tir_client)]: "
+                  f"ERREUR (partie_en_cours: {self.partie_en_cours}, mode_jeu: {self.mode_jeu})")
+            # Non, ce n'est pas le tour (ou la partie n'est pas initialisée).
+            self._envoyer_message_tcp(Message(const.MSG_ERREUR, {"detail": "Ce n'est pas votre tour ou partie non démarrée."}))
+            return
+
+        # Si nous sommes ici, c'est le tour du joueur et la partie est en cours.
+
+        if self.mode_jeu == const.MODE_VS_SERVEUR:
+            # LOGIQUE SOLO : Gérée par le thread local du client
+
+            # Note: Si votre Partie.traiter_tir ne gère pas de 'partie_terminee', il faudra l'ajouter.
+            resultat, navire_coule, partie_terminee = self.partie_en_cours.traiter_tir(x, y)
+            if resultat == const.MSG_ERREUR:
+                # Tir refusé (hors de la grille) : le joueur garde la main
+                with self.regrouper_envois():
+                    self.notifier_erreur(navire_coule)
+                    self.notifier_tour(True)
+                return
+            self._noter_tir(x, y)
+
+            # Résultat du tir, tir de l'IA et nouveau tour partent dans la même écriture
+            with self.regrouper_envois():
+                self.notifier_resultat_tir(x, y, resultat, navire_coule)
+
+                if partie_terminee:
+                    self._fermer_point_controle()
+                    self._envoyer_message_tcp(Message.creer_fin_partie(self.nom_joueur, " Félicitations vous avez gagné!"))
+                    # self.stop()
+                    return
+
+                self._executer_tour_ia()
+
+        elif self.mode_jeu == const.MODE_VS_JOUEUR:
+            # LOGIQUE PvP : Délégation au GestionnairePartie
+
+            if self.callback_get_map is None:
+                self._envoyer_message_tcp(Message.creer_erreur("Erreur serveur interne (map non fournie)."))
+                return
+
+            clients_actifs_map = self.callback_get_map()
+
+            # Délégation de la tâche à la logique centrale (GestionnairePartie)
+            self.gestionnaire_partie.traiter_tir(
+                tireur_client=self,
+                clients_actifs_map=clients_actifs_map,
+                x=x,
+                y=y
+            )
+
+        else:
+            self._envoyer_message_tcp(Message.creer_erreur("Mode de jeu inconnu."))
+
+    def _transmettre_chat(self, message: str) -> None:
+        """ Envoie le message de chat à l'adversaire (via GestionnairePartie) ou le journal local. """
+        print(f"[CHAT {self.nom_joueur}] {message}")
+        clients_actifs_map = self.callback_get_map()
+        self.gestionnaire_partie.transmettre_chat(
+            envoyeur_client=self,
+            message=message,
+            clients_actifs_map=clients_actifs_map,
+        )
+
+    def _traiter_deconnexion_sauvegarde(self, type_message: str) -> None:
+        """ Gère la déconnexion, l'abandon ou la sauvegarde. """
+        if self.mode_jeu == const.MODE_VS_JOUEUR:
+            # Logique PvP: sauvegarde, abandon et notification de l'adversaire par l'acteur de la partie
+            self._signaler_depart(type_message)
+
+        elif type_message == const.MSG_SAUVEGARDER_PARTIE:
+            if self.partie_en_cours:
+                # Le joueur local est j1 ou j2 dans la partie en cours.
+                self._sauvegarder_partie_durable()
+                print(f"[{self.nom_joueur}] Partie sauvegardée avec succès.")
+
+        elif type_message == const.MSG_ABANDON and self.partie_en_cours:
+            self.partie_en_cours.abandonner(self.nom_joueur)
+            self._supprimer_partie_sauvegardee()
+
+        # Partie Solo sauvegardée, abandonnée ou quittée : plus de point de contrôle
+        self._fermer_point_controle()
+
+        print(f"[{self.nom_joueur}] Déconnexion demandée.")
+        self.actif = False  # Sortie de boucle
+
+    def _signaler_depart(self, type_message: str = const.MSG_DECONNEXION) -> None:
+        """
+        Retire le joueur PvP de la file d'attente ou de sa partie. En Solo, une partie
+        encore suivie (connexion perdue, arrêt du serveur) est sauvegardée.
+        """
+        if self.mode_jeu == const.MODE_VS_JOUEUR and self.nom_joueur:
+            clients_actifs_map = self.callback_get_map() if self.callback_get_map else {}
+            self.gestionnaire_partie.quitter_partie(self, type_message, clients_actifs_map)
+
+        elif self.nom_joueur and self.gestionnaire_utilisateurs.points_controle.est_suivie(self.nom_joueur):
+            self._sauvegarder_partie_durable()
+            self._fermer_point_controle()
+            print(f"[{self.nom_joueur}] Connexion interrompue : partie sauvegardée.")
+
+    def _sauvegarder_partie_durable(self) -> None:
+        """ Sauvegarde la partie Solo, écrite sur disque avant que son point de contrôle soit effacé. """
+        self.gestionnaire_utilisateurs.sauvegarder_partie(self.nom_joueur, self.partie_en_cours, durable=True)
+
+    # --- Partie sauvegardée du joueur (lectures sur disque si elle n'est pas en cache) ---
+
+    def _partie_sauvegardee_existe(self) -> bool:
+        return self.gestionnaire_utilisateurs.partie_existe(self.nom_joueur)
+
+    def _charger_partie_sauvegardee(self) -> Partie | None:
+        return self.gestionnaire_utilisateurs.charger_partie(self.nom_joueur)
+
+    def _supprimer_partie_sauvegardee(self) -> None:
+        self.gestionnaire_utilisateurs.supprimer_partie_sauvegardee(self.nom_joueur)
+
+    # --- Points de contrôle (parties Solo en cours, voir PointsControle) ---
+
+    def _ouvrir_point_controle(self) -> None:
+        self.gestionnaire_utilisateurs.points_controle.ouvrir(self.nom_joueur, self.partie_en_cours)
+
+    def _noter_tir(self, x: int, y: int) -> None:
+        self.gestionnaire_utilisateurs.points_controle.ajouter_tir(self.nom_joueur, self.partie_en_cours, x, y)
+
+    def _fermer_point_controle(self) -> None:
+        points_controle = self.gestionnaire_utilisateurs.points_controle
+        if self.nom_joueur and points_controle.est_suivie(self.nom_joueur):
+            points_controle.fermer(self.nom_joueur)
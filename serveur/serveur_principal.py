@@ -4,8 +4,11 @@ import time
 
 from commun import constantes as const
 from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from serveur.donnees.gestionnaire_utilisateur_sqlite import GestionnaireUtilisateurSQLite
+from serveur.reseau.annuaire_jeu import AnnuaireJeu, PointAccesJeu
 from serveur.reseau.authentification_udp import AuthentificationUDP
 from serveur.reseau.ecouteur_serveur import EcouteurServeur
+from serveur.reseau.ecouteur_serveur_asyncio import EcouteurServeurAsyncio
 from serveur.logique_jeu.gestionnaire_partie import GestionnairePartie
 
 # Chemin du fichier de sauvegarde
@@ -13,6 +16,11 @@ CHEMIN_SAUVEGARDE = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),
     const.FICHIER_SAUVEGARDE_UTILISATEURS
 )
+# Chemin de la base SQLite (stockage const.STOCKAGE_SQLITE)
+CHEMIN_BASE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    const.FICHIER_BASE_UTILISATEURS
+)
 
 
 class ServeurPrincipal:
@@ -20,32 +28,45 @@ class ServeurPrincipal:
     Classe principale orchestrant le lancement et la gestion des composants du serveur.
     """
 
-    def __init__(self):
+    def __init__(self, mode_reseau: str = const.MODE_RESEAU_THREADS, stockage: str = const.STOCKAGE_UTILISATEURS):
+        """
+        Args:
+            mode_reseau: const.MODE_RESEAU_THREADS (un thread par client) ou
+                         const.MODE_RESEAU_ASYNCIO (une coroutine par client).
+            stockage: const.STOCKAGE_JSON (fichier JSON + journal) ou
+                      const.STOCKAGE_SQLITE (base SQLite, voir migration_json_sqlite).
+        """
         print("Initialisation du Serveur Bataille Navale...")
 
+        if mode_reseau not in (const.MODE_RESEAU_THREADS, const.MODE_RESEAU_ASYNCIO):
+            raise ValueError(f"Mode réseau inconnu: {mode_reseau}")
+        self.mode_reseau = mode_reseau
+        if stockage not in (const.STOCKAGE_JSON, const.STOCKAGE_SQLITE):
+            raise ValueError(f"Stockage inconnu: {stockage}")
+
         # 1. Composants de persistance et logique (Instanciés une seule fois)
-        self.gestionnaire_utilisateurs = GestionnaireUtilisateur(CHEMIN_SAUVEGARDE)
+        if stockage == const.STOCKAGE_SQLITE:
+            self.gestionnaire_utilisateurs = GestionnaireUtilisateurSQLite(CHEMIN_BASE)
+        else:
+            self.gestionnaire_utilisateurs = GestionnaireUtilisateur(CHEMIN_SAUVEGARDE)
         self.gestionnaire_partie = GestionnairePartie()
 
         # 2. Composants réseau
         self.ecouteur_udp: AuthentificationUDP | None = None
-        self.ecouteur_tcp: EcouteurServeur | None = None
+        self.ecouteur_tcp: EcouteurServeur | EcouteurServeurAsyncio | None = None
+        self.annuaire_jeu: AnnuaireJeu | None = None
 
     def demarrer(self):
         """ Démarre les deux écouteurs (UDP et TCP). """
 
-        # 1. Lancement de l'écouteur UDP (Authentification)
-        self.ecouteur_udp = AuthentificationUDP(
-            gestionnaire_utilisateurs=self.gestionnaire_utilisateurs,
-            port=const.PORT_AUTH
-        )
-        self.ecouteur_udp.daemon = True
-        self.ecouteur_udp.start()
+        # 0. Processus de calcul des tirs de l'IA, prêts avant la première partie Solo
+        self.gestionnaire_partie.calculateur_ia.demarrer()
 
-        # 2. Lancement de l'écouteur TCP (Jeu)
+        # 1. Lancement de l'écouteur TCP (Jeu), avant d'y envoyer des clients
         # Injection des dépendances. L'EcouteurServeur est maintenant responsable de
         # gérer et de fournir la map des clients au GestionnairePartie.
-        self.ecouteur_tcp = EcouteurServeur(
+        classe_ecouteur = EcouteurServeurAsyncio if self.mode_reseau == const.MODE_RESEAU_ASYNCIO else EcouteurServeur
+        self.ecouteur_tcp = classe_ecouteur(
             gestionnaire_utilisateurs=self.gestionnaire_utilisateurs,
             gestionnaire_partie=self.gestionnaire_partie,  # Injection du GestionnairePartie
             port=const.PORT_JEU
@@ -53,6 +74,22 @@ class ServeurPrincipal:
         self.ecouteur_tcp.daemon = True
         self.ecouteur_tcp.start()
 
+        # 2. Annuaire des serveurs de jeu annoncés (la charge de ce serveur est son nombre de connexions)
+        points = [PointAccesJeu(hote, port, self.ecouteur_tcp.nombre_connexions
+                                if hote is None and port == const.PORT_JEU else None)
+                  for hote, port in const.POINTS_ACCES_JEU]
+        self.annuaire_jeu = AnnuaireJeu(points, const.POLITIQUE_REPARTITION_JEU)
+        self.annuaire_jeu.start()
+
+        # 3. Lancement de l'écouteur UDP (Authentification)
+        self.ecouteur_udp = AuthentificationUDP(
+            gestionnaire_utilisateurs=self.gestionnaire_utilisateurs,
+            port=const.PORT_AUTH,
+            annuaire=self.annuaire_jeu
+        )
+        self.ecouteur_udp.daemon = True
+        self.ecouteur_udp.start()
+
         # NOTE: L'étape d'injection de la map est désormais gérée par les callbacks
         # de l'EcouteurServeur, et les méthodes de GestionnairePartie reçoivent
         # la map en argument, respectant le découplage.
@@ -60,7 +97,7 @@ class ServeurPrincipal:
         print("-" * 50)
         print("SERVEUR PRÊT.")
         print(f"Auth UDP démarré sur le port {const.PORT_AUTH}.")
-        print(f"Jeu TCP démarré sur le port {const.PORT_JEU}.")
+        print(f"Jeu TCP démarré sur le port {const.PORT_JEU} (mode {self.mode_reseau}).")
         print("Appuyez sur CTRL+C pour arrêter le serveur.")
         print("-" * 50)
 
@@ -85,6 +122,27 @@ class ServeurPrincipal:
             self.ecouteur_udp.stop()
             self.ecouteur_udp.join()
 
+        # 3. Arrêter le rafraîchissement de l'annuaire
+        if self.annuaire_jeu:
+            self.annuaire_jeu.stop()
+
+        # 4. Écrire les modifications en attente, puis compacter le journal des données
+        #    utilisateur dans le fichier de sauvegarde (SQLite : fermer les connexions)
+        self.gestionnaire_utilisateurs.fermer()
+        stats = self.gestionnaire_utilisateurs.statistiques()
+        print(f"Écriture différée : {stats['modifications']} modifications en {stats['lots']} lots "
+              f"(moyenne {stats['taille_lot_moyenne']:.1f}, max {stats['taille_lot_max']}, {stats['echecs']} en échec), "
+              f"latence de vidage p99 {stats['latence_p99'] * 1e3:.1f} ms.")
+
+        # 5. Arrêter les processus de calcul des tirs de l'IA
+        self.gestionnaire_partie.calculateur_ia.fermer()
+        stats = self.gestionnaire_partie.calculateur_ia.statistiques()
+        print(f"Tirs de l'IA : {stats['tirs']} tirs, latence p50 {stats['latence_p50'] * 1e3:.1f} ms, "
+              f"p99 {stats['latence_p99'] * 1e3:.1f} ms ; {stats['lourds']} tirs lourds, "
+              f"{stats['replis']} replis ({stats['taux_repli']:.1%}), {stats['plafonnes']} plafonnés "
+              f"({stats['taux_plafonne']:.1%}), "
+              f"saturation {stats['taux_saturation']:.1%} (max {stats['en_cours_max']} calculs en cours).")
+
         print("Serveur arrêté avec succès.")
         sys.exit(0)
 
@@ -92,5 +150,9 @@ class ServeurPrincipal:
 # --- Point d'entrée du script ---
 
 if __name__ == '__main__':
-    server = ServeurPrincipal()
+    # Mode réseau et stockage optionnels en argument :
+    # python -m serveur.serveur_principal [threads|asyncio] [json|sqlite]
+    mode = sys.argv[1].upper() if len(sys.argv) > 1 else const.MODE_RESEAU_THREADS
+    stockage = sys.argv[2].upper() if len(sys.argv) > 2 else const.STOCKAGE_UTILISATEURS
+    server = ServeurPrincipal(mode, stockage)
     server.demarrer()
\ No newline at end of file
@@ -0,0 +1,47 @@
+""" Parties jouées au hasard pour les tests. """
+import itertools
+import random
+from typing import Iterator
+
+from commun import constantes as const
+from commun.coeur_jeu.configuration_partie import ConfigurationPartie
+from commun.coeur_jeu.joueur import Joueur
+from commun.coeur_jeu.partie import Partie
+
+FLOTTE_COMPLETE = (("Porte-avions", 5), ("Croiseur", 4), ("Contre-torpilleur", 3),
+                   ("Sous-marin", 3), ("Torpilleur", 2))
+
+
+def nouvelle_partie(rng: random.Random, taille: int = 10) -> Partie:
+    """ Partie Solo démarrée, flotte complète placée au hasard des deux côtés. """
+    configuration = ConfigurationPartie(taille, FLOTTE_COMPLETE).valider()
+    partie = Partie(Joueur("Arnauld", configuration=configuration), strategie_ia=const.IA_DENSITE)
+    partie.joueur1.placer_navires_aleatoire(rng)
+    partie.demarrer()
+    return partie
+
+
+def tirer(partie: Partie, rng: random.Random) -> Iterator[tuple[int, int]]:
+    """ Tirs au hasard jusqu'à la fin de la partie (chaque joueur vise chaque case une fois) : chacun est joué avant d'être rendu. """
+    taille = partie.joueur1.grille.largeur
+    cases = {tireur: [(x, y) for y in range(taille) for x in range(taille)] for tireur in (True, False)}
+    for liste in cases.values():
+        rng.shuffle(liste)
+    while not partie.est_terminee():
+        x, y = cases[partie.est_tour_joueur1].pop()
+        partie.traiter_tir(x, y)
+        yield x, y
+
+
+def jouer(partie: Partie, rng: random.Random, nb_tirs: int) -> list[tuple[int, int]]:
+    """ Joue au plus nb_tirs tirs au hasard ; retourne les tirs joués. """
+    return list(itertools.islice(tirer(partie, rng), nb_tirs))
+
+
+def etat(partie: Partie) -> dict:
+    """ Partie.to_dict, cases touchées triées (ensembles : l'ordre n'est pas significatif). """
+    donnees = partie.to_dict()
+    for joueur in ("joueur1", "joueur2"):
+        for navire in donnees[joueur]["navires"]:
+            navire["cases_touchees"] = sorted(navire["cases_touchees"])
+    return donnees
@@ -0,0 +1,35 @@
+import pytest
+
+from commun import constantes as const
+from commun.reseau.cache_trames import CacheTrames
+from commun.reseau.message import Message
+
+
+def trame(message: Message, codec: str) -> bytes:
+    data = message.serialiser(codec)
+    return len(data).to_bytes(const.TAILLE_ENTETE, byteorder='big') + data
+
+
+@pytest.fixture(autouse=True)
+def cache_vide():
+    CacheTrames.vider()
+    yield
+    CacheTrames.vider()
+
+
+@pytest.mark.parametrize("codec", const.CODECS_SUPPORTES)
+def test_trame_identique(codec):
+    nom_navire = const.NAVIRES[0][0]
+    for message in (Message.creer_reponse_tir(const.TIR_COULE, 3, 4, nom_navire),
+                    Message.creer_reponse_tir(const.TIR_RATE, 3, 4)):
+        attendue = trame(message, codec)
+        assert CacheTrames.obtenir(message, codec) == attendue
+        assert CacheTrames.obtenir(message, codec) == attendue  # Depuis le cache
+
+
+def test_navires_nommes_par_le_client_non_mis_en_cache():
+    """ Les noms d'une flotte configurée sont choisis par le client : le cache ne doit pas en dépendre. """
+    for i in range(1000):
+        message = Message.creer_reponse_tir(const.TIR_COULE, 0, 0, f"Navire{i}")
+        assert CacheTrames.obtenir(message, const.CODEC_JSON) is None  # Encodé normalement par l'appelant
+    assert not CacheTrames._trames
@@ -0,0 +1,46 @@
+import pytest
+
+from commun import constantes as const
+from commun.reseau.codec_binaire import CodecBinaire
+from commun.reseau.schemas import SCHEMAS, COORD, RESULTAT, TEXTE
+
+# Valeur d'exemple de chaque genre de champ
+EXEMPLES = {COORD: 513, RESULTAT: const.TIR_COULE, TEXTE: "Émile"}
+BINAIRES = [type_message for type_message, schema in SCHEMAS.items() if schema.code is not None]
+
+
+def valeurs(type_message: str, optionnel: str | None) -> tuple:
+    schema = SCHEMAS[type_message]
+    champs = tuple(EXEMPLES[genre] for _, genre in schema.champs)
+    return champs + (optionnel,) if schema.optionnel is not None else champs
+
+
+@pytest.mark.parametrize("type_message", BINAIRES)
+@pytest.mark.parametrize("optionnel", [None, "Porte-avions"])
+def test_aller_retour(type_message, optionnel):
+    attendu = valeurs(type_message, optionnel)
+
+    data = CodecBinaire.encoder(type_message, attendu)
+
+    assert data is not None
+    assert CodecBinaire.decoder(data) == (type_message, attendu)
+
+
+@pytest.mark.parametrize("type_message", [t for t, schema in SCHEMAS.items() if schema.code is None])
+def test_sans_format_binaire(type_message):
+    assert not CodecBinaire.a_un_format_binaire(type_message)
+    assert CodecBinaire.encoder(type_message, ("{}",)) is None
+
+
+def test_hors_limites_en_json():
+    """ Une valeur que le format binaire ne peut pas porter laisse le message en JSON. """
+    assert CodecBinaire.encoder(const.MSG_TIR, (CodecBinaire.COORD_MAX + 1, 0)) is None
+    assert CodecBinaire.encoder(const.MSG_ADVERSAIRE_TROUVE, ("x" * (CodecBinaire.TEXTE_MAX + 1),)) is None
+
+
+@pytest.mark.parametrize("type_message", [t for t in BINAIRES if SCHEMAS[t].champs])
+def test_trame_tronquee_invalide(type_message):
+    data = CodecBinaire.encoder(type_message, valeurs(type_message, None))
+
+    with pytest.raises(ValueError):
+        CodecBinaire.decoder(data[:-1])
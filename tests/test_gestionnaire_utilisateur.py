@@ -0,0 +1,32 @@
+import pytest
+
+from commun import constantes as const
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+
+
+def test_inscription_reecrite_apres_lot_en_echec(tmp_path, monkeypatch):
+    """ Un lot en échec ne perd pas l'inscription : elle reste en attente et est soumise à nouveau. """
+    monkeypatch.setattr(const, "DELAI_REESSAI_ECRITURE_DIFFEREE", 0)
+    chemin = str(tmp_path / "utilisateurs.json")
+    gestionnaire = GestionnaireUtilisateur(chemin)
+    ajouter_lot = gestionnaire.journal.ajouter_lot
+    echecs = []
+
+    def ajouter_lot_disque_plein(lot, *args, **kwargs):
+        if not echecs:
+            echecs.append(lot)
+            raise OSError("disque plein")
+        return ajouter_lot(lot, *args, **kwargs)
+
+    gestionnaire.journal.ajouter_lot = ajouter_lot_disque_plein
+    with pytest.raises(OSError):
+        gestionnaire.enregistrer_utilisateur("alice", "motdepasse", durable=True)
+    assert gestionnaire.verifier_authentification("alice", "motdepasse")
+
+    # Arrêt brutal après l'écriture : seul le journal fait foi (pas d'instantané complet à la fermeture)
+    gestionnaire.ecrivain.stop()
+    gestionnaire.journal.fermer()
+
+    relu = GestionnaireUtilisateur(chemin)
+    assert relu.verifier_authentification("alice", "motdepasse")
+    relu.fermer()
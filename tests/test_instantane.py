@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+from commun.coeur_jeu.instantane import Instantane
+from commun.coeur_jeu.partie import Partie
+from outils import etat, jouer, nouvelle_partie
+
+
+@pytest.mark.parametrize("graine", range(5))
+@pytest.mark.parametrize("nb_tirs", [0, 17, 60, 300])
+def test_partie_aller_retour(graine, nb_tirs):
+    """ encoder_partie puis decoder_partie redonne la même partie (comparée après from_dict). """
+    rng = random.Random(graine)
+    partie = nouvelle_partie(rng)
+    jouer(partie, rng, nb_tirs)
+
+    data = Instantane.encoder_partie(partie.to_dict())
+
+    assert Instantane.est_instantane(data)
+    assert etat(Partie.from_dict(Instantane.decoder_partie(data))) == etat(Partie.from_dict(partie.to_dict()))
+
+
+def test_partie_tronquee_invalide():
+    partie = nouvelle_partie(random.Random(0))
+    data = Instantane.encoder_partie(partie.to_dict())
+
+    with pytest.raises(ValueError):
+        Instantane.decoder_partie(data[:-1])
@@ -0,0 +1,49 @@
+import os
+
+from serveur.donnees.journal_utilisateurs import JournalUtilisateurs
+
+
+def utilisateur(nom: str) -> dict:
+    return {"op": JournalUtilisateurs.OP_UTILISATEUR, "nom": nom, "u": {"mot_de_passe": nom * 2}}
+
+
+def test_rejeu(tmp_path):
+    journal = JournalUtilisateurs(str(tmp_path / "utilisateurs.json"))
+    journal.charger()
+    journal.ajouter_lot([utilisateur("alice"), utilisateur("bob")])
+    journal.ajouter_lot([{"op": JournalUtilisateurs.OP_PARTIE, "nom": "alice", "p": {"etat": "MIS_EN_PAUSE"}}])
+    journal.fermer()
+
+    relu = JournalUtilisateurs(str(tmp_path / "utilisateurs.json"))
+    donnees = relu.charger()
+    relu.fermer()
+
+    assert donnees["utilisateurs"] == {
+        "alice": {"mot_de_passe": "alicealice", "partie_sauvegardee": {"etat": "MIS_EN_PAUSE"}},
+        "bob": {"mot_de_passe": "bobbob"},
+    }
+    assert relu.nb_enregistrements == 3
+
+
+def test_dernier_enregistrement_incomplet(tmp_path):
+    """ Un arrêt pendant un ajout laisse une ligne incomplète : elle est ignorée puis tronquée. """
+    chemin = str(tmp_path / "utilisateurs.json")
+    journal = JournalUtilisateurs(chemin)
+    journal.charger()
+    journal.ajouter_lot([utilisateur("alice"), utilisateur("bob")])
+    journal.fermer()
+    taille_valide = os.path.getsize(journal.chemin_journal)
+    with open(journal.chemin_journal, "ab") as f:
+        f.write(b'{"op":"U","nom":"carol","u":{"mot_de')
+
+    relu = JournalUtilisateurs(chemin)
+    donnees = relu.charger()
+    assert set(donnees["utilisateurs"]) == {"alice", "bob"}
+    assert os.path.getsize(relu.chemin_journal) == taille_valide
+
+    # Les ajouts suivants ne sont pas masqués par la ligne incomplète
+    relu.ajouter_lot([utilisateur("dave")])
+    relu.fermer()
+    relu = JournalUtilisateurs(chemin)
+    assert set(relu.charger()["utilisateurs"]) == {"alice", "bob", "dave"}
+    relu.fermer()
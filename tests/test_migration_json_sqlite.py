@@ -0,0 +1,53 @@
+import os
+import random
+from pathlib import Path
+
+from commun import constantes as const
+from serveur.donnees.gestionnaire_utilisateur import GestionnaireUtilisateur
+from serveur.donnees.gestionnaire_utilisateur_sqlite import GestionnaireUtilisateurSQLite
+from serveur.donnees.migration_json_sqlite import migrer
+from outils import etat, jouer, nouvelle_partie
+
+
+def contenu(dossier) -> dict[str, bytes]:
+    """ Contenu de tous les fichiers du dossier, par chemin. """
+    return {os.path.join(racine, fichier): Path(racine, fichier).read_bytes()
+            for racine, _, fichiers in os.walk(dossier) for fichier in fichiers}
+
+
+def test_migration_apres_arret_brutal(tmp_path):
+    """ Journal avec une ligne incomplète et point de contrôle : tout est migré, aucun fichier JSON n'est modifié. """
+    rng = random.Random(0)
+    dossier_json = tmp_path / "json"
+    dossier_json.mkdir()
+    chemin_json = str(dossier_json / "utilisateurs.json")
+    gestionnaire = GestionnaireUtilisateur(chemin_json)
+    gestionnaire.enregistrer_utilisateur("Arnauld", "motdepasse")
+    gestionnaire.enregistrer_utilisateur("Blaise", "motdepasse")
+    sauvegardee = nouvelle_partie(rng)
+    jouer(sauvegardee, rng, 10)
+    gestionnaire.sauvegarder_partie("Blaise", sauvegardee)
+    en_cours = nouvelle_partie(rng)
+    gestionnaire.points_controle.ouvrir("Arnauld", en_cours)
+    for x, y in jouer(en_cours, rng, 20):
+        gestionnaire.points_controle.ajouter_tir("Arnauld", en_cours, x, y)
+
+    # Arrêt brutal : pas de compaction, dernier enregistrement du journal incomplet
+    gestionnaire.ecrivain.stop()
+    gestionnaire.journal.fermer()
+    with open(gestionnaire.journal.chemin_journal, "ab") as f:
+        f.write(b'{"op":"U","nom":"Car')
+    avant = contenu(dossier_json)
+
+    chemin_base = str(tmp_path / "utilisateurs.sqlite3")
+    assert migrer(chemin_json, chemin_base) == (2, 2)
+    assert contenu(dossier_json) == avant
+
+    base = GestionnaireUtilisateurSQLite(chemin_base)
+    assert base.verifier_authentification("Blaise", "motdepasse")
+    assert etat(base.charger_partie("Blaise")) == etat(sauvegardee)
+    reprise = base.charger_partie("Arnauld")
+    assert reprise.etat == const.ETAT_MIS_EN_PAUSE
+    en_cours.etat = const.ETAT_MIS_EN_PAUSE
+    assert etat(reprise) == etat(en_cours)
+    base.fermer()
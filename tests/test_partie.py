@@ -0,0 +1,32 @@
+import random
+
+import pytest
+
+from commun import constantes as const
+from outils import etat, nouvelle_partie
+
+MOTEURS = [const.GRILLE_LISTE, const.GRILLE_OCTETS, const.GRILLE_BITBOARD, const.GRILLE_CREUSE]
+
+
+@pytest.mark.parametrize("moteur", MOTEURS)
+@pytest.mark.parametrize("x, y", [(50, 0), (-1, 0), (0, -1), (10, 9), (0, 10)])
+def test_tir_hors_grille_refuse(monkeypatch, moteur, x, y):
+    """ Un tir hors de la grille est refusé : aucune case marquée, le tireur garde la main. """
+    monkeypatch.setattr(const, "MOTEUR_GRILLE", moteur)
+    partie = nouvelle_partie(random.Random(0))
+    avant = etat(partie)
+
+    resultat, _, terminee = partie.traiter_tir(x, y)
+
+    assert resultat == const.MSG_ERREUR
+    assert not terminee
+    assert etat(partie) == avant
+
+
+def test_enregistrer_tir_hors_grille():
+    partie = nouvelle_partie(random.Random(0))
+    avant = partie.joueur1.grille_suivi.en_listes()
+
+    partie.joueur1.enregistrer_tir(50, 0, const.TIR_RATE)
+
+    assert partie.joueur1.grille_suivi.en_listes() == avant
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from commun import constantes as const
+from commun.coeur_jeu.grille import Grille
+from commun.coeur_jeu.placeur_flotte import PlaceurFlotte
+
+
+def verifier(grille: Grille, tailles: list[int], placements: list[tuple[int, int, bool]]) -> None:
+    """ Chaque navire est dans la grille, sans chevauchement, et ses cases sont marquées. """
+    cases = set()
+    for taille, (x, y, horizontal) in zip(tailles, placements):
+        navire = {(x + i, y) if horizontal else (x, y + i) for i in range(taille)}
+        assert all(0 <= cx < grille.largeur and 0 <= cy < grille.hauteur for cx, cy in navire)
+        assert not cases & navire
+        cases |= navire
+    marquees = {(x, y) for y in range(grille.hauteur) for x, case in enumerate(grille.ligne(y))
+                if case == const.CASE_NAVIRE}
+    assert marquees == cases
+
+
+MOTEURS = [const.GRILLE_LISTE, const.GRILLE_OCTETS, const.GRILLE_BITBOARD, const.GRILLE_CREUSE]
+
+
+@pytest.mark.parametrize("graine", range(20))
+@pytest.mark.parametrize("moteur", MOTEURS)
+@pytest.mark.parametrize("largeur, hauteur, tailles", [
+    (10, 10, [5, 4, 3, 3, 2]),
+    (4, 4, [4, 4, 4, 4]),  # Grille entièrement remplie
+    (5, 5, [5, 4, 4, 3, 3, 2, 2]),  # 23 cases sur 25
+    (6, 6, [3] * 11),  # 33 cases sur 36
+    (8, 8, [5, 4, 4, 3, 3, 3, 2, 2, 2, 2] * 2),  # 60 cases sur 64
+    (40, 40, [5, 4, 3, 3, 2] * 60),  # Grande grille, sans masques de bits
+])
+def test_flotte_dense_placee(graine, moteur, largeur, hauteur, tailles):
+    """ Une flotte est toujours placée dès qu'une disposition existe, même dense. """
+    grille = Grille.creer(largeur, hauteur, moteur)
+
+    placements = PlaceurFlotte(grille, random.Random(graine)).tirer(tailles)
+
+    assert placements is not None
+    verifier(grille, tailles, placements)
+
+
+@pytest.mark.parametrize("moteur", MOTEURS)
+def test_sans_disposition(moteur):
+    """ Sans disposition possible, None et la grille n'est pas modifiée. """
+    grille = Grille.creer(3, 3, moteur)
+    assert PlaceurFlotte(grille, random.Random(0)).tirer([3, 3, 2, 2]) is None  # 10 cases sur 9
+
+    # Assez de cases libres (les coins et le centre), mais aucune paire voisine
+    for x, y in ((1, 0), (0, 1), (2, 1), (1, 2)):
+        grille.marquer_segment(x, y, 1, True, const.CASE_RATE)
+    assert PlaceurFlotte(grille, random.Random(0)).tirer([2]) is None
+    assert not grille.contient_valeur(const.CASE_NAVIRE)
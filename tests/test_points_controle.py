@@ -0,0 +1,50 @@
+import os
+import random
+
+import pytest
+
+from serveur.donnees.points_controle import PointsControle
+from outils import etat, nouvelle_partie, tirer
+
+
+@pytest.mark.parametrize("graine", range(5))
+@pytest.mark.parametrize("intervalle", [1, 7, 1000])
+def test_rejeu_partie_exacte(tmp_path, graine, intervalle):
+    """ Instantané de base puis tirs (avec ou sans nouvel instantané) : la partie est reconstruite à l'identique. """
+    rng = random.Random(graine)
+    points_controle = PointsControle(str(tmp_path), intervalle)
+    partie = nouvelle_partie(rng)
+    points_controle.ouvrir("Arnauld", partie)
+    for _, (x, y) in zip(range(rng.randint(1, 120)), tirer(partie, rng)):
+        points_controle.ajouter_tir("Arnauld", partie, x, y)
+
+    if partie.est_terminee():
+        pytest.skip("partie finie avant l'interruption")
+    (nom, reconstruite), = PointsControle(str(tmp_path), intervalle).recuperer()
+
+    assert nom == "Arnauld"
+    assert etat(reconstruite) == etat(partie)
+
+
+def test_dernier_tir_incomplet(tmp_path):
+    rng = random.Random(0)
+    points_controle = PointsControle(str(tmp_path))
+    partie = nouvelle_partie(rng)
+    points_controle.ouvrir("Arnauld", partie)
+    attendu = etat(partie)
+    with open(points_controle._chemin("Arnauld"), "ab") as f:
+        f.write(b"\x03")  # Arrêt au milieu d'un tir
+
+    (_, reconstruite), = points_controle.recuperer()
+
+    assert etat(reconstruite) == attendu
+
+
+def test_fermer_efface(tmp_path):
+    points_controle = PointsControle(str(tmp_path))
+    points_controle.ouvrir("Arnauld", nouvelle_partie(random.Random(0)))
+    points_controle.fermer("Arnauld")
+
+    assert not points_controle.est_suivie("Arnauld")
+    assert not os.path.exists(points_controle._chemin("Arnauld"))
+    assert points_controle.recuperer() == []